@@ -1,19 +1,13 @@
-from fastapi import APIRouter, HTTPException, BackgroundTasks
+from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel, Field
-import uuid
 import os
-import traceback
-from typing import Optional, List, Dict, Any
+from typing import Optional
 
 from .data import datasets_store
-from .jobs import job_store
+from .jobs import job_queue
 
 from examples import project_ENGIE
 from openoa.analysis.aep import MonteCarloAEP
-from openoa.analysis.electrical_losses import ElectricalLosses
-from openoa.analysis.turbine_long_term_gross_energy import TurbineLongTermGrossEnergy
-from openoa.analysis.wake_losses import WakeLosses
-from openoa.analysis.yaw_misalignment import StaticYawMisalignment
 
 router = APIRouter(
     prefix="/api/analysis",
@@ -22,75 +16,21 @@ router = APIRouter(
 
 class AnalysisRequestArgs(BaseModel):
     dataset_id: str = Field(..., description="ID of the dataset uploaded via /api/data/upload")
-    num_sim: int = Field(100, description="Number of Monte Carlo simulations to run")
+    num_sim: int = Field(100, description="Number of Monte Carlo simulations to run, or the maximum number when a tolerance is given")
+    tolerance: Optional[float] = Field(None, gt=0, description="Relative standard error of the target statistics at which the AEP, TIE and wake loss simulations stop early, e.g. 0.001 for 0.1%")
+    convergence_batch_size: Optional[int] = Field(None, gt=0, description="Number of simulations between each check of the tolerance; defaults to a tenth of num_sim, up to 500")
+    seed: int = Field(42, description="Random seed for the Monte Carlo sampling; results for the same dataset, parameters and seed are reused from the cache")
 
 class JobInitiatedResponse(BaseModel):
-    job_id: str = Field(..., description="ID to track the analysis progress via /api/jobs/{job_id}")
+    job_id: str = Field(..., description="ID to track the analysis progress via /api/jobs/{job_id}, or cancel it via /api/jobs/{job_id}/cancel")
     status: str
     message: str
 
-def get_plant_from_store(dataset_id: str):
-    if dataset_id not in datasets_store:
+def submit_job(kind: str, args: AnalysisRequestArgs, total: Optional[int] = None) -> str:
+    # The workers load the dataset themselves, so only check that it exists
+    if args.dataset_id not in datasets_store:
         raise HTTPException(status_code=404, detail="Dataset not found. Upload it first via /api/data/upload.")
-    return datasets_store[dataset_id]
-
-# ---------------------------------------------------------
-# BACKGROUND TASK WORKERS
-# ---------------------------------------------------------
-
-def run_aep_background_task(job_id: str, plant, num_sim: int):
-    try:
-        pa = MonteCarloAEP(plant, reanalysis_products=["era5", "merra2"], time_resolution="ME")
-        pa.run(num_sim=num_sim, progress_bar=False)
-        job_store[job_id]["status"] = "completed"
-        job_store[job_id]["result"] = {
-            "mean": pa.results.mean().to_dict(),
-            "std_dev": pa.results.std().to_dict(),
-            "type": "Monte Carlo AEP"
-        }
-    except Exception as e:
-        job_store[job_id]["status"] = "failed"
-        job_store[job_id]["error"] = str(e) + "\n" + traceback.format_exc()
-
-def run_electrical_losses_background_task(job_id: str, plant, num_sim: int):
-    try:
-        el = ElectricalLosses(plant=plant, URC_db=False)
-        el.run(num_sim=num_sim, progress_bar=False)
-        job_store[job_id]["status"] = "completed"
-        job_store[job_id]["result"] = {
-            "mean_electrical_losses": float(el.electrical_losses.mean()),
-            "std_electrical_losses": float(el.electrical_losses.std()),
-            "type": "Electrical Losses"
-        }
-    except Exception as e:
-        job_store[job_id]["status"] = "failed"
-        job_store[job_id]["error"] = str(e) + "\n" + traceback.format_exc()
-
-def run_tie_background_task(job_id: str, plant, num_sim: int):
-    try:
-        tie = TurbineLongTermGrossEnergy(plant, URC_db=False)
-        tie.run(num_sim=num_sim, progress_bar=False)
-        job_store[job_id]["status"] = "completed"
-        job_store[job_id]["result"] = {
-            "mean_tie": float(tie.plant_gross_energy.mean()),
-            "type": "Turbine Ideal Energy"
-        }
-    except Exception as e:
-        job_store[job_id]["status"] = "failed"
-        job_store[job_id]["error"] = str(e) + "\n" + traceback.format_exc()
-
-def run_wake_losses_background_task(job_id: str, plant):
-    try:
-        wl = WakeLosses(plant)
-        wl.run(progress_bar=False)
-        job_store[job_id]["status"] = "completed"
-        job_store[job_id]["result"] = {
-            "mean_wake_losses": float(wl.plant_wake_losses.mean()),
-            "type": "Wake Losses"
-        }
-    except Exception as e:
-        job_store[job_id]["status"] = "failed"
-        job_store[job_id]["error"] = str(e) + "\n" + traceback.format_exc()
+    return job_queue.submit(kind, args.dict(), total=total)
 
 # ---------------------------------------------------------
 # ROUTES
@@ -123,53 +63,26 @@ def run_example_aep():
 
 
 @router.post("/aep")
-def analyze_aep(args: AnalysisRequestArgs, background_tasks: BackgroundTasks):
-    plant = get_plant_from_store(args.dataset_id)
-    job_id = str(uuid.uuid4())
-    job_store[job_id] = {"status": "processing"}
-    background_tasks.add_task(run_aep_background_task, job_id, plant, args.num_sim)
-    return JobInitiatedResponse(job_id=job_id, status="processing", message="AEP background calculation started.")
+def analyze_aep(args: AnalysisRequestArgs):
+    job_id = submit_job("aep", args, total=args.num_sim)
+    return JobInitiatedResponse(job_id=job_id, status="queued", message="AEP calculation queued.")
 
 @router.post("/electrical-losses")
-def analyze_electrical_losses(args: AnalysisRequestArgs, background_tasks: BackgroundTasks):
-    plant = get_plant_from_store(args.dataset_id)
-    job_id = str(uuid.uuid4())
-    job_store[job_id] = {"status": "processing"}
-    background_tasks.add_task(run_electrical_losses_background_task, job_id, plant, args.num_sim)
-    return JobInitiatedResponse(job_id=job_id, status="processing", message="Electrical Losses background calculation started.")
+def analyze_electrical_losses(args: AnalysisRequestArgs):
+    job_id = submit_job("electrical-losses", args, total=args.num_sim)
+    return JobInitiatedResponse(job_id=job_id, status="queued", message="Electrical Losses calculation queued.")
 
 @router.post("/tie")
-def analyze_tie(args: AnalysisRequestArgs, background_tasks: BackgroundTasks):
-    plant = get_plant_from_store(args.dataset_id)
-    job_id = str(uuid.uuid4())
-    job_store[job_id] = {"status": "processing"}
-    background_tasks.add_task(run_tie_background_task, job_id, plant, args.num_sim)
-    return JobInitiatedResponse(job_id=job_id, status="processing", message="Turbine Ideal Energy (TIE) background calculation started.")
+def analyze_tie(args: AnalysisRequestArgs):
+    job_id = submit_job("tie", args, total=args.num_sim)
+    return JobInitiatedResponse(job_id=job_id, status="queued", message="Turbine Ideal Energy (TIE) calculation queued.")
 
 @router.post("/wake-losses")
-def analyze_wake_losses(args: AnalysisRequestArgs, background_tasks: BackgroundTasks):
-    plant = get_plant_from_store(args.dataset_id)
-    job_id = str(uuid.uuid4())
-    job_store[job_id] = {"status": "processing"}
-    background_tasks.add_task(run_wake_losses_background_task, job_id, plant)
-    return JobInitiatedResponse(job_id=job_id, status="processing", message="Wake Losses background calculation started.")
+def analyze_wake_losses(args: AnalysisRequestArgs):
+    job_id = submit_job("wake-losses", args, total=args.num_sim)
+    return JobInitiatedResponse(job_id=job_id, status="queued", message="Wake Losses calculation queued.")
 
 @router.post("/yaw-misalignment")
-def analyze_yaw_misalignment(args: AnalysisRequestArgs, background_tasks: BackgroundTasks):
-    plant = get_plant_from_store(args.dataset_id)
-    job_id = str(uuid.uuid4())
-    job_store[job_id] = {"status": "processing"}
-    
-    # Needs special plotting options in background task 
-    def run_yaw_misalignment(job_id, plant):
-        try:
-            yaw = StaticYawMisalignment(plant)
-            yaw.run(progress_bar=False)
-            job_store[job_id]["status"] = "completed"
-            job_store[job_id]["result"] = {"type": "Static Yaw Misalignment", "status": "completed"}
-        except Exception as e:
-            job_store[job_id]["status"] = "failed"
-            job_store[job_id]["error"] = str(e)
-            
-    background_tasks.add_task(run_yaw_misalignment, job_id, plant)
-    return JobInitiatedResponse(job_id=job_id, status="processing", message="Static Yaw Misalignment background calculation started.")
+def analyze_yaw_misalignment(args: AnalysisRequestArgs):
+    job_id = submit_job("yaw-misalignment", args)
+    return JobInitiatedResponse(job_id=job_id, status="queued", message="Static Yaw Misalignment calculation queued.")
@@ -3,18 +3,21 @@ from pydantic import ValidationError
 import pandas as pd
 import uuid
 import json
-import io
+import tempfile
 from .schema import DatasetResponse
+from .store import create_dataset_store
+from .ingest import ingest_upload
 from openoa.plant import PlantData
+from openoa.schema.metadata import PlantMetaData
 
 router = APIRouter(
     prefix="/api/data",
     tags=["data"],
 )
 
-# In-memory dictionary to store PlantData objects
-# Note: For production, consider serializing and storing securely 
-datasets_store = {}
+# Persistent store of the uploaded PlantData objects, saved under OPENOA_DATASET_DIR with only the
+# most recently used datasets kept in memory (see api/store.py)
+datasets_store = create_dataset_store()
 
 @router.post("/upload", response_model=DatasetResponse)
 async def upload_dataset(
@@ -33,38 +36,46 @@ async def upload_dataset(
         except json.JSONDecodeError:
             raise HTTPException(status_code=400, detail="Invalid JSON format for metadata")
 
-        # 2. Read CSVs into Pandas DataFrames
-        scada_df = pd.read_csv(io.StringIO((await scada.read()).decode('utf-8')))
-        meter_df = pd.read_csv(io.StringIO((await meter.read()).decode('utf-8')))
-        curtail_df = pd.read_csv(io.StringIO((await curtail.read()).decode('utf-8')))
-        asset_df = pd.read_csv(io.StringIO((await asset.read()).decode('utf-8')))
-        
+        # 2. Stream the CSVs to disk, and parse them with the metadata's column data types
+        plant_meta = PlantMetaData.load(meta_dict)
+        uploads = dict(
+            scada=scada,
+            meter=meter,
+            curtail=curtail,
+            asset=asset,
+            reanalysis_era5=reanalysis_era5,
+            reanalysis_merra2=reanalysis_merra2,
+        )
+        frames = {}
+        with tempfile.TemporaryDirectory() as spool_dir:
+            for name, upload in uploads.items():
+                if upload is not None:
+                    frames[name] = await ingest_upload(upload, spool_dir, plant_meta, name)
+        rows = {name: len(df) for name, df in frames.items()}
+
         reanalysis_dict = {}
-        if reanalysis_era5:
-            reanalysis_dict['era5'] = pd.read_csv(io.StringIO((await reanalysis_era5.read()).decode('utf-8')))
-        if reanalysis_merra2:
-            reanalysis_dict['merra2'] = pd.read_csv(io.StringIO((await reanalysis_merra2.read()).decode('utf-8')))
-            
+        for name in ("era5", "merra2"):
+            if f"reanalysis_{name}" in frames:
+                reanalysis_dict[name] = frames.pop(f"reanalysis_{name}")
+
         # 3. Initialize PlantData
         # (Assuming the files are pre-formatted correctly as required by OpenOA core libraries)
         plant_data = PlantData(
             analysis_type="MonteCarloAEP", 
-            metadata=meta_dict,
-            scada=scada_df,
-            meter=meter_df,
-            curtail=curtail_df,
-            asset=asset_df,
-            reanalysis=reanalysis_dict
+            metadata=plant_meta,
+            reanalysis=reanalysis_dict,
+            **frames
         )
         
-        # 4. Store in memory
+        # 4. Persist the dataset
         dataset_id = str(uuid.uuid4())
         datasets_store[dataset_id] = plant_data
         
         return DatasetResponse(
             dataset_id=dataset_id,
             status="success",
-            message=f"Dataset successfully created with {len(scada_df)} SCADA rows."
+            message=f"Dataset successfully created with {rows['scada']} SCADA rows.",
+            rows_processed=rows,
         )
         
     except Exception as e:
@@ -0,0 +1,152 @@
+"""
+Streaming ingestion of the uploaded CSV files.
+
+Uploads are spooled to disk in fixed-size chunks instead of being read into memory and decoded to
+a single string, and are then parsed with the data types prescribed by the ``PlantMetaData``, so
+the numeric columns never pass through ``object`` columns and the time columns are converted while
+parsing. With the default C engine the file is parsed in chunks of rows, logging the number of rows
+processed, and when ``pyarrow`` is installed its multi-threaded engine can be used instead.
+"""
+
+from __future__ import annotations
+
+import os
+import tempfile
+from typing import TYPE_CHECKING
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from openoa.logging import logging
+from openoa.schema.metadata import PlantMetaData
+
+if TYPE_CHECKING:
+    from fastapi import UploadFile
+
+logger = logging.getLogger(__name__)
+
+try:
+    import pyarrow  # noqa: F401
+
+    PYARROW_AVAILABLE = True
+except ModuleNotFoundError:
+    PYARROW_AVAILABLE = False
+
+# Size of the chunks copied from an upload to disk, in bytes
+UPLOAD_CHUNK_SIZE = 8 * 1024**2
+
+# Number of rows parsed at a time by the C engine
+CSV_CHUNK_ROWS = int(os.environ.get("OPENOA_CSV_CHUNK_ROWS", 500_000))
+
+# Use the pyarrow CSV engine, when it is installed, unless disabled
+USE_PYARROW = os.environ.get("OPENOA_CSV_ENGINE", "pyarrow") == "pyarrow" and PYARROW_AVAILABLE
+
+
+async def spool_upload(upload: UploadFile, directory: str | Path) -> Path:
+    """Copies an upload to a temporary file in ``directory`` in chunks of ``UPLOAD_CHUNK_SIZE``
+    bytes, so that at most one chunk is held in memory.
+
+    Args:
+        upload (UploadFile): The uploaded file.
+        directory (str | Path): The directory where the file is spooled.
+
+    Returns:
+        Path: The spooled file.
+    """
+    with tempfile.NamedTemporaryFile(dir=directory, suffix=".csv", delete=False) as f:
+        while chunk := await upload.read(UPLOAD_CHUNK_SIZE):
+            f.write(chunk)
+    await upload.close()
+    return Path(f.name)
+
+
+def csv_dtypes(col_map: dict, dtypes: dict) -> tuple[dict, list[str]]:
+    """Maps the OpenOA data types of a data type's metadata to the uploaded column names.
+
+    Args:
+        col_map (dict): The mapping of the OpenOA column names to the uploaded column names.
+        dtypes (dict): The mapping of the OpenOA column names to their data types.
+
+    Returns:
+        tuple[dict, list[str]]: The ``pd.read_csv`` data types of the non-time columns, and the
+            names of the time columns.
+    """
+    types = {}
+    time_cols = []
+    for name, column in col_map.items():
+        dtype = dtypes.get(name)
+        if dtype is None:
+            continue
+        if dtype is np.datetime64:
+            time_cols.append(column)
+        elif dtype is str:
+            types[column] = str
+        else:
+            types[column] = np.dtype(dtype)
+    return types, time_cols
+
+
+def read_csv(path: str | Path, col_map: dict, dtypes: dict, name: str) -> pd.DataFrame:
+    """Parses a spooled CSV file with the OpenOA data types of its columns.
+
+    Args:
+        path (str | Path): The CSV file.
+        col_map (dict): The mapping of the OpenOA column names to the uploaded column names.
+        dtypes (dict): The mapping of the OpenOA column names to their data types.
+        name (str): The name of the data type, used for logging.
+
+    Returns:
+        pd.DataFrame: The parsed data.
+    """
+    columns = pd.read_csv(path, nrows=0).columns
+    types, time_cols = csv_dtypes(col_map, dtypes)
+    types = {col: dtype for col, dtype in types.items() if col in columns}
+    time_cols = [col for col in time_cols if col in columns]
+
+    if USE_PYARROW:
+        df = pd.read_csv(path, dtype=types, parse_dates=time_cols, engine="pyarrow")
+        logger.info(f"Parsed {len(df):,} {name} rows")
+        return df
+
+    chunks = []
+    rows = 0
+    reader = pd.read_csv(path, dtype=types, parse_dates=time_cols, chunksize=CSV_CHUNK_ROWS)
+    with reader:
+        for chunk in reader:
+            chunks.append(chunk)
+            rows += len(chunk)
+            logger.info(f"Parsed {rows:,} {name} rows")
+    if not chunks:
+        return pd.read_csv(path, dtype=types, parse_dates=time_cols)
+    return pd.concat(chunks, ignore_index=True)
+
+
+async def ingest_upload(
+    upload: UploadFile, directory: str | Path, metadata: PlantMetaData, name: str
+) -> pd.DataFrame:
+    """Spools an upload to disk, and parses it with the data types of ``metadata.name``.
+
+    Args:
+        upload (UploadFile): The uploaded CSV file.
+        directory (str | Path): The directory where the file is spooled.
+        metadata (PlantMetaData): The plant's metadata.
+        name (str): The data type of the upload, such as "scada", or "reanalysis_era5" for a
+            reanalysis product.
+
+    Returns:
+        pd.DataFrame: The parsed data.
+    """
+    if name.startswith("reanalysis_"):
+        product = name[len("reanalysis_") :]
+        meta = metadata.reanalysis.get(product)
+        col_map, dtypes = ({}, {}) if meta is None else (meta.col_map, meta.dtypes)
+    else:
+        meta = getattr(metadata, name)
+        col_map, dtypes = meta.col_map, meta.dtypes
+
+    path = await spool_upload(upload, directory)
+    try:
+        return read_csv(path, col_map, dtypes, name)
+    finally:
+        path.unlink(missing_ok=True)
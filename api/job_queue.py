@@ -0,0 +1,274 @@
+"""
+Durable, SQLite-backed queue of the analysis jobs submitted through the API.
+
+Every job is a row in the ``jobs`` table that moves from "queued" to "running" when it is claimed
+by a worker, and then to "completed", "failed", or "cancelled". Jobs are claimed inside an
+``IMMEDIATE`` transaction, so any number of worker processes can share the same database file, and
+no more than ``max_concurrency`` jobs are ever running at once. Workers send a periodic heartbeat
+while running a job, so the jobs of a worker that died, e.g., when its instance was restarted, are
+returned to the queue.
+"""
+
+from __future__ import annotations
+
+import os
+import json
+import time
+import uuid
+import sqlite3
+from pathlib import Path
+from contextlib import contextmanager
+
+QUEUED = "queued"
+RUNNING = "running"
+COMPLETED = "completed"
+FAILED = "failed"
+CANCELLED = "cancelled"
+FINISHED = (COMPLETED, FAILED, CANCELLED)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id TEXT PRIMARY KEY,
+    kind TEXT NOT NULL,
+    params TEXT NOT NULL,
+    status TEXT NOT NULL,
+    progress INTEGER NOT NULL DEFAULT 0,
+    total INTEGER,
+    summary TEXT,
+    result TEXT,
+    error TEXT,
+    cancel_requested INTEGER NOT NULL DEFAULT 0,
+    worker TEXT,
+    created REAL NOT NULL,
+    started REAL,
+    heartbeat REAL,
+    finished REAL
+);
+CREATE INDEX IF NOT EXISTS jobs_status_created ON jobs (status, created);
+"""
+
+
+class JobCancelled(Exception):
+    """Raised inside a running job once its cancellation has been requested."""
+
+
+class JobQueue:
+    """SQLite-backed job queue shared by the API and the worker processes.
+
+    Args:
+        path (str | Path): The SQLite database file, which is created if it does not exist.
+        max_concurrency (int, optional): The maximum number of jobs that can be running at once,
+            across all of the workers. Defaults to 2.
+        stale_after (float, optional): The number of seconds without a heartbeat after which a
+            running job is assumed to have lost its worker, and is returned to the queue. Defaults
+            to 120.
+    """
+
+    def __init__(self, path: str | Path, max_concurrency: int = 2, stale_after: float = 120.0):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.max_concurrency = max_concurrency
+        self.stale_after = stale_after
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(SCHEMA)
+            # Add the columns missing from databases created by earlier versions
+            columns = {row["name"] for row in conn.execute("PRAGMA table_info(jobs)")}
+            if "summary" not in columns:
+                conn.execute("ALTER TABLE jobs ADD COLUMN summary TEXT")
+
+    @contextmanager
+    def _connect(self):
+        conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+        conn.row_factory = sqlite3.Row
+        try:
+            yield conn
+        finally:
+            conn.close()
+
+    @staticmethod
+    def _to_dict(row: sqlite3.Row | None) -> dict | None:
+        if row is None:
+            return None
+        job = dict(row)
+        job["params"] = json.loads(job["params"])
+        job["result"] = None if job["result"] is None else json.loads(job["result"])
+        job["summary"] = None if job["summary"] is None else json.loads(job["summary"])
+        job["cancel_requested"] = bool(job["cancel_requested"])
+        return job
+
+    def submit(self, kind: str, params: dict, total: int | None = None) -> str:
+        """Adds a job to the queue.
+
+        Args:
+            kind (str): The name of the task to run, see ``api.tasks.TASKS``.
+            params (dict): The JSON serializable task parameters.
+            total (int, optional): The expected number of iterations, if known. Defaults to None.
+
+        Returns:
+            str: The job ID.
+        """
+        job_id = str(uuid.uuid4())
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT INTO jobs (id, kind, params, status, total, created) VALUES (?, ?, ?, ?, ?, ?)",
+                (job_id, kind, json.dumps(params), QUEUED, total, time.time()),
+            )
+        return job_id
+
+    def get(self, job_id: str) -> dict | None:
+        """Returns the job as a dictionary of its columns, or None if it doesn't exist."""
+        with self._connect() as conn:
+            row = conn.execute("SELECT * FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        return self._to_dict(row)
+
+    def claim(self, worker_id: str) -> dict | None:
+        """Marks the oldest queued job as running by ``worker_id``, unless ``max_concurrency``
+        jobs are already running.
+
+        Returns:
+            dict | None: The claimed job, or None if there is nothing to run.
+        """
+        now = time.time()
+        with self._connect() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                conn.execute(
+                    "UPDATE jobs SET status = ?, worker = NULL WHERE status = ? AND heartbeat < ?",
+                    (QUEUED, RUNNING, now - self.stale_after),
+                )
+                (running,) = conn.execute(
+                    "SELECT COUNT(*) FROM jobs WHERE status = ?", (RUNNING,)
+                ).fetchone()
+                row = None
+                if running < self.max_concurrency:
+                    row = conn.execute(
+                        "SELECT * FROM jobs WHERE status = ? ORDER BY created LIMIT 1", (QUEUED,)
+                    ).fetchone()
+                if row is not None:
+                    conn.execute(
+                        "UPDATE jobs SET status = ?, worker = ?, started = ?, heartbeat = ?"
+                        " WHERE id = ?",
+                        (RUNNING, worker_id, now, now, row["id"]),
+                    )
+                conn.execute("COMMIT")
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+        if row is None:
+            return None
+        job = self._to_dict(row)
+        job.update(status=RUNNING, worker=worker_id, started=now, heartbeat=now)
+        return job
+
+    def update_progress(
+        self,
+        job_id: str,
+        progress: int,
+        total: int | None = None,
+        summary: dict | None = None,
+    ) -> bool:
+        """Records the progress, running summary statistics, and heartbeat, of a running job.
+
+        Returns:
+            bool: True if the job's cancellation has been requested.
+        """
+        with self._connect() as conn:
+            conn.execute(
+                "UPDATE jobs SET progress = ?, total = COALESCE(?, total),"
+                " summary = COALESCE(?, summary), heartbeat = ? WHERE id = ?",
+                (
+                    int(progress),
+                    None if total is None else int(total),
+                    None if summary is None else json.dumps(summary, default=float),
+                    time.time(),
+                    job_id,
+                ),
+            )
+            row = conn.execute(
+                "SELECT cancel_requested FROM jobs WHERE id = ?", (job_id,)
+            ).fetchone()
+        return row is not None and bool(row["cancel_requested"])
+
+    def heartbeat(self, job_id: str) -> bool:
+        """Records that the worker of a running job is still alive.
+
+        Returns:
+            bool: True if the job's cancellation has been requested.
+        """
+        with self._connect() as conn:
+            conn.execute("UPDATE jobs SET heartbeat = ? WHERE id = ?", (time.time(), job_id))
+            row = conn.execute(
+                "SELECT cancel_requested FROM jobs WHERE id = ?", (job_id,)
+            ).fetchone()
+        return row is not None and bool(row["cancel_requested"])
+
+    def _finish(self, job_id: str, status: str, result: dict | None, error: str | None) -> None:
+        with self._connect() as conn:
+            conn.execute(
+                "UPDATE jobs SET status = ?, result = ?, error = ?, finished = ?,"
+                " progress = CASE WHEN ? = ? THEN COALESCE(total, progress) ELSE progress END"
+                " WHERE id = ?",
+                (
+                    status,
+                    None if result is None else json.dumps(result, default=float),
+                    error,
+                    time.time(),
+                    status,
+                    COMPLETED,
+                    job_id,
+                ),
+            )
+
+    def complete(self, job_id: str, result: dict) -> None:
+        """Stores the result of a successful job."""
+        self._finish(job_id, COMPLETED, result, None)
+
+    def fail(self, job_id: str, error: str) -> None:
+        """Stores the error of a failed job."""
+        self._finish(job_id, FAILED, None, error)
+
+    def mark_cancelled(self, job_id: str) -> None:
+        """Marks a running job as cancelled once its worker has stopped it."""
+        self._finish(job_id, CANCELLED, None, None)
+
+    def cancel(self, job_id: str) -> str | None:
+        """Cancels a queued job immediately, or requests the cancellation of a running job, which
+        is stopped by its worker at its next progress update.
+
+        Returns:
+            str | None: The job's resulting status, or None if it doesn't exist.
+        """
+        with self._connect() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            row = conn.execute("SELECT status FROM jobs WHERE id = ?", (job_id,)).fetchone()
+            if row is None:
+                conn.execute("COMMIT")
+                return None
+            status = row["status"]
+            if status == QUEUED:
+                status = CANCELLED
+                conn.execute(
+                    "UPDATE jobs SET status = ?, finished = ? WHERE id = ?",
+                    (CANCELLED, time.time(), job_id),
+                )
+            elif status == RUNNING:
+                conn.execute("UPDATE jobs SET cancel_requested = 1 WHERE id = ?", (job_id,))
+            conn.execute("COMMIT")
+        return status
+
+    def count(self, status: str) -> int:
+        """Returns the number of jobs with the given status."""
+        with self._connect() as conn:
+            (n,) = conn.execute("SELECT COUNT(*) FROM jobs WHERE status = ?", (status,)).fetchone()
+        return n
+
+
+def create_job_queue() -> JobQueue:
+    """Creates the job queue configured by the ``OPENOA_JOB_DB`` and
+    ``OPENOA_MAX_CONCURRENT_JOBS`` environment variables.
+    """
+    return JobQueue(
+        os.environ.get("OPENOA_JOB_DB", os.path.join(".cache", "openoa_jobs.sqlite")),
+        max_concurrency=int(os.environ.get("OPENOA_MAX_CONCURRENT_JOBS", 2)),
+    )
@@ -1,32 +1,72 @@
 from fastapi import APIRouter, HTTPException
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 from typing import Dict, Any, Optional
+import asyncio
+
+from .job_queue import FINISHED, create_job_queue
 
 router = APIRouter(
     prefix="/api/jobs",
     tags=["jobs"],
 )
 
-# In-memory dictionary to store job statuses and results
-# A true production app would use Redis or a Database
-job_store: Dict[str, Dict[str, Any]] = {}
+# Durable job queue shared with the worker processes in api/workers.py
+job_queue = create_job_queue()
 
 class JobStatusResponse(BaseModel):
     job_id: str
     status: str
+    progress: int = 0
+    total: Optional[int] = None
+    summary: Optional[Dict[str, Any]] = None
     result: Optional[Any] = None
     error: Optional[str] = None
 
+def job_status_response(job: Dict[str, Any]) -> JobStatusResponse:
+    return JobStatusResponse(
+        job_id=job["id"],
+        status=job["status"],
+        progress=job["progress"],
+        total=job["total"],
+        summary=job["summary"],
+        result=job["result"],
+        error=job["error"]
+    )
+
 @router.get("/{job_id}", response_model=JobStatusResponse)
 def get_job_status(job_id: str):
-    if job_id not in job_store:
+    job = job_queue.get(job_id)
+    if job is None:
         raise HTTPException(status_code=404, detail="Job not found")
-        
-    job_data = job_store[job_id]
-    
-    return JobStatusResponse(
-        job_id=job_id,
-        status=job_data.get("status", "unknown"),
-        result=job_data.get("result"),
-        error=job_data.get("error")
+    return job_status_response(job)
+
+@router.post("/{job_id}/cancel", response_model=JobStatusResponse)
+def cancel_job(job_id: str):
+    """ Cancels a queued job, or stops a running job at its next progress update. """
+    if job_queue.cancel(job_id) is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return job_status_response(job_queue.get(job_id))
+
+@router.get("/{job_id}/events")
+async def stream_job_events(job_id: str, interval: float = 1.0):
+    """ Streams the job's status, progress and running summary statistics as server-sent events
+    whenever they change, until the job is finished. """
+    if job_queue.get(job_id) is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+
+    async def events():
+        last = None
+        while True:
+            job = await asyncio.to_thread(job_queue.get, job_id)
+            data = job_status_response(job).json()
+            if data != last:
+                last = data
+                yield f"event: {job['status']}\ndata: {data}\n\n"
+            if job["status"] in FINISHED:
+                break
+            await asyncio.sleep(interval)
+
+    return StreamingResponse(
+        events(), media_type="text/event-stream", headers={"Cache-Control": "no-cache"}
     )
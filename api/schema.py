@@ -1,5 +1,5 @@
 from pydantic import BaseModel, Field
-from typing import List
+from typing import Dict, List
 
 class AirDensityAdjustmentRequest(BaseModel):
     wind_speeds: List[float] = Field(..., description="List of wind speeds (m/s)")
@@ -12,3 +12,4 @@ class DatasetResponse(BaseModel):
     dataset_id: str = Field(..., description="Unique identifier for the loaded dataset")
     status: str = Field(..., description="Status of the dataset load operation")
     message: str = Field(..., description="Additional information about the dataset")
+    rows_processed: Dict[str, int] = Field(default_factory=dict, description="Number of rows parsed from each uploaded file")
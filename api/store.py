@@ -0,0 +1,263 @@
+"""
+Persistent storage for the uploaded ``PlantData`` objects.
+
+Each dataset is saved to its own directory as one columnar file per frame (Parquet when
+``pyarrow`` is installed, otherwise a pickle) plus a ``metadata.json`` describing the plant
+metadata, the analysis types and the stored frames. Datasets are only read from disk the first
+time they are accessed, and a bounded LRU keeps the most recently used ``PlantData`` objects in
+memory, so the server can hold many plants in bounded RAM, survive restarts, and share datasets
+between workers that point at the same directory.
+"""
+
+from __future__ import annotations
+
+import os
+import json
+import uuid
+import shutil
+import threading
+from abc import ABC, abstractmethod
+from pathlib import Path
+from collections import OrderedDict
+from collections.abc import Iterator
+
+import pandas as pd
+
+from openoa.plant import PlantData
+from openoa.logging import logging
+
+logger = logging.getLogger(__name__)
+
+try:
+    import pyarrow  # noqa: F401
+
+    PARQUET_AVAILABLE = True
+except ModuleNotFoundError:
+    PARQUET_AVAILABLE = False
+
+METADATA = "metadata.json"
+
+# Derived columns that are recreated when the PlantData is initialized
+DERIVED_COLUMNS = {"asset": ["geometry"]}
+
+# The scalar plant metadata that is saved along with the column mappings
+PLANT_METADATA = (
+    "latitude",
+    "longitude",
+    "reference_system",
+    "reference_longitude",
+    "utm_zone",
+    "capacity",
+)
+
+
+def plant_metadata_dict(plant: PlantData) -> dict:
+    """Creates the metadata dictionary for a ``PlantData`` object whose frames are saved with the
+    OpenOA column names, in the same manner as ``PlantData.to_csv``.
+    """
+    meta = {name: getattr(plant.metadata, name) for name in PLANT_METADATA}
+    for name, col_map in plant.metadata.column_map.items():
+        if name == "reanalysis":
+            meta[name] = {}
+            for re_name, re_col_map in col_map.items():
+                re_col_map = {k: k for k in re_col_map}
+                re_col_map["frequency"] = plant.metadata.reanalysis[re_name].frequency
+                meta[name][re_name] = re_col_map
+            continue
+        col_map = {k: k for k in col_map}
+        meta_obj = getattr(plant.metadata, name)
+        if hasattr(meta_obj, "frequency"):
+            col_map["frequency"] = meta_obj.frequency
+        meta[name] = col_map
+    return meta
+
+
+def _frame_items(plant: PlantData) -> Iterator[tuple[str, pd.DataFrame]]:
+    """Yields the file name stem and data of each frame in ``plant``."""
+    for name, df in plant.data_dict.items():
+        if name == "reanalysis":
+            for re_name, re_df in (df or {}).items():
+                yield f"reanalysis_{re_name}", re_df
+        elif df is not None:
+            yield name, df
+
+
+def write_frame(df: pd.DataFrame, path: Path) -> str:
+    """Writes ``df`` to ``path`` as Parquet, if available, otherwise as a pickle, and returns the
+    name of the file that was written.
+    """
+    if PARQUET_AVAILABLE:
+        file_name = path.with_suffix(".parquet")
+        df.to_parquet(file_name, index=False)
+    else:
+        file_name = path.with_suffix(".pkl")
+        df.to_pickle(file_name)
+    return file_name.name
+
+
+def read_frame(path: Path) -> pd.DataFrame:
+    """Reads a frame written by :py:func:`write_frame`."""
+    if path.suffix == ".parquet":
+        return pd.read_parquet(path)
+    return pd.read_pickle(path)
+
+
+class DatasetStore(ABC):
+    """Dictionary-like interface for the dataset storage backends, which map a dataset ID to its
+    ``PlantData`` object.
+    """
+
+    @abstractmethod
+    def __contains__(self, dataset_id: str) -> bool: ...
+
+    @abstractmethod
+    def __getitem__(self, dataset_id: str) -> PlantData: ...
+
+    @abstractmethod
+    def __setitem__(self, dataset_id: str, plant: PlantData) -> None: ...
+
+    @abstractmethod
+    def __delitem__(self, dataset_id: str) -> None: ...
+
+    @abstractmethod
+    def keys(self) -> list[str]: ...
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.keys())
+
+    def __len__(self) -> int:
+        return len(self.keys())
+
+    def add(self, plant: PlantData) -> str:
+        """Stores ``plant`` under a new dataset ID, and returns the ID."""
+        dataset_id = str(uuid.uuid4())
+        self[dataset_id] = plant
+        return dataset_id
+
+
+class LocalDatasetStore(DatasetStore):
+    """Stores the datasets in a local (or mounted) directory, with the ``max_in_memory`` most
+    recently used datasets kept in memory.
+
+    Args:
+        directory (str | Path): The directory where the datasets are saved. This will be created
+            if it does not already exist.
+        max_in_memory (int, optional): The maximum number of ``PlantData`` objects kept in memory.
+            Defaults to 4.
+    """
+
+    def __init__(self, directory: str | Path, max_in_memory: int = 4):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.max_in_memory = max_in_memory
+        self._memory: OrderedDict[str, PlantData] = OrderedDict()
+        self._lock = threading.RLock()
+
+    def _path(self, dataset_id: str) -> Path:
+        path = self.directory / dataset_id
+        if path.parent != self.directory:
+            raise KeyError(dataset_id)
+        return path
+
+    def __contains__(self, dataset_id: str) -> bool:
+        try:
+            return (self._path(dataset_id) / METADATA).is_file()
+        except KeyError:
+            return False
+
+    def keys(self) -> list[str]:
+        return sorted(p.parent.name for p in self.directory.glob(f"*/{METADATA}"))
+
+    def info(self, dataset_id: str) -> dict:
+        """Reads the saved metadata of a dataset without loading any of its frames."""
+        if dataset_id not in self:
+            raise KeyError(dataset_id)
+        return json.loads((self._path(dataset_id) / METADATA).read_text())
+
+    def load_frame(self, dataset_id: str, name: str) -> pd.DataFrame:
+        """Reads a single frame of a dataset, such as "scada" or "reanalysis_era5", using the
+        OpenOA column names, without loading the rest of the dataset.
+        """
+        frames = self.info(dataset_id)["frames"]
+        if name not in frames:
+            raise KeyError(f"Dataset {dataset_id} does not contain a '{name}' frame")
+        return read_frame(self._path(dataset_id) / frames[name]["file"])
+
+    def __setitem__(self, dataset_id: str, plant: PlantData) -> None:
+        path = self._path(dataset_id)
+        tmp = self.directory / f".tmp-{uuid.uuid4().hex}"
+        tmp.mkdir()
+
+        frames = {}
+        for name, df in _frame_items(plant):
+            base_name = "reanalysis" if name.startswith("reanalysis_") else name
+            derived = [c for c in DERIVED_COLUMNS.get(base_name, []) if c in df.columns]
+            df = df.drop(columns=derived).reset_index()
+            frames[name] = dict(file=write_frame(df, tmp / name), rows=len(df))
+        info = dict(
+            dataset_id=dataset_id,
+            analysis_type=plant.analysis_type,
+            metadata=plant_metadata_dict(plant),
+            frames=frames,
+        )
+        (tmp / METADATA).write_text(json.dumps(info, default=str))
+
+        with self._lock:
+            if path.exists():
+                shutil.rmtree(path)
+            os.replace(tmp, path)
+            self._remember(dataset_id, plant)
+        logger.info(f"Stored dataset: {dataset_id}")
+
+    def __getitem__(self, dataset_id: str) -> PlantData:
+        with self._lock:
+            if dataset_id in self._memory:
+                self._memory.move_to_end(dataset_id)
+                return self._memory[dataset_id]
+
+        info = self.info(dataset_id)
+        path = self._path(dataset_id)
+        data = {}
+        reanalysis = {}
+        for name, frame in info["frames"].items():
+            df = read_frame(path / frame["file"])
+            if name.startswith("reanalysis_"):
+                reanalysis[name[len("reanalysis_") :]] = df
+            else:
+                data[name] = df
+        plant = PlantData(
+            metadata=info["metadata"],
+            analysis_type=info["analysis_type"],
+            reanalysis=reanalysis or None,
+            **data,
+        )
+        logger.info(f"Loaded dataset from disk: {dataset_id}")
+
+        with self._lock:
+            self._remember(dataset_id, plant)
+        return plant
+
+    def __delitem__(self, dataset_id: str) -> None:
+        if dataset_id not in self:
+            raise KeyError(dataset_id)
+        with self._lock:
+            self._memory.pop(dataset_id, None)
+            shutil.rmtree(self._path(dataset_id), ignore_errors=True)
+
+    def _remember(self, dataset_id: str, plant: PlantData) -> None:
+        """Adds ``plant`` to the in-memory LRU, and drops the least recently used datasets."""
+        self._memory[dataset_id] = plant
+        self._memory.move_to_end(dataset_id)
+        while len(self._memory) > self.max_in_memory:
+            evicted, _ = self._memory.popitem(last=False)
+            logger.info(f"Released dataset from memory: {evicted}")
+
+
+def create_dataset_store() -> DatasetStore:
+    """Creates the dataset store configured by the ``OPENOA_DATASET_DIR`` and
+    ``OPENOA_DATASETS_IN_MEMORY`` environment variables.
+    """
+    return LocalDatasetStore(
+        os.environ.get("OPENOA_DATASET_DIR", os.path.join(".cache", "openoa_datasets")),
+        max_in_memory=int(os.environ.get("OPENOA_DATASETS_IN_MEMORY", 4)),
+    )
@@ -0,0 +1,119 @@
+"""
+The analysis tasks that are run by the job workers, keyed by the job ``kind`` in ``TASKS``.
+
+Each task takes the ``PlantData`` of the job's dataset, the job parameters, and a progress callback
+that is passed to the analysis' ``run`` method, and returns a JSON serializable summary of the
+results.
+"""
+
+from __future__ import annotations
+
+import os
+from typing import Callable
+
+from openoa.utils.cache import ResultCache
+from openoa.analysis.aep import MonteCarloAEP
+from openoa.analysis._progress import MonteCarloProgress
+from openoa.analysis.wake_losses import WakeLosses
+from openoa.analysis.yaw_misalignment import StaticYawMisalignment
+from openoa.analysis.electrical_losses import ElectricalLosses
+from openoa.analysis.turbine_long_term_gross_energy import TurbineLongTermGrossEnergy
+
+# Content-addressed cache of analysis results, keyed on the dataset, parameters and seed, so that
+# resubmitting the same dataset with the same parameters reuses the stored results
+result_cache = ResultCache(
+    os.environ.get("OPENOA_CACHE_DIR", os.path.join(".cache", "openoa_results")),
+    max_size=int(os.environ.get("OPENOA_CACHE_MAX_BYTES", 2 * 1024**3)),
+)
+
+
+def convergence_options(params: dict) -> dict:
+    # The tolerance is first checked after a tenth of the simulations, rather than the analysis
+    # default of every 500 simulations, so that the smaller API runs can stop early
+    batch_size = params.get("convergence_batch_size")
+    if batch_size is None:
+        batch_size = min(500, max(1, params["num_sim"] // 10))
+    return {"tolerance": params.get("tolerance"), "convergence_batch_size": batch_size}
+
+
+def run_aep(plant, params: dict, progress_callback: Callable[[MonteCarloProgress], None]) -> dict:
+    pa = MonteCarloAEP(
+        plant,
+        reanalysis_products=["era5", "merra2"],
+        time_resolution="ME",
+        seed=params["seed"],
+        cache=result_cache,
+    )
+    pa.run(
+        num_sim=params["num_sim"],
+        progress_bar=False,
+        progress_callback=progress_callback,
+        **convergence_options(params),
+    )
+    return {
+        "mean": pa.results.mean().to_dict(),
+        "std_dev": pa.results.std().to_dict(),
+        "precision": pa.precision,
+        "type": "Monte Carlo AEP",
+    }
+
+
+def run_electrical_losses(
+    plant, params: dict, progress_callback: Callable[[MonteCarloProgress], None]
+) -> dict:
+    el = ElectricalLosses(plant=plant, seed=params["seed"], cache=result_cache)
+    el.run(num_sim=params["num_sim"], progress_callback=progress_callback)
+    return {
+        "mean_electrical_losses": float(el.electrical_losses.mean()),
+        "std_electrical_losses": float(el.electrical_losses.std()),
+        "type": "Electrical Losses",
+    }
+
+
+def run_tie(plant, params: dict, progress_callback: Callable[[MonteCarloProgress], None]) -> dict:
+    tie = TurbineLongTermGrossEnergy(plant, seed=params["seed"], cache=result_cache)
+    tie.run(
+        num_sim=params["num_sim"],
+        progress_bar=False,
+        progress_callback=progress_callback,
+        **convergence_options(params),
+    )
+    return {
+        "mean_tie": float(tie.plant_gross.mean()),
+        "precision": tie.precision,
+        "type": "Turbine Ideal Energy",
+    }
+
+
+def run_wake_losses(
+    plant, params: dict, progress_callback: Callable[[MonteCarloProgress], None]
+) -> dict:
+    wl = WakeLosses(plant, seed=params["seed"], cache=result_cache)
+    wl.run(
+        num_sim=params["num_sim"],
+        progress_bar=False,
+        progress_callback=progress_callback,
+        **convergence_options(params),
+    )
+    return {
+        "mean_wake_losses": float(wl.wake_losses_lt.mean()),
+        "precision": wl.precision,
+        "type": "Wake Losses",
+    }
+
+
+def run_yaw_misalignment(
+    plant, params: dict, progress_callback: Callable[[MonteCarloProgress], None]
+) -> dict:
+    yaw = StaticYawMisalignment(plant, seed=params["seed"], cache=result_cache)
+    yaw.run(progress_bar=False, progress_callback=progress_callback)
+    return {"type": "Static Yaw Misalignment", "status": "completed"}
+
+
+TASKS = {
+    "aep": run_aep,
+    "electrical-losses": run_electrical_losses,
+    "tie": run_tie,
+    "wake-losses": run_wake_losses,
+    "yaw-misalignment": run_yaw_misalignment,
+}
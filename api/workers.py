@@ -0,0 +1,160 @@
+"""
+Worker processes that run the analysis jobs from the ``api.job_queue.JobQueue``.
+
+Each worker is a separate process that claims one job at a time, loads its dataset from the
+persistent dataset store, and runs the job's task, so long analyses never block the processes
+serving the API. While a job runs, a background thread sends heartbeats and watches for a
+cancellation request, which stops the analysis at its next progress update. The API starts
+``OPENOA_JOB_WORKERS`` workers alongside itself, and more capacity can be added by running
+``python -m api.workers`` on any machine that shares the job database and dataset directory.
+"""
+
+from __future__ import annotations
+
+import os
+import time
+import socket
+import argparse
+import threading
+import traceback
+import multiprocessing as mp
+
+from openoa.logging import logging
+from openoa.analysis._progress import MonteCarloProgress
+
+from .store import create_dataset_store
+from .job_queue import JobQueue, JobCancelled, create_job_queue
+
+logger = logging.getLogger(__name__)
+
+# Seconds between the heartbeats, and cancellation checks, of a running job
+HEARTBEAT_INTERVAL = 5.0
+
+# Minimum number of seconds between the progress updates written to the queue
+PROGRESS_INTERVAL = 1.0
+
+
+class _JobMonitor:
+    """Sends the heartbeats of a running job, and throttles its progress updates."""
+
+    def __init__(self, queue: JobQueue, job_id: str):
+        self.queue = queue
+        self.job_id = job_id
+        self.cancelled = threading.Event()
+        self._stop = threading.Event()
+        self._last_update = 0.0
+        self._thread = threading.Thread(target=self._beat, daemon=True)
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *args):
+        self._stop.set()
+        self._thread.join()
+
+    def _beat(self):
+        while not self._stop.wait(HEARTBEAT_INTERVAL):
+            if self.queue.heartbeat(self.job_id):
+                self.cancelled.set()
+
+    def progress(self, progress: MonteCarloProgress) -> None:
+        """The progress callback passed to the analysis, which records the progress and running
+        summary statistics, and raises ``JobCancelled`` once the job's cancellation has been
+        requested.
+        """
+        now = time.monotonic()
+        if progress.completed == progress.total or now - self._last_update >= PROGRESS_INTERVAL:
+            self._last_update = now
+            cancel = self.queue.update_progress(
+                self.job_id, progress.completed, progress.total, progress.summary()
+            )
+            if cancel:
+                self.cancelled.set()
+        if self.cancelled.is_set():
+            raise JobCancelled(self.job_id)
+
+
+def run_job(queue: JobQueue, datasets_store, job: dict) -> None:
+    """Runs a claimed job, and records its result, error, or cancellation in the queue."""
+    from .tasks import TASKS
+
+    job_id = job["id"]
+    logger.info(f"Running job {job_id}: {job['kind']}")
+    try:
+        with _JobMonitor(queue, job_id) as monitor:
+            plant = datasets_store[job["params"]["dataset_id"]]
+            result = TASKS[job["kind"]](plant, job["params"], monitor.progress)
+    except JobCancelled:
+        queue.mark_cancelled(job_id)
+        logger.info(f"Cancelled job {job_id}")
+    except Exception as e:
+        queue.fail(job_id, str(e) + "\n" + traceback.format_exc())
+        logger.info(f"Failed job {job_id}")
+    else:
+        queue.complete(job_id, result)
+        logger.info(f"Completed job {job_id}")
+
+
+def run_worker(stop: mp.synchronize.Event | None = None, poll_interval: float = 1.0) -> None:
+    """Claims and runs jobs until ``stop`` is set.
+
+    Args:
+        stop (multiprocessing.Event, optional): Signals the worker to exit once its current job
+            is finished. Defaults to None, which runs forever.
+        poll_interval (float, optional): Seconds to wait when there are no jobs to run. Defaults
+            to 1.
+    """
+    queue = create_job_queue()
+    datasets_store = create_dataset_store()
+    worker_id = f"{socket.gethostname()}:{os.getpid()}"
+    while stop is None or not stop.is_set():
+        job = queue.claim(worker_id)
+        if job is None:
+            time.sleep(poll_interval)
+            continue
+        run_job(queue, datasets_store, job)
+
+
+class WorkerPool:
+    """Pool of worker processes running :py:func:`run_worker`.
+
+    Args:
+        n_workers (int): The number of worker processes.
+    """
+
+    def __init__(self, n_workers: int):
+        self.n_workers = n_workers
+        self._context = mp.get_context("spawn")
+        self._stop = self._context.Event()
+        self._processes = []
+
+    def start(self) -> None:
+        for _ in range(self.n_workers):
+            process = self._context.Process(target=run_worker, args=(self._stop,))
+            process.start()
+            self._processes.append(process)
+
+    def stop(self, timeout: float = 10.0) -> None:
+        """Asks the workers to exit, and terminates any that are still running a job after
+        ``timeout`` seconds, whose jobs are returned to the queue once their heartbeats stop.
+        """
+        self._stop.set()
+        for process in self._processes:
+            process.join(timeout)
+            if process.is_alive():
+                process.terminate()
+        self._processes = []
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Run OpenOA API job workers.")
+    parser.add_argument("-n", "--n-workers", type=int, default=1)
+    args = parser.parse_args()
+    pool = WorkerPool(args.n_workers)
+    pool.start()
+    try:
+        for process in pool._processes:
+            process.join()
+    except KeyboardInterrupt:
+        pool.stop()
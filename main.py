@@ -4,9 +4,22 @@ import os
 import openoa
 
 from api import utils, jobs, data, analysis, qa, plots
+from api.workers import WorkerPool
 
 app = FastAPI(title="OpenOA API")
 
+# Worker processes that run the queued analysis jobs; set OPENOA_JOB_WORKERS=0 to run the workers
+# separately with `python -m api.workers`
+worker_pool = WorkerPool(int(os.environ.get("OPENOA_JOB_WORKERS", 1)))
+
+@app.on_event("startup")
+def start_workers():
+    worker_pool.start()
+
+@app.on_event("shutdown")
+def stop_workers():
+    worker_pool.stop()
+
 app.include_router(utils.router)
 app.include_router(jobs.router)
 app.include_router(data.router)
@@ -0,0 +1,176 @@
+"""Provides the adaptive stopping rule shared by the Monte Carlo simulations of the analysis classes.
+
+When a ``tolerance`` is passed to an analysis' ``run`` method, the requested number of simulations
+becomes the maximum number of simulations, and the precision of the analysis' target statistics is
+checked after each batch of simulations. The simulations stop once the standard error of every
+target statistic, relative to the statistic itself, is no larger than the tolerance, and the
+results are truncated to the completed simulations.
+
+The standard error of the mean is estimated from the sample standard deviation, and the standard
+error of a percentile from the distribution-free confidence interval given by the order statistics
+of the simulations, so no assumption is made about the shape of the distribution of the results.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Callable
+
+import attrs
+import numpy as np
+import pandas as pd
+import numpy.typing as npt
+from attrs import field, define
+
+from openoa.logging import logging
+
+logger = logging.getLogger(__name__)
+
+# The target statistics that can be checked, and the percentile of each, where the P50 and P90
+# follow the exceedance convention used for energy estimates
+STATISTICS = {"mean": None, "p50": 50.0, "p90": 10.0}
+
+
+def _finite_values(values: npt.ArrayLike) -> np.ndarray:
+    """Flattens :py:attr:`values`, and drops any non-finite simulation results."""
+    values = np.asarray(values, dtype=float).reshape(-1)
+    return values[np.isfinite(values)]
+
+
+def standard_error(values: npt.ArrayLike, statistic: str) -> tuple[float, float]:
+    """Estimates a statistic of the simulation results, and its standard error.
+
+    For a percentile, the standard error is half the width of the interval between the order
+    statistics that are one binomial standard deviation below and above the percentile's rank.
+
+    Args:
+        values (npt.ArrayLike): The results of each simulation.
+        statistic (str): One of "mean", "p50", or "p90".
+
+    Returns:
+        tuple[float, float]: The estimate of the statistic, and its standard error. Both are NaN if
+            there are fewer than two finite results.
+    """
+    values = _finite_values(values)
+    n = values.size
+    if n < 2:
+        return np.nan, np.nan
+
+    percentile = STATISTICS[statistic]
+    if percentile is None:
+        return float(values.mean()), float(values.std(ddof=1) / np.sqrt(n))
+
+    q = percentile / 100
+    values = np.sort(values)
+    rank = n * q
+    spread = np.sqrt(n * q * (1 - q))
+    lower = int(np.clip(np.floor(rank - spread), 0, n - 1))
+    upper = int(np.clip(np.ceil(rank + spread), 0, n - 1))
+    return float(np.percentile(values, percentile)), float(values[upper] - values[lower]) / 2
+
+
+def relative_standard_error(estimate: float, error: float) -> float:
+    """Computes the standard error relative to the magnitude of its estimate."""
+    if estimate == 0:
+        return 0.0 if error == 0 else np.inf
+    return abs(error / estimate)
+
+
+def monte_carlo_precision(
+    values: npt.ArrayLike, statistics: tuple[str, ...], tolerance: float | None = None
+) -> dict[str, Any]:
+    """Computes the achieved precision of the target statistics of a Monte Carlo simulation.
+
+    Args:
+        values (npt.ArrayLike): The results of each simulation.
+        statistics (tuple[str, ...]): The target statistics, see :py:attr:`STATISTICS`.
+        tolerance (float, optional): The relative standard error required of each statistic.
+            Defaults to None.
+
+    Returns:
+        dict[str, Any]: The number of simulations, the tolerance, whether every statistic is within
+            the tolerance (None if there is no tolerance), and the estimate, standard error, and
+            relative standard error of each statistic, e.g., "p90", "p90_std_error", and
+            "p90_relative_std_error".
+    """
+    precision = dict(num_sim=int(np.asarray(values).shape[0]), tolerance=tolerance, converged=None)
+    relative_errors = []
+    for statistic in statistics:
+        estimate, error = standard_error(values, statistic)
+        relative_errors.append(relative_standard_error(estimate, error))
+        precision[statistic] = estimate
+        precision[f"{statistic}_std_error"] = error
+        precision[f"{statistic}_relative_std_error"] = relative_errors[-1]
+    if tolerance is not None:
+        precision["converged"] = bool(all(e <= tolerance for e in relative_errors))
+    return precision
+
+
+def truncate_simulations(analysis, names: list[str], num_sim: int) -> None:
+    """Keeps only the first :py:attr:`num_sim` simulations of each of an analysis' per-simulation
+    attributes, and sets the analysis' ``num_sim`` to the number of completed simulations.
+
+    Args:
+        analysis: The analysis class object.
+        names (list[str]): The names of the per-simulation attributes, where each is a
+            ``pandas.DataFrame`` or ``numpy.ndarray`` with the simulations along the first axis.
+        num_sim (int): The number of completed simulations.
+    """
+    for name in names:
+        value = getattr(analysis, name)
+        if isinstance(value, (pd.DataFrame, pd.Series)):
+            value = value.iloc[:num_sim]
+        else:
+            value = value[:num_sim]
+        setattr(analysis, name, value)
+    analysis.num_sim = num_sim
+
+
+@define(auto_attribs=True)
+class ConvergenceCriterion:
+    """The stopping rule of an adaptive Monte Carlo simulation, which is checked once each batch
+    of simulations is completed.
+
+    Args:
+        tolerance (float): The relative standard error required of each target statistic, e.g.,
+            0.001 stops the simulations once the standard errors are within 0.1% of the estimates.
+        statistics (tuple[str, ...]): The target statistics, from "mean", "p50", and "p90".
+            Defaults to ("mean",).
+        batch_size (int): The number of simulations between each check, which is also the minimum
+            number of simulations. Defaults to 500.
+    """
+
+    tolerance: float = field(converter=float, validator=attrs.validators.gt(0))
+    statistics: tuple[str, ...] = field(
+        default=("mean",),
+        converter=tuple,
+        validator=attrs.validators.deep_iterable(attrs.validators.in_(STATISTICS)),
+    )
+    batch_size: int = field(default=500, converter=int, validator=attrs.validators.gt(0))
+    precision: dict[str, Any] = field(factory=dict, init=False)
+    _next_check: int = field(init=False)
+
+    def __attrs_post_init__(self):
+        self._next_check = self.batch_size
+
+    def check(self, completed: int, values: npt.ArrayLike | Callable[[], npt.ArrayLike]) -> bool:
+        """Checks if the simulations have converged, once the next batch has been completed.
+
+        Args:
+            completed (int): The number of completed simulations.
+            values (npt.ArrayLike | Callable[[], npt.ArrayLike]): The results of the completed
+                simulations, or a function that returns them, which is only called when a check is
+                due.
+
+        Returns:
+            bool: True if the simulations should stop.
+        """
+        if completed < self._next_check:
+            return False
+        self._next_check = (completed // self.batch_size + 1) * self.batch_size
+
+        if callable(values):
+            values = values()
+        self.precision = monte_carlo_precision(values, self.statistics, self.tolerance)
+        if self.precision["converged"]:
+            logger.info(f"Monte Carlo simulations converged after {completed} simulations")
+        return self.precision["converged"]
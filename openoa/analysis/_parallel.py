@@ -0,0 +1,200 @@
+"""Provides the shared process-based parallel execution routines for the Monte Carlo simulations
+of the analysis classes.
+
+The simulations are split into chunks that are each run as an independent, smaller Monte Carlo
+analysis in a worker process using its own copy of the analysis object, and an independent random
+stream spawned from a common ``numpy.random.SeedSequence``. The analysis is prepared once in the
+parent process, and each chunk only runs the analysis' ``_simulate`` method, which draws and runs
+the chunk's simulations without repeating any of the run's preprocessing. The results of each
+chunk are then stacked, in order, to produce the same result attributes as a serial analysis. For
+an adaptive simulation, the chunks are checked for convergence in order as they complete, and the
+remaining chunks are cancelled once the simulations have converged.
+"""
+
+from __future__ import annotations
+
+import random
+from typing import Any, Callable
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+import numpy.typing as npt
+from tqdm import tqdm
+
+from openoa.analysis._random import AnalysisRandomState
+from openoa.analysis._progress import ProgressReporter
+from openoa.analysis._convergence import ConvergenceCriterion
+
+# The analysis object copied to each worker process when the pool is initialized
+_worker_analysis = None
+
+
+def split_simulations(num_sim: int, n_chunks: int) -> list[int]:
+    """Splits :py:attr:`num_sim` simulations into :py:attr:`n_chunks` chunks of nearly equal size.
+
+    Args:
+        num_sim (int): The total number of simulations.
+        n_chunks (int): The number of chunks to create.
+
+    Returns:
+        list[int]: The number of simulations in each chunk, which will sum to :py:attr:`num_sim`.
+    """
+    n_chunks = max(1, min(num_sim, n_chunks))
+    size, remainder = divmod(num_sim, n_chunks)
+    return [size + (i < remainder) for i in range(n_chunks)]
+
+
+def merge_chunk_results(results: list[dict[str, Any]]) -> dict[str, Any]:
+    """Stacks the results of each chunk along the simulation axis.
+
+    Args:
+        results (list[dict[str, Any]]): The result attributes of each chunk, in simulation order,
+            where each value is either a ``pandas.DataFrame`` or a ``numpy.ndarray``.
+
+    Returns:
+        dict[str, Any]: The combined results of all of the chunks.
+    """
+    merged = {}
+    for name, value in results[0].items():
+        chunk_values = [r[name] for r in results]
+        if isinstance(value, pd.DataFrame):
+            merged[name] = pd.concat(chunk_values, ignore_index=True)
+        else:
+            merged[name] = np.concatenate(chunk_values, axis=0)
+    return merged
+
+
+def seed_global_random_state(seed_sequence: np.random.SeedSequence) -> None:
+    """Seeds NumPy's and Python's global random number generators from a ``SeedSequence``.
+
+    Args:
+        seed_sequence (np.random.SeedSequence): The chunk's random stream.
+    """
+    np.random.seed(seed_sequence.generate_state(4))
+    random.seed(int(seed_sequence.generate_state(1, np.uint64)[0]))
+
+
+def _initialize_worker(analysis) -> None:
+    """Stores the worker process' copy of the analysis object."""
+    global _worker_analysis
+    _worker_analysis = analysis
+
+
+def _run_chunk(
+    num_sim: int,
+    seed_sequence: np.random.SeedSequence,
+    run_kwargs: dict,
+    result_attributes: list[str],
+) -> dict[str, Any]:
+    """Runs a single chunk of simulations with the worker's copy of the prepared analysis object.
+
+    Args:
+        num_sim (int): The number of simulations in the chunk.
+        seed_sequence (np.random.SeedSequence): The chunk's random stream.
+        run_kwargs (dict): Any additional keyword arguments for the analysis' ``_simulate`` method.
+        result_attributes (list[str]): The names of the attributes to return.
+
+    Returns:
+        dict[str, Any]: The chunk's values of each of the :py:attr:`result_attributes`.
+    """
+    seed_global_random_state(seed_sequence)
+    _worker_analysis.num_sim = num_sim
+    _worker_analysis._rng = AnalysisRandomState(seed_sequence)
+    _worker_analysis._simulate(**run_kwargs)
+    return {name: getattr(_worker_analysis, name) for name in result_attributes}
+
+
+def run_parallel_monte_carlo(
+    analysis,
+    num_sim: int,
+    n_workers: int,
+    result_attributes: list[str],
+    run_kwargs: dict | None = None,
+    seed: int | np.random.SeedSequence | None = None,
+    chunks_per_worker: int = 4,
+    progress_bar: bool = True,
+    progress: ProgressReporter | None = None,
+    progress_values: Callable[[dict[str, Any]], npt.ArrayLike] | None = None,
+    convergence: ConvergenceCriterion | None = None,
+    convergence_values: Callable[[dict[str, Any]], npt.ArrayLike] | None = None,
+) -> dict[str, Any]:
+    """Runs the Monte Carlo simulations of an analysis across a pool of worker processes.
+
+    Each worker process receives its own copy of :py:attr:`analysis` when the pool is created,
+    so the preprocessing performed by the analysis' ``run`` method prior to calling this function,
+    and any memoized results computed by a worker, are reused by all of the chunks run in that
+    worker. Each chunk sets the analysis' ``num_sim`` to the chunk size, and its random state to
+    the chunk seed, and calls ``analysis._simulate(**run_kwargs)``, which sets up and runs the
+    chunk's simulations without a progress bar. The chunk seed is a child of :py:attr:`seed` that
+    is also used to seed the worker's global random states, so the results are reproducible for a
+    given seed, number of simulations, and number of workers.
+
+    Args:
+        analysis: The analysis object, with its run parameters already set and its preprocessing
+            done.
+        num_sim (int): The total number of simulations.
+        n_workers (int): The number of worker processes to use.
+        result_attributes (list[str]): The names of the per-simulation result attributes of
+            :py:attr:`analysis` to be merged.
+        run_kwargs (dict, optional): Any additional keyword arguments for the ``_simulate``
+            method. Defaults to None.
+        seed (int | np.random.SeedSequence, optional): The entropy used to spawn the independent
+            random stream of each chunk. Defaults to None.
+        chunks_per_worker (int, optional): The number of chunks to create for each worker, which
+            helps balance the load across workers. Defaults to 4.
+        progress_bar (bool, optional): Flag to use a progress bar for the completed chunks.
+            Defaults to True.
+        progress (ProgressReporter, optional): Reports the number of completed simulations as
+            each chunk completes. If its callback raises an exception, the remaining chunks are
+            cancelled. Defaults to None.
+        progress_values (Callable[[dict[str, Any]], npt.ArrayLike], optional): Function that
+            extracts the headline metric of each simulation from the results of a chunk, which
+            are reported with the progress. Defaults to None.
+        convergence (ConvergenceCriterion, optional): The stopping rule of an adaptive simulation,
+            which is checked as each chunk completes. Defaults to None.
+        convergence_values (Callable[[dict[str, Any]], npt.ArrayLike], optional): Function that
+            extracts the values checked by :py:attr:`convergence` from the merged results of the
+            completed chunks. Required if :py:attr:`convergence` is provided. Defaults to None.
+
+    Returns:
+        dict[str, Any]: The merged result attributes of all of the completed simulations.
+    """
+    run_kwargs = {} if run_kwargs is None else run_kwargs
+    chunks = split_simulations(num_sim, n_workers * chunks_per_worker)
+    if not isinstance(seed, np.random.SeedSequence):
+        seed = np.random.SeedSequence(seed)
+    seed_sequences = seed.spawn(len(chunks))
+
+    with ProcessPoolExecutor(
+        max_workers=n_workers, initializer=_initialize_worker, initargs=(analysis,)
+    ) as executor:
+        futures = [
+            executor.submit(_run_chunk, n, ss, run_kwargs, result_attributes)
+            for n, ss in zip(chunks, seed_sequences)
+        ]
+        results = []
+        values = []
+        completed = 0
+        try:
+            with tqdm(total=num_sim, disable=not progress_bar) as pbar:
+                for n, future in zip(chunks, futures):
+                    results.append(future.result())
+                    pbar.update(n)
+                    completed += n
+                    if progress is not None:
+                        if progress_values is not None:
+                            values.append(np.asarray(progress_values(results[-1])).reshape(-1))
+                        progress(completed, np.concatenate(values) if values else None)
+                    if convergence is not None and convergence.check(
+                        completed, lambda: convergence_values(merge_chunk_results(results))
+                    ):
+                        for future in futures:
+                            future.cancel()
+                        break
+        except BaseException:
+            for future in futures:
+                future.cancel()
+            raise
+
+    return merge_chunk_results(results)
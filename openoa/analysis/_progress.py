@@ -0,0 +1,160 @@
+"""Provides the progress reporting shared by the Monte Carlo simulations of the analysis classes.
+
+As the simulations complete, the ``progress_callback`` of an analysis' ``run`` method is called with
+a :py:class:`MonteCarloProgress` object that holds the number of completed simulations and the
+results of the analysis' headline metric for those simulations, from which the running summary
+statistics, and the convergence of the P50 and P90 estimates, are computed on demand.
+"""
+
+from __future__ import annotations
+
+import inspect
+import warnings
+from typing import Callable
+
+import numpy as np
+import numpy.typing as npt
+from attrs import field, define
+
+# The share of the completed simulations that are left out to estimate the convergence of the
+# P50 and P90 values
+CONVERGENCE_WINDOW = 0.1
+
+
+def _relative_change(new: float, old: float) -> float:
+    """Computes the absolute change between :py:attr:`old` and :py:attr:`new`, relative to
+    :py:attr:`new`.
+    """
+    if new == 0:
+        return 0.0 if old == 0 else np.inf
+    return abs(new - old) / abs(new)
+
+
+@define(auto_attribs=True)
+class MonteCarloProgress:
+    """The progress of a Monte Carlo simulation, and the results of its completed simulations.
+
+    The P50 and P90 follow the exceedance convention used for energy estimates, i.e., the P90 is
+    the value exceeded by 90% of the simulations, or the 10th percentile.
+
+    Args:
+        total (int): The total number of simulations.
+        metric (str): The name of the headline metric, such as "aep_GWh".
+        completed (int): The number of completed simulations. Defaults to 0.
+        values (np.ndarray | None): The headline metric of each completed simulation, or None if
+            the analysis doesn't produce one per simulation. Defaults to None.
+    """
+
+    total: int = field(converter=int)
+    metric: str
+    completed: int = field(default=0, converter=int)
+    values: npt.NDArray | None = field(default=None)
+
+    def update(self, completed: int, values: npt.ArrayLike | None = None) -> None:
+        """Sets the number of completed simulations and their results."""
+        self.completed = completed
+        self.values = None if values is None else np.asarray(values, dtype=float).reshape(-1)
+
+    @property
+    def fraction(self) -> float:
+        """The share of the simulations that have been completed."""
+        return self.completed / self.total if self.total else 1.0
+
+    def summary(self) -> dict[str, float | int | str | None]:
+        """Computes the running summary statistics of the completed simulations.
+
+        Returns:
+            dict: The number of completed and total simulations, and the mean, standard deviation,
+                standard error of the mean, P50, and P90 of the headline metric. The convergence of
+                the P50 and P90 is given as their relative change when the most recent 10% of the
+                completed simulations are included. The statistics are None when there are no
+                results yet.
+        """
+        summary = dict(completed=self.completed, total=self.total, metric=self.metric)
+        stats = dict.fromkeys(
+            ("mean", "std", "std_error", "p50", "p90", "p50_change", "p90_change")
+        )
+        summary.update(stats)
+
+        values = self.values
+        if values is None:
+            return summary
+        values = values[np.isfinite(values)]
+        n = values.size
+        if n == 0:
+            return summary
+
+        std = float(values.std(ddof=1)) if n > 1 else 0.0
+        p50, p90 = np.percentile(values, [50, 10])
+        summary.update(
+            mean=float(values.mean()),
+            std=std,
+            std_error=std / float(np.sqrt(n)),
+            p50=float(p50),
+            p90=float(p90),
+        )
+
+        previous = values[: n - max(1, int(n * CONVERGENCE_WINDOW))]
+        if previous.size > 0:
+            prev_p50, prev_p90 = np.percentile(previous, [50, 10])
+            summary.update(
+                p50_change=float(_relative_change(p50, prev_p50)),
+                p90_change=float(_relative_change(p90, prev_p90)),
+            )
+        return summary
+
+
+def _is_legacy_callback(callback: Callable) -> bool:
+    """Checks if :py:attr:`callback` takes the number of completed and total simulations as two
+    required positional arguments, which is the deprecated form of the progress callback.
+    """
+    try:
+        parameters = inspect.signature(callback).parameters.values()
+    except (TypeError, ValueError):
+        return False
+    positional = (inspect.Parameter.POSITIONAL_ONLY, inspect.Parameter.POSITIONAL_OR_KEYWORD)
+    if any(p.kind == inspect.Parameter.VAR_POSITIONAL for p in parameters):
+        return False
+    required = [p for p in parameters if p.kind in positional and p.default is p.empty]
+    return len(required) == 2
+
+
+class ProgressReporter:
+    """Calls a ``progress_callback`` with the :py:class:`MonteCarloProgress` of a simulation, and
+    does nothing if there is no callback.
+
+    A callback that takes the number of completed and total simulations as two arguments, i.e.,
+    ``progress_callback(completed, total)``, is still called in that form, but is deprecated.
+
+    Args:
+        callback (Callable[[MonteCarloProgress], None] | None): The progress callback.
+        total (int): The total number of simulations.
+        metric (str): The name of the headline metric.
+    """
+
+    def __init__(
+        self,
+        callback: Callable[[MonteCarloProgress], None] | Callable[[int, int], None] | None,
+        total: int,
+        metric: str,
+    ):
+        self.callback = callback
+        self.progress = MonteCarloProgress(total=total, metric=metric)
+        self._legacy = callback is not None and _is_legacy_callback(callback)
+        if self._legacy:
+            warnings.warn(
+                "Calling `progress_callback` with the number of completed and total simulations is"
+                " deprecated, and will be removed in a future release. Use a callback that takes a"
+                " `MonteCarloProgress` instead.",
+                DeprecationWarning,
+                stacklevel=3,
+            )
+
+    def __call__(self, completed: int, values: npt.ArrayLike | None = None) -> None:
+        if self.callback is None:
+            return
+        self.progress.update(completed, values)
+        if self._legacy:
+            self.callback(self.progress.completed, self.progress.total)
+        else:
+            self.callback(self.progress)
@@ -0,0 +1,139 @@
+"""Provides the random number source shared by the Monte Carlo sampling routines of the analysis
+classes.
+
+When an analysis is created without a seed, every draw is routed through NumPy's and Python's
+global random number generators in exactly the same order as prior versions of OpenOA, so that
+results seeded with ``np.random.seed`` and ``random.seed`` remain unchanged. When a seed is
+provided, every draw is instead made from a single ``numpy.random.Generator``, so the results of an
+analysis are fully determined by its data, parameters, and seed.
+"""
+
+from __future__ import annotations
+
+import random
+from typing import Sequence
+
+import numpy as np
+import numpy.typing as npt
+
+# The valid types for the ``seed`` argument of the analysis classes
+SEED_TYPES = (int, np.integer, np.random.SeedSequence, np.random.Generator, type(None))
+
+
+class AnalysisRandomState:
+    """Random number source for an analysis that wraps either a ``numpy.random.Generator``, or
+    the global random states when no seed is provided.
+
+    Args:
+        seed (int | np.random.SeedSequence | np.random.Generator | None, optional): The seed, or
+            generator, to draw from. If a ``Generator`` is provided, it is used directly, and
+            therefore its state is shared with the caller. Defaults to None, which uses NumPy's and
+            Python's global random states.
+    """
+
+    def __init__(self, seed: int | np.random.SeedSequence | np.random.Generator | None = None):
+        self.generator = None if seed is None else np.random.default_rng(seed)
+
+    @property
+    def is_seeded(self) -> bool:
+        """Flag for if the draws are made from a ``numpy.random.Generator``."""
+        return self.generator is not None
+
+    def normal(self, loc: float, scale: float, size: int | None = None) -> npt.NDArray:
+        """Draws from a normal distribution, see ``numpy.random.Generator.normal``."""
+        if self.generator is None:
+            return np.random.normal(loc, scale, size)
+        return self.generator.normal(loc, scale, size)
+
+    def integers(self, low: int, high: int | None = None, size: int | None = None) -> npt.NDArray:
+        """Draws integers from the half-open interval [low, high), see
+        ``numpy.random.Generator.integers``.
+        """
+        if self.generator is None:
+            return np.random.randint(low, high, size)
+        return self.generator.integers(low, high, size)
+
+    def choice(self, a: int | npt.ArrayLike, size: int | None = None, replace: bool = True):
+        """Draws a random sample from :py:attr:`a`, see ``numpy.random.Generator.choice``."""
+        if self.generator is None:
+            return np.random.choice(a, size=size, replace=replace)
+        return self.generator.choice(a, size=size, replace=replace)
+
+    def sample(self, population: Sequence, k: int) -> list:
+        """Draws :py:attr:`k` unique elements from :py:attr:`population`, in the style of
+        ``random.sample``.
+        """
+        if self.generator is None:
+            return random.sample(population, k)
+        ix = self.generator.choice(len(population), size=k, replace=False)
+        return [population[i] for i in ix]
+
+    def choices(self, population: Sequence, k: int = 1) -> list:
+        """Draws :py:attr:`k` elements from :py:attr:`population` with replacement, in the style of
+        ``random.choices``.
+        """
+        if self.generator is None:
+            return random.choices(population, k=k)
+        ix = self.generator.integers(0, len(population), size=k)
+        return [population[i] for i in ix]
+
+    def bootstrap_indices(self, n: int) -> npt.NDArray[np.int_]:
+        """Draws the row indices of a bootstrap resample of :py:attr:`n` rows with replacement,
+        which are the same draws as ``pandas.DataFrame.sample(frac=1.0, replace=True)``.
+
+        Args:
+            n (int): The number of rows being resampled.
+
+        Returns:
+            npt.NDArray[np.int_]: The :py:attr:`n` resampled row indices.
+        """
+        return self.choice(n, size=n, replace=True)
+
+    def bootstrap_weights(self, n: int) -> npt.NDArray[np.float64]:
+        """Draws the bootstrap weight of each of :py:attr:`n` rows, which is the number of times the
+        row appears in a resample, so that a statistic of a resample is computed as a weighted
+        statistic of the original rows without copying them. The weights are the counts of the
+        :py:meth:`bootstrap_indices`, so they sum to :py:attr:`n` and give the same resample as
+        prior versions of OpenOA.
+
+        Args:
+            n (int): The number of rows being resampled.
+
+        Returns:
+            npt.NDArray[np.float64]: The weight of each row.
+        """
+        return np.bincount(self.bootstrap_indices(n), minlength=n).astype(float)
+
+    def sklearn_random_state(self) -> int | None:
+        """Creates a ``random_state`` for scikit-learn estimators, which do not accept a
+        ``numpy.random.Generator``.
+
+        Returns:
+            int | None: None when unseeded, so scikit-learn uses the global random state, otherwise
+                an integer drawn from the generator.
+        """
+        if self.generator is None:
+            return None
+        return int(self.generator.integers(np.iinfo(np.int32).max))
+
+    def derived_seed(self) -> np.random.SeedSequence:
+        """Creates the seed of a random stream that is derived from the random state without
+        drawing from it, so the draws of the analysis are unchanged, such as for the draws of a
+        convergence check.
+
+        Returns:
+            np.random.SeedSequence: A new child of the generator's seed sequence, or the seed
+                sequence of NumPy's current global random state when unseeded.
+        """
+        if self.generator is None:
+            return np.random.SeedSequence(np.random.get_state()[1])
+        # ``BitGenerator.seed_seq`` is only public from NumPy 1.25
+        return self.generator.bit_generator._seed_seq.spawn(1)[0]
+
+    def spawn_seed(self) -> int:
+        """Creates the entropy for the independent random streams of parallel Monte Carlo chunks.
+
+        Returns:
+            int: A seed drawn from the generator, or from NumPy's global random state when unseeded.
+        """
+        return int(self.integers(np.iinfo(np.int32).max))
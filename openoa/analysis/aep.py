@@ -1,9 +1,9 @@
 from __future__ import annotations
 
 import sys
-import random
 import datetime
 from copy import deepcopy
+from typing import Callable
 
 import attrs
 import numpy as np
@@ -25,13 +25,29 @@ from openoa.utils import unit_conversion as un
 from openoa.utils import met_data_processing as mt
 from openoa.schema import FromDictMixin, ResetValuesMixin
 from openoa.logging import logging, logged_method_call
+from openoa.utils.cache import (
+    ResultCache,
+    convert_to_cache,
+    analysis_cache_key,
+    load_cached_results,
+    store_cached_results,
+)
 from openoa.schema.metadata import convert_frequency
+from openoa.analysis._random import SEED_TYPES, AnalysisRandomState
+from openoa.analysis._parallel import run_parallel_monte_carlo
+from openoa.analysis._progress import ProgressReporter, MonteCarloProgress
+from openoa.analysis._convergence import (
+    ConvergenceCriterion,
+    truncate_simulations,
+    monte_carlo_precision,
+)
 from openoa.utils.machine_learning_setup import MachineLearningSetup
 from openoa.analysis._analysis_validators import validate_reanalysis_selections
 
 logger = logging.getLogger(__name__)
 
 NDArrayFloat = npt.NDArray[np.float64]
+NDArrayBool = npt.NDArray[np.bool_]
 
 
 plot.set_styling()
@@ -59,6 +75,75 @@ def get_annual_values(data):
     return data.resample("12MS").sum().values
 
 
+def batched_linear_regression(
+    X: NDArrayFloat, y: NDArrayFloat, weights: NDArrayFloat | None = None
+) -> tuple[NDArrayFloat, NDArrayFloat, NDArrayFloat, NDArrayFloat]:
+    """Solves a stack of ordinary least squares problems at once via the normal equations on
+    mean-centered data, which mirrors the intercept handling of
+    :py:class:`sklearn.linear_model.LinearRegression`.
+
+    Args:
+        X(:obj:`numpy.ndarray`): Regression inputs with shape (n_fits, n_points, n_features), or
+            (n_points, n_features) when :py:attr:`weights` are provided, where every fit uses the
+            same points.
+        y(:obj:`numpy.ndarray`): Regression targets with shape (n_fits, n_points).
+        weights(:obj:`numpy.ndarray`, optional): The weight of each point in each fit with shape
+            (n_fits, n_points), such as the number of times it is drawn in a bootstrap resample,
+            so a resampled fit is solved without gathering the resampled inputs. Defaults to None.
+
+    Returns:
+        :obj:`tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray, numpy.ndarray]`: The intercepts
+            (n_fits,), coefficients (n_fits, n_features), R2 scores (n_fits,), and mean squared
+            errors (n_fits,) of each fit.
+    """
+    if weights is None:
+        X_offset = X.mean(axis=1, keepdims=True)
+        y_offset = y.mean(axis=1, keepdims=True)
+        X_centered = X - X_offset
+        y_centered = y - y_offset
+
+        gram = np.einsum("kmi,kmj->kij", X_centered, X_centered)
+        moment = np.einsum("kmi,km->ki", X_centered, y_centered)
+        X_offset = X_offset[:, 0, :]
+    else:
+        # Center the shared inputs once, so that the weighted moments of each fit only need a
+        # small correction for the fit's own weighted mean
+        X_mean = X.mean(axis=0)
+        X = X - X_mean
+        w_sum = weights.sum(axis=1)
+        X_offset = weights @ X / w_sum[:, None]
+        y_offset = (weights * y).sum(axis=1, keepdims=True) / w_sum[:, None]
+        y_centered = y - y_offset
+
+        gram = np.einsum("km,mi,mj->kij", weights, X, X, optimize=True)
+        gram -= w_sum[:, None, None] * X_offset[:, :, None] * X_offset[:, None, :]
+        moment = np.einsum("km,mi,km->ki", weights, X, y_centered, optimize=True)
+
+    try:
+        coef = np.linalg.solve(gram, moment[..., None])[..., 0]
+    except np.linalg.LinAlgError:
+        # Fall back to the minimum-norm solution for rank-deficient resamples
+        coef = np.einsum("kij,kj->ki", np.linalg.pinv(gram), moment)
+
+    if weights is None:
+        intercept = y_offset[:, 0] - np.einsum("ki,ki->k", X_offset, coef)
+        residual = y_centered - np.einsum("kmi,ki->km", X_centered, coef)
+        ss_res = (residual**2).sum(axis=1)
+        ss_tot = (y_centered**2).sum(axis=1)
+        n_points = y.shape[1]
+    else:
+        intercept = y_offset[:, 0] - np.einsum("ki,ki->k", X_offset + X_mean, coef)
+        residual = y_centered - (X @ coef.T).T + np.einsum("ki,ki->k", X_offset, coef)[:, None]
+        ss_res = (weights * residual**2).sum(axis=1)
+        ss_tot = (weights * y_centered**2).sum(axis=1)
+        n_points = w_sum
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        r2 = np.where(ss_tot != 0, 1 - ss_res / ss_tot, np.where(ss_res == 0, 1.0, 0.0))
+    mse = ss_res / n_points
+    return intercept, coef, r2, mse
+
+
 # TODO: Split this into a more generic naming convention to have other AEP methods, such as QMC
 # TODO: Create an analysis result class that could be used for better results aggregation
 @define(auto_attribs=True)
@@ -123,6 +208,14 @@ class MonteCarloAEP(FromDictMixin, ResetValuesMixin):
             the IAV adjustment is useful for comparing against short-term estimates of energy
             production, whereas the exclusion of the IAV is useful for comparing against long-term
             energy production estimates. Defaults to ``True``.
+        seed(:obj:`int` | :obj:`numpy.random.SeedSequence` | :obj:`numpy.random.Generator` | :obj:`None`):
+            The seed, or generator, for all of the random sampling in the Monte Carlo simulation. A
+            new generator is created from the seed at the start of each :py:meth:`run`, so the same
+            seed reproduces the same results. Defaults to None, which uses NumPy's and Python's
+            global random states.
+        cache(:obj:`ResultCache` | :obj:`str` | :obj:`pathlib.Path` | :obj:`None`): The cache, or
+            cache directory, used to store and reload the results of runs seeded with an integer
+            :py:attr:`seed`. See :py:class:`openoa.utils.cache.ResultCache`. Defaults to None.
     """
 
     plant: PlantData = field(converter=deepcopy, validator=attrs.validators.instance_of(PlantData))
@@ -181,12 +274,16 @@ class MonteCarloAEP(FromDictMixin, ResetValuesMixin):
         default=None, validator=attrs.validators.instance_of((int, type(None)))
     )
     apply_iav: bool = field(default=True, validator=attrs.validators.instance_of(bool))
+    seed: int | np.random.SeedSequence | np.random.Generator | None = field(
+        default=None, validator=attrs.validators.instance_of(SEED_TYPES)
+    )
+    cache: ResultCache | None = field(default=None, converter=convert_to_cache)
 
     # Internally created attributes need to be given a type before usage
     resample_freq: str = field(init=False)
     resample_hours: int = field(init=False)
     calendar_samples: int = field(init=False)
-    outlier_filtering: dict = field(factory=dict, init=False)
+    outlier_filtering: dict[tuple, NDArrayBool] = field(factory=dict, init=False)
     long_term_sampling: dict = field(factory=dict, init=False)
     opt_model: dict = field(factory=dict, init=False)
     reanalysis_vars: list[str] = field(factory=list, init=False)
@@ -209,6 +306,8 @@ class MonteCarloAEP(FromDictMixin, ResetValuesMixin):
     _mc_slope: NDArrayFloat = field(init=False)
     _run: pd.DataFrame = field(init=False)
     results: pd.DataFrame = field(init=False)
+    precision: dict = field(factory=dict, init=False)
+    _rng: AnalysisRandomState = field(init=False)
     run_parameters: list[str] = field(
         init=False,
         default=[
@@ -225,6 +324,19 @@ class MonteCarloAEP(FromDictMixin, ResetValuesMixin):
             "time_resolution",
             "end_date_lt",
             "ml_setup_kwargs",
+            "seed",
+        ],
+    )
+    cached_attributes: list[str] = field(
+        init=False,
+        default=[
+            "mc_inputs",
+            "results",
+            "_mc_num_points",
+            "_r2_score",
+            "_mse_score",
+            "num_sim",
+            "precision",
         ],
     )
 
@@ -254,6 +366,8 @@ class MonteCarloAEP(FromDictMixin, ResetValuesMixin):
 
         logger.info("Initializing MonteCarloAEP Analysis Object")
 
+        self._rng = AnalysisRandomState(self.seed)
+
         self.resample_freq = self.time_resolution
         self.resample_hours = {"MS": 30 * 24, "ME": 30 * 24, "D": 1 * 24, "h": 1}[
             self.time_resolution
@@ -298,6 +412,12 @@ class MonteCarloAEP(FromDictMixin, ResetValuesMixin):
         end_date_lt: str | pd.Timestamp | None = None,
         ml_setup_kwargs: dict = None,
         progress_bar: bool = True,
+        vectorized: bool = False,
+        n_workers: int = 1,
+        seed: int | np.random.SeedSequence | np.random.Generator | None = None,
+        progress_callback: Callable[[MonteCarloProgress], None] | None = None,
+        tolerance: float | None = None,
+        convergence_batch_size: int = 500,
     ) -> None:
         """
         Process all appropriate data and run the MonteCarlo AEP analysis.
@@ -306,7 +426,8 @@ class MonteCarloAEP(FromDictMixin, ResetValuesMixin):
             used for the analysis, and if no prior values were set, then this is the model's defaults.
 
         Args:
-            num_sim(:obj:`int`): number of simulations to perform
+            num_sim(:obj:`int`): number of simulations to perform, or the maximum number of
+                simulations when a :py:attr:`tolerance` is provided.
             reanal_products(obj:`list[str]`) : List of reanalysis products to use for Monte Carlo
                 sampling. Defaults to None, which pulls all the products contained in
                 :py:attr:`plant.reanalysis`.
@@ -339,6 +460,29 @@ class MonteCarloAEP(FromDictMixin, ResetValuesMixin):
                 :py:class:`openoa.utils.machine_learning_setup.MachineLearningSetup` class. Defaults to {}.
             progress_bar(:obj:`bool`): Flag to use a progress bar for the iterations in the AEP
                 calculation. Defaults to ``True``.
+            vectorized(:obj:`bool`): Flag to solve all of the Monte Carlo simulations in batches
+                with :py:meth:`run_AEP_monte_carlo_vectorized` instead of one at a time. Only
+                available when :py:attr:`reg_model` is "lin". The results match the iterative
+                calculation for the same random state. Defaults to ``False``.
+            n_workers(:obj:`int`): The number of processes to split the Monte Carlo simulations
+                across using :py:meth:`run_AEP_monte_carlo_parallel`. Defaults to 1, which runs
+                all of the simulations in the current process.
+            seed(:obj:`int` | :obj:`numpy.random.SeedSequence` | :obj:`numpy.random.Generator` | :obj:`None`):
+                The seed, or generator, for all of the random sampling in the Monte Carlo
+                simulation. Defaults to None, which uses :py:attr:`seed`.
+            progress_callback(:obj:`Callable[[MonteCarloProgress], None]`, optional): Function
+                called with the :py:class:`~openoa.analysis._progress.MonteCarloProgress` of the
+                simulations as the Monte Carlo simulation progresses, which includes the running
+                summary statistics of the AEP before the interannual variability is applied.
+                Defaults to None.
+            tolerance(:obj:`float`, optional): The relative standard error of the mean and P90
+                AEP at which the simulations are stopped, e.g., 0.001 for 0.1%, which is checked
+                after each :py:attr:`convergence_batch_size` simulations. The achieved precision is
+                stored in :py:attr:`precision`, and :py:attr:`num_sim` is set to the number of
+                simulations that were run. Defaults to None, which runs all :py:attr:`num_sim`
+                simulations.
+            convergence_batch_size(:obj:`int`): The number of simulations between each check of
+                the :py:attr:`tolerance`. Defaults to 500.
 
         Returns:
             None
@@ -381,6 +525,10 @@ class MonteCarloAEP(FromDictMixin, ResetValuesMixin):
         if ml_setup_kwargs is not None:
             initial_parameters["ml_setup_kwargs"] = self.ml_setup_kwargs
             self.ml_setup_kwargs = ml_setup_kwargs
+        if seed is not None:
+            initial_parameters["seed"] = self.seed
+            self.seed = seed
+        self._rng = AnalysisRandomState(self.seed)
 
         # Write parameters of run to the log file
         logged_params = dict(
@@ -391,13 +539,61 @@ class MonteCarloAEP(FromDictMixin, ResetValuesMixin):
             uncertainty_nan_energy=self.uncertainty_nan_energy,
             num_sim=self.num_sim,
             reanalysis_products=self.reanalysis_products,
+            seed=self.seed,
         )
         logger.info(f"Running with parameters: {logged_params}")
 
+        if vectorized and self.reg_model != "lin":
+            self.set_values(initial_parameters)
+            raise ValueError("The vectorized Monte Carlo is only available for linear regression.")
+
+        convergence = None
+        convergence_options = {}
+        if tolerance is not None:
+            convergence = ConvergenceCriterion(
+                tolerance, statistics=("mean", "p90"), batch_size=convergence_batch_size
+            )
+            convergence_options = dict(
+                tolerance=tolerance, convergence_batch_size=convergence_batch_size
+            )
+
         # Start the computation
         self.calculate_long_term_losses()
-        self.setup_monte_carlo_inputs()
-        self.results = self.run_AEP_monte_carlo(progress_bar=progress_bar)
+        cache_key = analysis_cache_key(self, n_workers=max(n_workers, 1), **convergence_options)
+        if load_cached_results(self, cache_key):
+            logger.info("Run results loaded from the cache")
+            self.set_values(initial_parameters)
+            return
+
+        if n_workers > 1:
+            self.results = self.run_AEP_monte_carlo_parallel(
+                n_workers=n_workers,
+                progress_bar=progress_bar,
+                vectorized=vectorized,
+                progress_callback=progress_callback,
+                convergence=convergence,
+            )
+        else:
+            self.setup_monte_carlo_inputs()
+            self.precompute_outlier_filters()
+            if vectorized:
+                self.results = self.run_AEP_monte_carlo_vectorized(
+                    progress_bar=progress_bar,
+                    progress_callback=progress_callback,
+                    convergence=convergence,
+                )
+            else:
+                self.results = self.run_AEP_monte_carlo(
+                    progress_bar=progress_bar,
+                    progress_callback=progress_callback,
+                    convergence=convergence,
+                )
+        self.precision = monte_carlo_precision(self.results.aep_GWh, ("mean", "p90"), tolerance)
+        # The regression coefficients are only set by the linear regression
+        cached_attributes = list(self.cached_attributes)
+        if self.reg_model == "lin":
+            cached_attributes.extend(["_mc_intercept", "_mc_slope"])
+        store_cached_results(self, cache_key, cached_attributes)
 
         # Log the completion of the run
         logger.info("Run completed")
@@ -707,20 +903,20 @@ class MonteCarloAEP(FromDictMixin, ResetValuesMixin):
         reanal_list = list(np.repeat(self.reanalysis_products, self.num_sim))
 
         inputs = {
-            "reanalysis_product": np.asarray(random.sample(reanal_list, self.num_sim)),
-            "metered_energy_fraction": np.random.normal(1, self.uncertainty_meter, self.num_sim),
-            "loss_fraction": np.random.normal(1, self.uncertainty_losses, self.num_sim),
-            "num_years_windiness": np.random.randint(
+            "reanalysis_product": np.asarray(self._rng.sample(reanal_list, self.num_sim)),
+            "metered_energy_fraction": self._rng.normal(1, self.uncertainty_meter, self.num_sim),
+            "loss_fraction": self._rng.normal(1, self.uncertainty_losses, self.num_sim),
+            "num_years_windiness": self._rng.integers(
                 self.uncertainty_windiness[0], self.uncertainty_windiness[1] + 1, self.num_sim
             ),
-            "loss_threshold": np.random.randint(
+            "loss_threshold": self._rng.integers(
                 self.uncertainty_loss_max[0], self.uncertainty_loss_max[1] + 1, self.num_sim
             )
             / 100.0,
         }
         if self.outlier_detection:
             inputs["outlier_threshold"] = (
-                np.random.randint(
+                self._rng.integers(
                     self.uncertainty_outlier[0] * 10,
                     (self.uncertainty_outlier[1] + 0.1) * 10,
                     self.num_sim,
@@ -730,66 +926,44 @@ class MonteCarloAEP(FromDictMixin, ResetValuesMixin):
 
         self.mc_inputs = pd.DataFrame(inputs)
 
-    @logged_method_call
-    def filter_outliers(self, n):
+    def _outlier_mask(
+        self, reanal: str, candidates: NDArrayBool, outlier_threshold: float | None
+    ) -> NDArrayBool:
         """
-        This function filters outliers based on a combination of range filter, unresponsive sensor
-        filter, and window filter.
-
-        We use a memoized funciton to store the regression data in a dictionary for each
-        combination as it comes up in the Monte Carlo simulation. This saves significant
-        computational time in not having to run robust linear regression for each Monte Carlo
-        iteration.
+        Applies the range, window, and outlier filters to the candidate rows of
+        :py:attr:`aggregate` for a reanalysis product.
 
         Args:
-            n(:obj:`float`): Monte Carlo iteration
+            reanal(:obj:`str`): The reanalysis product.
+            candidates(:obj:`numpy.ndarray`): Boolean mask of the rows of :py:attr:`aggregate` whose
+                combined losses are below the loss threshold, and that aren't flagged for NaNs.
+            outlier_threshold(:obj:`float` | None): The outlier threshold, if
+                :py:attr:`outlier_detection` is True.
 
         Returns:
-            :obj:`pandas.DataFrame`: Filtered monthly/daily data ready for linear regression
+            :obj:`numpy.ndarray`: Boolean mask of the valid rows of :py:attr:`aggregate`.
         """
-
-        reanal = self._run.reanalysis_product
-
-        # Check if valid data has already been calculated and stored. If so, just return it
-        if (reanal, self._run.loss_threshold) in self.outlier_filtering:
-            valid_data = self.outlier_filtering[(reanal, self._run.loss_threshold)]
-            return valid_data
-
-        # If valid data hasn't yet been stored in dictionary, determine the valid data
-        df = self.aggregate
-
-        # First set of filters checking combined losses and if the Nan data flag was on
-        df_sub = df.loc[
-            ((df["availability_pct"] + df["curtailment_pct"]) < self._run.loss_threshold)
-            & (~df["nan_flag"]),
-            :,
-        ]
-        if df_sub.size == 0:
-            raise ValueError(
-                "The `uncertainty_loss_max` is too low for the data or there are too many NaN values."
-            )
+        df_sub = self.aggregate.loc[candidates]
 
         # Set maximum range for using bin-filter, convert from MW to GWh
         plant_capac = self.plant.metadata.capacity / 1000.0 * self.resample_hours
 
-        # Apply range filter to wind speed
-        df_sub = df_sub.assign(flag_range=filters.range_flag(df_sub[reanal], lower=0, upper=40))
+        # Apply range filter to wind speed, and to temperature, in Kelvin
+        flag = filters.range_flag(df_sub[reanal], lower=0, upper=40).to_numpy()
         if self.reg_temperature:
-            # Apply range filter to temperature, in Kelvin
-            df_sub = df_sub.assign(
-                flag_range_T=filters.range_flag(
-                    df_sub[f"{reanal}_WMETR_EnvTmp"], lower=200, upper=320
-                )
-            )
+            flag |= filters.range_flag(
+                df_sub[f"{reanal}_WMETR_EnvTmp"], lower=200, upper=320
+            ).to_numpy()
+
         # Apply window range filter
-        df_sub.loc[:, "flag_window"] = filters.window_range_flag(
+        flag |= filters.window_range_flag(
             window_col=df_sub[reanal],
             window_start=5.0,
             window_end=40,
             value_col=df_sub["energy_gwh"],
             value_min=0.02 * plant_capac,
             value_max=1.2 * plant_capac,
-        )
+        ).to_numpy()
 
         if self.outlier_detection:
             if self.time_resolution in ("MS", "ME"):
@@ -801,62 +975,131 @@ class MonteCarloAEP(FromDictMixin, ResetValuesMixin):
                 y = df_sub["gross_energy_gwh"] * 30 / df_sub["num_days_expected"]
 
                 # Perform robust linear regression
-                rlm = sm.RLM(y, X, M=sm.robust.norms.HuberT(self._run.outlier_threshold))
+                rlm = sm.RLM(y, X, M=sm.robust.norms.HuberT(outlier_threshold))
                 rlm_results = rlm.fit()
 
                 # Define valid data as points in which the Huber algorithm returned a value of 1
-                df_sub.loc[:, "flag_outliers"] = rlm_results.weights != 1
+                flag |= np.asarray(rlm_results.weights != 1)
 
             else:
                 # Daily regressions (i.e., higher number of data points):
                 # Apply bin filter to catch outliers
-                df_sub.loc[:, "flag_outliers"] = filters.bin_filter(
-                    data=df_sub,
-                    bin_col="gross_energy_gwh",
-                    value_col=reanal,
-                    bin_width=0.06 * plant_capac,
-                    threshold=self._run.outlier_threshold,  # wind bin threshold (multiplicative factor of std of <value_col> in bin)
-                    center_type="median",
-                    bin_min=0.01 * plant_capac,
-                    bin_max=0.85 * plant_capac,
-                    threshold_type="std",
-                    direction="all",  # both left and right (from the median)
+                flag |= (
+                    filters.bin_filter(
+                        data=df_sub,
+                        bin_col="gross_energy_gwh",
+                        value_col=reanal,
+                        bin_width=0.06 * plant_capac,
+                        threshold=outlier_threshold,  # wind bin threshold (multiplicative factor of std of <value_col> in bin)
+                        center_type="median",
+                        bin_min=0.01 * plant_capac,
+                        bin_max=0.85 * plant_capac,
+                        threshold_type="std",
+                        direction="all",  # both left and right (from the median)
+                    )
+                    .reindex(df_sub.index)
+                    .to_numpy()
                 )
-        else:
-            df_sub.loc[:, "flag_outliers"] = False
 
-        # Create a 'final' flag which is true if any of the previous flags are true
-        df_sub.loc[:, "flag_final"] = df_sub[["flag_range", "flag_window", "flag_outliers"]].any(
-            axis=1
+        valid = np.zeros(candidates.size, dtype=bool)
+        valid[np.flatnonzero(candidates)[~flag]] = True
+        return valid
+
+    @logged_method_call
+    def precompute_outlier_filters(self) -> None:
+        """
+        Finds the valid data for every distinct combination of reanalysis product and loss
+        threshold sampled in :py:attr:`mc_inputs`, so the filters are run once for each distinct
+        outcome rather than as each combination comes up in the Monte Carlo simulation. As before,
+        the outlier threshold of a combination is the one sampled for its first simulation.
+
+        Loss thresholds that leave the same candidate rows share the result of the range, window,
+        and outlier filters, and the results are stored in :py:attr:`outlier_filtering` as boolean
+        masks over the rows of :py:attr:`aggregate`, where the combinations with the same valid
+        rows share the same mask.
+        """
+        self.outlier_filtering = {}
+        df = self.aggregate
+        losses = (df["availability_pct"] + df["curtailment_pct"]).to_numpy()
+        not_nan = ~df["nan_flag"].to_numpy(dtype=bool)
+
+        # The candidate rows for each loss threshold, before the range, window, and outlier filters
+        candidates = {}
+        for loss_threshold in self.mc_inputs.loss_threshold.unique():
+            mask = (losses < loss_threshold) & not_nan
+            if not mask.any():
+                raise ValueError(
+                    "The `uncertainty_loss_max` is too low for the data or there are too many NaN values."
+                )
+            candidates[loss_threshold] = mask
+
+        filtered = {}  # (product, candidate rows, outlier threshold) -> valid rows
+        masks = {}  # valid rows -> shared mask
+        first_runs = self.mc_inputs.drop_duplicates(["reanalysis_product", "loss_threshold"])
+        for run in first_runs.itertuples():
+            reanal = run.reanalysis_product
+            outlier_threshold = run.outlier_threshold if self.outlier_detection else None
+            rows = candidates[run.loss_threshold]
+            outcome = (reanal, rows.tobytes(), outlier_threshold)
+            if outcome not in filtered:
+                filtered[outcome] = self._outlier_mask(reanal, rows, outlier_threshold)
+            valid = filtered[outcome]
+            self.outlier_filtering[(reanal, run.loss_threshold)] = masks.setdefault(
+                valid.tobytes(), valid
+            )
+
+        logger.info(
+            f"Found {len(masks)} distinct outlier filtering results for {first_runs.shape[0]}"
+            " combinations of the Monte Carlo inputs"
         )
-        if self.reg_temperature:
-            df_sub.loc[:, "flag_final"] = df_sub[["flag_final", "flag_range_T"]].any(axis=1)
+
+    @logged_method_call
+    def filter_outliers(self, n):
+        """
+        This function filters outliers based on a combination of range filter, unresponsive sensor
+        filter, and window filter.
+
+        The valid data of each combination of inputs is looked up from the boolean masks
+        precomputed by :py:meth:`precompute_outlier_filters`, which saves significant computational
+        time in not having to run robust linear regression for each Monte Carlo iteration. Any
+        combination that is missing, e.g., if :py:attr:`mc_inputs` was modified, is filtered and
+        stored as it comes up in the Monte Carlo simulation.
+
+        Args:
+            n(:obj:`float`): Monte Carlo iteration
+
+        Returns:
+            :obj:`pandas.DataFrame`: Filtered monthly/daily data ready for linear regression
+        """
+
+        reanal = self._run.reanalysis_product
+        key = (reanal, self._run.loss_threshold)
+        valid = self.outlier_filtering.get(key)
+        if valid is None:
+            df = self.aggregate
+            candidates = (
+                ((df["availability_pct"] + df["curtailment_pct"]) < self._run.loss_threshold)
+                & (~df["nan_flag"])
+            ).to_numpy()
+            if not candidates.any():
+                raise ValueError(
+                    "The `uncertainty_loss_max` is too low for the data or there are too many NaN values."
+                )
+            outlier_threshold = self._run.outlier_threshold if self.outlier_detection else None
+            valid = self._outlier_mask(reanal, candidates, outlier_threshold)
+            self.outlier_filtering[key] = valid
 
         # Define valid data
-        valid_data = df_sub.loc[
-            ~df_sub.loc[:, "flag_final"],
-            [reanal, "energy_gwh", "availability_gwh", "curtailment_gwh"],
-        ]
+        columns = [reanal, "energy_gwh", "availability_gwh", "curtailment_gwh"]
         if self.reg_wind_direction:
-            add_cols = [
+            columns.extend(
                 f"{reanal}_{x}" for x in ("WMETR_HorWdDir", "WMETR_HorWdSpdU", "WMETR_HorWdSpdV")
-            ]
-            valid_data_to_add = df_sub.loc[~df_sub.loc[:, "flag_final"], add_cols]
-            valid_data = pd.concat([valid_data, valid_data_to_add], axis=1)
-
+            )
         if self.reg_temperature:
-            valid_data_to_add = df_sub.loc[~df_sub.loc[:, "flag_final"], [f"{reanal}_WMETR_EnvTmp"]]
-            valid_data = pd.concat([valid_data, valid_data_to_add], axis=1)
-
+            columns.append(f"{reanal}_WMETR_EnvTmp")
         if self.time_resolution in ("MS", "ME"):
-            valid_data_to_add = df_sub.loc[~df_sub.loc[:, "flag_final"], ["num_days_expected"]]
-            valid_data = pd.concat([valid_data, valid_data_to_add], axis=1)
-
-        # Update the dictionary
-        self.outlier_filtering[(reanal, self._run.loss_threshold)] = valid_data
-
-        # Return result
-        return valid_data
+            columns.append("num_days_expected")
+        return self.aggregate.loc[valid, columns]
 
     @logged_method_call
     def set_regression_data(self, n):
@@ -925,30 +1168,39 @@ class MonteCarloAEP(FromDictMixin, ResetValuesMixin):
         Returns:
             A trained regression model.
         """
-        reg_data = self.set_regression_data(n)  # Get regression data
-
-        # Bootstrap input data to incorporate some regression uncertainty
-        reg_data = np.array(reg_data.sample(frac=1.0, replace=True))
-
-        # Update Monte Carlo tracker fields
-        self._mc_num_points[n] = np.shape(reg_data)[0]
+        reg_data = self.set_regression_data(n).to_numpy()  # Get regression data
 
         # Run regression. Note, the last column of reg_data is the target variable for the regression
         # Linear regression
         if self.reg_model == "lin":
+            # Bootstrap input data to incorporate some regression uncertainty, as a weighted
+            # regression of the data points drawn at least once
+            weights = self._rng.bootstrap_weights(reg_data.shape[0])
+            self._mc_num_points[n] = weights.sum()
+            drawn = weights > 0
+            reg_data = reg_data[drawn]
+            weights = weights[drawn]
+
             reg = LinearRegression(n_jobs=self.n_jobs).fit(
-                np.array(reg_data[:, 0:-1]), reg_data[:, -1]
+                reg_data[:, 0:-1], reg_data[:, -1], sample_weight=weights
             )
-            predicted_y = reg.predict(np.array(reg_data[:, 0:-1]))
+            predicted_y = reg.predict(reg_data[:, 0:-1])
 
             self._mc_slope[n, :] = reg.coef_
             self._mc_intercept[n] = np.float64(reg.intercept_)
 
-            self._r2_score[n] = r2_score(reg_data[:, -1], predicted_y)
-            self._mse_score[n] = mean_squared_error(reg_data[:, -1], predicted_y)
+            self._r2_score[n] = r2_score(reg_data[:, -1], predicted_y, sample_weight=weights)
+            self._mse_score[n] = mean_squared_error(
+                reg_data[:, -1], predicted_y, sample_weight=weights
+            )
             return reg
         # Machine learning models
         else:
+            # Bootstrap input data to incorporate some regression uncertainty, where the resampled
+            # rows are kept in their drawn order for the cross validation folds
+            reg_data = reg_data[self._rng.bootstrap_indices(reg_data.shape[0])]
+            self._mc_num_points[n] = reg_data.shape[0]
+
             ml = MachineLearningSetup(algorithm=self.reg_model, **self.ml_setup_kwargs)
             if self.plant.log_level in ("WARNING", "ERROR", "CRITICAL", "INFO"):
                 verbosity = 0
@@ -968,6 +1220,7 @@ class MonteCarloAEP(FromDictMixin, ResetValuesMixin):
                     cv=KFold(n_splits=5),
                     verbose=verbosity,
                     n_jobs=self.n_jobs,
+                    random_state=self._rng.sklearn_random_state(),
                 )
                 # Store optimized hyperparameters for each reanalysis product
                 self.opt_model[(self._run.reanalysis_product)] = ml.opt_model
@@ -981,13 +1234,25 @@ class MonteCarloAEP(FromDictMixin, ResetValuesMixin):
             return self.opt_model[(self._run.reanalysis_product)]
 
     @logged_method_call
-    def run_AEP_monte_carlo(self, progress_bar: bool = True):
+    def run_AEP_monte_carlo(
+        self,
+        progress_bar: bool = True,
+        progress_callback: Callable[[MonteCarloProgress], None] | None = None,
+        convergence: ConvergenceCriterion | None = None,
+    ):
         """
         Loop through OA process a number of times and return array of AEP results each time
 
         Args:
             progress_bar(:obj:`bool`): Flag to use a progress bar for the iterations in the AEP
                 calculation. Defaults to ``True``.
+            progress_callback(:obj:`Callable[[MonteCarloProgress], None]`, optional): Function
+                called with the :py:class:`~openoa.analysis._progress.MonteCarloProgress` of the
+                simulations after each simulation, which includes the running summary statistics of
+                the AEP. Defaults to None.
+            convergence(:obj:`ConvergenceCriterion`, optional): The stopping rule for an adaptive
+                simulation, where the remaining simulations are dropped once it has been met.
+                Defaults to None.
 
         Returns:
             :obj:`numpy.ndarray` Array of AEP, long-term avail, long-term curtailment calculations
@@ -1017,6 +1282,8 @@ class MonteCarloAEP(FromDictMixin, ResetValuesMixin):
         iav = np.empty(num_sim)
 
         # Loop through number of simulations, run regression each time, store AEP results
+        report_progress = ProgressReporter(progress_callback, num_sim, "aep_GWh")
+        iav_seed = self._rng.derived_seed()
         _range = trange(num_sim) if progress_bar else np.arange(num_sim)
         for n in _range:
             self._run = self.mc_inputs.loc[n]
@@ -1034,27 +1301,8 @@ class MonteCarloAEP(FromDictMixin, ResetValuesMixin):
             gross_lt = fitted_model.predict(inputs)
 
             # Get POR gross energy by applying regression result to POR regression inputs
-            reg_inputs_por = [self.reanalysis_por[self._run.reanalysis_product]]
-            if self.reg_temperature:
-                reg_inputs_por += [
-                    self.reanalysis_por[self._run.reanalysis_product + "_WMETR_EnvTmp"]
-                ]
-            if self.reg_wind_direction:
-                reg_inputs_por += [
-                    np.sin(
-                        np.deg2rad(
-                            self.reanalysis_por[self._run.reanalysis_product + "_WMETR_HorWdDir"]
-                        )
-                    )
-                ]
-                reg_inputs_por += [
-                    np.cos(
-                        np.deg2rad(
-                            self.reanalysis_por[self._run.reanalysis_product + "_WMETR_HorWdDir"]
-                        )
-                    )
-                ]
-            gross_por = fitted_model.predict(np.array(pd.concat(reg_inputs_por, axis=1)))
+            reg_inputs_por = self.por_regression_inputs(self._run.reanalysis_product)
+            gross_por = fitted_model.predict(reg_inputs_por)
 
             # Create padans dataframe for gross_por and group by calendar date to have a single full year
             gross_por = self.groupby_time_res(
@@ -1098,18 +1346,403 @@ class MonteCarloAEP(FromDictMixin, ResetValuesMixin):
             )
             lt_por_ratio[n] = (gross_lt.sum() / self._run.num_years_windiness) / gps
 
+            report_progress(n + 1, aep_GWh[: n + 1])
+            if convergence is not None and convergence.check(
+                n + 1,
+                lambda: self._iav_adjusted_aep(
+                    aep_GWh[: n + 1], iav[: n + 1], self.apply_iav, iav_seed
+                ),
+            ):
+                num_sim = n + 1
+                self._truncate_simulations(num_sim)
+                break
+
+        return self.compile_simulation_results(
+            aep_GWh[:num_sim],
+            avail_pct[:num_sim],
+            curt_pct[:num_sim],
+            lt_por_ratio[:num_sim],
+            iav[:num_sim],
+        )
+
+    @logged_method_call
+    def run_AEP_monte_carlo_vectorized(
+        self,
+        progress_bar: bool = True,
+        batch_size: int = 1000,
+        progress_callback: Callable[[MonteCarloProgress], None] | None = None,
+        convergence: ConvergenceCriterion | None = None,
+    ) -> pd.DataFrame:
+        """
+        Vectorized version of :py:meth:`run_AEP_monte_carlo` for the linear regression model. The
+        simulations are processed in batches, where the bootstrapped regression data of all the
+        simulations sharing a reanalysis product and loss threshold are stacked, and fit at once
+        using the normal equations. The long-term and period of record gross energy, IAV, and
+        long-term losses are then computed for every simulation in the batch with array operations.
+
+        The bootstrap samples are drawn in the same order as in :py:meth:`run_AEP_monte_carlo`, so
+        for the same random state, the results are the same as the iterative calculation.
+
+        Args:
+            progress_bar(:obj:`bool`): Flag to use a progress bar for the batches in the AEP
+                calculation. Defaults to ``True``.
+            batch_size(:obj:`int`): The maximum number of simulations to process at once, which
+                limits the memory used by the stacked regression data. Defaults to 1000.
+            progress_callback(:obj:`Callable[[MonteCarloProgress], None]`, optional): Function
+                called with the :py:class:`~openoa.analysis._progress.MonteCarloProgress` of the
+                simulations after each batch, which includes the running summary statistics of the
+                AEP. Defaults to None.
+            convergence(:obj:`ConvergenceCriterion`, optional): The stopping rule for an adaptive
+                simulation, which is checked after each batch, where the remaining simulations are
+                dropped once it has been met. The batches are no larger than the batch size of the
+                stopping rule. Defaults to None.
+
+        Returns:
+            :obj:`pandas.DataFrame`: The simulation results.
+        """
+        num_sim = self.num_sim
+        monthly = self.time_resolution in ("MS", "ME")
+        if convergence is not None:
+            batch_size = min(batch_size, convergence.batch_size)
+
+        self._mc_num_points = np.empty(num_sim, dtype=np.float64)
+        self._r2_score = np.empty(num_sim, dtype=np.float64)
+        self._mse_score = np.empty(num_sim, dtype=np.float64)
+        self._mc_intercept = np.empty(num_sim, dtype=np.float64)
+        self._mc_slope = np.empty([num_sim, 1 + 2 * self.reg_wind_direction + self.reg_temperature])
+
+        aep_GWh = np.empty(num_sim)
+        avail_pct = np.empty(num_sim)
+        curt_pct = np.empty(num_sim)
+        lt_por_ratio = np.empty(num_sim)
+        iav = np.empty(num_sim)
+
+        product = self.mc_inputs.reanalysis_product.to_numpy()
+        loss_threshold = self.mc_inputs.loss_threshold.to_numpy()
+        num_years = self.mc_inputs.num_years_windiness.to_numpy()
+        meter_fraction = self.mc_inputs.metered_energy_fraction.to_numpy()
+        loss_fraction = self.mc_inputs.loss_fraction.to_numpy()
+
+        # Filtered regression data for each (reanalysis product, loss threshold) combination
+        regression_data = {}
+        por_inputs = {}
+        if monthly:
+            last_month = self._reanalysis_aggregate.index[-1].month
+            num_days_lt = np.array(self.num_days_lt)
+            num_days_lt_shifted = np.roll(num_days_lt, 12 - last_month)
+
+        pbar = tqdm(total=num_sim) if progress_bar else None
+        report_progress = ProgressReporter(progress_callback, num_sim, "aep_GWh")
+        iav_seed = self._rng.derived_seed()
+        for start in range(0, num_sim, batch_size):
+            sims = np.arange(start, min(start + batch_size, num_sim))
+
+            # Draw the bootstrap weights in simulation order to match the iterative approach
+            bootstrap = {}
+            for n in sims:
+                key = (product[n], loss_threshold[n])
+                if key not in regression_data:
+                    self._run = self.mc_inputs.loc[n]
+                    valid_data = self.filter_outliers(n)
+                    regression_data[key] = (
+                        self.set_regression_data(n).to_numpy()[:, :-1],
+                        valid_data["energy_gwh"].to_numpy(),
+                        valid_data["availability_gwh"].to_numpy(),
+                        valid_data["curtailment_gwh"].to_numpy(),
+                        valid_data["num_days_expected"].to_numpy() if monthly else None,
+                    )
+                n_points = regression_data[key][0].shape[0]
+                bootstrap[n] = self._rng.bootstrap_weights(n_points)
+
+            keys = pd.MultiIndex.from_arrays([product[sims], loss_threshold[sims]])
+            for key in keys.unique():
+                ix = sims[keys == key]
+                X, energy, availability, curtailment, num_days = regression_data[key]
+                weights = np.stack([bootstrap[n] for n in ix])
+
+                # Monte Carlo sample the gross energy for each simulation, and normalize to 30 days
+                mf = meter_fraction[ix, None]
+                lf = loss_fraction[ix, None]
+                y = energy * mf + availability * lf + curtailment * lf
+                if monthly:
+                    y = y * 30 / num_days
+
+                # Fit the bootstrap resamples as weighted regressions of the filtered data
+                intercept, coef, r2, mse = batched_linear_regression(X, y, weights)
+                self._mc_num_points[ix] = weights.sum(axis=1)
+                self._mc_intercept[ix] = intercept
+                self._mc_slope[ix] = coef
+                self._r2_score[ix] = r2
+                self._mse_score[ix] = mse
+
+                # Period of record gross energy, grouped by calendar date to have a single full year
+                reanalysis_product = key[0]
+                if reanalysis_product not in por_inputs:
+                    por_inputs[reanalysis_product] = self.por_regression_inputs(reanalysis_product)
+                gross_por = self.groupby_time_res(
+                    pd.DataFrame(
+                        data=por_inputs[reanalysis_product] @ coef.T + intercept,
+                        index=self.reanalysis_por.index,
+                    )
+                ).to_numpy()
+                if monthly:  # Undo normalization to 30-day months
+                    gross_por = gross_por * num_days_lt[:, None] / 30
+                gross_por = gross_por.sum(axis=0)
+
+                # Long-term gross energy for each number of years used in the windiness correction
+                for years in np.unique(num_years[ix]):
+                    ix_years = num_years[ix] == years
+                    n = ix[ix_years]
+                    self._run = self.mc_inputs.loc[n[0]]
+                    reg_inputs_lt = self.sample_long_term_reanalysis()
+
+                    gross_lt = reg_inputs_lt.to_numpy() @ coef[ix_years].T + intercept[ix_years]
+                    if monthly:  # Undo normalization to 30-day months
+                        gross_lt = gross_lt * np.tile(num_days_lt_shifted, years)[:, None] / 30
+                    gross_lt = pd.DataFrame(gross_lt, index=reg_inputs_lt.index)
+                    gross_lt_sum = gross_lt.to_numpy().sum(axis=0)
+
+                    # Annual values of lt gross energy, needed for IAV. Note that the index of
+                    # gross_lt is aligned to the start of the month, as in the iterative approach
+                    gross_lt_annual = get_annual_values(gross_lt)
+                    iav[n] = gross_lt_annual.std(axis=0) / gross_lt_annual.mean(axis=0)
+
+                    # Long-term losses, using gross_lt to weight individual monthly/daily losses
+                    gross_lt_avg = self.groupby_time_res(gross_lt.rename_axis("time"))
+                    avail_lt_losses = (
+                        gross_lt_avg.mul(self.long_term_losses[0], axis=0).sum()
+                        / gross_lt_avg.sum()
+                    ).to_numpy() * loss_fraction[n]
+                    curt_lt_losses = (
+                        gross_lt_avg.mul(self.long_term_losses[1], axis=0).sum()
+                        / gross_lt_avg.sum()
+                    ).to_numpy() * loss_fraction[n]
+
+                    aep_GWh[n] = gross_lt_sum / years * (1 - avail_lt_losses)
+                    avail_pct[n] = avail_lt_losses
+                    curt_pct[n] = curt_lt_losses
+                    lt_por_ratio[n] = (gross_lt_sum / years) / gross_por[ix_years]
+
+            if pbar is not None:
+                pbar.update(sims.size)
+            completed = sims[-1] + 1
+            report_progress(completed, aep_GWh[:completed])
+            if convergence is not None and convergence.check(
+                completed,
+                lambda: self._iav_adjusted_aep(
+                    aep_GWh[:completed], iav[:completed], self.apply_iav, iav_seed
+                ),
+            ):
+                num_sim = completed
+                self._truncate_simulations(num_sim)
+                break
+        if pbar is not None:
+            pbar.close()
+
+        return self.compile_simulation_results(
+            aep_GWh[:num_sim],
+            avail_pct[:num_sim],
+            curt_pct[:num_sim],
+            lt_por_ratio[:num_sim],
+            iav[:num_sim],
+        )
+
+    @logged_method_call
+    def run_AEP_monte_carlo_parallel(
+        self,
+        n_workers: int,
+        progress_bar: bool = True,
+        vectorized: bool = False,
+        progress_callback: Callable[[MonteCarloProgress], None] | None = None,
+        convergence: ConvergenceCriterion | None = None,
+    ) -> pd.DataFrame:
+        """
+        Splits the Monte Carlo simulations into chunks that are run across :py:attr:`n_workers`
+        processes, each with its own copy of the analysis, whose long-term losses have already
+        been calculated, and an independent random stream spawned from a seed drawn from the
+        analysis' random state. The interannual variability is applied once all of the chunks are
+        combined, so that the mean IAV of all of the simulations is used.
+
+        Args:
+            n_workers(:obj:`int`): The number of worker processes to use.
+            progress_bar(:obj:`bool`): Flag to use a progress bar for the completed simulations.
+                Defaults to ``True``.
+            vectorized(:obj:`bool`): Flag to use :py:meth:`run_AEP_monte_carlo_vectorized` in each
+                worker. Defaults to ``False``.
+            progress_callback(:obj:`Callable[[MonteCarloProgress], None]`, optional): Function
+                called with the :py:class:`~openoa.analysis._progress.MonteCarloProgress` of the
+                simulations as each chunk of simulations completes, which includes the running
+                summary statistics of the AEP. Defaults to None.
+            convergence(:obj:`ConvergenceCriterion`, optional): The stopping rule for an adaptive
+                simulation, which is checked as each chunk completes, where the remaining chunks
+                are cancelled once it has been met. Defaults to None.
+
+        Returns:
+            :obj:`pandas.DataFrame`: The simulation results.
+        """
+        result_attributes = ["mc_inputs", "results"]
+        if self.reg_model == "lin":
+            result_attributes.extend(["_mc_slope", "_mc_intercept"])
+
+        # The IAV is applied after the results of all of the workers are combined, so the workers
+        # don't apply it, while the convergence checks use the analysis' setting
+        apply_iav = self.apply_iav
+        iav_seed = self._rng.derived_seed()
+        self.apply_iav = False
+        try:
+            merged = run_parallel_monte_carlo(
+                self,
+                num_sim=self.num_sim,
+                n_workers=n_workers,
+                result_attributes=result_attributes,
+                run_kwargs={"vectorized": vectorized},
+                seed=self._rng.spawn_seed(),
+                progress_bar=progress_bar,
+                progress=ProgressReporter(progress_callback, self.num_sim, "aep_GWh"),
+                progress_values=lambda chunk: chunk["results"]["aep_GWh"],
+                convergence=convergence,
+                convergence_values=lambda merged: self._iav_adjusted_aep(
+                    merged["results"]["aep_GWh"].to_numpy(),
+                    merged["results"]["iav"].to_numpy(),
+                    apply_iav,
+                    iav_seed,
+                ),
+            )
+        finally:
+            self.apply_iav = apply_iav
+
+        self.mc_inputs = merged["mc_inputs"]
+        if self.reg_model == "lin":
+            self._mc_slope = merged["_mc_slope"]
+            self._mc_intercept = merged["_mc_intercept"]
+
+        results = merged["results"]
+        self.num_sim = results.shape[0]
+        self._r2_score = results["r2"].to_numpy()
+        self._mse_score = results["mse"].to_numpy()
+        self._mc_num_points = results["n_points"].to_numpy()
+        return self.compile_simulation_results(
+            results["aep_GWh"].to_numpy(),
+            results["avail_pct"].to_numpy(),
+            results["curt_pct"].to_numpy(),
+            results["lt_por_ratio"].to_numpy(),
+            results["iav"].to_numpy(),
+        )
+
+    def _simulate(self, vectorized: bool = False) -> None:
+        """
+        Sets up and runs the Monte Carlo simulations of a chunk of
+        :py:meth:`run_AEP_monte_carlo_parallel` in a worker process, whose copy of the analysis
+        already has the long-term losses of the run.
+
+        Args:
+            vectorized(:obj:`bool`): Flag to use :py:meth:`run_AEP_monte_carlo_vectorized`.
+                Defaults to ``False``.
+        """
+        self.setup_monte_carlo_inputs()
+        self.precompute_outlier_filters()
+        if vectorized:
+            self.results = self.run_AEP_monte_carlo_vectorized(progress_bar=False)
+        else:
+            self.results = self.run_AEP_monte_carlo(progress_bar=False)
+
+    @logged_method_call
+    def por_regression_inputs(self, reanalysis_product: str) -> NDArrayFloat:
+        """
+        Creates the period of record regression inputs (wind speed, and temperature and wind
+        direction, if used) for a reanalysis product, in the same column order as the regression.
+
+        Args:
+            reanalysis_product(:obj:`str`): The reanalysis product to use.
+
+        Returns:
+            :obj:`numpy.ndarray`: The period of record regression inputs.
+        """
+        reg_inputs_por = [self.reanalysis_por[reanalysis_product]]
+        if self.reg_temperature:
+            reg_inputs_por += [self.reanalysis_por[reanalysis_product + "_WMETR_EnvTmp"]]
+        if self.reg_wind_direction:
+            wd = np.deg2rad(self.reanalysis_por[reanalysis_product + "_WMETR_HorWdDir"])
+            reg_inputs_por += [np.sin(wd), np.cos(wd)]
+        return np.array(pd.concat(reg_inputs_por, axis=1))
+
+    @staticmethod
+    def _iav_adjusted_aep(
+        aep_GWh: NDArrayFloat,
+        iav: NDArrayFloat,
+        apply_iav: bool,
+        seed: np.random.SeedSequence,
+    ) -> NDArrayFloat:
+        """
+        Approximates the AEP of the completed simulations with the interannual variability applied,
+        which is used to check the convergence of an adaptive simulation. The IAV is sampled from a
+        random stream derived from the analysis' random state by
+        :py:meth:`~openoa.analysis._random.AnalysisRandomState.derived_seed`, so the analysis'
+        draws are unchanged, and each check of a run uses the same draws for the same simulations.
+
+        Args:
+            aep_GWh(:obj:`numpy.ndarray`): The AEP of each completed simulation, in GWh.
+            iav(:obj:`numpy.ndarray`): The interannual variability of each completed simulation.
+            apply_iav(:obj:`bool`): Flag to apply the interannual variability.
+            seed(:obj:`numpy.random.SeedSequence`): The seed of the run's IAV draws.
+
+        Returns:
+            :obj:`numpy.ndarray`: The AEP of each completed simulation, in GWh.
+        """
+        if not apply_iav:
+            return aep_GWh
+        z = np.random.default_rng(seed).standard_normal(aep_GWh.size)
+        return aep_GWh * (1 + iav.mean() * z)
+
+    def _truncate_simulations(self, num_sim: int) -> None:
+        """
+        Drops the Monte Carlo inputs and regression metrics of the simulations that were not run
+        because an adaptive simulation converged.
+
+        Args:
+            num_sim(:obj:`int`): The number of completed simulations.
+        """
+        names = ["mc_inputs", "_mc_num_points", "_r2_score", "_mse_score"]
+        if self.reg_model == "lin":
+            names.extend(["_mc_intercept", "_mc_slope"])
+        truncate_simulations(self, names, num_sim)
+
+    @logged_method_call
+    def compile_simulation_results(
+        self,
+        aep_GWh: NDArrayFloat,
+        avail_pct: NDArrayFloat,
+        curt_pct: NDArrayFloat,
+        lt_por_ratio: NDArrayFloat,
+        iav: NDArrayFloat,
+    ) -> pd.DataFrame:
+        """
+        Applies the interannual variability (if used) to the results of the individual Monte Carlo
+        simulations, and combines them with the regression metrics.
+
+        Args:
+            aep_GWh(:obj:`numpy.ndarray`): The AEP of each simulation, in GWh.
+            avail_pct(:obj:`numpy.ndarray`): The long-term availability loss of each simulation.
+            curt_pct(:obj:`numpy.ndarray`): The long-term curtailment loss of each simulation.
+            lt_por_ratio(:obj:`numpy.ndarray`): The ratio of long-term to period of record gross
+                energy of each simulation.
+            iav(:obj:`numpy.ndarray`): The interannual variability of each simulation.
+
+        Returns:
+            :obj:`pandas.DataFrame`: The simulation results.
+        """
         # Calculate mean IAV for gross energy
         iav_avg = iav.mean()
 
         # Apply IAV to AEP from single MC iterations
         if self.apply_iav:
-            iav_nsim = np.random.normal(1, iav_avg, self.num_sim)
+            iav_nsim = self._rng.normal(1, iav_avg, self.num_sim)
             aep_GWh = aep_GWh * iav_nsim
             lt_por_ratio = lt_por_ratio * iav_nsim
 
         # Return final output
         sim_results = pd.DataFrame(
-            index=np.arange(num_sim),
+            index=np.arange(self.num_sim),
             data={
                 "aep_GWh": aep_GWh,
                 "avail_pct": avail_pct,
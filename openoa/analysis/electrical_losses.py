@@ -7,13 +7,13 @@ from __future__ import annotations
 
 import datetime
 from copy import deepcopy
+from typing import Callable
 
 import attrs
 import numpy as np
 import pandas as pd
 import numpy.typing as npt
 import matplotlib.pyplot as plt
-from tqdm import tqdm
 from attrs import field, define
 
 import openoa.utils.timeseries as ts
@@ -21,6 +21,15 @@ from openoa.plant import PlantData
 from openoa.schema import FromDictMixin, ResetValuesMixin
 from openoa.logging import logging, logged_method_call
 from openoa.utils.plot import set_styling
+from openoa.utils.cache import (
+    ResultCache,
+    convert_to_cache,
+    analysis_cache_key,
+    load_cached_results,
+    store_cached_results,
+)
+from openoa.analysis._random import SEED_TYPES, AnalysisRandomState
+from openoa.analysis._progress import ProgressReporter, MonteCarloProgress
 from openoa.analysis._analysis_validators import validate_UQ_input, validate_half_closed_0_1_right
 
 logger = logging.getLogger(__name__)
@@ -31,6 +40,9 @@ NDArrayFloat = npt.NDArray[np.float64]
 MINUTES_PER_HOUR = 60
 HOURS_PER_DAY = 24
 
+# The maximum number of times the progress callback is called, evenly spaced over the simulations
+MAX_PROGRESS_REPORTS = 1000
+
 
 @define(auto_attribs=True)
 class ElectricalLosses(FromDictMixin, ResetValuesMixin):
@@ -69,6 +81,13 @@ class ElectricalLosses(FromDictMixin, ResetValuesMixin):
             the range of (0, 1), under which months should be eliminated. If :py:attr:`UQ` = True,
             then a 2-element tuple containing an upper and lower bound for a randomly selected value
             should be given, otherwise, a scalar value should be provided.
+        seed(:obj:`int` | :obj:`numpy.random.SeedSequence` | :obj:`numpy.random.Generator` | :obj:`None`):
+            The seed, or generator, for the Monte Carlo sampling. A new generator is created from
+            the seed at the start of each :py:meth:`run`, so the same seed reproduces the same
+            results. Defaults to None, which uses NumPy's global random state.
+        cache(:obj:`ResultCache` | :obj:`str` | :obj:`pathlib.Path` | :obj:`None`): The cache, or
+            cache directory, used to store and reload the results of runs seeded with an integer
+            :py:attr:`seed`. See :py:class:`openoa.utils.cache.ResultCache`. Defaults to None.
     """
 
     plant: PlantData = field(converter=deepcopy, validator=attrs.validators.instance_of(PlantData))
@@ -79,6 +98,10 @@ class ElectricalLosses(FromDictMixin, ResetValuesMixin):
     uncertainty_correction_threshold: NDArrayFloat | tuple[float, float] | float = field(
         default=(0.9, 0.995), validator=(validate_UQ_input, validate_half_closed_0_1_right)
     )
+    seed: int | np.random.SeedSequence | np.random.Generator | None = field(
+        default=None, validator=attrs.validators.instance_of(SEED_TYPES)
+    )
+    cache: ResultCache | None = field(default=None, converter=convert_to_cache)
 
     # Internally created attributes need to be given a type before usage
     monthly_meter: bool = field(default=False, init=False)
@@ -91,6 +114,7 @@ class ElectricalLosses(FromDictMixin, ResetValuesMixin):
     combined_energy: pd.DataFrame = field(init=False)
     total_turbine_energy: pd.DataFrame = field(init=False)
     total_meter_energy: pd.DataFrame = field(init=False)
+    _rng: AnalysisRandomState = field(init=False)
     run_parameters: list[str] = field(
         init=False,
         default=[
@@ -99,6 +123,14 @@ class ElectricalLosses(FromDictMixin, ResetValuesMixin):
             "uncertainty_meter",
             "uncertainty_scada",
             "uncertainty_correction_threshold",
+            "seed",
+        ],
+    )
+    cached_attributes: list[str] = field(
+        init=False,
+        default=[
+            "inputs",
+            "electrical_losses",
         ],
     )
 
@@ -115,6 +147,8 @@ class ElectricalLosses(FromDictMixin, ResetValuesMixin):
 
         logger.info("Initializing Electrical Losses Object")
 
+        self._rng = AnalysisRandomState(self.seed)
+
         # Check that selected UQ is allowed and reset num_sim if no UQ
         if self.UQ:
             logger.info("Note: uncertainty quantification will be performed in the calculation")
@@ -135,6 +169,8 @@ class ElectricalLosses(FromDictMixin, ResetValuesMixin):
         uncertainty_meter: NDArrayFloat | float = None,
         uncertainty_scada: NDArrayFloat | float = None,
         uncertainty_correction_threshold: NDArrayFloat | tuple[float, float] | float = None,
+        seed: int | np.random.SeedSequence | np.random.Generator | None = None,
+        progress_callback: Callable[[MonteCarloProgress], None] | None = None,
     ):
         """
         Run the electrical losses calculation.
@@ -152,6 +188,13 @@ class ElectricalLosses(FromDictMixin, ResetValuesMixin):
                 the range of (0, 1], under which months should be eliminated. If :py:attr:`UQ` = True,
                 then a 2-element tuple containing an upper and lower bound for a randomly selected value
                 should be given, otherwise, a scalar value should be provided.
+            seed(:obj:`int` | :obj:`numpy.random.SeedSequence` | :obj:`numpy.random.Generator` | :obj:`None`):
+                The seed, or generator, for the Monte Carlo sampling. Defaults to None, which uses
+                :py:attr:`seed`.
+            progress_callback(:obj:`Callable[[MonteCarloProgress], None]`, optional): Function
+                called with the :py:class:`~openoa.analysis._progress.MonteCarloProgress` of the
+                simulations as the simulations progress, which includes the running summary
+                statistics of the electrical losses. Defaults to None.
         """
         initial_parameters = {}
         if num_sim is not None:
@@ -173,10 +216,21 @@ class ElectricalLosses(FromDictMixin, ResetValuesMixin):
                 self.uncertainty_correction_threshold
             )
             self.uncertainty_correction_threshold = uncertainty_correction_threshold
+        if seed is not None:
+            initial_parameters["seed"] = self.seed
+            self.seed = seed
+        self._rng = AnalysisRandomState(self.seed)
+
+        cache_key = analysis_cache_key(self)
+        if load_cached_results(self, cache_key):
+            logger.info("Run results loaded from the cache")
+            self.set_values(initial_parameters)
+            return
 
         # Setup Monte Carlo approach, and calculate the electrical losses
         self.setup_inputs()
-        self.calculate_electrical_losses()
+        self.calculate_electrical_losses(progress_callback=progress_callback)
+        store_cached_results(self, cache_key)
 
         # Reset the class arguments back to the initialized values
         self.set_values(initial_parameters)
@@ -193,9 +247,9 @@ class ElectricalLosses(FromDictMixin, ResetValuesMixin):
             )
             integer_multiplier = 10**n_decimal
             inputs = {
-                "meter_data_fraction": np.random.normal(1, self.uncertainty_meter, self.num_sim),
-                "scada_data_fraction": np.random.normal(1, self.uncertainty_scada, self.num_sim),
-                "correction_threshold": np.random.randint(
+                "meter_data_fraction": self._rng.normal(1, self.uncertainty_meter, self.num_sim),
+                "scada_data_fraction": self._rng.normal(1, self.uncertainty_scada, self.num_sim),
+                "correction_threshold": self._rng.integers(
                     self.uncertainty_correction_threshold[0] * integer_multiplier,
                     self.uncertainty_correction_threshold[1] * integer_multiplier,
                     self.num_sim,
@@ -272,61 +326,95 @@ class ElectricalLosses(FromDictMixin, ResetValuesMixin):
         # Keep only data with all turbines reporting for every time step during the day
         self.meter_daily = self.meter_daily[self.meter_daily["count"] == expected_count]
 
+    def _concurrent_energy(self) -> tuple[pd.DataFrame, np.ndarray]:
+        """Combines the turbine and meter energy of each concurrent period, which are the months of
+        monthly meter data, or otherwise the days when the meter and all turbines are reporting at
+        all time steps.
+
+        Returns:
+            tuple[pd.DataFrame, np.ndarray]: The combined energy of each concurrent period, and the
+                turbine availability of each period, which is checked against the correction
+                threshold of each simulation for monthly meter data, and is infinite otherwise.
+        """
+        # If monthly meter data, sum the corrected daily turbine energy to monthly and merge
+        if self.monthly_meter:
+            scada_monthly = self.scada_daily.resample("MS")["corrected_energy"].sum().to_frame()
+            scada_monthly.columns = ["WTUR_SupWh"]
+
+            # Determine availability for each month represented
+            scada_monthly["count"] = self.scada_sum.resample("MS")["count"].sum()
+            scada_monthly["expected_count_monthly"] = (
+                scada_monthly.index.daysinmonth
+                * HOURS_PER_DAY
+                * MINUTES_PER_HOUR
+                / (ts.offset_to_seconds(self.plant.metadata.scada.frequency) / 60)
+                * self.plant.n_turbines
+            )
+            scada_monthly["percent"] = (
+                scada_monthly["count"] / scada_monthly["expected_count_monthly"]
+            )
+            combined_energy = self.plant.meter.join(
+                scada_monthly, lsuffix="_meter", rsuffix="_scada"
+            ).dropna()
+            return combined_energy, combined_energy["percent"].to_numpy()
+
+        # If sub-monthly meter data, merge the daily data for which all turbines are reporting at
+        # all timestamps. Note 'self.scada_full_count' only contains full reported data
+        combined_energy = self.meter_daily.join(
+            self.scada_full_count, lsuffix="_meter", rsuffix="_scada"
+        ).dropna()
+        return combined_energy, np.full(combined_energy.shape[0], np.inf)
+
     @logged_method_call
-    def calculate_electrical_losses(self):
+    def calculate_electrical_losses(
+        self,
+        progress_callback: Callable[[MonteCarloProgress], None] | None = None,
+    ):
         """
         Apply Monte Carlo approach to calculate electrical losses and their uncertainty based on the
         difference in the sum of turbine and metered energy over the compiled days.
-        """
-        logger.info("Calculating electrical losses")
 
-        # Loop through number of simulations, calculate losses each time, store results
-        for n in tqdm(np.arange(self.num_sim)):
-            _run = self.inputs.loc[n]
-            meter_df = self.plant.meter.copy()
-
-            # If monthly meter data, sum the corrected daily turbine energy to monthly and merge
-            if self.monthly_meter:
-                scada_monthly = self.scada_daily.resample("MS")["corrected_energy"].sum().to_frame()
-                scada_monthly.columns = ["WTUR_SupWh"]
-
-                # Determine availability for each month represented
-                scada_monthly["count"] = self.scada_sum.resample("MS")["count"].sum()
-                scada_monthly["expected_count_monthly"] = (
-                    scada_monthly.index.daysinmonth
-                    * HOURS_PER_DAY
-                    * MINUTES_PER_HOUR
-                    / (pd.to_timedelta(self.plant.scada.frequency).total_seconds() / 60)
-                    * self.plant.n_turbines
-                )
-                scada_monthly["percent"] = (
-                    scada_monthly["count"] / scada_monthly["expected_count_monthly"]
-                )
-
-                # Filter out months in which there was less than x% of total running (all turbines at all timesteps)
-                scada_monthly = scada_monthly.loc[
-                    scada_monthly["percent"] >= _run.correction_threshold, :
-                ]
-                self.combined_energy = meter_df.join(
-                    scada_monthly, lsuffix="_meter", rsuffix="_scada"
-                )
+        The turbine and meter energy of the concurrent periods are combined once, and sorted by
+        their availability, so the total energy of the periods that meet each simulation's
+        correction threshold is a lookup in their cumulative sums, and all of the simulations are
+        computed at once.
 
-            # If sub-monthly meter data, merge the daily data for which all turbines are reporting at all timestamps
-            else:
-                # Note 'self.scada_full_count' only contains full reported data
-                self.combined_energy = self.meter_daily.join(
-                    self.scada_full_count, lsuffix="_meter", rsuffix="_scada"
-                )
-
-            # Drop non-concurrent timestamps and get total sums over concurrent period of record
-            self.combined_energy.dropna(inplace=True)
-            merge_sum = self.combined_energy.sum(axis=0)
-
-            # Calculate electrical loss from difference of sum of turbine and meter energy
-            self.total_turbine_energy = merge_sum["WTUR_SupWh"] * _run.scada_data_fraction
-            self.total_meter_energy = merge_sum["MMTR_SupWh"] * _run.meter_data_fraction
+        Args:
+            progress_callback(:obj:`Callable[[MonteCarloProgress], None]`, optional): Function
+                called with the :py:class:`~openoa.analysis._progress.MonteCarloProgress` of the
+                simulations after each simulation, or at most :py:attr:`MAX_PROGRESS_REPORTS` times,
+                which includes the running summary statistics of the electrical losses. Defaults to
+                None.
+        """
+        logger.info("Calculating electrical losses")
 
-            self.electrical_losses[n] = 1 - self.total_meter_energy / self.total_turbine_energy
+        # Sort the concurrent periods from the highest to lowest availability, and sum their energy
+        combined_energy, percent = self._concurrent_energy()
+        order = np.argsort(-percent, kind="stable")
+        turbine_energy = np.append(0, combined_energy["WTUR_SupWh"].to_numpy()[order].cumsum())
+        meter_energy = np.append(0, combined_energy["MMTR_SupWh"].to_numpy()[order].cumsum())
+
+        # Sum the energy of the periods that meet each simulation's correction threshold, with the
+        # Monte Carlo sampled uncertainty of the SCADA and meter data
+        threshold = self.inputs["correction_threshold"].to_numpy(dtype=float)
+        n_periods = np.searchsorted(-percent[order], -threshold, side="right")
+        total_turbine_energy = (
+            turbine_energy[n_periods] * self.inputs["scada_data_fraction"].to_numpy()
+        )
+        total_meter_energy = meter_energy[n_periods] * self.inputs["meter_data_fraction"].to_numpy()
+        with np.errstate(divide="ignore", invalid="ignore"):
+            self.electrical_losses = (1 - total_meter_energy / total_turbine_energy).reshape(-1, 1)
+
+        # Keep the combined energy and totals of the last simulation
+        self.combined_energy = combined_energy.loc[percent >= threshold[-1]]
+        self.total_turbine_energy = total_turbine_energy[-1]
+        self.total_meter_energy = total_meter_energy[-1]
+
+        report_progress = ProgressReporter(progress_callback, self.num_sim, "electrical_losses")
+        if progress_callback is not None:
+            n_reports = min(self.num_sim, MAX_PROGRESS_REPORTS)
+            for n in np.unique(np.linspace(1, self.num_sim, n_reports).round().astype(int)):
+                report_progress(n, self.electrical_losses[:n])
 
     def plot_monthly_losses(
         self,
@@ -7,9 +7,8 @@ output is a 'waterfall' plot linking the EYA-estimated and operational-estiamted
 
 from __future__ import annotations
 
-import random
 from copy import deepcopy
-from typing import Callable
+from typing import Any, Callable
 
 import attrs
 import numpy as np
@@ -26,7 +25,23 @@ from openoa.utils import timeseries as ts
 from openoa.utils import met_data_processing as met
 from openoa.schema import FromDictMixin, ResetValuesMixin
 from openoa.logging import logging, logged_method_call
-from openoa.utils.power_curve import functions
+from openoa.utils.cache import (
+    MemoryCache,
+    ResultCache,
+    convert_to_cache,
+    analysis_cache_key,
+    load_cached_results,
+    store_cached_results,
+)
+from openoa.analysis._random import SEED_TYPES, AnalysisRandomState
+from openoa.analysis._parallel import run_parallel_monte_carlo
+from openoa.analysis._progress import ProgressReporter, MonteCarloProgress
+from openoa.analysis._convergence import (
+    ConvergenceCriterion,
+    truncate_simulations,
+    monte_carlo_precision,
+)
+from openoa.utils.power_curve.gam import GAMDesign, gam_edge_knots
 from openoa.analysis._analysis_validators import (
     validate_UQ_input,
     validate_half_closed_0_1_right,
@@ -41,6 +56,27 @@ NDArrayFloat = npt.NDArray[np.float64]
 MINUTES_PER_HOUR = 60
 HOURS_PER_DAY = 24
 
+# The maximum number of entries, and bytes, kept by the caches of the daily SCADA energy, imputed
+# daily SCADA energy, and unscaled long-term gross energy stages of the Monte Carlo simulations,
+# which are cleared at the start of each run
+DAILY_SCADA_CACHE_SIZE = 1024
+IMPUTED_SCADA_CACHE_SIZE = 256
+GROSS_ENERGY_CACHE_SIZE = 65536
+DAILY_SCADA_CACHE_BYTES = 256 * 1024**2
+IMPUTED_SCADA_CACHE_BYTES = 256 * 1024**2
+GROSS_ENERGY_CACHE_BYTES = 512 * 1024**2
+
+# The attributes of the last fit and application of the GAM, which are stored with each cached
+# long-term gross energy so they always describe the latest simulation
+GROSS_ENERGY_ATTRIBUTES = ["turbine_model_dict", "_model_results", "turb_lt_gross"]
+
+# The maximum number of GAM spline bases kept, which are keyed on the reanalysis product and the
+# edge knots of the daily data being fit
+GAM_DESIGN_CACHE_SIZE = 64
+
+# The reanalysis variables that the daily turbine energy is modeled with
+GAM_FEATURES = ["WMETR_HorWdSpd", "WMETR_HorWdDir", "WMETR_AirDen"]
+
 
 @define(auto_attribs=True)
 class TurbineLongTermGrossEnergy(FromDictMixin, ResetValuesMixin):
@@ -65,6 +101,17 @@ class TurbineLongTermGrossEnergy(FromDictMixin, ResetValuesMixin):
     energy in this context is what turbine would have produced under normal operation (i.e.
     excluding downtime and underperformance).
 
+    The preprocessing of each simulation is staged, and each stage is cached on the sampled
+    parameters that it depends on: the filtered daily SCADA energy on the wind bin threshold and
+    maximum power filter, the imputed daily SCADA energy on the filtered daily SCADA energy and the
+    days that meet the correction threshold, and the unscaled long-term gross energy on the imputed
+    daily SCADA energy and the reanalysis product. The sampled SCADA data fraction is applied last,
+    so simulations that only differ by their SCADA data fraction reuse the same GAM fits. The
+    caches are bounded by the size of their data, and cleared at the start of each run. The GAM
+    inputs and fits, and the long-term turbine gross energy, are cached with each long-term gross
+    energy, so :py:attr:`turbine_model_dict` and :py:attr:`turb_lt_gross` are those of the last
+    simulation.
+
     Required schema of PlantData:
 
         - _scada_freq
@@ -92,6 +139,13 @@ class TurbineLongTermGrossEnergy(FromDictMixin, ResetValuesMixin):
             scada energy data should be corrected. When :py:attr:`UQ` is True, then this should be a
             tuple of the lower and upper limits of this threshold, otherwise a single value should
             be used. Defaults to (0.85, 0.95)
+        seed(:obj:`int` | :obj:`numpy.random.SeedSequence` | :obj:`numpy.random.Generator` | :obj:`None`):
+            The seed, or generator, for the Monte Carlo sampling. A new generator is created from
+            the seed at the start of each :py:meth:`run`, so the same seed reproduces the same
+            results. Defaults to None, which uses NumPy's and Python's global random states.
+        cache(:obj:`ResultCache` | :obj:`str` | :obj:`pathlib.Path` | :obj:`None`): The cache, or
+            cache directory, used to store and reload the results of runs seeded with an integer
+            :py:attr:`seed`. See :py:class:`openoa.utils.cache.ResultCache`. Defaults to None.
     """
 
     plant: PlantData = field(converter=deepcopy, validator=attrs.validators.instance_of(PlantData))
@@ -116,6 +170,10 @@ class TurbineLongTermGrossEnergy(FromDictMixin, ResetValuesMixin):
     correction_threshold: NDArrayFloat = field(
         default=(0.85, 0.95), validator=(validate_UQ_input, validate_half_closed_0_1_right)
     )
+    seed: int | np.random.SeedSequence | np.random.Generator | None = field(
+        default=None, validator=attrs.validators.instance_of(SEED_TYPES)
+    )
+    cache: ResultCache | None = field(default=None, converter=convert_to_cache)
 
     # Internally created attributes need to be given a type before usage
     por_start: pd.Timestamp = field(init=False)
@@ -123,6 +181,23 @@ class TurbineLongTermGrossEnergy(FromDictMixin, ResetValuesMixin):
     turbine_ids: np.ndarray = field(init=False)
     scada: pd.DataFrame = field(init=False)
     scada_dict: dict = field(factory=dict, init=False)
+    _scada_days: pd.DatetimeIndex = field(init=False)
+    _scada_daily_codes: np.ndarray = field(init=False)
+    _daily_scada_cache: MemoryCache = field(
+        init=False, factory=lambda: MemoryCache(DAILY_SCADA_CACHE_SIZE, DAILY_SCADA_CACHE_BYTES)
+    )
+    _imputed_scada_cache: MemoryCache = field(
+        init=False,
+        factory=lambda: MemoryCache(IMPUTED_SCADA_CACHE_SIZE, IMPUTED_SCADA_CACHE_BYTES),
+    )
+    _gross_energy_cache: MemoryCache = field(
+        init=False,
+        factory=lambda: MemoryCache(GROSS_ENERGY_CACHE_SIZE, GROSS_ENERGY_CACHE_BYTES),
+    )
+    _gam_design_cache: MemoryCache = field(
+        init=False, factory=lambda: MemoryCache(GAM_DESIGN_CACHE_SIZE)
+    )
+    _imputation_key: tuple = field(init=False)
     daily_reanal_dict: dict = field(factory=dict, init=False)
     model_dict: dict = field(factory=dict, init=False)
     model_results: dict = field(factory=dict, init=False)
@@ -133,10 +208,12 @@ class TurbineLongTermGrossEnergy(FromDictMixin, ResetValuesMixin):
     _inputs: pd.DataFrame = field(init=False)
     scada_valid: pd.DataFrame = field(init=False)
     turbine_model_dict: dict[str, pd.DataFrame] = field(factory=dict, init=False)
-    _model_results: dict[str, Callable] = field(factory=dict, init=False)
+    _model_results: dict[str, tuple[GAMDesign, np.ndarray]] = field(factory=dict, init=False)
     turb_lt_gross: pd.DataFrame = field(default=pd.DataFrame(), init=False)
     summary_results: pd.DataFrame = field(init=False)
     plant_gross: dict[int, pd.DataFrame] = field(factory=dict, init=False)
+    precision: dict = field(factory=dict, init=False)
+    _rng: AnalysisRandomState = field(init=False)
     run_parameters: list[str] = field(
         init=False,
         default=[
@@ -146,6 +223,16 @@ class TurbineLongTermGrossEnergy(FromDictMixin, ResetValuesMixin):
             "wind_bin_threshold",
             "max_power_filter",
             "correction_threshold",
+            "seed",
+        ],
+    )
+    cached_attributes: list[str] = field(
+        init=False,
+        default=[
+            "_inputs",
+            "plant_gross",
+            "num_sim",
+            "precision",
         ],
     )
 
@@ -162,6 +249,8 @@ class TurbineLongTermGrossEnergy(FromDictMixin, ResetValuesMixin):
 
         logger.info("Initializing TurbineLongTermGrossEnergy Object")
 
+        self._rng = AnalysisRandomState(self.seed)
+
         # Check that selected UQ is allowed
         if self.UQ:
             logger.info("Note: uncertainty quantification will be performed in the calculation")
@@ -187,6 +276,12 @@ class TurbineLongTermGrossEnergy(FromDictMixin, ResetValuesMixin):
         wind_bin_threshold: float | tuple[float, float] | None = None,
         max_power_filter: float | tuple[float, float] | None = None,
         correction_threshold: float | tuple[float, float] | None = None,
+        progress_bar: bool = True,
+        n_workers: int = 1,
+        seed: int | np.random.SeedSequence | np.random.Generator | None = None,
+        progress_callback: Callable[[MonteCarloProgress], None] | None = None,
+        tolerance: float | None = None,
+        convergence_batch_size: int = 500,
     ) -> None:
         """
         Pre-process the run-specific data settings for each simulation, then fit and apply the
@@ -215,6 +310,29 @@ class TurbineLongTermGrossEnergy(FromDictMixin, ResetValuesMixin):
                 scada energy data should be corrected. When :py:attr:`UQ` is True, then this should be a
                 tuple of the lower and upper limits of this threshold, otherwise a single value should
                 be used. Defaults to (0.85, 0.95)
+            progress_bar(:obj:`bool`): Flag to use a progress bar for the simulations. Defaults to
+                ``True``.
+            n_workers(:obj:`int`): The number of processes to split the Monte Carlo simulations
+                across when :py:attr:`UQ` is True. Each process runs its share of the simulations
+                with its own copy of the analysis and an independent random stream spawned from a
+                seed drawn from the analysis' random state. Defaults to 1, which runs all of the
+                simulations in the current process.
+            seed(:obj:`int` | :obj:`numpy.random.SeedSequence` | :obj:`numpy.random.Generator` | :obj:`None`):
+                The seed, or generator, for the Monte Carlo sampling. Defaults to None, which uses
+                :py:attr:`seed`.
+            progress_callback(:obj:`Callable[[MonteCarloProgress], None]`, optional): Function
+                called with the :py:class:`~openoa.analysis._progress.MonteCarloProgress` of the
+                simulations as the simulations progress, which includes the running summary
+                statistics of the long-term gross energy. Defaults to None.
+            tolerance(:obj:`float`, optional): The relative standard error of the mean long-term
+                gross energy at which the simulations are stopped when :py:attr:`UQ` is True, e.g.,
+                0.001 for 0.1%, which is checked after each :py:attr:`convergence_batch_size`
+                simulations, making :py:attr:`num_sim` the maximum number of simulations. The
+                achieved precision is stored in :py:attr:`precision`, and :py:attr:`num_sim` is set
+                to the number of simulations that were run. Defaults to None, which runs all
+                :py:attr:`num_sim` simulations.
+            convergence_batch_size(:obj:`int`): The number of simulations between each check of
+                the :py:attr:`tolerance`. Defaults to 500.
         """
         initial_parameters = {}
         if num_sim is not None:
@@ -239,20 +357,68 @@ class TurbineLongTermGrossEnergy(FromDictMixin, ResetValuesMixin):
         if correction_threshold is not None:
             initial_parameters["correction_threshold"] = self.correction_threshold
             self.correction_threshold = correction_threshold
+        if seed is not None:
+            initial_parameters["seed"] = self.seed
+            self.seed = seed
+        self._rng = AnalysisRandomState(self.seed)
+
+        convergence = None
+        convergence_options = {}
+        if tolerance is not None:
+            if self.UQ:
+                convergence = ConvergenceCriterion(tolerance, batch_size=convergence_batch_size)
+                convergence_options = dict(
+                    tolerance=tolerance, convergence_batch_size=convergence_batch_size
+                )
+            else:
+                logger.info("`tolerance` is only used when `UQ=True`, value has not been set.")
 
-        self.setup_inputs()
-        logger.info("Running the long term gross energy analysis")
-
-        # Loop through number of simulations, store TIE results
-        for i in tqdm(np.arange(self.num_sim)):
-            self._run = self._inputs.loc[i]
+        cache_key = analysis_cache_key(
+            self, n_workers=n_workers if self.UQ and n_workers > 1 else 1, **convergence_options
+        )
+        if load_cached_results(self, cache_key):
+            logger.info("Run results loaded from the cache")
+            self.set_values(initial_parameters)
+            return
 
-            self.filter_turbine_data()  # Filter turbine data
-            self.setup_daily_reanalysis_data()  # Setup daily reanalysis products
-            self.filter_sum_impute_scada()  # Setup daily scada data
-            self.setupturbine_model_dict()  # Setup daily data to be fit using the GAM
-            self.fit_model()  # Fit daily turbine energy to atmospheric data
-            self.apply_model(i)  # Apply fitting result to long-term reanalysis data
+        # Release the cached stages of any earlier run, whose parameters may differ
+        for cache in (
+            self._daily_scada_cache,
+            self._imputed_scada_cache,
+            self._gross_energy_cache,
+            self._gam_design_cache,
+        ):
+            cache.clear()
+
+        if self.UQ and n_workers > 1:
+            logger.info("Running the long term gross energy analysis in parallel")
+            merged = run_parallel_monte_carlo(
+                self,
+                num_sim=self.num_sim,
+                n_workers=n_workers,
+                result_attributes=["_inputs", "plant_gross"],
+                seed=self._rng.spawn_seed(),
+                progress_bar=progress_bar,
+                progress=ProgressReporter(progress_callback, self.num_sim, "plant_gross"),
+                progress_values=lambda chunk: chunk["plant_gross"],
+                convergence=convergence,
+                convergence_values=lambda merged: merged["plant_gross"],
+            )
+            self._inputs = merged["_inputs"]
+            self.plant_gross = merged["plant_gross"]
+            self.num_sim = self.plant_gross.shape[0]
+        else:
+            self.setup_inputs()
+            logger.info("Running the long term gross energy analysis")
+            self._run_monte_carlo(
+                progress_bar=progress_bar,
+                progress_callback=progress_callback,
+                convergence=convergence,
+            )
+        self.precision = monte_carlo_precision(
+            self.plant_gross, ("mean",), None if convergence is None else tolerance
+        )
+        store_cached_results(self, cache_key)
 
         # Log the completion of the run
         logger.info("Run completed")
@@ -260,6 +426,57 @@ class TurbineLongTermGrossEnergy(FromDictMixin, ResetValuesMixin):
         # Reset the class arguments back to the initialized values
         self.set_values(initial_parameters)
 
+    def _run_monte_carlo(
+        self,
+        progress_bar: bool = True,
+        progress_callback: Callable[[MonteCarloProgress], None] | None = None,
+        convergence: ConvergenceCriterion | None = None,
+    ) -> None:
+        """
+        Estimates the long-term gross energy of each of the Monte Carlo simulations defined in
+        :py:attr:`_inputs`.
+
+        Args:
+            progress_bar(:obj:`bool`): Flag to use a progress bar for the simulations. Defaults to
+                ``True``.
+            progress_callback(:obj:`Callable[[MonteCarloProgress], None]`, optional): Function
+                called with the :py:class:`~openoa.analysis._progress.MonteCarloProgress` of the
+                simulations after each simulation. Defaults to None.
+            convergence(:obj:`ConvergenceCriterion`, optional): The stopping rule for an adaptive
+                simulation, where the remaining simulations are dropped once it has been met.
+                Defaults to None.
+        """
+        # Loop through number of simulations, store TIE results
+        report_progress = ProgressReporter(progress_callback, self.num_sim, "plant_gross")
+        for i in tqdm(np.arange(self.num_sim), disable=not progress_bar):
+            self._run = self._inputs.loc[i]
+
+            self.setup_daily_reanalysis_data()  # Setup daily reanalysis products
+            self.filter_sum_impute_scada()  # Filter turbine data, and setup daily scada data
+
+            # Fit and apply the GAM once for each set of imputed data and reanalysis product,
+            # then apply the Monte-Carlo sampled uncertainty to the SCADA data
+            key = (*self._imputation_key, self._run.reanalysis_product)
+            plant_gross, attributes = self._gross_energy_cache.get(
+                key, lambda: self._long_term_gross_energy(i)
+            )
+            for name, value in attributes.items():
+                setattr(self, name, value)
+            self.plant_gross[i] = plant_gross * self._run.scada_data_fraction
+
+            report_progress(i + 1, self.plant_gross[: i + 1])
+            if convergence is not None and convergence.check(i + 1, self.plant_gross[: i + 1]):
+                truncate_simulations(self, ["_inputs", "plant_gross"], i + 1)
+                break
+
+    def _simulate(self) -> None:
+        """
+        Sets up and runs the Monte Carlo simulations of a chunk of a parallel run in a worker
+        process, whose copy of the analysis keeps the stage caches it fills for its later chunks.
+        """
+        self.setup_inputs()
+        self._run_monte_carlo(progress_bar=False)
+
     def setup_inputs(self) -> None:
         """
         Create and populate the data frame defining the simulation parameters.
@@ -270,21 +487,21 @@ class TurbineLongTermGrossEnergy(FromDictMixin, ResetValuesMixin):
                 np.repeat(self.reanalysis_products, self.num_sim)
             )  # Create extra long list of renanalysis product names to sample from
             inputs = {
-                "reanalysis_product": np.asarray(random.sample(reanal_list, self.num_sim)),
-                "scada_data_fraction": np.random.normal(1, self.uncertainty_scada, self.num_sim),
-                "wind_bin_thresh": np.random.randint(
+                "reanalysis_product": np.asarray(self._rng.sample(reanal_list, self.num_sim)),
+                "scada_data_fraction": self._rng.normal(1, self.uncertainty_scada, self.num_sim),
+                "wind_bin_thresh": self._rng.integers(
                     self.wind_bin_threshold[0] * 100,
                     self.wind_bin_threshold[1] * 100,
                     self.num_sim,
                 )
                 / 100.0,
-                "max_power_filter": np.random.randint(
+                "max_power_filter": self._rng.integers(
                     self.max_power_filter[0] * 100,
                     self.max_power_filter[1] * 100,
                     self.num_sim,
                 )
                 / 100.0,
-                "correction_threshold": np.random.randint(
+                "correction_threshold": self._rng.integers(
                     self.correction_threshold[0] * 100,
                     self.correction_threshold[1] * 100,
                     self.num_sim,
@@ -322,6 +539,19 @@ class TurbineLongTermGrossEnergy(FromDictMixin, ResetValuesMixin):
             )
             dic[t].sort_index(inplace=True)
 
+        # Combine the turbines' data that have a wind speed and energy, in the same order, and code
+        # each row by its turbine and day for the daily sums of the filtered data
+        self.scada = pd.concat([dic[t] for t in self.turbine_ids]).dropna(
+            subset=["WMET_HorWdSpd", "WTUR_SupWh"]
+        )
+        day_codes, self._scada_days = pd.factorize(
+            self.scada.index.get_level_values("time").floor("D"), sort=True
+        )
+        turbine_codes = pd.Categorical(
+            self.scada.index.get_level_values("asset_id"), categories=self.turbine_ids
+        ).codes.astype(np.int64)
+        self._scada_daily_codes = turbine_codes * self._scada_days.size + day_codes
+
     @logged_method_call
     def filter_turbine_data(self) -> None:
         """
@@ -337,52 +567,65 @@ class TurbineLongTermGrossEnergy(FromDictMixin, ResetValuesMixin):
          6. Combine the flags using an "or" combination to be a new column in scada: "flag_final"
         """
 
-        dic = self.scada_dict
+        # Filter all turbines at once, where any data with a NaN wind speed or energy are dropped
+        scada = self.scada
+        turbine_capacity = self.plant.asset.loc[self.turbine_ids, "rated_power"]
+        max_bin = self._run.max_power_filter * turbine_capacity  # Set maximum range for bin-filter
+
+        flag_range = filters.range_flag_by_asset(scada.WMET_HorWdSpd, lower=0, upper=40)
+        flag_frozen = filters.unresponsive_flag_by_asset(scada.WMET_HorWdSpd, threshold=3)
+        flag_window = filters.window_range_flag_by_asset(
+            window_col="WMET_HorWdSpd",
+            window_start=5.0,
+            window_end=40,
+            value_col="WTUR_W",
+            value_min=0.02 * turbine_capacity,
+            value_max=1.2 * turbine_capacity,
+            data=scada,
+        )
+        flag_bin = filters.bin_filter_by_asset(
+            bin_col="WTUR_W",
+            value_col="WMET_HorWdSpd",
+            bin_width=0.06 * turbine_capacity,
+            threshold=self._run.wind_bin_thresh,
+            center_type="median",
+            bin_min=np.round(0.01 * turbine_capacity),
+            bin_max=np.round(max_bin),
+            threshold_type="std",
+            direction="all",
+            data=scada,
+        )
 
-        # Loop through turbines
-        for t in self.turbine_ids:
-            scada_df = self.scada_dict[t]
-            turbine_capacity = self.plant.asset.loc[t, "rated_power"]
-
-            max_bin = (
-                self._run.max_power_filter * turbine_capacity
-            )  # Set maximum range for using bin-filter
-
-            scada_df.dropna(
-                subset=["WMET_HorWdSpd", "WTUR_SupWh"], inplace=True
-            )  # Drop any data where scada wind speed or energy is NaN
-
-            scada_df = scada_df.assign(
-                flag_neg=filters.range_flag(scada_df.WTUR_W, lower=0, upper=scada_df.WTUR_W.max()),
-                flag_range=filters.range_flag(scada_df.WMET_HorWdSpd, lower=0, upper=40),
-                flag_frozen=filters.unresponsive_flag(scada_df.WMET_HorWdSpd, threshold=3),
-                flag_window=filters.window_range_flag(
-                    window_col=dic[t].loc[:, "WMET_HorWdSpd"],
-                    window_start=5.0,
-                    window_end=40,
-                    value_col=dic[t].loc[:, "WTUR_W"],
-                    value_min=0.02 * turbine_capacity,
-                    value_max=1.2 * turbine_capacity,
-                ),
-                flag_bin=filters.bin_filter(
-                    bin_col=dic[t].loc[:, "WTUR_W"],
-                    value_col=dic[t].loc[:, "WMET_HorWdSpd"],
-                    bin_width=0.06 * turbine_capacity,
-                    threshold=self._run.wind_bin_thresh,
-                    center_type="median",
-                    bin_min=np.round(0.01 * turbine_capacity),
-                    bin_max=np.round(max_bin),
-                    threshold_type="std",
-                    direction="all",
-                ),
-            )
-            # Create a 'final' flag which is true if any of the previous flags are true
-            self.scada_dict[t].loc[:, "flag_final"] = (
-                scada_df.flag_range
-                | scada_df.flag_window
-                | scada_df.flag_bin
-                | scada_df.flag_frozen
-            )
+        # Create a 'final' flag which is true if any of the previous flags are true
+        scada["flag_final"] = flag_range | flag_window | flag_bin | flag_frozen
+        scada_dict = dict(list(scada.groupby(level="asset_id", sort=False)))
+        self.scada_dict = {t: scada_dict.get(t, scada.iloc[:0]) for t in self.turbine_ids}
+
+    def _daily_scada_energy(self) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Filters the SCADA data with :py:meth:`filter_turbine_data`, then sums the valid energy
+        data of each turbine and day.
+
+        Returns:
+            tuple[np.ndarray, np.ndarray, np.ndarray]: The (turbine x day) arrays of the summed
+                energy, the number of valid energy data, and the fraction of NaN energy data, for
+                the days in :py:attr:`_scada_days`.
+        """
+        self.filter_turbine_data()
+
+        valid = ~self.scada["flag_final"].to_numpy()
+        codes = self._scada_daily_codes[valid]
+        energy = self.scada["WTUR_SupWh"].to_numpy()[valid]
+        reported = ~np.isnan(energy)
+
+        n = self.turbine_ids.size * self._scada_days.size
+        size = np.bincount(codes, minlength=n)
+        count = np.bincount(codes[reported], minlength=n)
+        energy = np.bincount(codes[reported], weights=energy[reported], minlength=n)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            percent_nan = np.where(size == 0, 1.0, (size - count) / size)
+
+        shape = (self.turbine_ids.size, self._scada_days.size)
+        return energy.reshape(shape), count.reshape(shape), percent_nan.reshape(shape)
 
     @logged_method_call
     def setup_daily_reanalysis_data(self) -> None:
@@ -419,10 +662,11 @@ class TurbineLongTermGrossEnergy(FromDictMixin, ResetValuesMixin):
         Filter SCADA data for unflagged data, gather SCADA energy data into daily sums, and correct daily summed
         energy based on amount of missing data and a threshold limit. Finally impute missing data for each turbine
         based on reported energy data from other highly correlated turbines.
-        threshold
-        """
 
-        scada = self.scada_dict
+        The daily sums are cached on the filter parameters, and the imputed data are cached on the
+        daily sums and the days that meet the correction threshold, so different correction
+        thresholds that keep the same days reuse the same imputation.
+        """
         expected_count = (
             HOURS_PER_DAY
             * MINUTES_PER_HOUR
@@ -430,109 +674,113 @@ class TurbineLongTermGrossEnergy(FromDictMixin, ResetValuesMixin):
         )
         num_thres = self._run.correction_threshold * expected_count  # Allowable reported timesteps
 
-        self.scada_valid = pd.DataFrame()
+        filter_key = (self._run.wind_bin_thresh, self._run.max_power_filter)
+        energy, count, percent_nan = self._daily_scada_cache.get(
+            filter_key, self._daily_scada_energy
+        )
 
-        # Loop through turbines
-        for t in self.turbine_ids:
-            scada_filt = scada[t].loc[~scada[t]["flag_final"]]  # Filter for valid data
-            # Calculate daily energy sum
-            scada_daily = (
-                scada_filt.groupby([pd.Grouper(freq="D", level="time")])["WTUR_SupWh"]
-                .sum()
-                .to_frame()
-            )
+        # Discard daily sums if less than 140 data counts (90% reported data)
+        valid = count >= num_thres
+        self._imputation_key = (*filter_key, np.packbits(valid).tobytes())
 
-            # Count number of entries in sum
-            scada_daily["data_count"] = (
-                scada_filt.groupby([pd.Grouper(freq="D", level="time")])["WTUR_SupWh"]
-                .count()
-                .to_frame()
+        def impute() -> pd.DataFrame:
+            # Correct energy for missing data
+            with np.errstate(divide="ignore", invalid="ignore"):
+                energy_corrected = np.where(valid, energy * expected_count / count, np.nan)
+            percent_nan_valid = np.where(valid, percent_nan, np.nan)
+
+            # Gap fill the data of each turbine over the period of record to be used for imputing
+            days = pd.date_range(self.por_start, self.por_end, freq="D", name="time")
+            ix = self._scada_days.get_indexer(days)
+            energy_corrected = np.where(ix >= 0, energy_corrected[:, ix], np.nan)
+            percent_nan_valid = np.where(ix >= 0, percent_nan_valid[:, ix], np.nan)
+
+            n_turbines = self.turbine_ids.size
+            index = pd.MultiIndex.from_arrays(
+                [np.tile(days, n_turbines), np.repeat(self.turbine_ids, days.size)],
+                names=["time", "asset_id"],
             )
-            scada_daily["percent_nan"] = (
-                scada_filt.groupby([pd.Grouper(freq="D", level="time")])["WTUR_SupWh"]
-                .apply(ts.percent_nan)
-                .to_frame()
+            scada_valid = pd.DataFrame(
+                {
+                    "energy_corrected": energy_corrected.ravel(),
+                    "percent_nan": percent_nan_valid.ravel(),
+                    "day": np.tile(days, n_turbines),
+                },
+                index=index,
             )
 
-            # Correct energy for missing data
-            scada_daily["energy_corrected"] = (
-                scada_daily["WTUR_SupWh"] * expected_count / scada_daily["data_count"]
+            # Impute missing days for each turbine - provides progress bar
+            scada_valid["energy_imputed"] = imputing.impute_all_assets_by_correlation(
+                scada_valid,
+                impute_col="energy_corrected",
+                reference_col="energy_corrected",
             )
 
-            # Discard daily sums if less than 140 data counts (90% reported data)
-            scada_daily = scada_daily.loc[scada_daily["data_count"] >= num_thres]
-
-            # Create temporary data frame that is gap filled and to be used for imputing
-            temp_df = pd.DataFrame(
-                index=pd.date_range(self.por_start, self.por_end, freq="D", name="time")
-            )
-            temp_df["energy_corrected"] = scada_daily["energy_corrected"]
-            temp_df["percent_nan"] = scada_daily["percent_nan"]
-            temp_df["asset_id"] = np.repeat(t, temp_df.shape[0])
-            temp_df["day"] = temp_df.index
-
-            # Append turbine data into single data frame for imputing
-            self.scada_valid = pd.concat([self.scada_valid, temp_df], axis=0)
-
-        # Reset index after all turbines has been combined
-        self.scada_valid = self.scada_valid.set_index("asset_id", append=True)
-
-        # Impute missing days for each turbine - provides progress bar
-        self.scada_valid["energy_imputed"] = imputing.impute_all_assets_by_correlation(
-            self.scada_valid,
-            impute_col="energy_corrected",
-            reference_col="energy_corrected",
-        )
+            # Drop data that could not be imputed
+            return scada_valid.dropna(subset=["energy_imputed"])
 
-        # Drop data that could not be imputed
-        self.scada_valid.dropna(subset=["energy_imputed"], inplace=True)
+        self.scada_valid = self._imputed_scada_cache.get(self._imputation_key, impute)
 
     @logged_method_call
     def setupturbine_model_dict(self) -> None:
         """Setup daily atmospheric variable averages and daily energy sums by turbine."""
         reanalysis = self.daily_reanalysis
-        for t in self.turbine_ids:
-            self.turbine_model_dict[t] = (
+        self.turbine_model_dict = {
+            t: (
                 self.scada_valid.loc[self.scada_valid.index.get_level_values("asset_id") == t]
                 .set_index("day")
                 .join(reanalysis)
                 .dropna(subset=["energy_imputed", "WMETR_HorWdSpd"])
             )
+            for t in self.turbine_ids
+        }
 
     @logged_method_call
     def fit_model(self) -> None:
         """Fit the daily turbine energy sum and atmospheric variable averages using a GAM model
-        using wind speed, wind direction, and air density.
-        """
-
-        mod_dict = self.turbine_model_dict
-        mod_results = self._model_results
+        using wind speed, wind direction, and air density. The models are fit to the unscaled daily
+        energy, and the sampled SCADA data fraction is applied in :py:meth:`apply_model`.
 
-        for t in self.turbine_ids:  # Loop throuh turbines
-            df = mod_dict[t]
-
-            # Add Monte-Carlo sampled uncertainty to SCADA data
-            df["energy_imputed"] = df["energy_imputed"] * self._run.scada_data_fraction
+        The spline basis of the reanalysis product's daily data is built once for each set of edge
+        knots, and reused by every turbine and simulation that fits data with the same edge knots,
+        where the turbines with the same days of data are fit together with a single linear solve.
+        """
+        reanalysis = self.daily_reanalysis
+        X = reanalysis[GAM_FEATURES].to_numpy()
 
-            # Consider wind speed, wind direction, and air density as features
-            mod_results[t] = functions.gam_3param(
-                windspeed_col="WMETR_HorWdSpd",
-                wind_direction_col="WMETR_HorWdDir",
-                air_density_col="WMETR_AirDen",
-                power_col="energy_imputed",
-                data=df,
+        # Group the turbines by the days of reanalysis data that are being fit
+        groups = {}
+        for t in self.turbine_ids:
+            rows = reanalysis.index.get_indexer(self.turbine_model_dict[t].index)
+            groups.setdefault(rows.tobytes(), (rows, []))[1].append(t)
+
+        mod_results = {}
+        for rows, turbines in groups.values():
+            edge_knots = gam_edge_knots(X[rows])
+            design = self._gam_design_cache.get(
+                (self._run.reanalysis_product, edge_knots.tobytes()),
+                lambda: GAMDesign(X, edge_knots=edge_knots),
+            )
+            y = np.column_stack(
+                [self.turbine_model_dict[t]["energy_imputed"].to_numpy() for t in turbines]
             )
+            coef = design.fit(y, rows)
+            mod_results.update({t: (design, coef[:, k]) for k, t in enumerate(turbines)})
         self._model_results = mod_results
 
     @logged_method_call
-    def apply_model(self, i: int) -> None:
+    def apply_model(self, i: int) -> float:
         """
         Apply the model to the reanalysis data to calculate long-term gross energy for each turbine.
 
         Args:
             i(:obj:`int`): The Monte Carlo iteration number.
+
+        Returns:
+            float: The long-term gross energy of the plant, before the sampled SCADA data fraction
+                is applied. The GAM is linear in the daily energy, so the scaled energy is the
+                unscaled energy multiplied by the SCADA data fraction.
         """
-        turb_gross = self.turb_lt_gross
         mod_results = self._model_results
 
         # Create a data frame to store final results
@@ -540,16 +788,14 @@ class TurbineLongTermGrossEnergy(FromDictMixin, ResetValuesMixin):
             index=self.reanalysis_products, columns=self.turbine_ids
         )
 
-        daily_reanalysis = self.daily_reanalysis
-        turb_gross = pd.DataFrame(index=daily_reanalysis.index)
-
-        # Loop through the turbines and apply the GAM to the reanalysis data
-        for t in self.turbine_ids:  # Loop through turbines
-            turb_gross.loc[:, t] = mod_results[t](
-                daily_reanalysis["WMETR_HorWdSpd"],
-                daily_reanalysis["WMETR_HorWdDir"],
-                daily_reanalysis["WMETR_AirDen"],
-            )
+        # Apply the GAM to the reanalysis data, which is the data each spline basis was built from
+        turb_gross = pd.DataFrame(
+            np.column_stack(
+                [mod_results[t][0].predict(mod_results[t][1]) for t in self.turbine_ids]
+            ),
+            index=self.daily_reanalysis.index,
+            columns=self.turbine_ids,
+        )
 
         turb_gross[turb_gross < 0] = 0
 
@@ -559,9 +805,24 @@ class TurbineLongTermGrossEnergy(FromDictMixin, ResetValuesMixin):
         # Get average sum by calendar month
         turb_mo_avg = turb_mo.groupby(turb_mo.index.month).mean()
 
-        # Store sum of turbine gross energy
-        self.plant_gross[i] = turb_mo_avg.sum(axis=1).sum(axis=0)
+        # Store sum of turbine gross energy, with the Monte-Carlo sampled uncertainty of the SCADA data
+        plant_gross = turb_mo_avg.sum(axis=1).sum(axis=0)
+        self.plant_gross[i] = plant_gross * self._run.scada_data_fraction
         self.turb_lt_gross = turb_gross
+        return plant_gross
+
+    def _long_term_gross_energy(self, i: int) -> tuple[float, dict[str, Any]]:
+        """Fits the GAM of each turbine to the imputed daily SCADA energy, and applies it to the
+        long-term reanalysis data, see :py:meth:`apply_model`.
+
+        Returns:
+            tuple[float, dict[str, Any]]: The unscaled long-term gross energy of the plant, and the
+                values of the ``GROSS_ENERGY_ATTRIBUTES`` that produced it.
+        """
+        self.setupturbine_model_dict()  # Setup daily data to be fit using the GAM
+        self.fit_model()  # Fit daily turbine energy to atmospheric data
+        plant_gross = self.apply_model(i)  # Apply fitting result to long-term reanalysis data
+        return plant_gross, {name: getattr(self, name) for name in GROSS_ENERGY_ATTRIBUTES}
 
     def plot_filtered_power_curves(
         self,
@@ -30,8 +30,6 @@
 
 from __future__ import annotations
 
-import random
-import itertools
 from copy import deepcopy
 from typing import Callable
 
@@ -49,6 +47,22 @@ from openoa.utils import plot, filters, power_curve
 from openoa.utils import met_data_processing as met
 from openoa.schema import FromDictMixin, ResetValuesMixin
 from openoa.logging import logging, logged_method_call
+from openoa.utils.cache import (
+    MemoryCache,
+    ResultCache,
+    convert_to_cache,
+    analysis_cache_key,
+    load_cached_results,
+    store_cached_results,
+)
+from openoa.analysis._random import SEED_TYPES, AnalysisRandomState
+from openoa.analysis._parallel import run_parallel_monte_carlo
+from openoa.analysis._progress import ProgressReporter, MonteCarloProgress
+from openoa.analysis._convergence import (
+    ConvergenceCriterion,
+    truncate_simulations,
+    monte_carlo_precision,
+)
 from openoa.analysis._analysis_validators import (
     validate_UQ_input,
     validate_half_closed_0_1_right,
@@ -59,6 +73,215 @@ logger = logging.getLogger(__name__)
 NDArrayFloat = npt.NDArray[np.float64]
 plot.set_styling()
 
+# The maximum number of derating and abnormal wind speed flags kept, which are keyed on the
+# derating filter parameters of the Monte Carlo simulations
+DERATING_FLAG_CACHE_SIZE = 1024
+
+# The maximum number of long-term wind direction and wind speed frequency tables kept, which are
+# keyed on the reanalysis product, number of years, and bin widths of the long-term correction
+REANALYSIS_FREQUENCY_CACHE_SIZE = 64
+
+# The wind direction and wind speed bin number of missing data in the long-term correction
+MISSING_BIN = np.iinfo(np.int64).min
+
+# The plant and turbine-level columns of the long-term correction's hourly data, where the
+# reanalysis wind speed of each product is added after these
+HOURLY_COLUMNS = [
+    ("wind_direction_ref", ""),
+    ("windspeed_mean_freestream", ""),
+    ("actual_plant_power", ""),
+    ("potential_plant_power", ""),
+]
+HOURLY_TURBINE_COLUMNS = ["WTUR_W", "potential_turbine_power"]
+
+# The per-simulation results of the Monte Carlo simulation when UQ = True
+MONTE_CARLO_RESULTS = [
+    "inputs",
+    "wake_losses_por",
+    "turbine_wake_losses_por",
+    "wake_losses_lt",
+    "turbine_wake_losses_lt",
+    "wake_losses_por_wd",
+    "turbine_wake_losses_por_wd",
+    "wake_losses_lt_wd",
+    "turbine_wake_losses_lt_wd",
+    "energy_por_wd",
+    "energy_lt_wd",
+    "wake_losses_por_ws",
+    "turbine_wake_losses_por_ws",
+    "wake_losses_lt_ws",
+    "turbine_wake_losses_lt_ws",
+    "energy_por_ws",
+    "energy_lt_ws",
+]
+
+
+def _assign_freestream_sectors(
+    wind_direction: NDArrayFloat, sector_wds: list[float], wd_bin_width: float
+) -> npt.NDArray[np.int_]:
+    """Assigns each time step to the freestream sector containing its reference wind direction,
+    where each sector spans from half a wind direction bin below its starting wind direction to
+    half a bin below the starting wind direction of the next sector, and the last sector wraps
+    around to the first.
+
+    Args:
+        wind_direction (NDArrayFloat): The reference wind direction of each time step, in degrees.
+        sector_wds (list[float]): The increasing starting wind directions of the sectors.
+        wd_bin_width (float): The width of the wind direction bins, in degrees.
+
+    Returns:
+        npt.NDArray[np.int_]: The index of the sector of each time step, or -1 if the wind
+            direction is missing.
+    """
+    sector_wds = np.asarray(sector_wds, dtype=float)
+    sectors = np.digitize(wind_direction, sector_wds - 0.5 * wd_bin_width) - 1
+    if sector_wds[0] == 0.0:
+        sectors[wind_direction >= 360.0 - 0.5 * wd_bin_width] = 0
+    else:
+        sectors[sectors == -1] = sector_wds.size - 1
+    sectors[np.isnan(wind_direction)] = -1
+    return sectors
+
+
+def _reduce_freestream(
+    values: NDArrayFloat, sectors: npt.NDArray[np.int_], membership: NDArrayFloat, method: str
+) -> NDArrayFloat:
+    """Reduces the values of each time step over the freestream turbines of its sector, ignoring
+    missing values, where a turbine is counted each time it appears in the (resampled) freestream
+    turbines of the sector.
+
+    Args:
+        values (NDArrayFloat): The (time step x turbine) values to reduce.
+        sectors (npt.NDArray[np.int_]): The freestream sector of each time step, or -1 if none.
+        membership (NDArrayFloat): The (sector x turbine) number of times each turbine appears in
+            the freestream turbines of each sector.
+        method (str): One of "mean", "median", or "max".
+
+    Returns:
+        NDArrayFloat: The reduced value of each time step, which is NaN if the time step isn't in a
+            sector, or none of its freestream turbines have a valid value.
+    """
+    reduced = np.full(values.shape[0], np.nan)
+    if method == "median":
+        # Sort the freestream values of each sector, repeating resampled turbines, with the
+        # missing values last, and average the middle two valid values
+        for i, counts in enumerate(membership.astype(int)):
+            rows = np.flatnonzero(sectors == i)
+            columns = np.repeat(np.arange(counts.size), counts)
+            if rows.size == 0 or columns.size == 0:
+                continue
+            sorted_values = np.sort(values[np.ix_(rows, columns)], axis=1)
+            n_valid = (~np.isnan(sorted_values)).sum(axis=1)
+            lower = np.take_along_axis(sorted_values, np.maximum(n_valid - 1, 0)[:, None] // 2, 1)
+            upper = np.take_along_axis(sorted_values, n_valid[:, None] // 2, 1)
+            reduced[rows] = ((lower + upper) / 2)[:, 0]
+        return reduced
+
+    in_sector = sectors >= 0
+    weights = membership[sectors[in_sector]]
+    values = values[in_sector]
+    valid = ~np.isnan(values) & (weights > 0)
+    if method == "mean":
+        with np.errstate(divide="ignore", invalid="ignore"):
+            reduced[in_sector] = np.where(valid, values * weights, 0.0).sum(axis=1) / np.where(
+                valid, weights, 0.0
+            ).sum(axis=1)
+    elif method == "max":
+        reduced[in_sector] = np.where(
+            valid.any(axis=1), np.where(valid, values, -np.inf).max(axis=1), np.nan
+        )
+    return reduced
+
+
+def _bin_sums(codes: npt.NDArray[np.int_], values: NDArrayFloat, n_bins: int) -> NDArrayFloat:
+    """Sums the (row x column) :py:attr:`values` of the rows in each bin.
+
+    Args:
+        codes (npt.NDArray[np.int_]): The bin of each row, from 0 to :py:attr:`n_bins` - 1.
+        values (NDArrayFloat): The (row x column) values to sum.
+        n_bins (int): The number of bins.
+
+    Returns:
+        NDArrayFloat: The (bin x column) sums, which are NaN for bins without any rows.
+    """
+    sums = np.column_stack(
+        [np.bincount(codes, weights=column, minlength=n_bins) for column in values.T]
+    )
+    sums[np.bincount(codes, minlength=n_bins) == 0] = np.nan
+    return sums
+
+
+def _weighted_bin_means(
+    codes: npt.NDArray[np.int_], values: NDArrayFloat, weights: NDArrayFloat, n_bins: int
+) -> tuple[npt.NDArray[np.int_], NDArrayFloat]:
+    """Averages the (row x column) :py:attr:`values` of the rows in each bin, ignoring missing
+    values, where each row is counted the (integer) number of times given by its weight, such as
+    its bootstrap weight.
+
+    The rows of each bin are summed in order with the compensated summation of the pandas
+    ``groupby`` mean, with each row repeated by its weight, so the averages are identical to those
+    of the resampled data frame, for which a difference in the last digit can move an average
+    across a bin edge. The rows are grouped by their bins with ``np.bincount``, and the sums of all
+    of the bins are computed together, one row of each bin at a time.
+
+    Args:
+        codes (npt.NDArray[np.int_]): The bin of each row, from 0 to :py:attr:`n_bins` - 1.
+        values (NDArrayFloat): The (row x column) values to average.
+        weights (NDArrayFloat): The number of times each row is counted.
+        n_bins (int): The number of bins.
+
+    Returns:
+        tuple[npt.NDArray[np.int_], NDArrayFloat]: The bins with any rows, and their (bin x column)
+            averages, which are NaN for a column without any valid values.
+    """
+    order = np.argsort(codes, kind="stable")
+    rows = np.repeat(order, weights[order].astype(int))
+    lengths = np.bincount(codes[rows], minlength=n_bins)
+    bins = np.flatnonzero(lengths)
+    starts = (np.cumsum(lengths) - lengths)[bins]
+    lengths = lengths[bins]
+
+    total = np.zeros((bins.size, values.shape[1]))
+    compensation = np.zeros_like(total)
+    for j in range(lengths.max(initial=0)):
+        groups = np.flatnonzero(lengths > j)
+        value = values[rows[starts[groups] + j]]
+        valid = ~np.isnan(value)
+        previous_total = total[groups]
+        previous_compensation = compensation[groups]
+        y = value - previous_compensation
+        t = previous_total + y
+        c = t - previous_total - y
+        c[c != c] = 0.0  # An infinite value would otherwise make the sum NaN
+        total[groups] = np.where(valid, t, previous_total)
+        compensation[groups] = np.where(valid, c, previous_compensation)
+    count = _bin_sums(codes, ~np.isnan(values) * weights.astype(int)[:, None], n_bins)[bins]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return bins, total / count
+
+
+def _level_sums(
+    energy: NDArrayFloat, first_bin: int, present: npt.NDArray[np.bool_]
+) -> NDArrayFloat:
+    """Places the energy of each row of a long-term frequency table's bins in the output bins,
+    where the output bins with data are 0 if none of their energy is in the table, and the output
+    bins without data are NaN.
+
+    Args:
+        energy (NDArrayFloat): The (table bin x column) energy of the table's bins.
+        first_bin (int): The bin number of the table's first bin.
+        present (npt.NDArray[np.bool_]): Flags for the output bins with either reanalysis or SCADA
+            data.
+
+    Returns:
+        NDArrayFloat: The (output bin x column) energy.
+    """
+    out = np.where(present[:, None], 0.0, np.nan) * np.ones(energy.shape[1])
+    bins = np.arange(energy.shape[0]) + first_bin
+    in_range = (bins >= 0) & (bins < present.size)
+    out[bins[in_range]] += energy[in_range]
+    return out
+
 
 @define(auto_attribs=True)
 class WakeLosses(FromDictMixin, ResetValuesMixin):
@@ -242,6 +465,13 @@ class WakeLosses(FromDictMixin, ResetValuesMixin):
         bin_count_thresh_lin_reg (int, optional): The minimum number of samples required in a wind
             speed bin to include when finding linear regression from SCADA freestream wind speeds to
             reanalysis wind speeds. Defaults to 50.
+        seed (int | np.random.SeedSequence | np.random.Generator, optional): The seed, or
+            generator, for the Monte Carlo sampling and bootstrapping. A new generator is created
+            from the seed at the start of each :py:meth:`run`, so the same seed reproduces the same
+            results. Defaults to None, which uses NumPy's and Python's global random states.
+        cache (ResultCache | str | Path, optional): The cache, or cache directory, used to store
+            and reload the results of runs seeded with an integer :py:attr:`seed`. See
+            :py:class:`openoa.utils.cache.ResultCache`. Defaults to None.
     """
 
     plant: PlantData = field(converter=deepcopy, validator=attrs.validators.instance_of(PlantData))
@@ -291,12 +521,27 @@ class WakeLosses(FromDictMixin, ResetValuesMixin):
     no_wakes_ws_thresh_LT_corr: float = field(default=13.0)
     min_ws_bin_lin_reg: float = field(default=3.0)
     bin_count_thresh_lin_reg: int = field(default=50, validator=attrs.validators.instance_of(int))
+    seed: int | np.random.SeedSequence | np.random.Generator | None = field(
+        default=None, validator=attrs.validators.instance_of(SEED_TYPES)
+    )
+    cache: ResultCache | None = field(default=None, converter=convert_to_cache)
 
     # Internally created attributes need to be given a type before usage
     turbine_ids: list[str] = field(init=False)
     aggregate_df: pd.DataFrame = field(init=False)
     inputs: pd.DataFrame = field(init=False)
     aggregate_df_sample: pd.DataFrame = field(init=False)
+    sample_weights: NDArrayFloat = field(init=False)
+    _derating_flag_cache: MemoryCache = field(
+        init=False, factory=lambda: MemoryCache(DERATING_FLAG_CACHE_SIZE)
+    )
+    _reanalysis_frequency_cache: MemoryCache = field(
+        init=False, factory=lambda: MemoryCache(REANALYSIS_FREQUENCY_CACHE_SIZE)
+    )
+    _aggregate_hourly: pd.DataFrame = field(init=False)
+    _hours: pd.DatetimeIndex = field(init=False)
+    _hour_codes: npt.NDArray[np.int_] = field(init=False)
+    _sample_rows: npt.NDArray[np.int_] = field(init=False)
     power_curve_func: Callable = field(init=False)
     wake_losses_por: NDArrayFloat = field(init=False)
     turbine_wake_losses_por: NDArrayFloat = field(init=False)
@@ -322,7 +567,9 @@ class WakeLosses(FromDictMixin, ResetValuesMixin):
     turbine_wake_losses_lt_std: float = field(init=False)
     wake_losses_por_std: float = field(init=False)
     turbine_wake_losses_por_std: float = field(init=False)
+    precision: dict = field(factory=dict, init=False)
     _run: pd.DataFrame = field(init=False)
+    _rng: AnalysisRandomState = field(init=False)
     run_parameters: list[str] = field(
         init=False,
         default=[
@@ -345,6 +592,39 @@ class WakeLosses(FromDictMixin, ResetValuesMixin):
             "no_wakes_ws_thresh_LT_corr",
             "min_ws_bin_lin_reg",
             "bin_count_thresh_lin_reg",
+            "seed",
+        ],
+    )
+    cached_attributes: list[str] = field(
+        init=False,
+        default=[
+            "inputs",
+            "wake_losses_por",
+            "turbine_wake_losses_por",
+            "wake_losses_lt",
+            "turbine_wake_losses_lt",
+            "wake_losses_por_wd",
+            "turbine_wake_losses_por_wd",
+            "wake_losses_lt_wd",
+            "turbine_wake_losses_lt_wd",
+            "energy_por_wd",
+            "energy_lt_wd",
+            "wake_losses_por_ws",
+            "turbine_wake_losses_por_ws",
+            "wake_losses_lt_ws",
+            "turbine_wake_losses_lt_ws",
+            "energy_por_ws",
+            "energy_lt_ws",
+            "wake_losses_lt_mean",
+            "turbine_wake_losses_lt_mean",
+            "wake_losses_por_mean",
+            "turbine_wake_losses_por_mean",
+            "wake_losses_lt_std",
+            "turbine_wake_losses_lt_std",
+            "wake_losses_por_std",
+            "turbine_wake_losses_por_std",
+            "num_sim",
+            "precision",
         ],
     )
 
@@ -367,6 +647,8 @@ class WakeLosses(FromDictMixin, ResetValuesMixin):
         """
         logger.info("Initializing WakeLosses analysis object")
 
+        self._rng = AnalysisRandomState(self.seed)
+
         if self.wind_direction_data_type == "scada":
             if {"WakeLosses-scada", "all"}.intersection(self.plant.analysis_type) == set():
                 self.plant.analysis_type.append("WakeLosses-scada")
@@ -439,6 +721,12 @@ class WakeLosses(FromDictMixin, ResetValuesMixin):
         no_wakes_ws_thresh_LT_corr: float | None = None,
         min_ws_bin_lin_reg: float | None = None,
         bin_count_thresh_lin_reg: int | None = None,
+        progress_bar: bool = True,
+        n_workers: int = 1,
+        seed: int | np.random.SeedSequence | np.random.Generator | None = None,
+        progress_callback: Callable[[MonteCarloProgress], None] | None = None,
+        tolerance: float | None = None,
+        convergence_batch_size: int = 500,
     ):
         """
         Estimates wake losses by comparing wind plant energy production to energy production of the
@@ -538,11 +826,33 @@ class WakeLosses(FromDictMixin, ResetValuesMixin):
             bin_count_thresh_lin_reg (int, optional): The minimum number of samples required in a
                 wind speed bin to include when finding linear regression from SCADA freestream wind
                 speeds to reanalysis wind speeds. Defaults to 50.
+            progress_bar (bool, optional): Flag to use a progress bar for the simulations. Defaults
+                to True.
+            n_workers (int, optional): The number of processes to split the Monte Carlo simulations
+                across when :py:attr:`UQ` = True. Each process runs its share of the simulations
+                with its own copy of the analysis and an independent random stream spawned from a
+                seed drawn from the analysis' random state. Defaults to 1, which runs all of the
+                simulations in the current process.
+            seed (int | np.random.SeedSequence | np.random.Generator, optional): The seed, or
+                generator, for the Monte Carlo sampling and bootstrapping. Defaults to None, which
+                uses :py:attr:`seed`.
+            progress_callback (Callable[[MonteCarloProgress], None], optional): Function called with
+                the :py:class:`~openoa.analysis._progress.MonteCarloProgress` of the simulations as
+                the simulations progress, which includes the running summary statistics of the
+                long-term wake losses when :py:attr:`UQ` is True. Defaults to None.
+            tolerance (float, optional): The relative standard error of the mean long-term wake
+                losses at which the simulations are stopped when :py:attr:`UQ` = True, e.g., 0.01
+                for 1%, which is checked after each :py:attr:`convergence_batch_size` simulations,
+                making :py:attr:`num_sim` the maximum number of simulations. The achieved precision
+                is stored in :py:attr:`precision`, and :py:attr:`num_sim` is set to the number of
+                simulations that were run. Defaults to None, which runs all :py:attr:`num_sim`
+                simulations.
+            convergence_batch_size (int, optional): The number of simulations between each check
+                of the :py:attr:`tolerance`. Defaults to 500.
         """
         initial_parameters = {}
         # Assign default parameter values depending on whether UQ is performed
         if num_sim is not None:
-            initial_parameters["num_sim"] = num_sim
             self.num_sim = num_sim
         if reanalysis_products is not None:
             initial_parameters["reanalysis_products"] = reanalysis_products
@@ -606,11 +916,107 @@ class WakeLosses(FromDictMixin, ResetValuesMixin):
         if bin_count_thresh_lin_reg is not None:
             initial_parameters["bin_count_thresh_lin_reg"] = self.bin_count_thresh_lin_reg
             self.bin_count_thresh_lin_reg = bin_count_thresh_lin_reg
+        if seed is not None:
+            initial_parameters["seed"] = self.seed
+            self.seed = seed
+        self._rng = AnalysisRandomState(self.seed)
+
+        convergence = None
+        convergence_options = {}
+        if tolerance is not None:
+            if self.UQ:
+                convergence = ConvergenceCriterion(tolerance, batch_size=convergence_batch_size)
+                convergence_options = dict(
+                    tolerance=tolerance, convergence_batch_size=convergence_batch_size
+                )
+            else:
+                logger.info("`tolerance` is only used when `UQ=True`, value has not been set.")
+
+        cache_key = analysis_cache_key(
+            self, n_workers=n_workers if self.UQ and n_workers > 1 else 1, **convergence_options
+        )
+        if load_cached_results(self, cache_key):
+            logger.info("Run results loaded from the cache")
+            self.set_values(initial_parameters)
+            return
+
+        if self.UQ and n_workers > 1:
+            merged = run_parallel_monte_carlo(
+                self,
+                num_sim=self.num_sim,
+                n_workers=n_workers,
+                result_attributes=MONTE_CARLO_RESULTS,
+                seed=self._rng.spawn_seed(),
+                progress_bar=progress_bar,
+                progress=ProgressReporter(progress_callback, self.num_sim, "wake_losses_lt"),
+                progress_values=lambda chunk: chunk["wake_losses_lt"],
+                convergence=convergence,
+                convergence_values=lambda merged: merged["wake_losses_lt"],
+            )
+            for name, value in merged.items():
+                setattr(self, name, value)
+            self.num_sim = self.wake_losses_lt.shape[0]
+        else:
+            # Set up Monte Carlo simulation inputs if UQ = True or single simulation inputs if
+            # UQ = False.
+            self._setup_monte_carlo_inputs()
+            self._run_monte_carlo(
+                progress_bar=progress_bar,
+                progress_callback=progress_callback,
+                convergence=convergence,
+            )
 
-        # Set up Monte Carlo simulation inputs if UQ = True or single simulation inputs if UQ = False.
+        if self.UQ:
+            # Calculate mean and standard deviation of wake losses from Monte Carlo simulations
+            self.wake_losses_lt_mean = np.mean(self.wake_losses_lt)
+            self.turbine_wake_losses_lt_mean = np.mean(self.turbine_wake_losses_lt, axis=0)
+            self.wake_losses_por_mean = np.mean(self.wake_losses_por)
+            self.turbine_wake_losses_por_mean = np.mean(self.turbine_wake_losses_por, axis=0)
+
+            self.wake_losses_lt_std = np.std(self.wake_losses_lt)
+            self.turbine_wake_losses_lt_std = np.std(self.turbine_wake_losses_lt, axis=0)
+            self.wake_losses_por_std = np.std(self.wake_losses_por)
+            self.turbine_wake_losses_por_std = np.std(self.turbine_wake_losses_por, axis=0)
+
+            self.precision = monte_carlo_precision(
+                self.wake_losses_lt, ("mean",), None if convergence is None else tolerance
+            )
+        store_cached_results(self, cache_key)
+
+        self.set_values(initial_parameters)
+
+    def _simulate(self) -> None:
+        """Sets up and runs the Monte Carlo simulations of a chunk of a parallel run in a worker
+        process, whose copy of the analysis already has the aggregate data of the run.
+        """
         self._setup_monte_carlo_inputs()
+        self._run_monte_carlo(progress_bar=False)
+
+    @logged_method_call
+    def _run_monte_carlo(
+        self,
+        progress_bar: bool = True,
+        progress_callback: Callable[[MonteCarloProgress], None] | None = None,
+        convergence: ConvergenceCriterion | None = None,
+    ):
+        """
+        Estimates the wake losses for each of the Monte Carlo simulations defined in
+        :py:attr:`inputs`. If :py:attr:`UQ` is False, the long-term corrected results are averaged
+        over all of the reanalysis products.
 
-        for n in tqdm(range(self.num_sim)):
+        Args:
+            progress_bar (bool, optional): Flag to use a progress bar for the simulations. Defaults
+                to True.
+            progress_callback (Callable[[MonteCarloProgress], None], optional): Function called with
+                the :py:class:`~openoa.analysis._progress.MonteCarloProgress` of the simulations
+                after each simulation, which includes the running summary statistics of the
+                long-term wake losses when :py:attr:`UQ` is True. Defaults to None.
+            convergence (ConvergenceCriterion, optional): The stopping rule for an adaptive
+                simulation when :py:attr:`UQ` is True, where the remaining simulations are dropped
+                once it has been met. Defaults to None.
+        """
+        report_progress = ProgressReporter(progress_callback, self.num_sim, "wake_losses_lt")
+        for n in tqdm(range(self.num_sim), disable=not progress_bar):
             self._run = self.inputs.loc[n].copy()
 
             # Estimate periods when each turbine is unavailable, derated, or curtailed, based on power curve filtering
@@ -622,328 +1028,35 @@ class WakeLosses(FromDictMixin, ResetValuesMixin):
             if self.correct_for_derating:
                 self._identify_derating()
 
-            # Randomly resample 10-minute periods for bootstrapping
+            # Randomly resample 10-minute periods for bootstrapping, where the resample is kept as
+            # the periods drawn at least once and the number of times each of them is drawn
             if self.UQ:
-                self.aggregate_df_sample = self.aggregate_df.sample(frac=1.0, replace=True)
+                weights = self._rng.bootstrap_weights(self.aggregate_df.shape[0])
+                drawn = weights > 0
+                self.aggregate_df_sample = self.aggregate_df.loc[drawn]
+                self.sample_weights = weights[drawn]
+                self._sample_rows = np.flatnonzero(drawn)
             else:
                 self.aggregate_df_sample = self.aggregate_df.copy()
-
-            # For a set of wind direction bins, identify freestream turbines and calculate mean energy production and
-            # wind speed
-            self.aggregate_df_sample["power_mean_freestream"] = np.nan
-            self.aggregate_df_sample["windspeed_mean_freestream"] = np.nan
-
-            wd_bins = np.arange(0.0, 360.0, self.wd_bin_width)
-
-            # Create columns for turbine power and wind speed during normal operation (NaN otherwise)
-            for t in self.turbine_ids:
-                valid_inds = ~self.aggregate_df_sample[("derate_flag", t)]
-                self.aggregate_df_sample.loc[valid_inds, ("power_normal", t)] = (
-                    self.aggregate_df_sample.loc[valid_inds, ("WTUR_W", t)]
-                )
-                valid_inds = ~self.aggregate_df_sample[("abnormal_ws_flag", t)]
-                self.aggregate_df_sample.loc[valid_inds, ("windspeed_normal", t)] = (
-                    self.aggregate_df_sample.loc[valid_inds, ("WMET_HorWdSpd", t)]
-                )
-
-            if self.correct_for_ws_heterogeneity:
-                # Create a representative power curve model for the turbines in the plant
-                self.power_curve_func = power_curve.IEC(
-                    self.aggregate_df_sample.loc[:, "windspeed_normal"].stack(future_stack=True),
-                    self.aggregate_df_sample.loc[:, "power_normal"].stack(future_stack=True),
-                    windspeed_end=100.0,
-                    interpolate=True,
-                )
-
-                # Create column for speedup factor during normal operation (NaN otherwise)
-                for t in self.turbine_ids:
-                    valid_inds = ~self.aggregate_df_sample[("abnormal_ws_flag", t)]
-                    self.aggregate_df_sample.loc[valid_inds, ("speedup_factor_normal", t)] = (
-                        self.aggregate_df_sample.loc[valid_inds, ("speedup_factor", t)]
-                    )
-
-                # Initialize columns for estimated freestream wind speeds and powers
-                new_cols = ["windspeed_freestream_estimate", "power_freestream_estimate"]
-                self.aggregate_df_sample[list(itertools.product(new_cols, self.turbine_ids))] = (
-                    np.nan
-                )
-
-            # Find freestream turbines for each wind direction. Update the dictionary only when the set of turbines
-            # differs from the previous wind direction bin.
-            freestream_turbine_dict = {}
-            freestream_turbine_ids_prev = []
-
-            for wd in wd_bins:
-                # identify freestream turbines
-                freestream_turbine_ids = self.plant.get_freestream_turbines(
-                    wd, sector_width=self._run.freestream_sector_width
-                )
-
-                if freestream_turbine_ids != freestream_turbine_ids_prev:
-                    freestream_turbine_dict[wd] = freestream_turbine_ids
-                    freestream_turbine_ids_prev = freestream_turbine_ids
-
-            if freestream_turbine_dict[0.0] == list(freestream_turbine_dict.values())[-1]:
-                freestream_turbine_dict.pop(0.0)
-
-            # Find freestream energy production for each wind direction sector containing the same freestream turbines
-            freestream_sector_wds = list(freestream_turbine_dict.keys())
-
-            for i_wd, wd in enumerate(freestream_sector_wds):
-                freestream_turbine_ids = freestream_turbine_dict[wd]
-
-                # if UQ is enabled, randomly resample set of freestream turbines
-                if self.UQ:
-                    freestream_turbine_ids = random.choices(
-                        freestream_turbine_ids, k=len(freestream_turbine_ids)
-                    )
-
-                # Check whether last wind direction in dictionary and handle wind direction wrapping
-                # between 0 and 360 degrees
-                _agg_wd = self.aggregate_df_sample["wind_direction_ref"]
-                if wd == 0.0:
-                    wd_bin_flag = _agg_wd >= 360.0 - 0.5 * self.wd_bin_width
-                    wd_bin_flag |= _agg_wd < (
-                        freestream_sector_wds[i_wd + 1] - 0.5 * self.wd_bin_width
-                    )
-                elif i_wd < len(freestream_sector_wds) - 1:
-                    wd_bin_flag = _agg_wd >= (wd - 0.5 * self.wd_bin_width)
-                    wd_bin_flag &= _agg_wd < (
-                        freestream_sector_wds[i_wd + 1] - 0.5 * self.wd_bin_width
-                    )
-                elif (i_wd == len(freestream_sector_wds) - 1) & (freestream_sector_wds[0] == 0.0):
-                    wd_bin_flag = _agg_wd >= (wd - 0.5 * self.wd_bin_width)
-                    wd_bin_flag &= _agg_wd < (360.0 - 0.5 * self.wd_bin_width)
-                else:  # last wind direction in dictionary and first wind direction is not zero:
-                    wd_bin_flag = _agg_wd >= (wd - 0.5 * self.wd_bin_width)
-                    wd_bin_flag |= _agg_wd < (freestream_sector_wds[0] - 0.5 * self.wd_bin_width)
-
-                # Assign representative energy and wind speed of freestream turbines. If correct_for_derating
-                # is True, only freestream turbines operating normally will be considered.
-                _power = self.aggregate_df_sample.loc[wd_bin_flag, "power_normal"]
-                if self.freestream_power_method == "mean":
-                    _power = _power[freestream_turbine_ids].mean(axis=1)
-                elif self.freestream_power_method == "median":
-                    _power = _power[freestream_turbine_ids].median(axis=1)
-                elif self.freestream_power_method == "max":
-                    _power = _power[freestream_turbine_ids].max(axis=1)
-                self.aggregate_df_sample.loc[wd_bin_flag, "power_mean_freestream"] = _power.values
-
-                _ws = self.aggregate_df_sample.loc[wd_bin_flag, "windspeed_normal"]
-                if self.freestream_wind_speed_method == "mean":
-                    _ws = _ws[freestream_turbine_ids].mean(axis=1)
-                elif self.freestream_wind_speed_method == "median":
-                    _ws = _ws[freestream_turbine_ids].median(axis=1)
-                self.aggregate_df_sample.loc[wd_bin_flag, "windspeed_mean_freestream"] = _ws.values
-
-                if self.correct_for_ws_heterogeneity:
-                    # Estimate expected wind speed at each turbine location based on speedup
-                    # factors and wind speeds at normally operating freestream wind turbines.
-                    _mean_speedup_factor = self.aggregate_df_sample.loc[
-                        wd_bin_flag, "speedup_factor_normal"
-                    ]
-                    _mean_speedup_factor = _mean_speedup_factor[freestream_turbine_ids].mean(axis=1)
-                    self.aggregate_df_sample.loc[wd_bin_flag, "windspeed_freestream_estimate"] = (
-                        self.aggregate_df_sample.loc[wd_bin_flag, "speedup_factor"]
-                        .mul(_ws.values / _mean_speedup_factor.values, axis=0)
-                        .values
-                    )
-
-                    # Correct mean freestream wind speed to represent mean freestream wind speed
-                    # over all turbines in the plant based on speedup factors of unwaked turbines
-                    self.aggregate_df_sample.loc[wd_bin_flag, "windspeed_mean_freestream"] = (
-                        self.aggregate_df_sample.loc[wd_bin_flag, "windspeed_mean_freestream"]
-                        / _mean_speedup_factor
-                    ).values
-
-                    # Interpolate power curve to estimate potential freestream power
-                    self.aggregate_df_sample.loc[wd_bin_flag, "power_freestream_estimate"] = (
-                        self.power_curve_func(
-                            self.aggregate_df_sample.loc[
-                                wd_bin_flag, "windspeed_freestream_estimate"
-                            ]
-                        )
-                    )
-
-                    # Get mean estimated freestream power of normally operating unwaked turbines
-                    _valid_inds = ~self.aggregate_df_sample.loc[wd_bin_flag, "derate_flag"]
-                    _valid_inds = _valid_inds[freestream_turbine_ids]
-                    _power_freestream_estimate = self.aggregate_df_sample.loc[
-                        wd_bin_flag, "power_freestream_estimate"
-                    ]
-                    self.aggregate_df_sample.loc[wd_bin_flag, "power_mean_freestream_estimate"] = (
-                        (_valid_inds * _power_freestream_estimate[freestream_turbine_ids]).sum(
-                            axis=1
-                        )
-                        / _valid_inds.sum(axis=1)
-                    ).values
-
-            # Remove rows where no freestream turbines in normal operation were identified
-            self.aggregate_df_sample = self.aggregate_df_sample.dropna(
-                subset=[("power_mean_freestream", ""), ("windspeed_mean_freestream", "")]
-            )
-
-            # Calculate total plant-level wake losses during period of record
-
-            # Determine ideal wind plant energy, correcting for derated turbines if correct_for_derating is True. If
-            # correct_for_derating is True, ideal energy is calculated as the sum of the power produced by derated
-            # turbines and the mean power produced by freestream turbines operating normally multiplied by the total
-            # number of turbines operating normally. If correcting for wind speed heterogeneity, the ideal power of
-            # the normally operating turbines is given by scaling the mean power of the normally operating freestream
-            # turbines by a correction factor determined using the estimated power variations across the wind plant
-            # from the provided wind speed speedup factors.
-            total_derated_turbine_power = (
-                self.aggregate_df_sample["WTUR_W"] * self.aggregate_df_sample["derate_flag"]
-            ).sum(axis=1)
-
-            if self.correct_for_ws_heterogeneity:
-                # Indices where mean measured power and the mean estimated freestream power of all
-                # turbines are greater than zero, and mean estimated freestream power is
-                # sufficiently large (treated as greater than 1 kW), allowing valid potential power
-                # corrections.
-                valid_ix = self.aggregate_df_sample["power_mean_freestream"] > 0
-                valid_ix &= (
-                    ~self.aggregate_df_sample["derate_flag"]
-                    * self.aggregate_df_sample["power_freestream_estimate"]
-                ).sum(axis=1) > 0
-                valid_ix &= self.aggregate_df_sample["power_mean_freestream_estimate"] > 1.0
-
-                total_potential_freestream_power = (
-                    self.aggregate_df_sample["power_mean_freestream"]
-                    * (
-                        ~self.aggregate_df_sample["derate_flag"]
-                        * self.aggregate_df_sample["power_freestream_estimate"]
-                    ).sum(axis=1)
-                    / self.aggregate_df_sample["power_mean_freestream_estimate"]
-                )
-
-                # For invalid indices, use measured power of freestream turbines
-                total_potential_freestream_power.loc[~valid_ix] = self.aggregate_df_sample.loc[
-                    ~valid_ix, "power_mean_freestream"
-                ] * (~self.aggregate_df_sample.loc[~valid_ix, "derate_flag"]).sum(axis=1)
-
-                # Check for corrected potential power values greater than the maximum possible
-                # output of number of normally operating turbines
-                plant_power_max = self.aggregate_df_sample["WTUR_W"].max().max() * (
-                    ~self.aggregate_df_sample["derate_flag"]
-                ).sum(axis=1)
-                total_potential_freestream_power.loc[
-                    total_potential_freestream_power > plant_power_max
-                ] = plant_power_max.loc[total_potential_freestream_power > plant_power_max]
-            else:
-                total_potential_freestream_power = self.aggregate_df_sample[
-                    "power_mean_freestream"
-                ] * (~self.aggregate_df_sample["derate_flag"]).sum(axis=1)
-
-            # Assign total potential power
-            self.aggregate_df_sample["potential_plant_power"] = (
-                total_potential_freestream_power + total_derated_turbine_power
-            )
-
-            # Assign actual total power produced by wind plant
-            self.aggregate_df_sample["actual_plant_power"] = self.aggregate_df_sample["WTUR_W"].sum(
-                axis=1
-            )
-
-            wake_losses_por = (
-                1
-                - self.aggregate_df_sample["actual_plant_power"].sum()
-                / self.aggregate_df_sample["potential_plant_power"].sum()
-            )
-
-            # bin wake losses by wind direction
-            # group wind farm efficiency by wind direction bin
-            self.aggregate_df_sample["wind_direction_bin"] = (
-                self.wd_bin_width_LT_corr
-                * (
-                    self.aggregate_df_sample["wind_direction_ref"] / self.wd_bin_width_LT_corr
-                ).round()
-            )
-            self.aggregate_df_sample.loc[
-                self.aggregate_df_sample["wind_direction_bin"] == 360.0, "wind_direction_bin"
-            ] = 0.0
-
-            # Calculate turbine-level wake losses during period of record
-            turbine_wake_losses_por = len(self.turbine_ids) * [0.0]
-            for i, t in enumerate(self.turbine_ids):
-                # Determine ideal turbine energy as sum of the power produced by the turbine when it
-                # is derated and the mean power produced by all freestream turbines when the turbine
-                # is operating normally
-
-                valid_inds = ~self.aggregate_df_sample[("derate_flag", t)]
-                if self.correct_for_ws_heterogeneity:
-                    # Indices where mean measured power and the mean estimated freestream power of all
-                    # turbines are greater than zero, and mean estimated freestream power is
-                    # sufficiently large (treated as greater than 1 kW times the number of normally
-                    # operating freestream turbines), allowing valid potential power corrections.
-                    valid_inds_freestream_power = (
-                        (self.aggregate_df_sample["power_mean_freestream"] > 0)
-                        & (self.aggregate_df_sample[("power_freestream_estimate", t)] > 0)
-                        & (self.aggregate_df_sample["power_mean_freestream_estimate"] > 1.0)
-                    )
-
-                    self.aggregate_df_sample.loc[valid_inds, ("potential_turbine_power", t)] = (
-                        self.aggregate_df_sample.loc[valid_inds, "power_mean_freestream"]
-                        * self.aggregate_df_sample.loc[valid_inds, ("power_freestream_estimate", t)]
-                        / self.aggregate_df_sample.loc[valid_inds, "power_mean_freestream_estimate"]
-                    )
-
-                    # For indices with insufficiently high freestream power, use measured power of freestream turbines
-                    self.aggregate_df_sample.loc[
-                        valid_inds & ~valid_inds_freestream_power, ("potential_turbine_power", t)
-                    ] = self.aggregate_df_sample.loc[
-                        valid_inds & ~valid_inds_freestream_power, "power_mean_freestream"
-                    ]
-
-                    # Check for corrected potential power values greater than the maximum possible
-                    turbine_power_max = self.aggregate_df_sample.loc[
-                        valid_inds, ("WTUR_W", t)
-                    ].max()
-                    self.aggregate_df_sample.loc[
-                        self.aggregate_df_sample[("potential_turbine_power", t)]
-                        > turbine_power_max,
-                        ("potential_turbine_power", t),
-                    ] = turbine_power_max
-                else:
-                    self.aggregate_df_sample.loc[valid_inds, ("potential_turbine_power", t)] = (
-                        self.aggregate_df_sample.loc[valid_inds, "power_mean_freestream"]
-                    )
-
-                self.aggregate_df_sample.loc[~valid_inds, ("potential_turbine_power", t)] = (
-                    self.aggregate_df_sample.loc[~valid_inds, ("WTUR_W", t)]
-                )
-                turbine_wake_losses_por[i] = (
-                    1
-                    - self.aggregate_df_sample[("WTUR_W", t)].sum()
-                    / self.aggregate_df_sample[("potential_turbine_power", t)].sum()
-                )
-
-            df_wd_bin = self.aggregate_df_sample.groupby("wind_direction_bin").sum()
-
-            index = np.arange(0.0, 360.0, self.wd_bin_width_LT_corr)
-            df_wd_bin = df_wd_bin.reindex(index)
-
-            # Save plant and turbine-level wake losses binned by wind direction
-            wake_losses_por_wd = (
-                df_wd_bin["actual_plant_power"] / df_wd_bin["potential_plant_power"]
-            ).values
-
-            turbine_wake_losses_por_wd = np.empty(
-                [len(self.turbine_ids), int(360.0 / self.wd_bin_width_LT_corr)]
-            )
-            for i, t in enumerate(self.turbine_ids):
-                turbine_wake_losses_por_wd[i, :] = (
-                    df_wd_bin[("WTUR_W", t)] / df_wd_bin[("potential_turbine_power", t)]
-                ).values
+                self.sample_weights = np.ones(self.aggregate_df.shape[0])
+                self._sample_rows = np.arange(self.aggregate_df.shape[0])
+
+            # Estimate the plant and turbine-level wake losses during the period of record
+            (
+                wake_losses_por,
+                turbine_wake_losses_por,
+                wake_losses_por_wd,
+                turbine_wake_losses_por_wd,
+                energy_por_wd,
+            ) = self._calculate_por_wake_losses()
+            self._calculate_hourly_aggregate()
 
             if self.UQ:
                 self.wake_losses_por[n] = wake_losses_por
                 self.turbine_wake_losses_por[n, :] = turbine_wake_losses_por
                 self.wake_losses_por_wd[n, :] = wake_losses_por_wd
                 self.turbine_wake_losses_por_wd[n, :, :] = turbine_wake_losses_por_wd
-                self.energy_por_wd[n, :] = (
-                    df_wd_bin["actual_plant_power"].values / df_wd_bin["actual_plant_power"].sum()
-                )
+                self.energy_por_wd[n, :] = energy_por_wd
 
                 # apply long-term correction to wake losses
                 (
@@ -972,15 +1085,18 @@ class WakeLosses(FromDictMixin, ResetValuesMixin):
                 self.turbine_wake_losses_lt_ws[n, :, :] = turbine_wake_losses_lt_ws
                 self.energy_lt_ws[n, :] = energy_lt_ws
 
+            report_progress(n + 1, self.wake_losses_lt[: n + 1] if self.UQ else None)
+            if convergence is not None and convergence.check(n + 1, self.wake_losses_lt[: n + 1]):
+                truncate_simulations(self, MONTE_CARLO_RESULTS, n + 1)
+                break
+
         if not self.UQ:
             # apply long-term correction to wake losses and average results over all reanalysis products
             self.wake_losses_por = wake_losses_por
             self.turbine_wake_losses_por = turbine_wake_losses_por
             self.wake_losses_por_wd = wake_losses_por_wd
             self.turbine_wake_losses_por_wd = turbine_wake_losses_por_wd
-            self.energy_por_wd = (
-                df_wd_bin["actual_plant_power"].values / df_wd_bin["actual_plant_power"].sum()
-            )
+            self.energy_por_wd = energy_por_wd
 
             wake_losses_lt_all_products = np.empty([len(self.reanalysis_products), 1])
             turbine_wake_losses_lt_all_products = np.empty(
@@ -1081,20 +1197,6 @@ class WakeLosses(FromDictMixin, ResetValuesMixin):
             self.turbine_wake_losses_lt_ws = np.mean(turbine_wake_losses_lt_ws_all_products, axis=0)
             self.energy_lt_ws = np.mean(energy_lt_ws_all_products, axis=0)
 
-        else:
-            # Calculate mean and standard deviation of wake losses from Monte Carlo simulations
-            self.wake_losses_lt_mean = np.mean(self.wake_losses_lt)
-            self.turbine_wake_losses_lt_mean = np.mean(self.turbine_wake_losses_lt, axis=0)
-            self.wake_losses_por_mean = np.mean(self.wake_losses_por)
-            self.turbine_wake_losses_por_mean = np.mean(self.turbine_wake_losses_por, axis=0)
-
-            self.wake_losses_lt_std = np.std(self.wake_losses_lt)
-            self.turbine_wake_losses_lt_std = np.std(self.turbine_wake_losses_lt, axis=0)
-            self.wake_losses_por_std = np.std(self.wake_losses_por)
-            self.turbine_wake_losses_por_std = np.std(self.turbine_wake_losses_por, axis=0)
-
-        self.set_values(initial_parameters)
-
     @logged_method_call
     def _setup_monte_carlo_inputs(self):
         """
@@ -1104,28 +1206,28 @@ class WakeLosses(FromDictMixin, ResetValuesMixin):
 
         if self.UQ:
             inputs = {
-                "reanalysis_product": random.choices(self.reanalysis_products, k=self.num_sim),
-                "freestream_sector_width": np.random.randint(
+                "reanalysis_product": self._rng.choices(self.reanalysis_products, k=self.num_sim),
+                "freestream_sector_width": self._rng.integers(
                     self.freestream_sector_width[0],
                     self.freestream_sector_width[1] + 1,
                     self.num_sim,
                 ),
-                "wind_bin_mad_thresh": np.random.randint(
+                "wind_bin_mad_thresh": self._rng.integers(
                     self.wind_bin_mad_thresh[0], self.wind_bin_mad_thresh[1] + 1, self.num_sim
                 ),
-                "derating_filter_wind_speed_start": np.random.randint(
+                "derating_filter_wind_speed_start": self._rng.integers(
                     self.derating_filter_wind_speed_start[0] * 10,
                     self.derating_filter_wind_speed_start[1] * 10 + 1,
                     self.num_sim,
                 )
                 / 10.0,
-                "max_power_filter": np.random.randint(
+                "max_power_filter": self._rng.integers(
                     self.max_power_filter[0] * 100,
                     self.max_power_filter[1] * 100 + 1,
                     self.num_sim,
                 )
                 / 100.0,
-                "num_years_LT": np.random.randint(
+                "num_years_LT": self._rng.integers(
                     self.num_years_LT[0], self.num_years_LT[1] + 1, self.num_sim
                 ),
             }
@@ -1223,6 +1325,9 @@ class WakeLosses(FromDictMixin, ResetValuesMixin):
         if self.correct_for_ws_heterogeneity:
             self._get_speedup_factors()
 
+        # The hour of each time step, for averaging each simulation's time steps to hourly data
+        self._hour_codes, self._hours = pd.factorize(self.aggregate_df.index.floor("h"), sort=True)
+
     @logged_method_call
     def _calculate_mean_wind_direction(self):
         """
@@ -1310,280 +1415,622 @@ class WakeLosses(FromDictMixin, ResetValuesMixin):
         """
         Estimates whether each turbine is derated, curtailed, or otherwise not operating for each time stamp based on
         power curve filtering. A derated flag is then added to the aggregate data frame for each turbine.
+
+        The flags only depend on the Monte Carlo simulation's derating filter wind speed start,
+        maximum power filter, and wind bin MAD threshold, so they are computed once for each
+        combination of these parameters, and stored as packed bits.
         """
+        key = (
+            self._run.derating_filter_wind_speed_start,
+            self._run.max_power_filter,
+            self._run.wind_bin_mad_thresh,
+        )
+        flags = self._derating_flag_cache.get(key, self._calculate_derating_flags)
 
-        for t in self.turbine_ids:
-            # Apply window range filter to flag samples for which wind speed is greater than a threshold and power is
-            # below 1% of rated power
-
-            turb_capac = self.plant.asset.loc[t, "rated_power"]
-
-            flag_window = filters.window_range_flag(
-                window_col=self.aggregate_df[("WMET_HorWdSpd", t)],
-                window_start=self._run.derating_filter_wind_speed_start,
-                window_end=40,
-                value_col=self.aggregate_df[("WTUR_W", t)],
-                value_min=0.01 * turb_capac,
-                value_max=1.2 * turb_capac,
-            )
+        n_time, n_turbines = self.aggregate_df.shape[0], len(self.turbine_ids)
+        for col, packed_flag in zip(("derate_flag", "abnormal_ws_flag"), flags):
+            flag = np.unpackbits(packed_flag, count=n_time * n_turbines).reshape(n_time, n_turbines)
+            self.aggregate_df[[(col, t) for t in self.turbine_ids]] = flag.astype(bool)
 
-            # Apply bin-based filter to flag samples for which wind speed is greater than a threshold from the median
-            # wind speed in each power bin
-            bin_width_frac = 0.04 * (
-                self._run.max_power_filter - 0.01
-            )  # split into 25 bins TODO: make this an optional argument?
-            flag_bin = filters.bin_filter(
-                bin_col=self.aggregate_df[("WTUR_W", t)],
-                value_col=self.aggregate_df[("WMET_HorWdSpd", t)],
-                bin_width=bin_width_frac * turb_capac,
-                threshold=self._run.wind_bin_mad_thresh,  # wind bin thresh
-                center_type="median",
-                bin_min=0.01 * turb_capac,
-                bin_max=self._run.max_power_filter * turb_capac,
-                threshold_type="mad",
-                direction="above",
-            )
+    def _calculate_derating_flags(self) -> tuple[npt.NDArray[np.uint8], npt.NDArray[np.uint8]]:
+        """
+        Flags the derated, curtailed, or otherwise not operating turbines, and the turbines with an
+        abnormal wind speed measurement, of each time step for the current Monte Carlo simulation.
 
-            self.aggregate_df[("derate_flag", t)] = (
-                self.aggregate_df[("derate_flag", t)] | flag_window | flag_bin
-            )
+        Returns:
+            tuple[npt.NDArray[np.uint8], npt.NDArray[np.uint8]]: The (time step x turbine) derating
+                and abnormal wind speed flags, packed into bits with ``np.packbits``.
+        """
 
-            # Apply bin-based filter to flag samples for which wind speed is less than a threshold from the median
-            # wind speed in each power bin, which likely indicates a faulty wind speed measurement
-            bin_width_frac = 0.04 * (
-                self._run.max_power_filter - 0.01
-            )  # split into 25 bins TODO: make this an optional argument?
-            flag_bin = filters.bin_filter(
-                bin_col=self.aggregate_df[("WTUR_W", t)],
-                value_col=self.aggregate_df[("WMET_HorWdSpd", t)],
-                bin_width=bin_width_frac * turb_capac,
-                threshold=self._run.wind_bin_mad_thresh,  # wind bin thresh
-                center_type="median",
-                bin_min=0.01 * turb_capac,
-                bin_max=self._run.max_power_filter * turb_capac,
-                threshold_type="mad",
-                direction="below",
-            )
+        # Filter the (time x turbine) power and wind speed of all turbines at once
+        power = self.aggregate_df["WTUR_W"].loc[:, self.turbine_ids]
+        windspeed = self.aggregate_df["WMET_HorWdSpd"].loc[:, self.turbine_ids]
+        turb_capac = self.plant.asset.loc[self.turbine_ids, "rated_power"]
+
+        # Apply window range filter to flag samples for which wind speed is greater than a threshold and power is
+        # below 1% of rated power
+        flag_window = filters.window_range_flag_by_asset(
+            window_col=windspeed,
+            window_start=self._run.derating_filter_wind_speed_start,
+            window_end=40,
+            value_col=power,
+            value_min=0.01 * turb_capac,
+            value_max=1.2 * turb_capac,
+        )
 
-            self.aggregate_df[("abnormal_ws_flag", t)] = (
-                self.aggregate_df[("abnormal_ws_flag", t)] | flag_bin
-            )
+        # Apply bin-based filter to flag samples for which wind speed is greater than a threshold from the median
+        # wind speed in each power bin
+        bin_width_frac = 0.04 * (
+            self._run.max_power_filter - 0.01
+        )  # split into 25 bins TODO: make this an optional argument?
+        flag_bin = filters.bin_filter_by_asset(
+            bin_col=power,
+            value_col=windspeed,
+            bin_width=bin_width_frac * turb_capac,
+            threshold=self._run.wind_bin_mad_thresh,  # wind bin thresh
+            center_type="median",
+            bin_min=0.01 * turb_capac,
+            bin_max=self._run.max_power_filter * turb_capac,
+            threshold_type="mad",
+            direction="above",
+        )
+        derate_flag = flag_window.to_numpy() | flag_bin.to_numpy()
+
+        # Apply bin-based filter to flag samples for which wind speed is less than a threshold from the median
+        # wind speed in each power bin, which likely indicates a faulty wind speed measurement
+        flag_bin = filters.bin_filter_by_asset(
+            bin_col=power,
+            value_col=windspeed,
+            bin_width=bin_width_frac * turb_capac,
+            threshold=self._run.wind_bin_mad_thresh,  # wind bin thresh
+            center_type="median",
+            bin_min=0.01 * turb_capac,
+            bin_max=self._run.max_power_filter * turb_capac,
+            threshold_type="mad",
+            direction="below",
+        )
 
-            # Classify the wind speed as abnormal if it is either faulty or corresponding to a derated period
-            self.aggregate_df[("abnormal_ws_flag", t)] = (
-                self.aggregate_df[("abnormal_ws_flag", t)] | self.aggregate_df[("derate_flag", t)]
-            )
+        # Classify the wind speed as abnormal if it is either faulty or corresponding to a derated period
+        abnormal_ws_flag = flag_bin.to_numpy() | derate_flag
+        return np.packbits(derate_flag, axis=None), np.packbits(abnormal_ws_flag, axis=None)
+
+    def _turbine_values(self, df: pd.DataFrame, col: str, dtype: type = float) -> np.ndarray:
+        """Returns the (time step x turbine) array of a turbine-level column of :py:attr:`df`."""
+        return df.loc[:, [(col, t) for t in self.turbine_ids]].to_numpy(dtype=dtype)
 
     @logged_method_call
-    def _apply_LT_correction(self):
+    def _find_freestream_turbines(self) -> dict[float, list[str]]:
         """
-        Estimates long term-corrected wake losses by binning wake losses by wind direction and wind
-        speed and weighting by bin frequencies from long-term historical reanalysis data.
+        Identifies the freestream turbines for each wind direction bin, using the freestream sector
+        width of the current Monte Carlo simulation, and combines consecutive wind direction bins
+        with the same freestream turbines into sectors.
 
         Returns:
-            tuple[float, np.ndarray, np.ndarray, np.ndarray, np.ndarray]: The estimated long
-                term-corrected wake losses, an array containing the estimated turbine-level long
-                term-corrected wake losses, and arrays containing the long-term corrected plant and
-                turbine-level wake losses as well as the normalized wind plant energy production
-                binned by wind direction
+            dict[float, list[str]]: The freestream turbine IDs of each sector, keyed by the starting
+                wind direction of the sector.
         """
-        # First, create hourly data frame for LT correction to match resolution of reanalysis data
-        df_1hr = self.aggregate_df_sample[
-            [
-                ("wind_direction_ref", ""),
-                ("windspeed_mean_freestream", ""),
-                ("actual_plant_power", ""),
-                ("potential_plant_power", ""),
-            ]
-            + [("WTUR_W", t) for t in self.turbine_ids]
-            + [("potential_turbine_power", t) for t in self.turbine_ids]
-            + [(f"WMETR_HorWdSpd_{self._run.reanalysis_product}", "")]
-        ].copy()
+        freestream_table = self.plant.freestream_turbine_table(
+            sector_width=self._run.freestream_sector_width, wd_bin_width=self.wd_bin_width
+        )
 
-        df_1hr = df_1hr.resample("h").mean().dropna(how="any")
+        # Update the dictionary only when the set of turbines differs from the previous wind
+        # direction bin.
+        freestream_turbine_dict = {}
+        freestream_turbine_ids_prev = []
 
-        df_1hr["windspeed_mean_freestream_bin"] = df_1hr["windspeed_mean_freestream"].round()
+        for wd, freestream in freestream_table.iterrows():
+            freestream_turbine_ids = list(freestream_table.columns[freestream.values])
 
-        # Bin by integer wind speeds
-        df_ws_bin = df_1hr.groupby(("windspeed_mean_freestream_bin", "")).mean()
-        df_ws_bin_count = df_1hr.groupby(("windspeed_mean_freestream_bin", "")).count()
+            if freestream_turbine_ids != freestream_turbine_ids_prev:
+                freestream_turbine_dict[wd] = freestream_turbine_ids
+                freestream_turbine_ids_prev = freestream_turbine_ids
 
-        valid_ws_bins = (df_ws_bin.index >= self.min_ws_bin_lin_reg) & (
-            df_ws_bin_count["windspeed_mean_freestream"] >= self.bin_count_thresh_lin_reg
-        )
+        if freestream_turbine_dict[0.0] == list(freestream_turbine_dict.values())[-1]:
+            freestream_turbine_dict.pop(0.0)
 
-        # Find linear regression mapping from SCADA freestream wind speed to reanalysis wind speeds
-        # and use to correct SCADA freestream wind speeds
-        reg = LinearRegression().fit(
-            df_ws_bin.loc[valid_ws_bins].index.values.reshape(-1, 1),
-            df_ws_bin.loc[valid_ws_bins, f"WMETR_HorWdSpd_{self._run.reanalysis_product}"].values,
-        )
+        return freestream_turbine_dict
 
-        df_1hr[f"windspeed_mean_freestream_corr_{self._run.reanalysis_product}"] = reg.predict(
-            df_1hr["windspeed_mean_freestream"].values.reshape(-1, 1)
-        )
+    @logged_method_call
+    def _calculate_por_wake_losses(self):
+        """
+        Estimates the plant and turbine-level wake losses during the period of record from the
+        time steps in :py:attr:`aggregate_df_sample`, which is then limited to the time steps with
+        valid freestream power and wind speed, and extended with the freestream, potential, and
+        actual power columns used for the long-term correction. Each time step's contribution to
+        the sums is weighted by its bootstrap weight in :py:attr:`sample_weights`.
 
-        # adjust the no_wakes_ws_thresh_LT_corr parameter to relect the SCADA wind speed correction as well
-        no_wakes_ws_corr_thresh_LT_corr = np.round(
-            reg.predict(np.array(self.no_wakes_ws_thresh_LT_corr).reshape(1, -1))[0]
+        The estimates are computed from (time step x turbine) arrays, where each time step is
+        assigned to a freestream wind direction sector, and the freestream power and wind speed are
+        reduced over the freestream turbines of each time step's sector.
+
+        Returns:
+            tuple[float, list[float], np.ndarray, np.ndarray, np.ndarray]: The estimated wake
+                losses, the turbine-level wake losses, the plant and turbine-level wind plant
+                efficiency binned by wind direction, and the normalized wind plant energy production
+                binned by wind direction.
+        """
+        sample = self.aggregate_df_sample
+        power = self._turbine_values(sample, "WTUR_W")
+        windspeed = self._turbine_values(sample, "WMET_HorWdSpd")
+        derate_flag = self._turbine_values(sample, "derate_flag", dtype=bool)
+        abnormal_ws_flag = self._turbine_values(sample, "abnormal_ws_flag", dtype=bool)
+        wind_direction = sample[("wind_direction_ref", "")].to_numpy(dtype=float)
+
+        # Turbine power and wind speed during normal operation (NaN otherwise)
+        power_normal = np.where(derate_flag, np.nan, power)
+        windspeed_normal = np.where(abnormal_ws_flag, np.nan, windspeed)
+
+        # Assign each time step to a freestream sector, and count the number of times each turbine
+        # is a freestream turbine of each sector. If UQ is enabled, randomly resample the set of
+        # freestream turbines of each sector.
+        freestream_turbine_dict = self._find_freestream_turbines()
+        sectors = _assign_freestream_sectors(
+            wind_direction, list(freestream_turbine_dict), self.wd_bin_width
         )
+        turbine_index = {t: i for i, t in enumerate(self.turbine_ids)}
+        membership = np.zeros((len(freestream_turbine_dict), len(self.turbine_ids)))
+        for i_wd, freestream_turbine_ids in enumerate(freestream_turbine_dict.values()):
+            if self.UQ:
+                freestream_turbine_ids = self._rng.choices(
+                    freestream_turbine_ids, k=len(freestream_turbine_ids)
+                )
+            for t in freestream_turbine_ids:
+                membership[i_wd, turbine_index[t]] += 1
 
-        # get reanalysis data and limit date range
-        df_reanal = self.plant.reanalysis[self._run.reanalysis_product].copy()
-        df_reanal = df_reanal.loc[
-            (df_reanal.index <= self.end_date_lt)
-            & (
-                df_reanal.index
-                > self.end_date_lt - pd.offsets.DateOffset(years=self._run.num_years_LT)
-            )
-        ]
-        df_reanal["windspeed_bin"] = (
-            self.ws_bin_width_LT_corr
-            * (df_reanal["WMETR_HorWdSpd"] / self.ws_bin_width_LT_corr).round()
+        # Representative power and wind speed of the freestream turbines. If correct_for_derating is
+        # True, only freestream turbines operating normally will be considered.
+        power_mean_freestream = _reduce_freestream(
+            power_normal, sectors, membership, self.freestream_power_method
         )
-        df_reanal["wind_direction_bin"] = (
-            self.wd_bin_width_LT_corr
-            * (df_reanal["WMETR_HorWdDir"] / self.wd_bin_width_LT_corr).round()
+        windspeed_mean_freestream = _reduce_freestream(
+            windspeed_normal, sectors, membership, self.freestream_wind_speed_method
         )
-        df_reanal.loc[df_reanal["wind_direction_bin"] == 360.0, "wind_direction_bin"] = 0.0
 
-        df_reanal["freq"] = 1.0
-        df_reanal = df_reanal.groupby(["wind_direction_bin", "windspeed_bin"]).count()["freq"]
+        if self.correct_for_ws_heterogeneity:
+            speedup_factor = self._turbine_values(sample, "speedup_factor")
+
+            # Create a representative power curve model for the turbines in the plant
+            self.power_curve_func = power_curve.IEC(
+                pd.Series(windspeed_normal.ravel()),
+                pd.Series(power_normal.ravel()),
+                windspeed_end=100.0,
+                interpolate=True,
+                weights=np.repeat(self.sample_weights, len(self.turbine_ids)),
+            )
 
-        # Create data frame with long-term frequencies of wind direction and wind speed bins from reanalysis data
-        df_reanal_freqs = pd.DataFrame(df_reanal / df_reanal.sum())
+            # Estimate expected wind speed at each turbine location based on speedup factors and
+            # wind speeds at normally operating freestream wind turbines.
+            mean_speedup_factor = _reduce_freestream(
+                np.where(abnormal_ws_flag, np.nan, speedup_factor), sectors, membership, "mean"
+            )
+            windspeed_freestream_estimate = (
+                speedup_factor * (windspeed_mean_freestream / mean_speedup_factor)[:, None]
+            )
 
-        # Weight wake losses in each wind direction and wind speed bin by long-term frequencies to
-        # estimate long-term wake losses
-        df_1hr["windspeed_bin"] = (
-            self.ws_bin_width_LT_corr
-            * (
-                df_1hr[f"windspeed_mean_freestream_corr_{self._run.reanalysis_product}"]
-                / self.ws_bin_width_LT_corr
-            ).round()
-        )
-        df_1hr["wind_direction_bin"] = (
-            self.wd_bin_width_LT_corr
-            * (df_1hr["wind_direction_ref"] / self.wd_bin_width_LT_corr).round()
-        )
-        df_1hr.loc[df_1hr["wind_direction_bin"] == 360.0, "wind_direction_bin"] = 0.0
+            # Correct mean freestream wind speed to represent mean freestream wind speed over all
+            # turbines in the plant based on speedup factors of unwaked turbines
+            windspeed_mean_freestream = windspeed_mean_freestream / mean_speedup_factor
 
-        # First, compute POR wake losses as a function of wind speed
-        df_1hr_ws_por_bin = df_1hr.groupby(("windspeed_bin", "")).sum()
+            # Interpolate power curve to estimate potential freestream power
+            in_sector = sectors >= 0
+            power_freestream_estimate = np.full_like(power, np.nan)
+            power_freestream_estimate[in_sector] = self.power_curve_func(
+                windspeed_freestream_estimate[in_sector]
+            )
 
-        # reindex to fill in missing wind speed bins
-        index = np.arange(0.0, 31.0, self.ws_bin_width_LT_corr)
-        df_1hr_ws_por_bin = df_1hr_ws_por_bin.reindex(index)
+            # Get mean estimated freestream power of normally operating unwaked turbines
+            weights = np.where(in_sector[:, None], membership[sectors], 0.0) * ~derate_flag
+            with np.errstate(divide="ignore", invalid="ignore"):
+                power_mean_freestream_estimate = (
+                    weights * np.nan_to_num(power_freestream_estimate, nan=0.0)
+                ).sum(axis=1) / weights.sum(axis=1)
+
+        # Remove time steps where no freestream turbines in normal operation were identified
+        valid = ~np.isnan(power_mean_freestream) & ~np.isnan(windspeed_mean_freestream)
+        weights = self.sample_weights[valid]
+        power = power[valid]
+        derate_flag = derate_flag[valid]
+        wind_direction = wind_direction[valid]
+        power_mean_freestream = power_mean_freestream[valid]
+        windspeed_mean_freestream = windspeed_mean_freestream[valid]
+
+        # Calculate total plant-level wake losses during period of record
+
+        # Determine ideal wind plant energy, correcting for derated turbines if correct_for_derating is True. If
+        # correct_for_derating is True, ideal energy is calculated as the sum of the power produced by derated
+        # turbines and the mean power produced by freestream turbines operating normally multiplied by the total
+        # number of turbines operating normally. If correcting for wind speed heterogeneity, the ideal power of
+        # the normally operating turbines is given by scaling the mean power of the normally operating freestream
+        # turbines by a correction factor determined using the estimated power variations across the wind plant
+        # from the provided wind speed speedup factors.
+        total_derated_turbine_power = np.nansum(np.where(derate_flag, power, 0.0), axis=1)
+        n_normal_turbines = (~derate_flag).sum(axis=1)
 
-        wake_losses_por_ws = (
-            df_1hr_ws_por_bin[("actual_plant_power", "")]
-            / df_1hr_ws_por_bin[("potential_plant_power", "")]
-        ).values
+        if self.correct_for_ws_heterogeneity:
+            power_freestream_estimate = power_freestream_estimate[valid]
+            power_mean_freestream_estimate = power_mean_freestream_estimate[valid]
+            total_power_freestream_estimate = np.nansum(
+                np.where(derate_flag, 0.0, power_freestream_estimate), axis=1
+            )
+
+            # Indices where mean measured power and the mean estimated freestream power of all
+            # turbines are greater than zero, and mean estimated freestream power is
+            # sufficiently large (treated as greater than 1 kW), allowing valid potential power
+            # corrections.
+            valid_ix = power_mean_freestream > 0
+            valid_ix &= total_power_freestream_estimate > 0
+            valid_ix &= power_mean_freestream_estimate > 1.0
+
+            # For invalid indices, use measured power of freestream turbines
+            with np.errstate(divide="ignore", invalid="ignore"):
+                total_potential_freestream_power = np.where(
+                    valid_ix,
+                    power_mean_freestream
+                    * total_power_freestream_estimate
+                    / power_mean_freestream_estimate,
+                    power_mean_freestream * n_normal_turbines,
+                )
 
-        energy_por_ws = (
-            df_1hr_ws_por_bin[("actual_plant_power", "")].values
-            / df_1hr_ws_por_bin[("actual_plant_power", "")].sum()
+            # Check for corrected potential power values greater than the maximum possible
+            # output of number of normally operating turbines
+            plant_power_max = np.nanmax(power) * n_normal_turbines
+            total_potential_freestream_power = np.where(
+                total_potential_freestream_power > plant_power_max,
+                plant_power_max,
+                total_potential_freestream_power,
+            )
+        else:
+            total_potential_freestream_power = power_mean_freestream * n_normal_turbines
+
+        potential_plant_power = total_potential_freestream_power + total_derated_turbine_power
+        actual_plant_power = np.nansum(power, axis=1)
+
+        wake_losses_por = 1 - np.nansum(actual_plant_power * weights) / np.nansum(
+            potential_plant_power * weights
         )
 
-        turbine_wake_losses_por_ws = np.empty(
-            [len(self.turbine_ids), int(30.0 / self.ws_bin_width_LT_corr) + 1]
+        # bin wake losses by wind direction
+        wind_direction_bin = self.wd_bin_width_LT_corr * np.round(
+            wind_direction / self.wd_bin_width_LT_corr
         )
-        for i, t in enumerate(self.turbine_ids):
-            turbine_wake_losses_por_ws[i, :] = (
-                df_1hr_ws_por_bin[("WTUR_W", t)] / df_1hr_ws_por_bin[("potential_turbine_power", t)]
-            ).values
+        wind_direction_bin[wind_direction_bin == 360.0] = 0.0
 
-        # Bin variables by wind direction and wind speed
-        df_1hr_bin = df_1hr.groupby([("wind_direction_bin", ""), ("windspeed_bin", "")]).mean()
+        # Calculate turbine-level wake losses during period of record
 
-        df_1hr_bin = pd.concat([df_reanal_freqs, df_1hr_bin], axis=1)
+        # Determine ideal turbine energy as sum of the power produced by the turbine when it is
+        # derated and the mean power produced by all freestream turbines when the turbine is
+        # operating normally
+        if self.correct_for_ws_heterogeneity:
+            # Indices where mean measured power and the mean estimated freestream power of all
+            # turbines are greater than zero, and mean estimated freestream power is sufficiently
+            # large (treated as greater than 1 kW times the number of normally operating freestream
+            # turbines), allowing valid potential power corrections.
+            valid_inds_freestream_power = (
+                (power_mean_freestream[:, None] > 0)
+                & (power_freestream_estimate > 0)
+                & (power_mean_freestream_estimate[:, None] > 1.0)
+            )
 
-        # If specified, assume no wake losses at wind speeds above a given threshold for bins where
-        # data are missing by assigning rated power to the actual and potential power production
-        if self.assume_no_wakes_high_ws_LT_corr:
-            fill_inds = (df_1hr_bin[("actual_plant_power", "")].isna()) & (
-                df_1hr_bin.index.get_level_values(1) >= no_wakes_ws_corr_thresh_LT_corr
+            # For indices with insufficiently high freestream power, use measured power of
+            # freestream turbines
+            with np.errstate(divide="ignore", invalid="ignore"):
+                potential_turbine_power = np.where(
+                    valid_inds_freestream_power,
+                    power_mean_freestream[:, None]
+                    * power_freestream_estimate
+                    / power_mean_freestream_estimate[:, None],
+                    power_mean_freestream[:, None],
+                )
+
+            # Check for corrected potential power values greater than the maximum possible
+            turbine_power_max = np.fmax.reduce(np.where(derate_flag, np.nan, power), axis=0)
+            potential_turbine_power = np.where(
+                potential_turbine_power > turbine_power_max,
+                turbine_power_max,
+                potential_turbine_power,
+            )
+        else:
+            potential_turbine_power = np.repeat(
+                power_mean_freestream[:, None], len(self.turbine_ids), axis=1
+            )
+        potential_turbine_power = np.where(derate_flag, power, potential_turbine_power)
+
+        turbine_wake_losses_por = list(
+            1
+            - np.nansum(power * weights[:, None], axis=0)
+            / np.nansum(potential_turbine_power * weights[:, None], axis=0)
+        )
+
+        # Keep the valid time steps, with the columns needed for the long-term correction
+        columns = [
+            ("power_mean_freestream", ""),
+            ("windspeed_mean_freestream", ""),
+            ("potential_plant_power", ""),
+            ("actual_plant_power", ""),
+            ("wind_direction_bin", ""),
+        ] + [("potential_turbine_power", t) for t in self.turbine_ids]
+        sample = sample.loc[valid]
+        self._sample_rows = self._sample_rows[valid]
+        self.aggregate_df_sample = pd.concat(
+            [
+                sample,
+                pd.DataFrame(
+                    np.column_stack(
+                        [
+                            power_mean_freestream,
+                            windspeed_mean_freestream,
+                            potential_plant_power,
+                            actual_plant_power,
+                            wind_direction_bin,
+                            potential_turbine_power,
+                        ]
+                    ),
+                    index=sample.index,
+                    columns=pd.MultiIndex.from_tuples(columns),
+                ),
+            ],
+            axis=1,
+        )
+        self.sample_weights = weights
+
+        # Sum the plant and turbine-level actual and potential power in each wind direction bin
+        n_turbines = len(self.turbine_ids)
+        df_wd_bin = (
+            pd.DataFrame(
+                np.column_stack(
+                    [actual_plant_power, potential_plant_power, power, potential_turbine_power]
+                )
+                * weights[:, None]
             )
-            df_1hr_bin.loc[
-                fill_inds, [("actual_plant_power", ""), ("potential_plant_power", "")]
-            ] = (self.plant.metadata.capacity * 1e3)
-            df_1hr_bin.loc[
-                fill_inds,
-                [("WTUR_W", t) for t in self.turbine_ids]
-                + [("potential_turbine_power", t) for t in self.turbine_ids],
-            ] = 2 * [self.plant.asset.loc[t, "rated_power"] for t in self.turbine_ids]
-
-        df_1hr_bin["actual_plant_energy"] = (
-            df_1hr_bin["freq"] * df_1hr_bin[("actual_plant_power", "")]
+            .groupby(wind_direction_bin)
+            .sum()
+            .reindex(np.arange(0.0, 360.0, self.wd_bin_width_LT_corr))
+            .to_numpy()
         )
-        df_1hr_bin["potential_plant_energy"] = (
-            df_1hr_bin["freq"] * df_1hr_bin[("potential_plant_power", "")]
+
+        # Save plant and turbine-level wake losses binned by wind direction
+        with np.errstate(divide="ignore", invalid="ignore"):
+            wake_losses_por_wd = df_wd_bin[:, 0] / df_wd_bin[:, 1]
+            turbine_wake_losses_por_wd = (
+                df_wd_bin[:, 2 : 2 + n_turbines] / df_wd_bin[:, 2 + n_turbines :]
+            ).T
+        energy_por_wd = df_wd_bin[:, 0] / np.nansum(df_wd_bin[:, 0])
+
+        return (
+            wake_losses_por,
+            turbine_wake_losses_por,
+            wake_losses_por_wd,
+            turbine_wake_losses_por_wd,
+            energy_por_wd,
         )
 
-        wake_losses_lt = 1 - (
-            df_1hr_bin["actual_plant_energy"].sum() / df_1hr_bin["potential_plant_energy"].sum()
+    @logged_method_call
+    def _calculate_hourly_aggregate(self):
+        """
+        Averages the time steps of :py:attr:`aggregate_df_sample` in each hour, weighted by their
+        bootstrap weights, to match the resolution of the reanalysis data for the long-term
+        correction. The time steps are grouped by their hour, which is found once when the aggregate
+        data are set up, and averaged identically to a resampled data frame, only including the
+        reanalysis wind speeds of the current simulation's product when :py:attr:`UQ` is True.
+        """
+        products = [self._run.reanalysis_product] if self.UQ else self.reanalysis_products
+        columns = (
+            HOURLY_COLUMNS
+            + [(col, t) for col in HOURLY_TURBINE_COLUMNS for t in self.turbine_ids]
+            + [(f"WMETR_HorWdSpd_{product}", "") for product in products]
+        )
+        hours, hourly = _weighted_bin_means(
+            self._hour_codes[self._sample_rows],
+            self.aggregate_df_sample[columns].to_numpy(dtype=float),
+            self.sample_weights,
+            self._hours.size,
         )
+        self._aggregate_hourly = pd.DataFrame(hourly, index=self._hours[hours], columns=columns)
 
-        # Calculate long-term corrected turbine-level wake losses
-        turbine_wake_losses_lt = len(self.turbine_ids) * [0.0]
-        for i, t in enumerate(self.turbine_ids):
-            # determine ideal turbine energy as sum of the power produced by the turbine when it is derated and the
-            # mean power produced by all freestream turbines when the turbine is operating normally
+    def _calculate_reanalysis_frequencies(self) -> tuple[NDArrayFloat, int, int]:
+        """
+        Computes the long-term frequency of each wind direction and wind speed bin from the
+        reanalysis data of the current simulation's product and number of years.
 
-            df_1hr_bin[("energy_avg", t)] = df_1hr_bin["freq"] * df_1hr_bin[("WTUR_W", t)]
-            df_1hr_bin[("potential_turbine_energy", t)] = (
-                df_1hr_bin["freq"] * df_1hr_bin[("potential_turbine_power", t)]
+        Returns:
+            tuple[NDArrayFloat, int, int]: The (wind direction bin x wind speed bin) frequencies,
+                and the bin numbers of the first wind direction and wind speed bins, where the bin
+                number is the bin's value divided by the bin width.
+        """
+        df_reanal = self.plant.reanalysis[self._run.reanalysis_product]
+        df_reanal = df_reanal.loc[
+            (df_reanal.index <= self.end_date_lt)
+            & (
+                df_reanal.index
+                > self.end_date_lt - pd.offsets.DateOffset(years=self._run.num_years_LT)
             )
+        ]
+        wd_bin, ws_bin = self._bin_numbers(
+            df_reanal["WMETR_HorWdDir"].to_numpy(dtype=float),
+            df_reanal["WMETR_HorWdSpd"].to_numpy(dtype=float),
+        )
+        valid = (wd_bin != MISSING_BIN) & (ws_bin != MISSING_BIN)
+        wd_bin, ws_bin = wd_bin[valid], ws_bin[valid]
 
-            turbine_wake_losses_lt[i] = 1 - (
-                df_1hr_bin[("energy_avg", t)].sum()
-                / df_1hr_bin[("potential_turbine_energy", t)].sum()
-            )
+        first_wd_bin, first_ws_bin = wd_bin.min(), ws_bin.min()
+        shape = (wd_bin.max() - first_wd_bin + 1, ws_bin.max() - first_ws_bin + 1)
+        counts = np.bincount(
+            (wd_bin - first_wd_bin) * shape[1] + ws_bin - first_ws_bin, minlength=np.prod(shape)
+        )
+        return (counts / counts.sum()).reshape(shape), first_wd_bin, first_ws_bin
 
-        # Save long-term corrected plant and turbine-level wake losses binned by wind direction
-        df_1hr_wd_bin = df_1hr_bin.groupby(level=[0]).sum()
+    def _bin_numbers(
+        self, wind_direction: NDArrayFloat, windspeed: NDArrayFloat
+    ) -> tuple[npt.NDArray[np.int_], npt.NDArray[np.int_]]:
+        """
+        Assigns the wind direction and wind speed bins of the long-term correction, where the
+        360 degree wind direction bin is the 0 degree bin.
+
+        Args:
+            wind_direction (NDArrayFloat): The wind directions, in degrees.
+            windspeed (NDArrayFloat): The wind speeds, in m/s.
+
+        Returns:
+            tuple[npt.NDArray[np.int_], npt.NDArray[np.int_]]: The wind direction and wind speed
+                bin numbers, which are the bin values divided by the bin widths, and
+                :py:data:`MISSING_BIN` for missing data.
+        """
+        wd_bin = self.wd_bin_width_LT_corr * np.round(wind_direction / self.wd_bin_width_LT_corr)
+        wd_bin[wd_bin == 360.0] = 0.0
+        wd_bin = np.nan_to_num(np.round(wd_bin / self.wd_bin_width_LT_corr), nan=MISSING_BIN)
+        ws_bin = np.nan_to_num(np.round(windspeed / self.ws_bin_width_LT_corr), nan=MISSING_BIN)
+        return wd_bin.astype(np.int64), ws_bin.astype(np.int64)
+
+    @logged_method_call
+    def _apply_LT_correction(self):
+        """
+        Estimates long term-corrected wake losses by binning wake losses by wind direction and wind
+        speed and weighting by bin frequencies from long-term historical reanalysis data.
 
-        index = np.arange(0.0, 360.0, self.wd_bin_width_LT_corr)
-        df_1hr_wd_bin = df_1hr_wd_bin.reindex(index)
+        The hourly data of the simulation are binned with ``np.bincount``, and the binned power is
+        weighted by the long-term frequencies of the bins, which are computed once for each
+        reanalysis product, number of years, and set of bin widths.
 
-        wake_losses_lt_wd = (
-            df_1hr_wd_bin["actual_plant_energy"] / df_1hr_wd_bin["potential_plant_energy"]
-        ).values
+        Returns:
+            tuple[float, np.ndarray, np.ndarray, np.ndarray, np.ndarray]: The estimated long
+                term-corrected wake losses, an array containing the estimated turbine-level long
+                term-corrected wake losses, and arrays containing the long-term corrected plant and
+                turbine-level wake losses as well as the normalized wind plant energy production
+                binned by wind direction
+        """
+        n_turbines = len(self.turbine_ids)
+        reanalysis_col = (f"WMETR_HorWdSpd_{self._run.reanalysis_product}", "")
+        power_cols = HOURLY_COLUMNS[2:] + [
+            (col, t) for col in HOURLY_TURBINE_COLUMNS for t in self.turbine_ids
+        ]
 
-        energy_lt_wd = (
-            df_1hr_wd_bin["actual_plant_energy"].values / df_1hr_wd_bin["actual_plant_energy"].sum()
+        # Hourly data for the LT correction, with the plant-level actual and potential power,
+        # followed by the turbine-level actual and potential power
+        df_1hr = self._aggregate_hourly[HOURLY_COLUMNS + power_cols[2:] + [reanalysis_col]].dropna(
+            how="any"
         )
+        power = df_1hr[power_cols].to_numpy()
+        windspeed = df_1hr[("windspeed_mean_freestream", "")].to_numpy()
 
-        turbine_wake_losses_lt_wd = np.empty(
-            [len(self.turbine_ids), int(360.0 / self.wd_bin_width_LT_corr)]
+        # Bin by integer wind speeds
+        ws_bins, ws_bin_codes = np.unique(np.round(windspeed), return_inverse=True)
+        ws_bin_count = np.bincount(ws_bin_codes)
+        reanalysis_ws_bin = (
+            np.bincount(ws_bin_codes, weights=df_1hr[reanalysis_col].to_numpy()) / ws_bin_count
+        )
+        valid_ws_bins = (ws_bins >= self.min_ws_bin_lin_reg) & (
+            ws_bin_count >= self.bin_count_thresh_lin_reg
         )
-        for i, t in enumerate(self.turbine_ids):
-            turbine_wake_losses_lt_wd[i, :] = (
-                df_1hr_wd_bin[("energy_avg", t)] / df_1hr_wd_bin[("potential_turbine_energy", t)]
-            ).values
 
-        # Save long-term corrected plant and turbine-level wake losses binned by wind speed
-        df_1hr_ws_bin = df_1hr_bin.groupby(level=[1]).sum()
+        # Find linear regression mapping from SCADA freestream wind speed to reanalysis wind speeds
+        # and use to correct SCADA freestream wind speeds
+        reg = LinearRegression().fit(
+            ws_bins[valid_ws_bins].reshape(-1, 1), reanalysis_ws_bin[valid_ws_bins]
+        )
+        windspeed_corr = reg.predict(windspeed.reshape(-1, 1))
 
-        # reindex to fill in missing wind speed bins
-        index = np.arange(0.0, 31.0, self.ws_bin_width_LT_corr)
-        df_1hr_ws_bin = df_1hr_ws_bin.reindex(index)
+        # adjust the no_wakes_ws_thresh_LT_corr parameter to relect the SCADA wind speed correction as well
+        no_wakes_ws_corr_thresh_LT_corr = np.round(
+            reg.predict(np.array(self.no_wakes_ws_thresh_LT_corr).reshape(1, -1))[0]
+        )
 
-        wake_losses_lt_ws = (
-            df_1hr_ws_bin["actual_plant_energy"] / df_1hr_ws_bin["potential_plant_energy"]
-        ).values
+        # Get the long-term frequencies of the wind direction and wind speed bins from the
+        # reanalysis data
+        key = (
+            self._run.reanalysis_product,
+            self._run.num_years_LT,
+            self.wd_bin_width_LT_corr,
+            self.ws_bin_width_LT_corr,
+        )
+        freqs, first_wd_bin, first_ws_bin = self._reanalysis_frequency_cache.get(
+            key, self._calculate_reanalysis_frequencies
+        )
 
-        energy_lt_ws = (
-            df_1hr_ws_bin["actual_plant_energy"].values / df_1hr_ws_bin["actual_plant_energy"].sum()
+        # Weight wake losses in each wind direction and wind speed bin by long-term frequencies to
+        # estimate long-term wake losses
+        wd_bin, ws_bin = self._bin_numbers(
+            df_1hr[("wind_direction_ref", "")].to_numpy(), windspeed_corr
         )
+        n_wd_bins = np.arange(0.0, 360.0, self.wd_bin_width_LT_corr).size
+        n_ws_bins = np.arange(0.0, 31.0, self.ws_bin_width_LT_corr).size
 
-        turbine_wake_losses_lt_ws = np.empty(
-            [len(self.turbine_ids), int(30.0 / self.ws_bin_width_LT_corr) + 1]
+        # First, compute POR wake losses as a function of wind speed
+        in_range = (ws_bin >= 0) & (ws_bin < n_ws_bins)
+        power_por_ws = _bin_sums(ws_bin[in_range], power[in_range], n_ws_bins)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            wake_losses_por_ws = power_por_ws[:, 0] / power_por_ws[:, 1]
+            turbine_wake_losses_por_ws = (
+                power_por_ws[:, 2 : 2 + n_turbines] / power_por_ws[:, 2 + n_turbines :]
+            ).T
+        energy_por_ws = power_por_ws[:, 0] / np.nansum(power_por_ws[:, 0])
+
+        # Average the power in each wind direction and wind speed bin of the frequency table
+        table_wd_bin = wd_bin - first_wd_bin
+        table_ws_bin = ws_bin - first_ws_bin
+        in_table = (
+            (table_wd_bin >= 0)
+            & (table_wd_bin < freqs.shape[0])
+            & (table_ws_bin >= 0)
+            & (table_ws_bin < freqs.shape[1])
         )
-        for i, t in enumerate(self.turbine_ids):
-            turbine_wake_losses_lt_ws[i, :] = (
-                df_1hr_ws_bin[("energy_avg", t)] / df_1hr_ws_bin[("potential_turbine_energy", t)]
-            ).values
+        table_bin = table_wd_bin[in_table] * freqs.shape[1] + table_ws_bin[in_table]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            power_bin = (
+                _bin_sums(table_bin, power[in_table], freqs.size)
+                / np.bincount(table_bin, minlength=freqs.size)[:, None]
+            )
+
+        # If specified, assume no wake losses at wind speeds above a given threshold for bins where
+        # data are missing by assigning rated power to the actual and potential power production
+        if self.assume_no_wakes_high_ws_LT_corr:
+            ws_bin_values = self.ws_bin_width_LT_corr * (
+                np.arange(freqs.shape[1]) + first_ws_bin
+            ).astype(float)
+            fill_bins = np.isnan(power_bin[:, 0]) & np.tile(
+                ws_bin_values >= no_wakes_ws_corr_thresh_LT_corr, freqs.shape[0]
+            )
+            rated_power = self.plant.asset.loc[self.turbine_ids, "rated_power"].to_numpy()
+            power_bin[fill_bins] = np.r_[
+                2 * [self.plant.metadata.capacity * 1e3], np.tile(rated_power, 2)
+            ]
+
+        # Long-term energy of each bin, where bins without data don't contribute
+        energy_bin = np.nan_to_num(freqs.reshape(-1, 1) * power_bin, nan=0.0)
+        energy = energy_bin.sum(axis=0)
+        wake_losses_lt = 1 - energy[0] / energy[1]
+
+        # Calculate long-term corrected turbine-level wake losses, where the ideal turbine energy
+        # is the sum of the power produced by the turbine when it is derated and the mean power
+        # produced by all freestream turbines when the turbine is operating normally
+        turbine_wake_losses_lt = list(1 - energy[2 : 2 + n_turbines] / energy[2 + n_turbines :])
+
+        # Sum the energy of each wind direction and wind speed bin, where a bin with data in either
+        # the reanalysis or hourly SCADA data has zero energy if none of its bins have any energy
+        energy_bin = energy_bin.reshape(*freqs.shape, -1)
+        wd_present = np.zeros(n_wd_bins, dtype=bool)
+        ws_present = np.zeros(n_ws_bins, dtype=bool)
+        for present, bins, first_bin, reanalysis_count in (
+            (wd_present, wd_bin, first_wd_bin, freqs.sum(axis=1)),
+            (ws_present, ws_bin, first_ws_bin, freqs.sum(axis=0)),
+        ):
+            bins = np.r_[bins, np.flatnonzero(reanalysis_count > 0) + first_bin]
+            present[bins[(bins >= 0) & (bins < present.size)]] = True
+        energy_wd = _level_sums(energy_bin.sum(axis=1), first_wd_bin, wd_present)
+        energy_ws = _level_sums(energy_bin.sum(axis=0), first_ws_bin, ws_present)
+
+        # Save long-term corrected plant and turbine-level wake losses binned by wind direction
+        # and wind speed
+        with np.errstate(divide="ignore", invalid="ignore"):
+            wake_losses_lt_wd = energy_wd[:, 0] / energy_wd[:, 1]
+            turbine_wake_losses_lt_wd = (
+                energy_wd[:, 2 : 2 + n_turbines] / energy_wd[:, 2 + n_turbines :]
+            ).T
+            wake_losses_lt_ws = energy_ws[:, 0] / energy_ws[:, 1]
+            turbine_wake_losses_lt_ws = (
+                energy_ws[:, 2 : 2 + n_turbines] / energy_ws[:, 2 + n_turbines :]
+            ).T
+        energy_lt_wd = energy_wd[:, 0] / np.nansum(energy_wd[:, 0])
+        energy_lt_ws = energy_ws[:, 0] / np.nansum(energy_ws[:, 0])
 
         return (
             wake_losses_lt,
@@ -35,6 +35,7 @@
 from __future__ import annotations
 
 from copy import deepcopy
+from typing import Callable
 
 import attrs
 import numpy as np
@@ -42,12 +43,21 @@ import pandas as pd
 import numpy.typing as npt
 from tqdm import tqdm
 from attrs import field, define
-from scipy.optimize import curve_fit
 
 from openoa.plant import PlantData
 from openoa.utils import plot, filters
 from openoa.schema import FromDictMixin, ResetValuesMixin
 from openoa.logging import logging, logged_method_call
+from openoa.utils.cache import (
+    ResultCache,
+    convert_to_cache,
+    analysis_cache_key,
+    load_cached_results,
+    store_cached_results,
+)
+from openoa.analysis._random import SEED_TYPES, AnalysisRandomState
+from openoa.analysis._parallel import run_parallel_monte_carlo
+from openoa.analysis._progress import ProgressReporter, MonteCarloProgress
 from openoa.analysis._analysis_validators import validate_UQ_input, validate_half_closed_0_1_right
 
 logger = logging.getLogger(__name__)
@@ -70,6 +80,140 @@ def cos_curve(x, A, Offset, cos_exp):
     return A * np.cos((np.pi / 180) * (x - Offset)) ** cos_exp
 
 
+def _cos_curve_residuals(
+    x: NDArrayFloat, y: NDArrayFloat, valid: npt.NDArray[np.bool_], params: NDArrayFloat
+) -> tuple[NDArrayFloat, NDArrayFloat]:
+    """Computes the residuals of the cosine exponent curve of each group and their derivatives with
+    respect to the curve parameters, where the residuals of missing points are 0.
+
+    Args:
+        x (NDArrayFloat): The (group x point) yaw misalignments, in degrees.
+        y (NDArrayFloat): The (group x point) values being fit.
+        valid (npt.NDArray[np.bool_]): The (group x point) flags for the points being fit.
+        params (NDArrayFloat): The (group x 3) amplitude, offset, and exponent of each group's curve.
+
+    Returns:
+        tuple[NDArrayFloat, NDArrayFloat]: The (group x point) residuals and the (group x point x 3)
+            Jacobian of the residuals.
+    """
+    A, offset, cos_exp = (params[:, [j]] for j in range(3))
+    angle = (np.pi / 180) * (x - offset)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        cos = np.cos(angle)
+        cos_pow = cos**cos_exp
+        jacobian = np.stack(
+            [
+                cos_pow,
+                (np.pi / 180) * A * cos_exp * cos_pow * np.tan(angle),
+                A * cos_pow * np.log(cos),
+            ],
+            axis=-1,
+        )
+    residuals = np.where(valid, A * cos_pow - y, 0.0)
+    return residuals, np.where(valid[..., None], jacobian, 0.0)
+
+
+def fit_cos_curves(
+    x: npt.ArrayLike,
+    y: npt.ArrayLike,
+    p0: npt.ArrayLike | None = None,
+    xtol: float = 1e-10,
+    max_iterations: int = 800,
+) -> NDArrayFloat:
+    """Fits a :py:func:`cos_curve` to each group of points at once with the Levenberg-Marquardt
+    method, which minimizes the sum of the squared residuals of each group, as in
+    ``scipy.optimize.curve_fit``. The damped Gauss-Newton steps of all of the groups are solved
+    together, and a group stops iterating once its step is within :py:attr:`xtol` of its parameters.
+    The fits of nearly flat curves can creep along a valley of equally good parameters without
+    converging, in which case their current parameters are returned, and the groups are logged in a
+    warning.
+
+    Args:
+        x (:obj:`numpy.typing.ArrayLike`): The (group x point) yaw misalignments, in degrees, or
+            the yaw misalignments of the points of every group.
+        y (:obj:`numpy.typing.ArrayLike`): The (group x point) values being fit, where NaN values
+            are missing points.
+        p0 (:obj:`numpy.typing.ArrayLike`, optional): The (group x 3) initial amplitude, offset, and
+            exponent of each group's curve. Defaults to the largest value of each group, 0 degrees,
+            and an exponent of 2.
+        xtol (float, optional): The relative change in the parameters of a step below which a
+            group's fit has converged. Defaults to 1e-10.
+        max_iterations (int, optional): The maximum number of steps, which matches the 800
+            function evaluations ``scipy.optimize.curve_fit`` allows for 3 parameters. Defaults to
+            800.
+
+    Raises:
+        ValueError: Raised if any group has fewer points than the 3 curve parameters.
+
+    Returns:
+        NDArrayFloat: The (group x 3) best-fit amplitude, offset (degrees), and exponent of each
+            group's curve.
+    """
+    y = np.asarray(y, dtype=float)
+    x = np.broadcast_to(np.asarray(x, dtype=float), y.shape)
+    valid = ~np.isnan(y)
+    if (too_few := valid.sum(axis=1) < 3).any():
+        raise ValueError(
+            f"The cosine curves of groups {np.flatnonzero(too_few).tolist()} have fewer than 3 "
+            "points to fit."
+        )
+    x = np.where(valid, x, 0.0)
+    y = np.where(valid, y, 0.0)
+
+    if p0 is None:
+        p0 = np.column_stack(
+            [
+                np.where(valid, y, -np.inf).max(axis=1),
+                np.zeros(y.shape[0]),
+                np.full(y.shape[0], 2.0),
+            ]
+        )
+    params = np.array(p0, dtype=float)
+    residuals, jacobian = _cos_curve_residuals(x, y, valid, params)
+    cost = (residuals**2).sum(axis=1)
+    damping = np.full(y.shape[0], 1e-3)
+
+    active = np.arange(y.shape[0])
+    for _ in range(max_iterations):
+        if active.size == 0:
+            break
+
+        # Solve the damped normal equations of every group that has not yet converged
+        J = jacobian[active]
+        JtJ = np.einsum("gmi,gmj->gij", J, J)
+        gradient = np.einsum("gmi,gm->gi", J, residuals[active])
+        scale = np.maximum(np.diagonal(JtJ, axis1=1, axis2=2), np.finfo(float).eps)
+        step = -np.linalg.solve(
+            JtJ + damping[active, None, None] * (scale[:, :, None] * np.eye(3)),
+            gradient[..., None],
+        )[..., 0]
+        trial = params[active] + step
+        trial_residuals, trial_jacobian = _cos_curve_residuals(
+            x[active], y[active], valid[active], trial
+        )
+        trial_cost = (trial_residuals**2).sum(axis=1)
+
+        # Accept the steps that reduce the cost and move closer to Gauss-Newton steps, and
+        # otherwise increase the damping of the next step
+        better = trial_cost < cost[active]
+        accepted = active[better]
+        params[accepted] = trial[better]
+        residuals[accepted] = trial_residuals[better]
+        jacobian[accepted] = trial_jacobian[better]
+        cost[accepted] = trial_cost[better]
+        damping[active] = np.where(better, damping[active] / 10, damping[active] * 10)
+
+        small_step = (np.abs(step) <= xtol * (np.abs(params[active]) + xtol)).all(axis=1)
+        active = active[~small_step]
+
+    if active.size > 0:
+        logger.warning(
+            f"The cosine curves of groups {active.tolist()} did not converge within "
+            f"{max_iterations} iterations, and their last parameters are used."
+        )
+    return params
+
+
 @define(auto_attribs=True)
 class StaticYawMisalignment(FromDictMixin, ResetValuesMixin):
     """
@@ -155,6 +299,13 @@ class StaticYawMisalignment(FromDictMixin, ResetValuesMixin):
         use_power_coeff (bool, optional): If True, power performance as a function of wind vane
             angle will be quantified by normalizing power by the cube of the wind speed,
             approximating the power coefficient. If False, only power will be used. Defaults to False.
+        seed (int | np.random.SeedSequence | np.random.Generator, optional): The seed, or
+            generator, for the Monte Carlo sampling and bootstrapping. A new generator is created
+            from the seed at the start of each :py:meth:`run`, so the same seed reproduces the same
+            results. Defaults to None, which uses NumPy's global random state.
+        cache (ResultCache | str | Path, optional): The cache, or cache directory, used to store
+            and reload the results of runs seeded with an integer :py:attr:`seed`. See
+            :py:class:`openoa.utils.cache.ResultCache`. Defaults to None.
     """
 
     plant: PlantData = field(converter=deepcopy, validator=attrs.validators.instance_of(PlantData))
@@ -184,6 +335,10 @@ class StaticYawMisalignment(FromDictMixin, ResetValuesMixin):
         default=(4.0, 10.0), validator=validate_UQ_input
     )
     use_power_coeff: bool = field(default=False, validator=attrs.validators.instance_of(bool))
+    seed: int | np.random.SeedSequence | np.random.Generator | None = field(
+        default=None, validator=attrs.validators.instance_of(SEED_TYPES)
+    )
+    cache: ResultCache | None = field(default=None, converter=convert_to_cache)
 
     # Internally created attributes need to be given a type before usage
     inputs: pd.DataFrame = field(init=False)
@@ -200,9 +355,11 @@ class StaticYawMisalignment(FromDictMixin, ResetValuesMixin):
     yaw_misalignment_95ci_ws: NDArrayFloat = field(init=False)
     _run: pd.DataFrame = field(init=False)
     _vane_bins: list[float] = field(init=False)
-    _df_turb: pd.DataFrame = field(init=False)
-    _df_turb_ws: pd.DataFrame = field(init=False)
+    _df_groups: pd.DataFrame = field(init=False)
+    _groups: npt.NDArray[np.int_] = field(init=False)
+    _sample_weights: NDArrayFloat = field(init=False)
     _curve_fit_params_ws: NDArrayFloat = field(init=False)
+    _rng: AnalysisRandomState = field(init=False)
     run_parameters: list[str] = field(
         init=False,
         default=[
@@ -218,6 +375,25 @@ class StaticYawMisalignment(FromDictMixin, ResetValuesMixin):
             "max_power_filter",
             "power_bin_mad_thresh",
             "use_power_coeff",
+            "seed",
+        ],
+    )
+    cached_attributes: list[str] = field(
+        init=False,
+        default=[
+            "inputs",
+            "power_values_vane_ws",
+            "_curve_fit_params_ws",
+            "yaw_misalignment_ws",
+            "mean_vane_angle_ws",
+            "yaw_misalignment",
+            "mean_vane_angle",
+            "yaw_misalignment_avg",
+            "yaw_misalignment_std",
+            "yaw_misalignment_95ci",
+            "yaw_misalignment_avg_ws",
+            "yaw_misalignment_std_ws",
+            "yaw_misalignment_95ci_ws",
         ],
     )
 
@@ -234,6 +410,8 @@ class StaticYawMisalignment(FromDictMixin, ResetValuesMixin):
 
         logger.info("Initializing StaticYawMisalignment analysis object")
 
+        self._rng = AnalysisRandomState(self.seed)
+
         # Check that selected UQ is allowed and reset num_sim if no UQ
         if self.UQ:
             logger.info("Note: uncertainty quantification will be performed in the calculation")
@@ -258,6 +436,10 @@ class StaticYawMisalignment(FromDictMixin, ResetValuesMixin):
         max_power_filter: float | None = None,
         power_bin_mad_thresh: float | None = None,
         use_power_coeff: bool | None = None,
+        progress_bar: bool = True,
+        n_workers: int = 1,
+        seed: int | np.random.SeedSequence | np.random.Generator | None = None,
+        progress_callback: Callable[[MonteCarloProgress], None] | None = None,
     ):
         """
         Estimates static yaw misalignment for each wind speed bin for each specified wind turbine.
@@ -305,6 +487,20 @@ class StaticYawMisalignment(FromDictMixin, ResetValuesMixin):
             use_power_coeff (bool, optional): If True, power performance as a function of wind vane
                 angle will be quantified by normalizing power by the cube of the wind speed,
                 approximating the power coefficient. If False, only power will be used. Defaults to False.
+            progress_bar (bool, optional): Flag to use a progress bar for the simulations. Defaults
+                to True.
+            n_workers (int, optional): The number of processes to split the Monte Carlo simulations
+                across when :py:attr:`UQ` = True. Each process runs its share of the simulations
+                with its own copy of the analysis and an independent random stream spawned from a
+                seed drawn from the analysis' random state. Defaults to 1, which runs all of the
+                simulations in the current process.
+            seed (int | np.random.SeedSequence | np.random.Generator, optional): The seed, or
+                generator, for the Monte Carlo sampling and bootstrapping. Defaults to None, which
+                uses :py:attr:`seed`.
+            progress_callback (Callable[[MonteCarloProgress], None], optional): Function called with
+                the :py:class:`~openoa.analysis._progress.MonteCarloProgress` of the simulations as
+                the simulations progress, which includes the running summary statistics of the mean
+                yaw misalignment of the turbines when :py:attr:`UQ` is True. Defaults to None.
         """
         initial_parameters = {}
         if num_sim is not None:
@@ -343,6 +539,11 @@ class StaticYawMisalignment(FromDictMixin, ResetValuesMixin):
         if power_bin_mad_thresh is not None:
             initial_parameters["power_bin_mad_thresh"] = self.power_bin_mad_thresh
             self.power_bin_mad_thresh = power_bin_mad_thresh
+        if seed is not None:
+            initial_parameters["seed"] = self.seed
+            self.seed = seed
+        self._rng = AnalysisRandomState(self.seed)
+
         # determine wind vane angle bins
         max_abs_vane_angle_trunc = self.vane_bin_width * np.floor(
             self.max_abs_vane_angle / self.vane_bin_width
@@ -351,58 +552,40 @@ class StaticYawMisalignment(FromDictMixin, ResetValuesMixin):
             -1 * max_abs_vane_angle_trunc, max_abs_vane_angle_trunc, self.vane_bin_width
         ).tolist()
 
-        # Set up Monte Carlo simulation inputs if UQ = True or single simulation inputs if UQ = False.
-        self._setup_monte_carlo_inputs()
-
-        for n in tqdm(range(self.num_sim)):
-            self._run = self.inputs.loc[n].copy()
-
-            # Estimate static yaw misalginment for each turbine
-            for i, t in enumerate(self.turbine_ids):
-                # Get turbine-sepcific scada dataframe
-                self._df_turb = self.plant.scada.loc[
-                    (slice(None), t),
-                    ["WMET_HorWdSpd", "WTUR_W", "WMET_HorWdDirRel", "WROT_BlPthAngVal"],
-                ]
-
-                # remove power curve outliers
-                self._remove_power_curve_outliers(t)
-
-                # Estimate static yaw misalginment for each wind speed bin
-                for k, ws in enumerate(self.ws_bins):
-                    self._df_turb_ws = self._df_turb.loc[
-                        (self._df_turb["WMET_HorWdSpd"] >= (ws - self.ws_bin_width / 2))
-                        & (self._df_turb["WMET_HorWdSpd"] < (ws + self.ws_bin_width / 2))
-                    ].copy()
-
-                    # Randomly resample 10-minute periods for bootstrapping
-                    if self.UQ:
-                        self._df_turb_ws = self._df_turb_ws.sample(frac=1.0, replace=True)
-
-                    (
-                        yaw_misalignment,
-                        mean_vane_angle,
-                        curve_fit_params,
-                        power_values_vane,
-                    ) = self._estimate_static_yaw_misalignment()
-
-                    if self.UQ:
-                        self.yaw_misalignment_ws[n, i, k] = yaw_misalignment
-                        self.mean_vane_angle_ws[n, i, k] = mean_vane_angle
-                        self.power_values_vane_ws[n, i, k, :] = power_values_vane
-                        self._curve_fit_params_ws[n, i, k, :] = curve_fit_params
-                    else:
-                        self.yaw_misalignment_ws[i, k] = yaw_misalignment
-                        self.mean_vane_angle_ws[i, k] = mean_vane_angle
-                        self.power_values_vane_ws[i, k, :] = power_values_vane
-                        self._curve_fit_params_ws[i, k, :] = curve_fit_params
-
-                if self.UQ:
-                    self.yaw_misalignment[n, i] = np.mean(self.yaw_misalignment_ws[n, i, :])
-                    self.mean_vane_angle[n, i] = np.mean(self.mean_vane_angle_ws[n, i, :])
-                else:
-                    self.yaw_misalignment[i] = np.mean(self.yaw_misalignment_ws[i, :])
-                    self.mean_vane_angle[i] = np.mean(self.mean_vane_angle_ws[i, :])
+        cache_key = analysis_cache_key(
+            self, n_workers=n_workers if self.UQ and n_workers > 1 else 1
+        )
+        if load_cached_results(self, cache_key):
+            logger.info("Run results loaded from the cache")
+            self.set_values(initial_parameters)
+            return
+
+        if self.UQ and n_workers > 1:
+            merged = run_parallel_monte_carlo(
+                self,
+                num_sim=self.num_sim,
+                n_workers=n_workers,
+                result_attributes=[
+                    "inputs",
+                    "power_values_vane_ws",
+                    "_curve_fit_params_ws",
+                    "yaw_misalignment_ws",
+                    "mean_vane_angle_ws",
+                    "yaw_misalignment",
+                    "mean_vane_angle",
+                ],
+                seed=self._rng.spawn_seed(),
+                progress_bar=progress_bar,
+                progress=ProgressReporter(progress_callback, self.num_sim, "yaw_misalignment"),
+                progress_values=lambda chunk: chunk["yaw_misalignment"].mean(axis=1),
+            )
+            for name, value in merged.items():
+                setattr(self, name, value)
+        else:
+            # Set up Monte Carlo simulation inputs if UQ = True or single simulation inputs if
+            # UQ = False.
+            self._setup_monte_carlo_inputs()
+            self._run_monte_carlo(progress_bar=progress_bar, progress_callback=progress_callback)
 
         # Compute mean, std. dev., and 95% confidence intervals of yaw misalginments
         if self.UQ:
@@ -417,6 +600,7 @@ class StaticYawMisalignment(FromDictMixin, ResetValuesMixin):
             self.yaw_misalignment_95ci_ws = np.percentile(
                 self.yaw_misalignment_ws, [2.5, 97.5], 0
             ).transpose((1, 2, 0))
+        store_cached_results(self, cache_key)
 
         self.set_values(initial_parameters)
 
@@ -430,10 +614,10 @@ class StaticYawMisalignment(FromDictMixin, ResetValuesMixin):
 
         if self.UQ:
             inputs = {
-                "power_bin_mad_thresh": np.random.randint(
+                "power_bin_mad_thresh": self._rng.integers(
                     self.power_bin_mad_thresh[0], self.power_bin_mad_thresh[1] + 1, self.num_sim
                 ),
-                "max_power_filter": np.random.randint(
+                "max_power_filter": self._rng.integers(
                     self.max_power_filter[0] * 100,
                     self.max_power_filter[1] * 100 + 1,
                     self.num_sim,
@@ -492,29 +676,96 @@ class StaticYawMisalignment(FromDictMixin, ResetValuesMixin):
 
             self.num_sim = 1
 
+    def _simulate(self) -> None:
+        """Sets up and runs the Monte Carlo simulations of a chunk of a parallel run in a worker
+        process, whose copy of the analysis already has the wind vane angle bins of the run.
+        """
+        self._setup_monte_carlo_inputs()
+        self._run_monte_carlo(progress_bar=False)
+
     @logged_method_call
-    def _remove_power_curve_outliers(self, turbine_id):
+    def _run_monte_carlo(
+        self,
+        progress_bar: bool = True,
+        progress_callback: Callable[[MonteCarloProgress], None] | None = None,
+    ):
         """
-        Removes power curve outliers for a specific turbine by removing timestamps where the pitch
-        angle is above a threshold and timestamps where the wind speed is more than a specific
-        threshold from the median wind speed in each power bin. The filtered turbine data frame is
-        meant to include timestamps when the turbine is operating normally in below-rated
-        conditions.
+        Estimates the static yaw misalignment for each wind speed bin and turbine for each of the
+        Monte Carlo simulations defined in :py:attr:`inputs`.
 
         Args:
-            turbine_id (str): The name of the turbine for which power curve outlier removal will be performed.
+            progress_bar (bool, optional): Flag to use a progress bar for the simulations. Defaults
+                to True.
+            progress_callback (Callable[[MonteCarloProgress], None], optional): Function called with
+                the :py:class:`~openoa.analysis._progress.MonteCarloProgress` of the simulations
+                after each simulation, which includes the running summary statistics of the mean yaw
+                misalignment of the turbines when :py:attr:`UQ` is True. Defaults to None.
+        """
+        report_progress = ProgressReporter(progress_callback, self.num_sim, "yaw_misalignment")
+        for n in tqdm(range(self.num_sim), disable=not progress_bar):
+            self._run = self.inputs.loc[n].copy()
+
+            # remove power curve outliers of all turbines at once
+            df_normal = self._remove_power_curve_outliers()
+
+            # Estimate static yaw misalginment for each turbine and wind speed bin at once
+            self._group_turbine_ws_bins(df_normal)
+            shape = (len(self.turbine_ids), len(self.ws_bins))
+            (
+                yaw_misalignment,
+                mean_vane_angle,
+                curve_fit_params,
+                power_values_vane,
+            ) = self._estimate_static_yaw_misalignment()
+            yaw_misalignment = yaw_misalignment.reshape(shape)
+            mean_vane_angle = mean_vane_angle.reshape(shape)
+
+            if self.UQ:
+                self.yaw_misalignment_ws[n] = yaw_misalignment
+                self.mean_vane_angle_ws[n] = mean_vane_angle
+                self.power_values_vane_ws[n] = power_values_vane.reshape(*shape, -1)
+                self._curve_fit_params_ws[n] = curve_fit_params.reshape(*shape, -1)
+                self.yaw_misalignment[n] = yaw_misalignment.mean(axis=1)
+                self.mean_vane_angle[n] = mean_vane_angle.mean(axis=1)
+            else:
+                self.yaw_misalignment_ws[:] = yaw_misalignment
+                self.mean_vane_angle_ws[:] = mean_vane_angle
+                self.power_values_vane_ws[:] = power_values_vane.reshape(*shape, -1)
+                self._curve_fit_params_ws[:] = curve_fit_params.reshape(*shape, -1)
+                self.yaw_misalignment[:] = yaw_misalignment.mean(axis=1)
+                self.mean_vane_angle[:] = mean_vane_angle.mean(axis=1)
+
+            report_progress(n + 1, self.yaw_misalignment[: n + 1].mean(axis=1) if self.UQ else None)
+
+    @logged_method_call
+    def _remove_power_curve_outliers(self) -> pd.DataFrame:
+        """
+        Removes power curve outliers for all turbines by removing timestamps where the pitch angle
+        is above a threshold and timestamps where the wind speed is more than a specific threshold
+        from the median wind speed in each of the turbine's power bins. The filtered turbine data
+        is meant to include timestamps when the turbines are operating normally in below-rated
+        conditions.
+
+        Returns:
+            pd.DataFrame: The filtered SCADA data of each turbine in :py:attr:`turbine_ids`.
         """
 
         # Limit to pitch angles below the specified threshold
-        self._df_turb = self._df_turb.loc[self._df_turb["WROT_BlPthAngVal"] <= self.pitch_thresh]
+        scada = self.plant.scada.loc[
+            :, ["WMET_HorWdSpd", "WTUR_W", "WMET_HorWdDirRel", "WROT_BlPthAngVal"]
+        ]
+        scada = scada.loc[
+            scada.index.get_level_values("asset_id").isin(self.turbine_ids)
+            & (scada["WROT_BlPthAngVal"] <= self.pitch_thresh)
+        ]
 
         # Apply bin-based filter to flag samples for which wind speed is greater than a threshold from the median
         # wind speed in each power bin
-        turb_capac = self.plant.asset.loc[turbine_id, "rated_power"]
+        turb_capac = self.plant.asset.loc[self.turbine_ids, "rated_power"]
         bin_width_frac = (self._run.max_power_filter - self.min_power_filter) / self.num_power_bins
-        flag_bin = filters.bin_filter(
-            bin_col=self._df_turb["WTUR_W"],
-            value_col=self._df_turb["WMET_HorWdSpd"],
+        flag_bin = filters.bin_filter_by_asset(
+            bin_col="WTUR_W",
+            value_col="WMET_HorWdSpd",
             bin_width=bin_width_frac * turb_capac,
             threshold=self._run.power_bin_mad_thresh,
             center_type="median",
@@ -522,63 +773,130 @@ class StaticYawMisalignment(FromDictMixin, ResetValuesMixin):
             bin_max=self._run.max_power_filter * turb_capac,
             threshold_type="mad",
             direction="all",
+            data=scada,
         )
 
-        self._df_turb = self._df_turb.loc[~flag_bin]
+        return scada.loc[~flag_bin]
+
+    @logged_method_call
+    def _group_turbine_ws_bins(self, df_normal: pd.DataFrame):
+        """
+        Divides the filtered SCADA data of each turbine into the wind speed bins, where each
+        turbine's data are sorted by wind speed once to find the data in each bin. The data of
+        every (turbine, wind speed bin) group are stored in :py:attr:`_df_groups`, in the order of
+        the turbines and then the wind speed bins, with the group number of each time step in
+        :py:attr:`_groups`.
+
+        If :py:attr:`UQ` is True, the time steps of each group are randomly resampled for
+        bootstrapping, where the resample is kept as the time steps drawn at least once and the
+        number of times each of them is drawn, in :py:attr:`_sample_weights`.
+
+        Args:
+            df_normal (pd.DataFrame): The filtered SCADA data of each turbine in
+                :py:attr:`turbine_ids`.
+        """
+        turbine = pd.Categorical(
+            df_normal.index.get_level_values("asset_id"), categories=self.turbine_ids
+        ).codes
+        windspeed = df_normal["WMET_HorWdSpd"].to_numpy()
+        order = np.lexsort((windspeed, turbine))
+        turbine_starts = np.searchsorted(turbine[order], np.arange(len(self.turbine_ids) + 1))
+        ws_bins = np.asarray(self.ws_bins, dtype=float)
+
+        rows = []
+        weights = []
+        for i in range(len(self.turbine_ids)):
+            turbine_order = order[turbine_starts[i] : turbine_starts[i + 1]]
+            turbine_ws = windspeed[turbine_order]
+            starts = np.searchsorted(turbine_ws, ws_bins - self.ws_bin_width / 2)
+            ends = np.searchsorted(turbine_ws, ws_bins + self.ws_bin_width / 2)
+            for start, end in zip(starts, ends):
+                # Keep the time steps in time order, which is the order they're bootstrapped in
+                group_rows = np.sort(turbine_order[start:end])
+                if self.UQ:
+                    group_weights = self._rng.bootstrap_weights(group_rows.size)
+                    drawn = group_weights > 0
+                    group_rows = group_rows[drawn]
+                    group_weights = group_weights[drawn]
+                else:
+                    group_weights = np.ones(group_rows.size)
+                rows.append(group_rows)
+                weights.append(group_weights)
+
+        self._df_groups = df_normal.iloc[np.concatenate(rows)]
+        self._groups = np.repeat(np.arange(len(rows)), [group_rows.size for group_rows in rows])
+        self._sample_weights = np.concatenate(weights)
 
     @logged_method_call
     def _estimate_static_yaw_misalignment(self):
         """
-        Estimates static yaw misalignment for a single turbine and wind speed bin by fitting a
-        cosine curve to the binned power performance vs. wind vane angle. Yaw misalignment is
-        estimated as the difference between the wind vane angle where power is maximized based on
-        the best-fit cosine curve and the mean wind vane angle.
+        Estimates static yaw misalignment for every turbine and wind speed bin in
+        :py:attr:`_df_groups` by fitting a cosine curve to the binned power performance vs. wind
+        vane angle of each group. Yaw misalignment is estimated as the difference between the wind
+        vane angle where power is maximized based on the best-fit cosine curve and the mean wind
+        vane angle. The means and bin counts are weighted by the bootstrap weight of each time
+        step, and are computed for all of the groups' wind vane bins at once with ``np.bincount``.
 
         Returns:
-            tuple[float, float, np.ndarray, np.ndarray]: The estimated static yaw misaligment, the
-                mean wind vane angle, and arrays containing the best-fit cosine curve parameters
-                (magnitude, offset (degrees), and cosine exponent) and power performance values
-                binned by wind vane angle.
+            tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]: The estimated static yaw
+                misaligment and the mean wind vane angle of each group, and the (group x 3) best-fit
+                cosine curve parameters (magnitude, offset (degrees), and cosine exponent) and
+                (group x vane bin) power performance values binned by wind vane angle.
         """
 
-        self._df_turb_ws["vane_bin"] = self.vane_bin_width * np.round(
-            self._df_turb_ws["WMET_HorWdDirRel"].values / self.vane_bin_width
-        )
+        weights = self._sample_weights
+        groups = self._groups
+        n_groups = len(self.turbine_ids) * len(self.ws_bins)
+        vane_angle = self._df_groups["WMET_HorWdDirRel"].to_numpy()
+        power = self._df_groups["WTUR_W"].to_numpy()
+        vane_bin = np.round(vane_angle / self.vane_bin_width)
 
         # Normalize by wind speed cubed if using power coefficient to determine power performance
         if self.use_power_coeff:
-            self._df_turb_ws["pow_ref"] = self._df_turb_ws["WMET_HorWdSpd"].values ** 3
+            pow_ratio = power / self._df_groups["WMET_HorWdSpd"].to_numpy() ** 3
         else:
-            self._df_turb_ws["pow_ref"] = 1.0
-
-        self._df_turb_ws["pow_ratio"] = (
-            self._df_turb_ws["WTUR_W"].values / self._df_turb_ws["pow_ref"].values
-        )
+            pow_ratio = power / 1.0
+
+        mean_vane_angle = np.bincount(
+            groups, weights=vane_angle * weights, minlength=n_groups
+        ) / np.bincount(groups, weights=weights, minlength=n_groups)
+
+        # Bin power performance by wind vane, ignoring missing values, and only keeping the vane
+        # angles that aren't too large
+        max_vane_bin = int(np.ceil(self.max_abs_vane_angle / self.vane_bin_width))
+        n_vane_bins = 2 * max_vane_bin + 1
+        in_range = np.abs(self.vane_bin_width * vane_bin) <= self.max_abs_vane_angle
+        bin_ids = groups[in_range] * n_vane_bins + (vane_bin[in_range] + max_vane_bin).astype(int)
+        weights = weights[in_range]
+        valid_ratio = ~np.isnan(pow_ratio[in_range])
+
+        def bin_sums(values):
+            return np.bincount(bin_ids, weights=values, minlength=n_groups * n_vane_bins).reshape(
+                n_groups, n_vane_bins
+            )
 
-        mean_vane_angle = self._df_turb_ws["WMET_HorWdDirRel"].values.mean()
+        count = bin_sums(np.where(np.isnan(power[in_range]), 0.0, weights))
+        with np.errstate(divide="ignore", invalid="ignore"):
+            pow_ratio_bin = bin_sums(
+                np.where(valid_ratio, pow_ratio[in_range] * weights, 0.0)
+            ) / bin_sums(np.where(valid_ratio, weights, 0.0))
 
-        # Bin power performance by wind vane
-        df_bin = self._df_turb_ws.groupby("vane_bin").mean()
-        df_bin_count = self._df_turb_ws.groupby("vane_bin").count()
+        # Remove bins with too few samples
+        pow_ratio_bin[count <= self.min_vane_bin_count] = np.nan
 
-        # Remove bins with too few samples or vane angles that are too large
-        df_bin = df_bin.loc[
-            (df_bin_count["WTUR_W"] > self.min_vane_bin_count)
-            & (np.abs(df_bin.index) <= self.max_abs_vane_angle)
-        ]
-
-        # Find best fit cosine curve parameters
-        curve_fit_params, _ = curve_fit(
-            cos_curve, df_bin.index, df_bin["pow_ratio"], [df_bin["pow_ratio"].max(), 0.0, 2.0]
-        )
+        # Find best fit cosine curve parameters of all of the groups at once
+        vane_bins = self.vane_bin_width * (np.arange(n_vane_bins) - max_vane_bin)
+        curve_fit_params = fit_cos_curves(vane_bins, pow_ratio_bin)
 
         # yaw_misalignment, mean_vane_angle, curve_fit_params, power_values_vane
-
+        vane_bin_columns = (
+            np.round(np.asarray(self._vane_bins) / self.vane_bin_width).astype(int) + max_vane_bin
+        )
         return (
-            curve_fit_params[1] - mean_vane_angle,
+            curve_fit_params[:, 1] - mean_vane_angle,
             mean_vane_angle,
             curve_fit_params,
-            df_bin["pow_ratio"].reindex(self._vane_bins).values,
+            pow_ratio_bin[:, vane_bin_columns],
         )
 
     def plot_yaw_misalignment_by_turbine(
@@ -3,16 +3,18 @@ from __future__ import annotations
 import sys
 import logging
 import itertools
-from typing import Callable, Optional, Sequence
+from typing import Any, Callable, Optional, Sequence
 from pathlib import Path
 
 import yaml
 import attrs
 import numpy as np
 import pandas as pd
+import numpy.typing as npt
 from attrs import field, define
 from pyproj import Transformer
 from tabulate import tabulate
+from scipy.spatial import cKDTree
 from IPython.display import Markdown, display
 from shapely.geometry import Point
 
@@ -310,6 +312,22 @@ def load_to_pandas_dict(
     return data
 
 
+def _reset_asset_caches(instance: PlantData, attribute: attrs.Attribute, value: Any) -> Any:
+    """Clears the memoized freestream turbine tables and asset KD-trees of a ``PlantData`` object
+    when its ``asset`` data is replaced.
+
+    Args:
+        instance (PlantData): The ``PlantData`` object.
+        attribute (attrs.Attribute): The ``asset`` attribute.
+        value (Any): The new ``asset`` data.
+
+    Returns:
+        Any: The unchanged :py:attr:`value`.
+    """
+    instance._reset_asset_caches()
+    return value
+
+
 @logged_method_call
 def rename_columns(df: pd.DataFrame, col_map: dict, reverse: bool = True) -> pd.DataFrame:
     """Renames the pandas DataFrame columns using col_map. Intended to be used in
@@ -429,7 +447,11 @@ class PlantData:
     tower: pd.DataFrame | None = field(default=None, converter=load_to_pandas)  # noqa: F821
     status: pd.DataFrame | None = field(default=None, converter=load_to_pandas)  # noqa: F821
     curtail: pd.DataFrame | None = field(default=None, converter=load_to_pandas)  # noqa: F821
-    asset: pd.DataFrame | None = field(default=None, converter=load_to_pandas)  # noqa: F821
+    asset: pd.DataFrame | None = field(
+        default=None,
+        converter=load_to_pandas,
+        on_setattr=[attrs.setters.convert, attrs.setters.validate, _reset_asset_caches],
+    )  # noqa: F821
     reanalysis: dict[str, pd.DataFrame] | None = field(
         default=None, converter=load_to_pandas_dict  # noqa: F821
     )
@@ -442,6 +464,10 @@ class PlantData:
     eia: dict = field(default={}, init=False)
     asset_distance_matrix: pd.DataFrame = field(init=False, default=pd.DataFrame([]))
     asset_direction_matrix: pd.DataFrame = field(init=False, default=pd.DataFrame([]))
+    _freestream_tables: dict[tuple, pd.DataFrame] = field(init=False, factory=dict, repr=False)
+    _asset_trees: dict[str | None, tuple[cKDTree, np.ndarray]] = field(
+        init=False, factory=dict, repr=False
+    )
 
     def __attrs_post_init__(self):
         """Post-initialization hook."""
@@ -1223,6 +1249,22 @@ class PlantData:
 
     # NOTE: v2 AssetData methods
 
+    def asset_coordinates(self, asset_ids: list | np.ndarray | None = None) -> np.ndarray:
+        """Returns the projected x and y coordinates of the assets' "geometry", as calculated by
+        :py:meth:`parse_asset_geometry`.
+
+        Args:
+            asset_ids (list | np.ndarray, optional): The asset IDs to return the coordinates of.
+                Defaults to None, which returns all of the assets.
+
+        Returns:
+            np.ndarray: The (asset x 2) array of x and y coordinates (meters).
+        """
+        geometry = (
+            self.asset["geometry"] if asset_ids is None else self.asset.loc[asset_ids, "geometry"]
+        )
+        return np.array([(point.x, point.y) for point in geometry], dtype=float).reshape(-1, 2)
+
     @logged_method_call
     def calculate_asset_distance_matrix(self) -> pd.DataFrame:
         """Calculates the distance between all assets on the site with `np.inf` for the distance
@@ -1232,27 +1274,15 @@ class PlantData:
             pd.DataFrame: Dataframe containing distances between each pair of assets
         """
         ix = self.asset.index.values
-        distance = (
-            pd.DataFrame(
-                [i, j, self.asset.loc[i, "geometry"].distance(self.asset.loc[j, "geometry"])]
-                for i, j in itertools.combinations(ix, 2)
-            )
-            .pivot(index=0, columns=1, values=2)
-            .rename_axis(index={0: None}, columns={1: None})
-            .fillna(0)
-            .loc[ix[:-1], ix[1:]]
-        )
-
-        # Insert the first column and last row because the self-self combinations are not produced in the above
-        distance.insert(0, ix[0], 0.0)
-        distance.loc[ix[-1]] = 0
+        xy = self.asset_coordinates()
+        dx = xy[None, :, 0] - xy[:, None, 0]
+        dy = xy[None, :, 1] - xy[:, None, 1]
+        distance_array = np.sqrt(dx**2 + dy**2)
 
         # Maintain v2 compatibility of np.inf for the diagonal
-        distance = distance + distance.values.T - np.diag(np.diag(distance.values))
-        distance_array = distance.values
         np.fill_diagonal(distance_array, np.inf)
-        distance.loc[:, :] = distance_array
-        self.asset_distance_matrix = distance
+        self.asset_distance_matrix = pd.DataFrame(distance_array, index=ix, columns=ix)
+        self._reset_asset_caches()
 
     def turbine_distance_matrix(self, turbine_id: str = None) -> pd.DataFrame:
         """Returns the distances between all turbines in the plant with `np.inf` for the distance
@@ -1298,41 +1328,19 @@ class PlantData:
                 from the asset given by the row index to the asset given by the column index, relative to north)
         """
         ix = self.asset.index.values
-        direction = (
-            pd.DataFrame(
-                [
-                    i,
-                    j,
-                    np.degrees(
-                        np.arctan2(
-                            self.asset.loc[j, "geometry"].x - self.asset.loc[i, "geometry"].x,
-                            self.asset.loc[j, "geometry"].y - self.asset.loc[i, "geometry"].y,
-                        )
-                    )
-                    % 360.0,
-                ]
-                for i, j in itertools.combinations(ix, 2)
-            )
-            .pivot(index=0, columns=1, values=2)
-            .rename_axis(index={0: None}, columns={1: None})
-            .fillna(0)
-            .loc[ix[:-1], ix[1:]]
-        )
+        xy = self.asset_coordinates()
+        dx = xy[None, :, 0] - xy[:, None, 0]
+        dy = xy[None, :, 1] - xy[:, None, 1]
 
-        # Insert the first column and last row because the self-self combinations are not produced in the above
-        direction.insert(0, ix[0], 0.0)
-        direction.loc[ix[-1]] = 0
+        # Calculate the directions of the later assets from the earlier assets, and reverse them
+        # for the directions of the earlier assets from the later assets
+        direction_array = np.triu(np.degrees(np.arctan2(dx, dy)) % 360.0, 1)
+        direction_array += np.triu((direction_array - 180.0) % 360.0, 1).T
 
         # Maintain v2 compatibility of np.inf for the diagonal
-        direction = (
-            direction
-            + np.triu((direction.values - 180.0) % 360.0, 1).T
-            - np.diag(np.diag(direction.values))
-        )
-        direction_array = direction.values
         np.fill_diagonal(direction_array, np.inf)
-        direction.loc[:, :] = direction_array
-        self.asset_direction_matrix = direction
+        self.asset_direction_matrix = pd.DataFrame(direction_array, index=ix, columns=ix)
+        self._reset_asset_caches()
 
     def turbine_direction_matrix(self, turbine_id: str = None) -> pd.DataFrame:
         """Returns the directions between all turbines in the plant with `np.inf` for the direction
@@ -1381,74 +1389,169 @@ class PlantData:
             self.calculate_asset_distance_matrix()
             self.calculate_asset_direction_matrix()
 
-    def get_freestream_turbines(
-        self, wd: float, freestream_method: str = "sector", sector_width: float = 90.0
-    ):
+    def _reset_asset_caches(self) -> None:
+        """Clears the memoized freestream turbine tables and asset KD-trees, which are computed from
+        the asset geometries.
         """
-        Returns a list of freestream (unwaked) turbines for a given wind direction. Freestream turbines can be
-        identified using different methods ("sector" or "IEC" methods). For the sector method, if there are any
-        turbines upstream of a turbine within a fixed wind direction sector centered on the wind direction of interest,
-        defined by the sector_width argument, the turbine is considered waked. The IEC method uses the freestream
-        definition provided in Annex A of IEC 61400-12-1 (2005).
+        self._freestream_tables.clear()
+        self._asset_trees.clear()
+
+    def freestream_turbine_flags(
+        self, wd: npt.ArrayLike, freestream_method: str = "sector", sector_width: float = 90.0
+    ) -> pd.DataFrame:
+        """
+        Identifies the freestream (unwaked) turbines for many wind directions at once, using the
+        freestream definitions of :py:meth:`get_freestream_turbines`.
 
         Args:
-            wd (float): Wind direction to identify freestream turbines for (degrees)
+            wd (npt.ArrayLike): Wind direction(s) to identify freestream turbines for (degrees)
             freestream_method (str, optional): Method used to identify freestream turbines
                 ("sector" or "IEC"). Defaults to "sector".
-            sector_width (float, optional): Width of wind direction sector centered on the wind direction of
-                interest used to determine whether a turbine is waked for the "sector" method (degrees). For a given
-                turbine, if any other upstream turbines are located within the sector, then the turbine is considered
-                waked. Defaults to 90 degrees.
+            sector_width (float, optional): Width of wind direction sector centered on the wind
+                direction of interest used to determine whether a turbine is waked for the "sector"
+                method (degrees). Defaults to 90 degrees.
+
         Returns:
-            list: List of freestream turbine asset IDs
+            pd.DataFrame: Boolean (wind direction x turbine) table, which is True where the turbine
+                is freestream for the wind direction.
         """
-        turbine_direction_matrix = self.turbine_direction_matrix()
-
+        wd = np.atleast_1d(np.asarray(wd, dtype=float))
         if freestream_method == "sector":
-            # find turbines for which no other upstream turbines are within half of the sector width of the specified
-            # wind direction
-            freestream_indices = np.all(
-                (np.abs(met.wrap_180(wd - turbine_direction_matrix.values)) > 0.5 * sector_width)
-                | np.diag(np.ones(len(turbine_direction_matrix), dtype=bool)),
-                axis=1,
-            )
+            freestream_indices = self._freestream_sector_margins(wd) > 0.5 * sector_width
         elif freestream_method == "IEC":
             # find freestream turbines according to the definition in Annex A of IEC 61400-12-1 (2005)
             turbine_distance_matrix = self.turbine_distance_matrix()
 
             # normalize distances by rotor diameters of upstream turbines
-            rotor_diameters_vector = self.asset.loc[
-                turbine_direction_matrix.index, "rotor_diameter"
-            ].values
-            rotor_diameters = np.ones((len(turbine_direction_matrix), 1)) * rotor_diameters_vector
-            turbine_distance_matrix /= rotor_diameters
+            rotor_diameters = self.asset.loc[turbine_distance_matrix.columns, "rotor_diameter"]
+            turbine_distance_matrix = turbine_distance_matrix.values / rotor_diameters.values
 
+            offsets = self._upstream_direction_offsets(wd)
             freestream_indices = np.all(
                 (
-                    (turbine_distance_matrix.values > 2)
+                    (turbine_distance_matrix > 2)
                     & (
-                        np.abs(met.wrap_180(wd - turbine_direction_matrix.values))
+                        offsets
                         > 0.5
-                        * (
-                            1.3 * np.degrees(np.arctan(2.5 / turbine_distance_matrix.values + 0.15))
-                            + 10
-                        )
+                        * (1.3 * np.degrees(np.arctan(2.5 / turbine_distance_matrix + 0.15)) + 10)
                     )
                 )
-                | (turbine_distance_matrix.values > 20)
-                | (turbine_distance_matrix.values < 0),
-                axis=1,
+                | (turbine_distance_matrix > 20)
+                | (turbine_distance_matrix < 0),
+                axis=2,
             )
         else:
             raise ValueError(
                 'Invalid freestream method. Currently, "sector" and "IEC" are supported.'
             )
 
-        return list(self.asset.loc[self.asset["type"] == "turbine"].index[freestream_indices])
+        return pd.DataFrame(freestream_indices, index=wd, columns=self.turbine_ids)
+
+    def _upstream_direction_offsets(self, wd: np.ndarray) -> np.ndarray:
+        """Computes the absolute angle between each wind direction and the direction from each
+        turbine to every other turbine, with NaN for the direction from a turbine to itself.
+
+        Args:
+            wd (np.ndarray): The wind directions (degrees).
+
+        Returns:
+            np.ndarray: The (wind direction x turbine x other turbine) angles (degrees).
+        """
+        turbine_direction_matrix = self.turbine_direction_matrix().values
+        self_pairs = np.eye(turbine_direction_matrix.shape[0], dtype=bool)
+        offsets = np.abs(
+            met.wrap_180(wd[:, None, None] - np.where(self_pairs, 0.0, turbine_direction_matrix))
+        )
+        offsets = np.reshape(offsets, (wd.size, *turbine_direction_matrix.shape))
+        return np.where(self_pairs, np.nan, offsets)
+
+    def _freestream_sector_margins(self, wd: np.ndarray) -> np.ndarray:
+        """Computes the smallest angle between each wind direction and the direction from each
+        turbine to any other turbine, so a turbine is freestream with the "sector" method when its
+        margin is larger than half of the sector width.
+
+        Args:
+            wd (np.ndarray): The wind directions (degrees).
+
+        Returns:
+            np.ndarray: The (wind direction x turbine) margins (degrees), which are infinite if there
+                are no other turbines.
+        """
+        offsets = self._upstream_direction_offsets(wd)
+        return np.fmin.reduce(offsets, axis=2, initial=np.inf)
+
+    def freestream_turbine_table(
+        self,
+        freestream_method: str = "sector",
+        sector_width: float = 90.0,
+        wd_bin_width: float = 5.0,
+    ) -> pd.DataFrame:
+        """
+        Returns the freestream (unwaked) turbines for each wind direction bin from 0 to 360 degrees.
+        The turbine geometry of each bin is computed once for each freestream method and bin width,
+        and is reused until the ``asset`` data or the asset geometries are updated, so tables for
+        any number of "sector" method sector widths only require a comparison.
+
+        Args:
+            freestream_method (str, optional): Method used to identify freestream turbines
+                ("sector" or "IEC"). Defaults to "sector".
+            sector_width (float, optional): Width of wind direction sector centered on the wind
+                direction of interest used to determine whether a turbine is waked for the "sector"
+                method (degrees). Defaults to 90 degrees.
+            wd_bin_width (float, optional): The width of the wind direction bins (degrees).
+                Defaults to 5 degrees.
+
+        Returns:
+            pd.DataFrame: Boolean (wind direction bin x turbine) table, which is True where the
+                turbine is freestream for the wind direction bin.
+        """
+        key = (freestream_method, float(wd_bin_width))
+        if key not in self._freestream_tables:
+            wd = np.arange(0.0, 360.0, wd_bin_width)
+            if freestream_method == "sector":
+                table = pd.DataFrame(
+                    self._freestream_sector_margins(wd), index=wd, columns=self.turbine_ids
+                )
+            else:
+                table = self.freestream_turbine_flags(wd, freestream_method=freestream_method)
+            self._freestream_tables[key] = table
+
+        table = self._freestream_tables[key]
+        if freestream_method == "sector":
+            return table > 0.5 * sector_width
+        return table.copy()
+
+    def get_freestream_turbines(
+        self, wd: float, freestream_method: str = "sector", sector_width: float = 90.0
+    ):
+        """
+        Returns a list of freestream (unwaked) turbines for a given wind direction. Freestream turbines can be
+        identified using different methods ("sector" or "IEC" methods). For the sector method, if there are any
+        turbines upstream of a turbine within a fixed wind direction sector centered on the wind direction of interest,
+        defined by the sector_width argument, the turbine is considered waked. The IEC method uses the freestream
+        definition provided in Annex A of IEC 61400-12-1 (2005). See :py:meth:`freestream_turbine_flags` and
+        :py:meth:`freestream_turbine_table` for identifying the freestream turbines of many wind directions at once.
+
+        Args:
+            wd (float): Wind direction to identify freestream turbines for (degrees)
+            freestream_method (str, optional): Method used to identify freestream turbines
+                ("sector" or "IEC"). Defaults to "sector".
+            sector_width (float, optional): Width of wind direction sector centered on the wind direction of
+                interest used to determine whether a turbine is waked for the "sector" method (degrees). For a given
+                turbine, if any other upstream turbines are located within the sector, then the turbine is considered
+                waked. Defaults to 90 degrees.
+        Returns:
+            list: List of freestream turbine asset IDs
+        """
+        freestream = self.freestream_turbine_flags(wd, freestream_method, sector_width).iloc[0]
+        return list(freestream.index[freestream.values])
 
     @logged_method_call
     def calculate_nearest_neighbor(
-        self, turbine_ids: list | np.ndarray = None, tower_ids: list | np.ndarray = None
+        self,
+        turbine_ids: list | np.ndarray = None,
+        tower_ids: list | np.ndarray = None,
+        use_kdtree: bool = False,
     ) -> None:
         """Finds nearest turbine and met tower neighbors all of the available turbines and towers
         in `asset` or as defined in `turbine_ids` and `tower_ids`.
@@ -1458,6 +1561,9 @@ class PlantData:
                 turbines in the data. Defaults to None.
             tower_ids (list | np.ndarray, optional): A list of met tower IDs, if not using all
                 met towers in the data. Defaults to None.
+            use_kdtree (bool, optional): If True, the neighbors are found by querying a KD-tree of
+                the asset coordinates instead of sorting the rows of the asset distance matrix,
+                which is faster for large numbers of assets. Defaults to False.
 
         Returns: None
             Creates the "nearest_turbine_id" and "nearest_tower_id" column in `asset`.
@@ -1468,20 +1574,123 @@ class PlantData:
         ix_tower = self.tower_ids if tower_ids is None else np.array(tower_ids)
         ix = np.concatenate([ix_turb, ix_tower])
 
-        distance = self.asset_distance_matrix.loc[ix, ix]
+        self.asset.loc[ix, "nearest_turbine_id"] = self._nearest_assets(
+            ix, ix_turb, use_kdtree, "turbine"
+        )
+        self.asset.loc[ix, "nearest_tower_id"] = self._nearest_assets(
+            ix, ix_tower, use_kdtree, "tower"
+        )
+
+    def _nearest_assets(
+        self,
+        asset_ids: np.ndarray,
+        candidate_ids: np.ndarray,
+        use_kdtree: bool,
+        asset_type: str | None = None,
+    ) -> np.ndarray:
+        """Finds the nearest of the candidate assets to each asset, other than the asset itself.
+
+        Args:
+            asset_ids (np.ndarray): The IDs of the assets to find the nearest neighbor of.
+            candidate_ids (np.ndarray): The IDs of the candidate neighbors.
+            use_kdtree (bool): If True, query a KD-tree of the candidates' coordinates, otherwise
+                sort the rows of the asset distance matrix.
+            asset_type (str, optional): The type of the candidate assets, "turbine" or "tower", or
+                None for all of the assets. When the candidates are all of the assets of the type,
+                the memoized KD-tree of :py:meth:`asset_kdtree` is queried, otherwise a KD-tree of
+                just the candidates is built. Defaults to None.
+
+        Returns:
+            np.ndarray: The ID of the nearest candidate to each asset, or None if there are no
+                candidates.
+        """
+        if len(candidate_ids) == 0:
+            return np.full(len(asset_ids), None, dtype=object)
+
+        if use_kdtree:
+            tree, tree_ids = self.asset_kdtree(asset_type)
+            if not np.array_equal(tree_ids, candidate_ids):
+                tree, tree_ids = cKDTree(self.asset_coordinates(candidate_ids)), candidate_ids
+            candidate_ids = tree_ids
+            k = min(2, len(candidate_ids))
+            _, index = tree.query(self.asset_coordinates(asset_ids), k=k)
+            index = np.reshape(index, (len(asset_ids), k))
+        else:
+            # The distance between an asset and itself is infinite, so it's sorted last
+            distance = self.asset_distance_matrix.loc[asset_ids, candidate_ids].values
+            index = distance.argsort(axis=1)[:, :2]
 
-        nearest_turbine = distance[ix_turb].values.argsort(axis=1)
-        nearest_turbine = pd.DataFrame(
-            distance.columns.values[nearest_turbine], index=distance.index
-        ).loc[ix, 0]
+        candidate_ids = np.asarray(candidate_ids)
+        nearest = candidate_ids[index[:, 0]]
+        if index.shape[1] > 1:
+            nearest = np.where(nearest == asset_ids, candidate_ids[index[:, 1]], nearest)
+        return nearest
 
-        nearest_tower = distance[ix_tower].values.argsort(axis=1)
-        nearest_tower = pd.DataFrame(
-            distance.columns.values[nearest_tower], index=distance.index
-        ).loc[ix, 0]
+    def asset_kdtree(self, asset_type: str | None = None) -> tuple[cKDTree, np.ndarray]:
+        """Returns a KD-tree of the projected asset coordinates, which is built once for each asset
+        type, and reused until the ``asset`` data or the asset geometries are updated.
 
-        self.asset.loc[ix, "nearest_turbine_id"] = nearest_turbine.values
-        self.asset.loc[ix, "nearest_tower_id"] = nearest_tower.values
+        Args:
+            asset_type (str, optional): The type of the assets in the tree, "turbine" or "tower", or
+                None for all of the assets. Defaults to None.
+
+        Returns:
+            tuple[cKDTree, np.ndarray]: The KD-tree of the x and y coordinates (meters), and the
+                asset ID of each of its points.
+        """
+        if asset_type not in self._asset_trees:
+            if asset_type is None:
+                ids = self.asset_ids
+            else:
+                ids = self.asset.index.values[self.asset["type"] == asset_type]
+            self._asset_trees[asset_type] = (cKDTree(self.asset_coordinates(ids)), ids)
+        return self._asset_trees[asset_type]
+
+    def assets_within_radius(
+        self,
+        asset_ids: str | list | np.ndarray | None = None,
+        radius: float | None = None,
+        rotor_diameters: float | None = None,
+        asset_type: str | None = "turbine",
+    ) -> dict[str, list[str]]:
+        """Finds the assets within a radius of each asset, such as all of the turbines within five
+        rotor diameters of each turbine, using the KD-tree of :py:meth:`asset_kdtree`.
+
+        Args:
+            asset_ids (str | list | np.ndarray, optional): The ID(s) of the assets to find the
+                neighbors of. Defaults to None, which uses all of the assets of
+                :py:attr:`asset_type`.
+            radius (float, optional): The search radius (meters). Defaults to None.
+            rotor_diameters (float, optional): The search radius as a multiple of the rotor diameter
+                of each asset in :py:attr:`asset_ids`, which is used instead of :py:attr:`radius`.
+                Defaults to None.
+            asset_type (str, optional): The type of the neighboring assets, "turbine" or "tower",
+                or None for all of the assets. Defaults to "turbine".
+
+        Raises:
+            ValueError: Raised if neither or both of :py:attr:`radius` and
+                :py:attr:`rotor_diameters` are provided.
+
+        Returns:
+            dict[str, list[str]]: The IDs of the neighboring assets of each asset, in order of
+                increasing distance, excluding the asset itself.
+        """
+        if (radius is None) == (rotor_diameters is None):
+            raise ValueError("Exactly one of `radius` and `rotor_diameters` must be provided.")
+
+        tree, tree_ids = self.asset_kdtree(asset_type)
+        asset_ids = tree_ids if asset_ids is None else np.atleast_1d(asset_ids)
+        xy = self.asset_coordinates(asset_ids)
+        if rotor_diameters is not None:
+            radius = rotor_diameters * self.asset.loc[asset_ids, "rotor_diameter"].values
+
+        neighbors = {}
+        for asset_id, point, index in zip(asset_ids, xy, tree.query_ball_point(xy, r=radius)):
+            index = np.asarray(index, dtype=int)
+            distance = np.sqrt(((tree.data[index] - point) ** 2).sum(axis=1))
+            index = index[np.argsort(distance, kind="stable")]
+            neighbors[asset_id] = [i for i in tree_ids[index] if i != asset_id]
+        return neighbors
 
     def nearest_turbine(self, asset_id: str) -> str:
         """Finds the nearest turbine to the provided `asset_id`.
@@ -11,6 +11,7 @@ from inspect import getfullargspec
 from functools import wraps
 from itertools import filterfalse
 
+import numpy as np
 import pandas as pd
 
 
@@ -303,3 +304,62 @@ def dataframe_method(data_cols: list[str] = None):
         return wrapper
 
     return decorator
+
+
+def flatten_by_asset(*data) -> tuple[list[np.ndarray], np.ndarray, pd.Index]:
+    """Flattens the data of a batched filter or fit over all of the assets to 1-D arrays, along with
+    the integer code of the asset of each value.
+
+    Args:
+        data (:obj:`pandas.Series` | `pandas.DataFrame` | `numpy.ndarray`): One or more arrays with
+            the same layout, which is either a ``pandas.Series`` with an "asset_id" index level, such
+            as a column of ``PlantData.scada``, or a (time x asset) ``pandas.DataFrame`` or 2-D
+            ``numpy.ndarray``.
+
+    Raises:
+        ValueError: Raised if the data have a different layout, or if a ``pandas.Series`` has no
+            "asset_id" index level.
+
+    Returns:
+        tuple[list[np.ndarray], np.ndarray, pd.Index]: The flattened values of each of
+            :py:attr:`data`, the code of each value's asset, and the asset IDs of the codes, which
+            are the sorted asset IDs of a ``pandas.Series``, the columns of a ``pandas.DataFrame``,
+            or the column numbers of a ``numpy.ndarray``.
+    """
+    like = data[0]
+    if any(np.shape(el) != np.shape(like) for el in data[1:]):
+        raise ValueError("The batched inputs must all have the same shape.")
+
+    if isinstance(like, pd.Series):
+        if "asset_id" not in like.index.names:
+            raise ValueError("A batched pandas Series input needs an `asset_id` level.")
+        codes, assets = pd.factorize(like.index.get_level_values("asset_id"), sort=True)
+        return [np.asarray(el, dtype=float) for el in data], codes, pd.Index(assets)
+
+    if np.ndim(like) != 2:
+        raise ValueError("The batched inputs must be a pandas Series or 2-D (time x asset).")
+    n_time, n_assets = np.shape(like)
+    assets = like.columns if isinstance(like, pd.DataFrame) else pd.RangeIndex(n_assets)
+    values = [np.asarray(el, dtype=float).ravel(order="F") for el in data]
+    return values, np.repeat(np.arange(n_assets), n_time), assets
+
+
+def unflatten_by_asset(
+    flag: np.ndarray, like: pd.Series | pd.DataFrame | np.ndarray
+) -> pd.Series | pd.DataFrame | np.ndarray:
+    """Returns the 1-D flags from a batched filter in the layout of its input data, :py:attr:`like`.
+
+    Args:
+        flag (:obj:`numpy.ndarray`): The flags, in the order of :py:func:`flatten_by_asset`.
+        like (:obj:`pandas.Series` | `pandas.DataFrame` | `numpy.ndarray`): The input data.
+
+    Returns:
+        pandas.Series | pandas.DataFrame | numpy.ndarray: The flags, in the layout of
+            :py:attr:`like`.
+    """
+    if isinstance(like, pd.Series):
+        return pd.Series(flag, index=like.index, dtype="bool")
+    flag = flag.reshape(np.shape(like)[::-1]).T
+    if isinstance(like, pd.DataFrame):
+        return pd.DataFrame(flag, index=like.index, columns=like.columns)
+    return flag
@@ -0,0 +1,446 @@
+"""
+This module provides a content-addressed, on-disk cache for the results of the analysis classes,
+and an in-memory cache for the intermediate results of their Monte Carlo simulations.
+
+Results are keyed on a stable hash of the :py:class:`openoa.plant.PlantData` data and metadata,
+the analysis class and its parameters, and the random seed used, so a repeated run of the same
+analysis on the same data is loaded from disk instead of being recomputed. Only runs with an
+integer seed are cached because unseeded runs are not reproducible. ``DataFrame`` outputs are
+stored as Parquet files when ``pyarrow`` is installed (otherwise as pickles), ``numpy`` arrays are
+stored in a single NPZ file, and the least recently used entries are evicted once the cache
+exceeds its maximum size.
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+import json
+import uuid
+import pickle
+import shutil
+import hashlib
+from typing import Any, Callable, Hashable
+from pathlib import Path
+from collections import OrderedDict
+
+import attrs
+import numpy as np
+import pandas as pd
+from attrs import field, define
+
+import openoa
+from openoa.logging import logging
+
+logger = logging.getLogger(__name__)
+
+try:
+    import pyarrow  # noqa: F401
+
+    PARQUET_AVAILABLE = True
+except ModuleNotFoundError:
+    PARQUET_AVAILABLE = False
+
+MANIFEST = "manifest.json"
+ARRAYS = "arrays.npz"
+
+
+def _update_with_frame(hasher, df: pd.DataFrame | None) -> None:
+    """Adds the column names, index names, data types, and values of :py:attr:`df` to
+    :py:attr:`hasher`.
+    """
+    if df is None:
+        hasher.update(b"None")
+        return
+    hasher.update(repr(df.columns.tolist()).encode())
+    hasher.update(repr(list(df.index.names)).encode())
+    hasher.update(repr(df.dtypes.astype(str).tolist()).encode())
+    hasher.update(pd.util.hash_pandas_object(df, index=True).to_numpy().tobytes())
+
+
+def hash_plant_data(plant) -> str:
+    """Creates a stable hash of the data and metadata contained in a
+    :py:class:`openoa.plant.PlantData` object.
+
+    Args:
+        plant(:obj:`PlantData`): The ``PlantData`` object to be hashed.
+
+    Returns:
+        :obj:`str`: The hexadecimal SHA-256 digest of the plant's data.
+    """
+    hasher = hashlib.sha256()
+    hasher.update(repr(plant.metadata).encode())
+    for name, data in plant.data_dict.items():
+        hasher.update(name.encode())
+        if name == "reanalysis":
+            data = {} if data is None else data
+            for product in sorted(data):
+                hasher.update(product.encode())
+                _update_with_frame(hasher, data[product])
+        else:
+            _update_with_frame(hasher, data)
+    return hasher.hexdigest()
+
+
+def _to_json(value: Any) -> Any:
+    """Converts the non-JSON serializable analysis parameter types to a stable representation."""
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, (pd.Timestamp, pd.Timedelta)):
+        return str(value)
+    if isinstance(value, (pd.DataFrame, pd.Series)):
+        hasher = hashlib.sha256()
+        _update_with_frame(hasher, pd.DataFrame(value))
+        return hasher.hexdigest()
+    if isinstance(value, (set, tuple)):
+        return list(value)
+    return repr(value)
+
+
+def hash_parameters(parameters: dict) -> str:
+    """Creates a stable hash of a dictionary of analysis parameters.
+
+    Args:
+        parameters(:obj:`dict`): The parameter names and values.
+
+    Returns:
+        :obj:`str`: The hexadecimal SHA-256 digest of the parameters.
+    """
+    serialized = json.dumps(parameters, sort_keys=True, default=_to_json)
+    return hashlib.sha256(serialized.encode()).hexdigest()
+
+
+@define(auto_attribs=True)
+class ResultCache:
+    """An on-disk cache of analysis results, where each entry is a directory named by its key,
+    containing a manifest of the stored attributes and their data files. The modification time of
+    an entry's manifest is updated each time it is loaded, and is used to evict the least recently
+    used entries.
+
+    Args:
+        directory(:obj:`str` | :obj:`pathlib.Path`): The directory where the results are stored.
+            This will be created if it does not already exist.
+        max_size(:obj:`int`): The maximum size of the cache, in bytes. Defaults to 2 GB.
+    """
+
+    directory: Path = field(converter=Path)
+    max_size: int = field(default=2 * 1024**3, converter=int)
+
+    def __attrs_post_init__(self):
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    def key(self, plant_hash: str, analysis_name: str, parameters: dict) -> str:
+        """Creates the cache key for an analysis run.
+
+        Args:
+            plant_hash(:obj:`str`): The hash of the ``PlantData``, see :py:func:`hash_plant_data`.
+            analysis_name(:obj:`str`): The name of the analysis class.
+            parameters(:obj:`dict`): All of the parameters, including the seed, of the run.
+
+        Returns:
+            :obj:`str`: The key of the analysis run.
+        """
+        return hash_parameters(
+            dict(
+                version=openoa.__version__,
+                plant=plant_hash,
+                analysis=analysis_name,
+                parameters=parameters,
+            )
+        )
+
+    def _entries(self) -> list[Path]:
+        """Lists the directories of all of the completed cache entries."""
+        return [p.parent for p in self.directory.glob(f"*/{MANIFEST}")]
+
+    def __contains__(self, key: str) -> bool:
+        return (self.directory / key / MANIFEST).is_file()
+
+    @property
+    def size(self) -> int:
+        """The total size of all of the cache entries, in bytes."""
+        return sum(_directory_size(entry) for entry in self._entries())
+
+    def load(self, key: str) -> dict[str, Any] | None:
+        """Loads the results stored under :py:attr:`key`, and marks the entry as recently used.
+
+        Args:
+            key(:obj:`str`): The key of the analysis run.
+
+        Returns:
+            :obj:`dict[str, Any]` | :obj:`None`: The stored attribute names and their values, or
+                None if there is no entry for :py:attr:`key`.
+        """
+        entry = self.directory / key
+        if key not in self:
+            return None
+
+        manifest = json.loads((entry / MANIFEST).read_text())
+        arrays = None
+        values = {}
+        for name, (kind, value) in manifest["attributes"].items():
+            if kind == "value":
+                values[name] = value
+            elif kind == "array":
+                if arrays is None:
+                    arrays = np.load(entry / ARRAYS, allow_pickle=True)
+                values[name] = arrays[name]
+            elif kind == "parquet":
+                values[name] = pd.read_parquet(entry / value)
+            else:
+                with open(entry / value, "rb") as f:
+                    values[name] = pickle.load(f)
+        if arrays is not None:
+            arrays.close()
+
+        os.utime(entry / MANIFEST)
+        logger.info(f"Loaded cached results: {key}")
+        return values
+
+    def store(self, key: str, values: dict[str, Any]) -> None:
+        """Stores the analysis results under :py:attr:`key`, then evicts the least recently used
+        entries if the cache is larger than :py:attr:`max_size`.
+
+        Args:
+            key(:obj:`str`): The key of the analysis run.
+            values(:obj:`dict[str, Any]`): The attribute names and their values to be stored.
+        """
+        tmp = self.directory / f".tmp-{uuid.uuid4().hex}"
+        tmp.mkdir()
+
+        attributes = {}
+        arrays = {}
+        for i, (name, value) in enumerate(values.items()):
+            if isinstance(value, np.ndarray):
+                arrays[name] = value
+                attributes[name] = ("array", None)
+            elif isinstance(value, (bool, int, float, str, type(None), np.generic)):
+                attributes[name] = (
+                    "value",
+                    value.item() if isinstance(value, np.generic) else value,
+                )
+            elif (
+                isinstance(value, pd.DataFrame)
+                and PARQUET_AVAILABLE
+                and all(isinstance(c, str) for c in value.columns)
+            ):
+                value.to_parquet(tmp / f"{i}.parquet")
+                attributes[name] = ("parquet", f"{i}.parquet")
+            else:
+                with open(tmp / f"{i}.pkl", "wb") as f:
+                    pickle.dump(value, f)
+                attributes[name] = ("pickle", f"{i}.pkl")
+        if arrays:
+            np.savez(tmp / ARRAYS, **arrays)
+        (tmp / MANIFEST).write_text(json.dumps(dict(key=key, attributes=attributes)))
+
+        entry = self.directory / key
+        try:
+            os.replace(tmp, entry)
+        except OSError:
+            # Another process has already stored the same results
+            shutil.rmtree(tmp, ignore_errors=True)
+        logger.info(f"Stored results in the cache: {key}")
+        self.evict(keep=key)
+
+    def evict(self, keep: str | None = None) -> None:
+        """Removes the least recently used entries until the cache is no larger than
+        :py:attr:`max_size`.
+
+        Args:
+            keep(:obj:`str`, optional): The key of an entry that should not be removed, such as
+                the entry that was just stored. Defaults to None.
+        """
+        entries = sorted(self._entries(), key=lambda p: (p / MANIFEST).stat().st_mtime)
+        sizes = {entry: _directory_size(entry) for entry in entries}
+        total = sum(sizes.values())
+        for entry in entries:
+            if total <= self.max_size:
+                break
+            if entry.name == keep:
+                continue
+            shutil.rmtree(entry, ignore_errors=True)
+            total -= sizes[entry]
+            logger.info(f"Evicted cached results: {entry.name}")
+
+    def clear(self) -> None:
+        """Removes all of the cache entries."""
+        for entry in self._entries():
+            shutil.rmtree(entry, ignore_errors=True)
+
+
+def memory_size(value: Any) -> int:
+    """Estimates the memory used by a cached value, in bytes, from the size of the data of its
+    ``numpy`` arrays and ``pandas`` objects, including those nested in tuples, lists, and dicts.
+
+    Args:
+        value(:obj:`Any`): The cached value.
+
+    Returns:
+        :obj:`int`: The estimated size, in bytes.
+    """
+    if isinstance(value, np.ndarray):
+        return value.nbytes
+    if isinstance(value, pd.DataFrame):
+        return int(value.memory_usage(index=True).sum())
+    if isinstance(value, (pd.Series, pd.Index)):
+        return int(value.memory_usage(index=True))
+    if isinstance(value, (tuple, list)):
+        return sum(memory_size(v) for v in value)
+    if isinstance(value, dict):
+        return sum(memory_size(v) for v in value.values())
+    return sys.getsizeof(value)
+
+
+@define(auto_attribs=True)
+class MemoryCache:
+    """An in-memory cache of the intermediate results of an analysis, keyed on the parameters that
+    each result depends on, so that the result is only computed once for each distinct set of
+    parameters. The least recently used entries are evicted once the cache holds more than
+    :py:attr:`max_entries` entries, or more than :py:attr:`max_bytes` bytes of data, as estimated
+    by :py:func:`memory_size`.
+
+    Args:
+        max_entries(:obj:`int`): The maximum number of entries. Defaults to 1024.
+        max_bytes(:obj:`int`, optional): The maximum total size of the entries, in bytes, where the
+            most recent entry is always kept. Defaults to None, which only limits the number of
+            entries.
+    """
+
+    max_entries: int = field(default=1024, converter=int, validator=attrs.validators.gt(0))
+    max_bytes: int | None = field(
+        default=None, validator=attrs.validators.optional(attrs.validators.gt(0))
+    )
+    hits: int = field(default=0, init=False)
+    misses: int = field(default=0, init=False)
+    nbytes: int = field(default=0, init=False)
+    _entries: OrderedDict = field(factory=OrderedDict, init=False, repr=False)
+    _sizes: dict = field(factory=dict, init=False, repr=False)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable, compute: Callable[[], Any]) -> Any:
+        """Returns the result stored under :py:attr:`key`, or computes and stores it.
+
+        Args:
+            key(:obj:`Hashable`): The parameters that the result depends on.
+            compute(:obj:`Callable[[], Any]`): The function that computes the result, which is only
+                called if there is no entry for :py:attr:`key`.
+
+        Returns:
+            :obj:`Any`: The result.
+        """
+        if key in self._entries:
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return self._entries[key]
+
+        self.misses += 1
+        value = compute()
+        self._entries[key] = value
+        if self.max_bytes is not None:
+            self._sizes[key] = memory_size(value)
+            self.nbytes += self._sizes[key]
+        while len(self._entries) > self.max_entries or (
+            self.max_bytes is not None and self.nbytes > self.max_bytes and len(self._entries) > 1
+        ):
+            evicted, _ = self._entries.popitem(last=False)
+            self.nbytes -= self._sizes.pop(evicted, 0)
+        return value
+
+    def clear(self) -> None:
+        """Removes all of the cache entries, and resets the hit and miss counts."""
+        self._entries.clear()
+        self._sizes.clear()
+        self.hits = 0
+        self.misses = 0
+        self.nbytes = 0
+
+
+def _directory_size(path: Path) -> int:
+    """Computes the total size of the files in :py:attr:`path`, in bytes."""
+    return sum(f.stat().st_size for f in path.iterdir() if f.is_file())
+
+
+def convert_to_cache(value: ResultCache | str | Path | None) -> ResultCache | None:
+    """Converts a directory to a :py:class:`ResultCache`, or returns :py:attr:`value` if it's
+    already a ``ResultCache``, or None.
+    """
+    if value is None or isinstance(value, ResultCache):
+        return value
+    return ResultCache(value)
+
+
+def analysis_cache_key(analysis, **run_options) -> str | None:
+    """Creates the cache key for an analysis' current run from its ``PlantData``, its initialized
+    and run parameters, and its seed.
+
+    Args:
+        analysis: An analysis class object with ``cache``, ``seed``, ``plant``, and
+            ``run_parameters`` attributes.
+        run_options: Any additional ``run`` arguments that change the results.
+
+    Returns:
+        :obj:`str` | :obj:`None`: The key, or None if the analysis has no cache, or is not seeded
+            with an integer, and therefore can't be reproduced.
+    """
+    if analysis.cache is None:
+        return None
+    if not isinstance(analysis.seed, (int, np.integer)):
+        logger.info("Results are only cached for analyses seeded with an integer")
+        return None
+
+    parameters = {
+        f.name: getattr(analysis, f.name)
+        for f in attrs.fields(type(analysis))
+        if f.init and f.name not in ("plant", "cache")
+    }
+    parameters.update({name: getattr(analysis, name) for name in analysis.run_parameters})
+    parameters.update(run_options)
+    return analysis.cache.key(hash_plant_data(analysis.plant), type(analysis).__name__, parameters)
+
+
+def load_cached_results(analysis, key: str | None) -> bool:
+    """Sets the cached results for :py:attr:`key` on :py:attr:`analysis`, if they exist.
+
+    Args:
+        analysis: An analysis class object with a ``cache`` attribute.
+        key(:obj:`str` | :obj:`None`): The key from :py:func:`analysis_cache_key`.
+
+    Returns:
+        :obj:`bool`: True if the results were loaded, otherwise False.
+    """
+    if key is None:
+        return False
+    values = analysis.cache.load(key)
+    if values is None:
+        return False
+    for name, value in values.items():
+        object.__setattr__(analysis, name, value)
+    return True
+
+
+def store_cached_results(analysis, key: str | None, attributes: list[str] | None = None) -> None:
+    """Stores the ``cached_attributes`` of :py:attr:`analysis` that have been set under
+    :py:attr:`key`.
+
+    Args:
+        analysis: An analysis class object with ``cache`` and ``cached_attributes`` attributes.
+        key(:obj:`str` | :obj:`None`): The key from :py:func:`analysis_cache_key`. If None, then
+            nothing is stored.
+        attributes(:obj:`list[str]`, optional): The attributes to store, for an analysis whose
+            results depend on the run's configuration. Defaults to ``cached_attributes``.
+    """
+    if key is None:
+        return
+    if attributes is None:
+        attributes = analysis.cached_attributes
+    # Attributes that aren't used by the run's configuration are never set, so they are skipped
+    values = {name: getattr(analysis, name) for name in attributes if hasattr(analysis, name)}
+    analysis.cache.store(key, values)
@@ -8,12 +8,15 @@ from __future__ import annotations
 import numpy as np
 import scipy as sp
 import pandas as pd
+import numpy.typing as npt
 from sklearn.cluster import KMeans
 
 from openoa.utils._converters import (
     series_to_df,
     series_method,
     dataframe_method,
+    flatten_by_asset,
+    unflatten_by_asset,
     convert_args_to_lists,
 )
 
@@ -188,6 +191,106 @@ def window_range_flag(
     return flag
 
 
+def _grouped_median(values: np.ndarray, groups: np.ndarray, n_groups: int) -> np.ndarray:
+    """Computes the median of the non-NaN values in each group, which is NaN for empty groups.
+
+    Args:
+        values (np.ndarray): The 1-D array of values.
+        groups (np.ndarray): The group ID of each value, from 0 to :py:attr:`n_groups` - 1.
+        n_groups (int): The number of groups.
+
+    Returns:
+        np.ndarray: The median of each group.
+    """
+    valid = ~np.isnan(values)
+    values = values[valid]
+    groups = groups[valid]
+
+    # Sort the values within each group, so each group's median is at the middle of its slice
+    order = np.lexsort((values, groups))
+    values = values[order]
+    counts = np.bincount(groups, minlength=n_groups)
+    starts = np.cumsum(counts) - counts
+
+    median = np.full(n_groups, np.nan)
+    nonempty = counts > 0
+    lower = values[starts[nonempty] + (counts[nonempty] - 1) // 2]
+    upper = values[starts[nonempty] + counts[nonempty] // 2]
+    median[nonempty] = (lower + upper) / 2
+    return median
+
+
+def _bin_edges(bin_min: float, bin_max: float, bin_width: float) -> np.ndarray:
+    """Creates the bin edges of :py:func:`bin_filter`, where the last bin edge is :py:attr:`bin_max`."""
+    bin_edges = np.arange(bin_min, bin_max, bin_width)
+    return np.unique(np.clip(np.append(bin_edges, bin_max), bin_min, bin_max))
+
+
+def _check_bin_filter_options(center_type: str, threshold_type: str, direction: str) -> None:
+    """Checks the :py:attr:`center_type`, :py:attr:`threshold_type`, and :py:attr:`direction`
+    options of :py:func:`bin_filter`.
+    """
+    if center_type not in ("mean", "median"):
+        raise ValueError("Incorrect `center_type` specified; must be one of 'mean' or 'median'.")
+    if threshold_type not in ("std", "scalar", "mad"):
+        raise ValueError("Incorrect `threshold_type` specified; must be one of 'std' or 'scalar'.")
+    if direction not in ("all", "above", "below"):
+        raise ValueError(
+            "Incorrect `direction` specified; must be one of 'all', 'above', or 'below'."
+        )
+
+
+def _bin_filter_flags(
+    bins: np.ndarray,
+    n_bins: int,
+    values: np.ndarray,
+    threshold: float | np.ndarray,
+    center_type: str,
+    threshold_type: str,
+    direction: str,
+) -> np.ndarray:
+    """Flags the values that are outside the threshold of the center of their bin, where each bin's
+    statistics are reduced from its values with O(n) memory. See :py:func:`bin_filter` for the
+    arguments.
+
+    Args:
+        bins (np.ndarray): The bin ID of each value, from 0 to :py:attr:`n_bins` - 1.
+        n_bins (int): The number of bins.
+        threshold (float | np.ndarray): The threshold, or the threshold of each bin.
+
+    Returns:
+        np.ndarray: The boolean flag of each value, before the values outside of the bin limits are
+            reset.
+    """
+    valid = ~np.isnan(values)
+    counts = np.bincount(bins[valid], minlength=n_bins)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        mean = np.bincount(bins[valid], weights=values[valid], minlength=n_bins) / counts
+        if center_type == "median":
+            center = _grouped_median(values, bins, n_bins)
+        else:
+            center = mean
+
+        # Define threshold of data flag
+        if threshold_type == "std":
+            residual = values[valid] - mean[bins[valid]]
+            variance = np.bincount(bins[valid], weights=residual**2, minlength=n_bins)
+            deviation = np.sqrt(variance / (counts - 1)) * threshold
+        elif threshold_type == "scalar":
+            deviation = np.full(n_bins, threshold, dtype=float)
+        else:  # median absolute deviation (mad)
+            deviation = _grouped_median(np.abs(values - center[bins]), bins, n_bins) * threshold
+
+    # Perform flagging depending on specfied direction
+    flag = np.zeros(values.shape, dtype=bool)
+    if direction in ("above", "all"):
+        flag |= values > (center + deviation)[bins]
+    if direction in ("below", "all"):
+        flag |= values < (center - deviation)[bins]
+    return flag
+
+
 @series_method(data_cols=["bin_col", "value_col"])
 def bin_filter(
     bin_col: pd.Series | str,
@@ -222,14 +325,7 @@ def bin_filter(
     Returns:
         :obj:`pandas.Series(bool)`: Array-like object with boolean entries.
     """
-    if center_type not in ("mean", "median"):
-        raise ValueError("Incorrect `center_type` specified; must be one of 'mean' or 'median'.")
-    if threshold_type not in ("std", "scalar", "mad"):
-        raise ValueError("Incorrect `threshold_type` specified; must be one of 'std' or 'scalar'.")
-    if direction not in ("all", "above", "below"):
-        raise ValueError(
-            "Incorrect `direction` specified; must be one of 'all', 'above', or 'below'."
-        )
+    _check_bin_filter_options(center_type, threshold_type, direction)
 
     # Set bin min and max values if not passed to function
     if bin_min is None:
@@ -237,55 +333,302 @@ def bin_filter(
     if bin_max is None:
         bin_max = np.max(bin_col.values)
 
-    # Define bin edges
-    bin_edges = np.arange(bin_min, bin_max, bin_width)
+    # Define bin edges, where the last bin edge value is bin_max
+    bin_edges = _bin_edges(bin_min, bin_max, bin_width)
+
+    # Flag the values by bin, and reset any values outside the bin limits
+    bin_values = bin_col.to_numpy(dtype=float)
+    flag = _bin_filter_flags(
+        np.digitize(bin_values, bin_edges, right=True),
+        bin_edges.size + 1,
+        value_col.to_numpy(dtype=float),
+        threshold,
+        center_type,
+        threshold_type,
+        direction,
+    )
+    flag[(bin_values <= bin_min) | (bin_values > bin_max)] = False
+    return pd.Series(flag, index=value_col.index, dtype="bool")
+
+
+def _select_columns(data: pd.DataFrame | None, *cols) -> list:
+    """Selects the columns of :py:attr:`data` that are passed by name to a batched filter, where the
+    column of a (time x asset) ``DataFrame`` with ("variable", "asset_id") columns is itself a
+    (time x asset) ``DataFrame``.
+    """
+    if data is None:
+        return list(cols)
+    return [data[col] if isinstance(col, str) else col for col in cols]
 
-    # Ensure the last bin edge value is bin_max
-    bin_edges = np.unique(np.clip(np.append(bin_edges, bin_max), bin_min, bin_max))
 
-    # Bin the data and recreate the comparison data as a multi-column data frame
-    which_bin_col = np.digitize(bin_col, bin_edges, right=True)
+def _asset_parameter(value: float | npt.ArrayLike | pd.Series, assets: pd.Index) -> np.ndarray:
+    """Broadcasts a batched filter parameter to an array of the value for each of :py:attr:`assets`.
+
+    Args:
+        value (:obj:`float` | `numpy.typing.ArrayLike` | `pandas.Series`): A single value for all of
+            the assets, the value of each asset in the same order as :py:attr:`assets`, or a
+            ``pandas.Series`` indexed by the asset IDs, such as ``PlantData.asset.rated_power``.
+        assets (:obj:`pandas.Index`): The asset IDs.
+
+    Raises:
+        ValueError: Raised if there is not a value for each asset.
+
+    Returns:
+        np.ndarray: The value of each asset.
+    """
+    if isinstance(value, pd.Series):
+        if (missing := assets.difference(value.index)).size > 0:
+            raise ValueError(f"No batched filter parameter provided for assets: {missing.tolist()}")
+        return value.reindex(assets).to_numpy(dtype=float)
+
+    value = np.asarray(value, dtype=float)
+    if value.ndim == 0:
+        return np.full(assets.size, value)
+    if value.shape != (assets.size,):
+        raise ValueError(
+            f"A batched filter parameter must be a single value or one value for each of the {assets.size} assets."
+        )
+    return value
+
 
-    # Create the flag values as a matrix with each column being the timestamp's binned value,
-    # e.g., all columns values are NaN if the data point is not in that bin
-    flag_vals = (
-        value_col.to_frame().set_index(pd.Series(which_bin_col, name="bin"), append=True).unstack()
+def range_flag_by_asset(
+    data: pd.Series | pd.DataFrame | np.ndarray,
+    lower: float | npt.ArrayLike | pd.Series,
+    upper: float | npt.ArrayLike | pd.Series,
+) -> pd.Series | pd.DataFrame | np.ndarray:
+    """Flag data for which the specified data is outside the range of [lower, upper] of each asset,
+    for all of the assets at once. This is equivalent to :py:func:`range_flag` applied to each
+    asset's data.
+
+    Args:
+        data (:obj:`pandas.Series` | `pandas.DataFrame` | `numpy.ndarray`): A ``pandas.Series`` with an
+            "asset_id" index level, such as a column of ``PlantData.scada``, or a (time x asset)
+            ``pandas.DataFrame`` or 2-D ``numpy.ndarray``.
+        lower (:obj:`float` | `numpy.typing.ArrayLike` | `pandas.Series`): lower threshold
+            (inclusive) for all assets, or for each asset (see :py:func:`_asset_parameter`).
+        upper (:obj:`float` | `numpy.typing.ArrayLike` | `pandas.Series`): upper threshold
+            (inclusive) for all assets, or for each asset.
+
+    Returns:
+        :obj:`pandas.Series` | `pandas.DataFrame` | `numpy.ndarray`: The boolean flags, in the same
+            layout as :py:attr:`data`.
+    """
+    (values,), codes, assets = flatten_by_asset(data)
+    lower = _asset_parameter(lower, assets)[codes]
+    upper = _asset_parameter(upper, assets)[codes]
+    flag = ~((values >= lower) & (values <= upper))
+    return unflatten_by_asset(flag, data)
+
+
+def unresponsive_flag_by_asset(
+    data: pd.Series | pd.DataFrame | np.ndarray, threshold: int = 3
+) -> pd.Series | pd.DataFrame | np.ndarray:
+    """Flag time stamps for which the reported data of an asset does not change for `threshold`
+    repeated intervals, for all of the assets at once. This is equivalent to
+    :py:func:`unresponsive_flag` applied to each asset's data, where the intervals are the
+    successive values of each asset, in the order that they appear in :py:attr:`data`.
+
+    Args:
+        data (:obj:`pandas.Series` | `pandas.DataFrame` | `numpy.ndarray`): A ``pandas.Series`` with an
+            "asset_id" index level, such as a column of ``PlantData.scada``, or a (time x asset)
+            ``pandas.DataFrame`` or 2-D ``numpy.ndarray``.
+        threshold (:obj:`int`): number of intervals over which measurment does not change, of at
+            least 2. Defaults to 3.
+
+    Returns:
+        :obj:`pandas.Series` | `pandas.DataFrame` | `numpy.ndarray`: The boolean flags, in the same
+            layout as :py:attr:`data`.
+    """
+    if not isinstance(threshold, int):
+        raise TypeError("The input to `threshold` must be an integer.")
+    if threshold < 2:
+        raise ValueError("The input to `threshold` must be at least 2.")
+
+    # Order the values by asset, so each asset's successive values are contiguous
+    (values,), codes, _ = flatten_by_asset(data)
+    order = np.argsort(codes, kind="stable")
+    values = values[order]
+    codes = codes[order]
+
+    # Find the changes between successive values, where the first value of each asset is a change
+    changed = np.ones(values.size, dtype=bool)
+    changed[1:] = ~(np.diff(values) == 0) | (codes[1:] != codes[:-1])
+
+    # The values are unresponsive when there are no changes in the `threshold - 1` preceding
+    # differences, which can't span two assets, because each asset's first value is a change
+    window = threshold - 1
+    n_changed = np.cumsum(changed)
+    n_changed[window:] -= n_changed[:-window].copy()
+    unresponsive = n_changed == 0
+
+    # Need to flag preceding `threshold` values as well
+    n_unresponsive = np.cumsum(unresponsive)
+    ahead = np.minimum(np.arange(values.size) + window, values.size - 1)
+    unresponsive |= n_unresponsive[ahead] > n_unresponsive
+
+    flag = np.empty(values.size, dtype=bool)
+    flag[order] = unresponsive
+    return unflatten_by_asset(flag, data)
+
+
+def window_range_flag_by_asset(
+    window_col: str | pd.Series | pd.DataFrame | np.ndarray = None,
+    window_start: float | npt.ArrayLike | pd.Series = -np.inf,
+    window_end: float | npt.ArrayLike | pd.Series = np.inf,
+    value_col: str | pd.Series | pd.DataFrame | np.ndarray = None,
+    value_min: float | npt.ArrayLike | pd.Series = -np.inf,
+    value_max: float | npt.ArrayLike | pd.Series = np.inf,
+    data: pd.DataFrame = None,
+) -> pd.Series | pd.DataFrame | np.ndarray:
+    """Flag time stamps for which measurement in `window_col` are within the range: [`window_start`,
+    `window_end`], and the measurements in `value_col` are outside of the range [`value_min`,
+    `value_max`], with the ranges of each asset, for all of the assets at once. This is equivalent
+    to :py:func:`window_range_flag` applied to each asset's data.
+
+    Args:
+        window_col (:obj:`str` | `pandas.Series` | `pandas.DataFrame` | `numpy.ndarray`): The column
+            in :py:attr:`data` used to define the window range, or the data as a ``pandas.Series``
+            with an "asset_id" index level, or a (time x asset) ``pandas.DataFrame`` or 2-D
+            ``numpy.ndarray``, by default None.
+        window_start(:obj:`float` | `numpy.typing.ArrayLike` | `pandas.Series`): minimum value for the
+            inclusive window, for all assets or for each asset, by default -np.inf.
+        window_end(:obj:`float` | `numpy.typing.ArrayLike` | `pandas.Series`): maximum value for the
+            inclusive window, for all assets or for each asset, by default np.inf.
+        value_col (:obj:`str` | `pandas.Series` | `pandas.DataFrame` | `numpy.ndarray`): The column in
+            :py:attr:`data` used to define the value range, or the data in the same layout as
+            :py:attr:`window_col`, by default None.
+        value_min(:obj:`float` | `numpy.typing.ArrayLike` | `pandas.Series`): lower threshold for the
+            inclusive data range, for all assets or for each asset; default -np.inf
+        value_max(:obj:`float` | `numpy.typing.ArrayLike` | `pandas.Series`): upper threshold for the
+            inclusive data range, for all assets or for each asset; default np.inf
+        data (:obj:`pandas.DataFrame`): data frame containing the columns :py:attr:`window_col` and
+            :py:attr:`value_col`, such as ``PlantData.scada``, by default None.
+
+    Returns:
+        :obj:`pandas.Series` | `pandas.DataFrame` | `numpy.ndarray`: The boolean flags, in the same
+            layout as :py:attr:`window_col`.
+    """
+    window_col, value_col = _select_columns(data, window_col, value_col)
+    (window, values), codes, assets = flatten_by_asset(window_col, value_col)
+    in_window = (window >= _asset_parameter(window_start, assets)[codes]) & (
+        window <= _asset_parameter(window_end, assets)[codes]
     )
-    drop = [i for i, el in enumerate(flag_vals.columns.names) if el != "bin"]
-    flag_vals.columns = flag_vals.columns.droplevel(drop).rename(None)
-
-    # Create a False array as default, so flags are set to True
-    flag_df = pd.DataFrame(np.zeros_like(flag_vals, dtype=bool), index=flag_vals.index)
-
-    # Get center of binned data
-    if center_type == "median":
-        center = np.nanmedian(flag_vals.values, axis=0)
-    else:
-        center = np.nanmean(flag_vals.values, axis=0)
-    center = pd.DataFrame(
-        np.full(flag_vals.shape, center),
-        index=flag_vals.index,
-        columns=flag_vals.columns,
+    in_range = (values >= _asset_parameter(value_min, assets)[codes]) & (
+        values <= _asset_parameter(value_max, assets)[codes]
     )
+    return unflatten_by_asset(in_window & ~in_range, window_col)
 
-    # Define threshold of data flag
-    if threshold_type == "std":
-        deviation = np.nanstd(flag_vals.values, ddof=1, axis=0) * threshold
-    elif threshold_type == "scalar":
-        deviation = threshold
-    else:  # median absolute deviation (mad)
-        deviation = np.nanmedian(np.abs(flag_vals.values - center.values), axis=0) * threshold
 
-    # Perform flagging depending on specfied direction
-    if direction in ("above", "all"):
-        flag_df |= flag_vals > center + deviation
-    if direction in ("below", "all"):
-        flag_df |= flag_vals < center - deviation
+def _digitize_by_asset(
+    values: np.ndarray, codes: np.ndarray, bin_edges: list[np.ndarray]
+) -> tuple[np.ndarray, int]:
+    """Bins the values of every asset with the asset's own bin edges, in a single sort.
 
-    # Get all instances where the value is True, and reset any values outside the bin limits
-    flag = pd.Series(np.nanmax(flag_df, axis=1), index=flag_df.index, dtype="bool")
-    flag.loc[(bin_col <= bin_min) | (bin_col > bin_max)] = False
-    return flag
+    Args:
+        values (np.ndarray): The 1-D array of values.
+        codes (np.ndarray): The code of each value's asset.
+        bin_edges (list[np.ndarray]): The bin edges of each asset.
+
+    Returns:
+        tuple[np.ndarray, int]: The bin ID of each value, which is the asset's ``np.digitize`` bin,
+            with ``right=True``, offset by the number of bins of the preceding assets, and the total
+            number of bins.
+    """
+    n_edges = np.array([edges.size for edges in bin_edges], dtype=int)
+    n_bins = n_edges + 1
+
+    # Sort the values and edges of each asset together, where values equal to an edge come before
+    # the edge, so the bin of each value is the number of the asset's edges that are less than it
+    all_values = np.concatenate([values, *bin_edges])
+    all_codes = np.concatenate([codes, np.repeat(np.arange(n_edges.size), n_edges)])
+    is_edge = np.arange(all_values.size) >= values.size
+    order = np.lexsort((is_edge, all_values, all_codes))
+    n_lower_edges = np.cumsum(is_edge[order])
+
+    is_value = ~is_edge[order]
+    value_ix = order[is_value]
+    bins = np.empty(values.size, dtype=int)
+    bins[value_ix] = (n_lower_edges[is_value] - (np.cumsum(n_edges) - n_edges)[codes[value_ix]]) + (
+        np.cumsum(n_bins) - n_bins
+    )[codes[value_ix]]
+    return bins, int(n_bins.sum())
+
+
+def bin_filter_by_asset(
+    bin_col: str | pd.Series | pd.DataFrame | np.ndarray,
+    value_col: str | pd.Series | pd.DataFrame | np.ndarray,
+    bin_width: float | npt.ArrayLike | pd.Series,
+    threshold: float | npt.ArrayLike | pd.Series = 2,
+    center_type: str = "mean",
+    bin_min: float | npt.ArrayLike | pd.Series = None,
+    bin_max: float | npt.ArrayLike | pd.Series = None,
+    threshold_type: str = "std",
+    direction: str = "all",
+    data: pd.DataFrame = None,
+) -> pd.Series | pd.DataFrame | np.ndarray:
+    """Flag time stamps for which data in `value_col` when binned by data in `bin_col` into bins of
+    width `bin_width` are outside the `threshold` bin, where each asset is binned separately, for
+    all of the assets at once. This is equivalent to :py:func:`bin_filter` applied to each asset's
+    data, and the bin parameters can be different for each asset, e.g., a fraction of the rated
+    power, but the bins of every asset are reduced in a single vectorized pass.
+
+    Args:
+        bin_col (:obj:`str` | `pandas.Series` | `pandas.DataFrame` | `numpy.ndarray`): The column in
+            :py:attr:`data` to be used for binning, or the data as a ``pandas.Series`` with an
+            "asset_id" index level, or a (time x asset) ``pandas.DataFrame`` or 2-D
+            ``numpy.ndarray``.
+        value_col (:obj:`str` | `pandas.Series` | `pandas.DataFrame` | `numpy.ndarray`): The column in
+            :py:attr:`data` to be flagged, or the data in the same layout as :py:attr:`bin_col`.
+        bin_width(:obj:`float` | `numpy.typing.ArrayLike` | `pandas.Series`): Width of bin in units
+            of :py:attr:`bin_col`, for all assets or for each asset (see
+            :py:func:`_asset_parameter`).
+        threshold(:obj:`float` | `numpy.typing.ArrayLike` | `pandas.Series`): Outlier threshold, for
+            all assets or for each asset.
+        bin_min(:obj:`float` | `numpy.typing.ArrayLike` | `pandas.Series`): Minimum bin value below
+            which flag should not be applied, for all assets or for each asset. Defaults to the
+            minimum of each asset's :py:attr:`bin_col`.
+        bin_max(:obj:`float` | `numpy.typing.ArrayLike` | `pandas.Series`): Maximum bin value above
+            which flag should not be applied, for all assets or for each asset. Defaults to the
+            maximum of each asset's :py:attr:`bin_col`.
+        threshold_type(:obj:`str`): Option to apply a 'std', 'scalar', or 'mad' (median absolute deviation)
+            based threshold
+        center_type(:obj:`str`): Option to use a 'mean' or 'median' center for each bin
+        direction(:obj:`str`): Option to apply flag only to data 'above' or 'below' the mean, by default 'all'
+        data(:obj:`pd.DataFrame`): DataFrame containing both :py:attr:`bin_col` and
+            :py:attr:`value_col`, such as ``PlantData.scada``, by default None.
+
+    Returns:
+        :obj:`pandas.Series` | `pandas.DataFrame` | `numpy.ndarray`: The boolean flags, in the same
+            layout as :py:attr:`bin_col`.
+    """
+    _check_bin_filter_options(center_type, threshold_type, direction)
+
+    bin_col, value_col = _select_columns(data, bin_col, value_col)
+    (bin_values, values), codes, assets = flatten_by_asset(bin_col, value_col)
+
+    # Set bin min and max values of each asset if not passed to function
+    if bin_min is None:
+        bin_min = pd.Series(bin_values).groupby(codes).min().reindex(range(assets.size)).values
+    if bin_max is None:
+        bin_max = pd.Series(bin_values).groupby(codes).max().reindex(range(assets.size)).values
+    bin_min = _asset_parameter(bin_min, assets)
+    bin_max = _asset_parameter(bin_max, assets)
+
+    # Define the bin edges of each asset, and bin all of the values at once
+    bin_edges = [
+        _bin_edges(*args) for args in zip(bin_min, bin_max, _asset_parameter(bin_width, assets))
+    ]
+    bins, n_bins = _digitize_by_asset(bin_values, codes, bin_edges)
+    threshold = np.repeat(
+        _asset_parameter(threshold, assets), [edges.size + 1 for edges in bin_edges]
+    )
+
+    # Flag the values by bin, and reset any values outside each asset's bin limits
+    flag = _bin_filter_flags(
+        bins, n_bins, values, threshold, center_type, threshold_type, direction
+    )
+    flag[(bin_values <= bin_min[codes]) | (bin_values > bin_max[codes])] = False
+    return unflatten_by_asset(flag, bin_col)
 
 
 @dataframe_method(data_cols=["data_col1", "data_col2"])
@@ -131,6 +131,56 @@ def impute_data(
     return data.loc[:, target_col].rename(final_col_name)
 
 
+def _asset_matrix(data: pd.DataFrame, col: str, time_codes, asset_codes, shape) -> np.ndarray:
+    """Pivots :py:attr:`col` of a (time, asset_id) MultiIndex ``DataFrame`` to a (time x asset)
+    matrix, where the times and assets without data are NaN.
+    """
+    matrix = np.full(shape, np.nan)
+    matrix[time_codes, asset_codes] = data[col].to_numpy(dtype=float)
+    return matrix
+
+
+def _linear_fits(target: np.ndarray, reference: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Fits the least squares line between each target asset and each reference asset, using the
+    times for which both assets have finite data, with the closed-form solution computed from the
+    (asset x asset) sums of the data.
+
+    Args:
+        target(:obj:`numpy.ndarray`): The (time x asset) matrix of the data to be imputed.
+        reference(:obj:`numpy.ndarray`): The (time x asset) matrix of the data used for imputation.
+
+    Returns:
+        :obj:`tuple[numpy.ndarray, numpy.ndarray]`: The (target x reference) matrices of the
+            intercepts and slopes.
+    """
+    target_valid = np.isfinite(target)
+    reference_valid = np.isfinite(reference)
+
+    # Center each asset's data on its mean, so the sums are well conditioned
+    with np.errstate(divide="ignore", invalid="ignore"):
+        target_mean = np.where(target_valid, target, 0).sum(axis=0) / target_valid.sum(axis=0)
+        reference_mean = np.where(reference_valid, reference, 0).sum(axis=0) / reference_valid.sum(
+            axis=0
+        )
+    y = np.where(target_valid, target - target_mean, 0)
+    x = np.where(reference_valid, reference - reference_mean, 0)
+    target_valid = target_valid.astype(float)
+    reference_valid = reference_valid.astype(float)
+
+    # Sum over the times where both the target, i, and reference, j, have data, as (i x j) matrices
+    n = target_valid.T @ reference_valid
+    sum_x = target_valid.T @ x
+    sum_xx = target_valid.T @ x**2
+    sum_y = y.T @ reference_valid
+    sum_xy = y.T @ x
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        slope = (n * sum_xy - sum_x * sum_y) / (n * sum_xx - sum_x**2)
+        intercept = (sum_y - slope * sum_x) / n
+    intercept = intercept + target_mean[:, None] - slope * reference_mean[None, :]
+    return intercept, slope
+
+
 def impute_all_assets_by_correlation(
     data: pd.DataFrame,
     impute_col: str,
@@ -154,6 +204,10 @@ def impute_all_assets_by_correlation(
         b. There are no more neighbors to consider
         c. The neighboring asset does not meet the specified correlation threshold, :py:attr:`r2_threshold`
 
+    The data are pivoted once to (time x asset) matrices, and each target asset's data are fit to
+    each neighbor's data, in the same way as :py:func:`impute_data`, with a single vectorized least
+    squares solution for all of the asset pairs when the fit is linear.
+
     Args:
         data(:obj:`pandas.DataFrame`): input data frame such as :py:attr:`PlantData.scada` that uses a
             MultiIndex with a timestamp and asset_id column for indices, in that order.
@@ -170,60 +224,62 @@ def impute_all_assets_by_correlation(
         :obj:`pandas.Series`: The imputation results
 
     """
-    impute_df = data.loc[:, :].copy()
+    # Ensure old method call will work here
+    if method == "linear":
+        method = "polynomial"
+        degree = 1
+    if method != "polynomial":
+        raise NotImplementedError(
+            "Only 'linear' (1-degree polynomial) and 'polynomial' fits are implemented at this time."
+        )
+
+    # Pivot the data to (time x asset) matrices, with the times and assets in sorted order
+    time_codes, times = pd.factorize(data.index.get_level_values(0), sort=True)
+    asset_codes, assets = pd.factorize(data.index.get_level_values(asset_id_col), sort=True)
+    shape = (times.size, assets.size)
+    if np.bincount(time_codes * assets.size + asset_codes).max(initial=0) > 1:
+        raise ValueError("Index contains duplicate entries, cannot reshape")
+    target = _asset_matrix(data, impute_col, time_codes, asset_codes, shape)
+    reference = _asset_matrix(data, reference_col, time_codes, asset_codes, shape)
 
     # Create correlation matrix between different assets
-    corr_df = asset_correlation_matrix(data, impute_col)
+    corr = pd.DataFrame(target).corr(min_periods=2).to_numpy()
+    np.fill_diagonal(corr, np.nan)
 
     # Sort the correlated values according to the highest value, with nans at the end.
-    ix_sort = (-corr_df.fillna(-2)).values.argsort(axis=1)
-    sort_df = pd.DataFrame(corr_df.columns.to_numpy()[ix_sort], index=corr_df.index)
-    # Loop over the assets and impute missing data
-    for target_id in corr_df.columns:
+    ix_sort = (-np.where(np.isnan(corr), -2, corr)).argsort(axis=1)
+
+    if degree == 1:
+        intercept, slope = _linear_fits(target, reference)
+
+    # Loop over the assets and impute missing data from the neighbors, in order of correlation
+    imputed = target.copy()
+    for i in range(assets.size):
         # If there are no NaN values, then skip the asset altogether, otherwise
         # keep track of the number we need to continue checking for
-        ix_target = impute_df.index.get_level_values(1) == target_id
-        if (ix_nan := data.loc[ix_target, impute_col].isnull()).sum() == 0:
+        if (ix_nan := np.isnan(target[:, i])).sum() == 0:
             continue
 
-        # Get the correlation-based neareast neighbor and data
+        # Get the correlation-based neareast neighbor
         id_sort_neighbor = 0
-        id_neighbor = sort_df.loc[target_id, id_sort_neighbor]
-        r2_neighbor = corr_df.loc[target_id, id_neighbor]
-
-        # If the R2 value is too low, then move on to the next asset
-        if r2_neighbor <= r2_threshold:
-            continue
-
-        num_neighbors = corr_df.shape[0] - 1
-        while (ix_nan.sum() > 0) & (num_neighbors > 0) & (r2_neighbor > r2_threshold):
-            # Get the imputed data based on the correlation-based next nearest neighbor
-            imputed_data = impute_data(
-                # target_data=data.xs(target_id, level=1).loc[:, [impute_col]],
-                target_data=data.loc[
-                    data.index.get_level_values(1) == target_id, [impute_col]
-                ].droplevel(asset_id_col),
-                target_col=impute_col,
-                # reference_data=data.xs(id_neighbor, level=1).loc[:, [reference_col]],
-                reference_data=data.loc[
-                    data.index.get_level_values(1) == id_neighbor, [reference_col]
-                ].droplevel(asset_id_col),
-                reference_col=impute_col,
-                method=method,
-                degree=degree,
-            )
-
-            # Fill any NaN values with available imputed values
-            impute_df.loc[ix_target, [impute_col]] = impute_df.loc[ix_target, [impute_col]].where(
-                ~ix_nan, imputed_data.to_frame()
-            )
-
-            ix_nan = impute_df.loc[ix_target, impute_col].isnull()
+        j = ix_sort[i, id_sort_neighbor]
+        num_neighbors = assets.size - 1
+        while (ix_nan.sum() > 0) & (num_neighbors > 0) & (corr[i, j] > r2_threshold):
+            # Fill any NaN values with the neighbor's data that are available
+            ix_fill = ix_nan & np.isfinite(reference[:, j])
+            if degree == 1:
+                imputed[ix_fill, i] = intercept[i, j] + slope[i, j] * reference[ix_fill, j]
+            else:
+                ix_fit = ~np.isnan(target[:, i]) & ~np.isnan(reference[:, j])
+                curve_fit = Polynomial.fit(reference[ix_fit, j], target[ix_fit, i], degree)
+                imputed[ix_fill, i] = curve_fit(reference[ix_fill, j])
+
+            ix_nan = np.isnan(imputed[:, i])
             num_neighbors -= 1
             id_sort_neighbor += 1
-            id_neighbor = sort_df.loc[target_id, id_sort_neighbor]
-            r2_neighbor = corr_df.loc[target_id, id_neighbor]
+            j = ix_sort[i, id_sort_neighbor]
 
     # Return the results with the impute_col renamed with a leading "imputed_" for clarity
-    # return impute_df.rename(columns={c: f"imputed_{c}" for c in impute_df.columns})
-    return impute_df[impute_col].rename(f"imputed_{impute_col}")
+    return pd.Series(
+        imputed[time_codes, asset_codes], index=data.index, name=f"imputed_{impute_col}"
+    )
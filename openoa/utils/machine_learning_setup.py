@@ -170,6 +170,7 @@ class MachineLearningSetup:
         report: bool = True,
         verbose: int = 0,
         n_jobs: int | None = None,
+        random_state: int | None = None,
     ) -> None:
         """
         Optimize hyperparameters through cross-validation
@@ -192,10 +193,16 @@ class MachineLearningSetup:
             n_jobs(:obj:`int`): The number of jobs to use for the computation in the scikit-learn model.
                 This will only provide speedup in case of sufficiently large problems.``None`` means 1
                 unless in a :obj:`joblib.parallel_backend` context. ``-1`` means using all processors.
+            random_state(:obj:`int` | :obj:`None`): Seed for the hyperparameter sampling and, when
+                the algorithm supports it, the model's own randomness. Defaults to None, which uses
+                NumPy's global random state.
 
         Returns:
             (none)
         """
+        if random_state is not None and "random_state" in self.algorithm.get_params():
+            self.algorithm.set_params(random_state=random_state)
+
         # Setup randomized cross-validated grid search
         self.random_search = RandomizedSearchCV(
             self.algorithm,
@@ -206,6 +213,7 @@ class MachineLearningSetup:
             verbose=0,
             return_train_score=True,
             n_jobs=n_jobs,
+            random_state=random_state,
         )
         # Fit the model to each combination of hyperparmeters
         self.random_search.fit(X, y)
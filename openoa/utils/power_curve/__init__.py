@@ -4,4 +4,5 @@ power generation.
 
 """
 
-from .functions import IEC, gam, gam_3param, logistic_5_parametric
+from .fleet import FleetPowerCurves, fit_fleet_power_curves
+from .functions import IEC, IEC_by_asset, IECPowerCurve, gam, gam_3param, logistic_5_parametric
@@ -0,0 +1,398 @@
+"""
+This module fits the power curves of every turbine of a plant, or fleet, at once, and stores the
+fitted parameters of each turbine's curves in a compact table that can be saved and reloaded.
+
+The IEC curves of all of the turbines are binned together with
+:py:func:`openoa.utils.power_curve.functions.IEC_by_asset`, while the 5 parameter logistic (L5P)
+and GAM curves are fit to each turbine in parallel worker processes. When the parameters of a
+previous fit are provided, each turbine's L5P fit starts from its previous parameters with a local
+optimization, and only falls back to the global differential evolution, which is also seeded with
+the local result, when the local fit is worse than the previous fit.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor
+
+import attrs
+import numpy as np
+import pandas as pd
+from attrs import field, define
+from scipy.optimize import minimize, differential_evolution
+
+from openoa.utils.power_curve.gam import GAMDesign
+from openoa.utils.power_curve.functions import (
+    LOGISTIC_5_PARAMETRIC_BOUNDS,
+    IEC_by_asset,
+    IECPowerCurve,
+    _iec_bins,
+)
+from openoa.utils.power_curve.parametric_forms import logistic5param
+from openoa.utils.power_curve.parametric_optimize import least_squares
+
+POWER_CURVE_METHODS = ("IEC", "L5P", "GAM")
+L5P_PARAMETERS = ("a", "b", "c", "d", "g")
+TABLE_COLUMNS = ["asset_id", "method", "parameter", "value"]
+
+
+def _rmse(modeled: np.ndarray, power: np.ndarray) -> float:
+    """Computes the root mean square error of the modeled power."""
+    return float(np.sqrt(np.mean((modeled - power) ** 2))) if power.size else np.nan
+
+
+def _l5p_bounds(rated_power: float) -> tuple[tuple[float, float], ...]:
+    """Scales the upper asymptote's bounds of the L5P curve to the turbine's rated power, if known."""
+    if not np.isfinite(rated_power):
+        return LOGISTIC_5_PARAMETRIC_BOUNDS
+    return ((0.5 * rated_power, 1.2 * rated_power), *LOGISTIC_5_PARAMETRIC_BOUNDS[1:])
+
+
+def _fit_l5p(
+    windspeed: np.ndarray,
+    power: np.ndarray,
+    bounds: tuple[tuple[float, float], ...],
+    seed: int,
+    previous: np.ndarray | None = None,
+    previous_rmse: float = np.nan,
+    warm_start_tolerance: float = 0.05,
+) -> tuple[np.ndarray, float]:
+    """Fits the L5P curve to a turbine's data, starting from the previous parameters, if provided.
+
+    Returns:
+        tuple[np.ndarray, float]: The fitted parameters and their root mean square error.
+    """
+
+    def cost(params):
+        return least_squares(logistic5param(windspeed, *params), power)
+
+    x0 = None
+    if previous is not None and np.isfinite(previous).all():
+        lower, upper = np.array(bounds).T
+        x0 = np.clip(previous, lower, upper)
+        with np.errstate(all="ignore"):
+            local = minimize(cost, x0, method="L-BFGS-B", bounds=bounds)
+        rmse = np.sqrt(local.fun / power.size)
+        if rmse <= previous_rmse * (1 + warm_start_tolerance):
+            return local.x, float(rmse)
+        if local.fun < cost(x0):
+            x0 = local.x
+
+    with np.errstate(all="ignore"):
+        fit = differential_evolution(cost, bounds, x0=x0, seed=seed)
+    return fit.x, float(np.sqrt(fit.fun / power.size))
+
+
+def _fit_turbine(task: dict) -> list[tuple]:
+    """Fits the L5P and GAM curves of a single turbine, and returns the rows of its parameters in
+    the parameter table, see :py:class:`FleetPowerCurves`.
+    """
+    asset_id = task["asset_id"]
+    windspeed, power = task["windspeed"], task["power"]
+    n = float(power.size)
+    rows = []
+    if "L5P" in task["methods"]:
+        params, rmse = _fit_l5p(
+            windspeed,
+            power,
+            task["bounds"],
+            task["seed"],
+            task["previous"],
+            task["previous_rmse"],
+            task["warm_start_tolerance"],
+        )
+        values = [*params, rmse, n]
+        names = [*L5P_PARAMETERS, "rmse", "n_samples"]
+        rows.extend((asset_id, "L5P", k, v) for k, v in zip(names, values))
+
+    if "GAM" in task["methods"]:
+        design = GAMDesign(windspeed, n_splines=task["n_splines"])
+        coef = design.fit(power)
+        rmse = _rmse(design.predict(coef), power)
+        values = [task["n_splines"], *design.edge_knots[0], *coef, rmse, n]
+        names = [
+            "n_splines",
+            "edge_min",
+            "edge_max",
+            *(f"coef_{i}" for i in range(coef.size)),
+            "rmse",
+            "n_samples",
+        ]
+        rows.extend((asset_id, "GAM", k, v) for k, v in zip(names, values))
+    return rows
+
+
+def _reset_tables(
+    instance: FleetPowerCurves, attribute: attrs.Attribute, value: pd.DataFrame
+) -> pd.DataFrame:
+    """Clears the pivoted parameter tables of a :py:class:`FleetPowerCurves` when its parameters
+    are replaced, and returns the unchanged :py:attr:`value`.
+    """
+    instance._tables.clear()
+    return value
+
+
+@define(auto_attribs=True)
+class FleetPowerCurves:
+    """The fitted power curves of each turbine of a fleet, as created by
+    :py:func:`fit_fleet_power_curves`.
+
+    The fitted parameters are stored in a long table with the columns "asset_id", "method",
+    "parameter", and "value", where each method stores the root mean square error, "rmse", and
+    number of samples, "n_samples", of its fit along with its parameters:
+
+    - "IEC": "bin_width", "windspeed_start", "windspeed_end", "interpolate", and the power of each
+      bin, "P_0", "P_1", ...
+    - "L5P": the parameters of :py:func:`openoa.utils.power_curve.parametric_forms.logistic5param`,
+      "a", "b", "c", "d", and "g".
+    - "GAM": "n_splines", the edge knots, "edge_min" and "edge_max", and the spline coefficients,
+      "coef_0", "coef_1", ...
+
+    Args:
+        parameters(:obj:`pandas.DataFrame`): The table of fitted parameters.
+    """
+
+    parameters: pd.DataFrame = field(on_setattr=[attrs.setters.validate, _reset_tables])
+    _tables: dict[str, pd.DataFrame] = field(init=False, factory=dict, repr=False, eq=False)
+
+    @parameters.validator
+    def _check_columns(self, attribute, value):
+        if missing := set(TABLE_COLUMNS).difference(value.columns):
+            raise ValueError(f"The power curve parameters are missing the columns: {missing}")
+
+    @property
+    def asset_ids(self) -> np.ndarray:
+        """The asset IDs with fitted power curves."""
+        return self.parameters.asset_id.unique()
+
+    def values(self, method: str, parameter: str) -> pd.Series:
+        """Returns a parameter of every turbine's fit of a power curve method, e.g., the "rmse"."""
+        df = self.parameters
+        df = df.loc[(df.method == method) & (df.parameter == parameter)]
+        return df.set_index("asset_id")["value"].rename(parameter)
+
+    def _method_table(self, method: str) -> pd.DataFrame:
+        """Returns the parameters of every turbine's fit of a power curve method as an
+        (asset x parameter) table, with the assets and parameters in their stored order. The table
+        of each method is pivoted from :py:attr:`parameters` once, and reused until the parameters
+        are replaced.
+        """
+        if method not in self._tables:
+            df = self.parameters.loc[self.parameters.method == method]
+            table = df.pivot(index="asset_id", columns="parameter", values="value")
+            self._tables[method] = table.reindex(
+                index=df.asset_id.unique(), columns=df.parameter.unique()
+            )
+        return self._tables[method]
+
+    def _method_parameters(self, asset_id, method: str) -> pd.Series:
+        table = self._method_table(method)
+        if asset_id not in table.index:
+            raise KeyError(f"There is no {method} power curve for asset: {asset_id}")
+        return table.loc[asset_id]
+
+    def iec(self, asset_ids: list | None = None) -> IECPowerCurve:
+        """Creates the IEC power curves of the turbines, which are evaluated all at once.
+
+        Args:
+            asset_ids(:obj:`list`, optional): The turbines to include. Defaults to all turbines.
+
+        Returns:
+            :obj:`IECPowerCurve`: The IEC power curves.
+        """
+        table = self._method_table("IEC")
+        asset_ids = table.index if asset_ids is None else pd.Index(asset_ids)
+        if (missing := asset_ids.difference(table.index)).size > 0:
+            raise KeyError(f"There is no IEC power curve for assets: {missing.tolist()}")
+        table = table.loc[asset_ids]
+        params = table.iloc[0]
+        bins = _iec_bins(*params[["bin_width", "windspeed_start", "windspeed_end"]])
+        power = table.loc[:, table.columns.str.startswith("P_")].to_numpy()
+        return IECPowerCurve(
+            bins,
+            power,
+            params["windspeed_start"],
+            params["windspeed_end"],
+            params["interpolate"],
+            asset_ids=asset_ids.to_numpy(),
+        )
+
+    def curve(self, asset_id, method: str):
+        """Creates the power curve of a turbine's fit of a power curve method.
+
+        Args:
+            asset_id: The turbine's asset ID.
+            method(:obj:`str`): One of "IEC", "L5P", or "GAM".
+
+        Returns:
+            :obj:`Callable`: Python function of type (Array[float] -> Array[float]) implementing the
+                power curve.
+        """
+        if method == "IEC":
+            curves = self.iec([asset_id])
+            return IECPowerCurve(
+                curves.bins,
+                curves.power[0],
+                curves.windspeed_start,
+                curves.windspeed_end,
+                curves.interpolate,
+            )
+
+        params = self._method_parameters(asset_id, method)
+        if method == "L5P":
+            values = params[list(L5P_PARAMETERS)].to_numpy()
+            return lambda x: logistic5param(x, *values)
+        if method == "GAM":
+            edge_knots = params[["edge_min", "edge_max"]].to_numpy()
+            coef = params[params.index.str.startswith("coef_")].dropna().to_numpy()
+            design = GAMDesign(edge_knots, edge_knots=edge_knots, n_splines=params["n_splines"])
+            return lambda x: design.predict(coef, x)
+        raise ValueError(f"`method` must be one of {POWER_CURVE_METHODS}")
+
+    def save(self, path: str | Path) -> None:
+        """Saves the parameter table to a Parquet file if :py:attr:`path` ends in ".parquet", which
+        requires ``pyarrow``, and otherwise to a CSV file.
+        """
+        path = Path(path)
+        if path.suffix == ".parquet":
+            self.parameters.to_parquet(path, index=False)
+        else:
+            self.parameters.to_csv(path, index=False)
+
+    @classmethod
+    def load(cls, path: str | Path) -> FleetPowerCurves:
+        """Loads a parameter table saved with :py:meth:`save`."""
+        path = Path(path)
+        if path.suffix == ".parquet":
+            return cls(pd.read_parquet(path))
+        return cls(pd.read_csv(path, dtype={"asset_id": str}))
+
+
+def fit_fleet_power_curves(
+    plant,
+    methods: tuple[str, ...] = POWER_CURVE_METHODS,
+    asset_ids: list | None = None,
+    windspeed_col: str = "WMET_HorWdSpd",
+    power_col: str = "WTUR_W",
+    bin_width: float = 0.5,
+    windspeed_start: float = 0,
+    windspeed_end: float = 30.0,
+    interpolate: bool = False,
+    n_splines: int = 20,
+    previous: FleetPowerCurves | None = None,
+    warm_start_tolerance: float = 0.05,
+    n_workers: int = 1,
+    seed: int | None = None,
+) -> FleetPowerCurves:
+    """Fits the IEC, L5P, and GAM power curves of every turbine in a ``PlantData`` object's SCADA
+    data. The data should already be filtered for the turbines' normal operation.
+
+    Args:
+        plant(:obj:`openoa.plant.PlantData`): The plant data, where the L5P curve's upper asymptote
+            is bounded by each turbine's rated power in ``plant.asset``, when available.
+        methods(:obj:`tuple[str, ...]`): The power curve methods to fit, from "IEC", "L5P", and
+            "GAM". Defaults to all of the methods.
+        asset_ids(:obj:`list`, optional): The turbines to fit. Defaults to all turbines.
+        windspeed_col(:obj:`str`): The wind speed column of ``plant.scada``. Defaults to
+            "WMET_HorWdSpd".
+        power_col(:obj:`str`): The power column of ``plant.scada``. Defaults to "WTUR_W".
+        bin_width(:obj:`float`): The IEC curves' wind speed bin width. Defaults to 0.5 m/s.
+        windspeed_start(:obj:`float`): The IEC curves' cut-in wind speed. Defaults to 0.0.
+        windspeed_end(:obj:`float`): The IEC curves' cut-out wind speed. Defaults to 30.0.
+        interpolate(:obj:`bool`): If True, the IEC curves are linearly interpolated between the
+            bins. Defaults to False.
+        n_splines(:obj:`int`): The number of splines of the GAM curves. Defaults to 20.
+        previous(:obj:`FleetPowerCurves`, optional): The power curves of a previous fit, whose L5P
+            parameters start each turbine's L5P fit. Defaults to None.
+        warm_start_tolerance(:obj:`float`): The relative increase of a turbine's L5P root mean
+            square error from the previous fit that is accepted from the local fit started at the
+            previous parameters, before the global fit is run. Defaults to 0.05.
+        n_workers(:obj:`int`): The number of worker processes that fit the L5P and GAM curves.
+            Defaults to 1, which fits the turbines in the current process.
+        seed(:obj:`int`, optional): The random seed of the L5P fits' differential evolution, where
+            each turbine's random stream is spawned from the seed, so the results don't depend on
+            :py:attr:`n_workers`. Defaults to None.
+
+    Returns:
+        :obj:`FleetPowerCurves`: The fitted parameters of each turbine's power curves.
+    """
+    if invalid := set(methods).difference(POWER_CURVE_METHODS):
+        raise ValueError(f"Invalid power curve methods: {invalid}")
+
+    df = plant.scada[[windspeed_col, power_col]].dropna()
+    if asset_ids is not None:
+        df = df.loc[df.index.get_level_values("asset_id").isin(asset_ids)]
+    windspeed = df[windspeed_col].rename_axis(["time", "asset_id"])
+    power = df[power_col].rename_axis(["time", "asset_id"])
+    codes, assets = pd.factorize(windspeed.index.get_level_values("asset_id"), sort=True)
+    order = np.argsort(codes, kind="stable")
+    splits = np.cumsum(np.bincount(codes, minlength=assets.size))[:-1]
+    windspeed_by_asset = np.split(windspeed.to_numpy(dtype=float)[order], splits)
+    power_by_asset = np.split(power.to_numpy(dtype=float)[order], splits)
+
+    rows = []
+    if "IEC" in methods:
+        curves = IEC_by_asset(
+            windspeed,
+            power,
+            bin_width=bin_width,
+            windspeed_start=windspeed_start,
+            windspeed_end=windspeed_end,
+            interpolate=interpolate,
+        )
+        settings = dict(
+            bin_width=bin_width,
+            windspeed_start=windspeed_start,
+            windspeed_end=windspeed_end,
+            interpolate=float(interpolate),
+        )
+        for i, t in enumerate(curves.asset_ids):
+            modeled = curves(windspeed_by_asset[i], assets=np.full(power_by_asset[i].size, t))
+            values = {
+                **settings,
+                **{f"P_{j}": P for j, P in enumerate(curves.power[i])},
+                "rmse": _rmse(modeled, power_by_asset[i]),
+                "n_samples": float(power_by_asset[i].size),
+            }
+            rows.extend((t, "IEC", k, v) for k, v in values.items())
+
+    if {"L5P", "GAM"}.intersection(methods):
+        rated_power = pd.Series(np.nan, index=assets)
+        if plant.asset is not None and "rated_power" in plant.asset:
+            rated_power = plant.asset["rated_power"].reindex(assets).astype(float)
+        previous_params = previous_rmse = None
+        if previous is not None:
+            previous_params = {p: previous.values("L5P", p).reindex(assets) for p in L5P_PARAMETERS}
+            previous_rmse = previous.values("L5P", "rmse").reindex(assets)
+
+        seeds = np.random.SeedSequence(seed).spawn(assets.size)
+        tasks = [
+            dict(
+                asset_id=t,
+                methods=methods,
+                windspeed=windspeed_by_asset[i],
+                power=power_by_asset[i],
+                bounds=_l5p_bounds(rated_power.iloc[i]),
+                seed=int(seeds[i].generate_state(1)[0]),
+                previous=(
+                    None
+                    if previous_params is None
+                    else np.array([previous_params[p].iloc[i] for p in L5P_PARAMETERS])
+                ),
+                previous_rmse=np.nan if previous_rmse is None else previous_rmse.iloc[i],
+                warm_start_tolerance=warm_start_tolerance,
+                n_splines=n_splines,
+            )
+            for i, t in enumerate(assets)
+        ]
+        if n_workers > 1:
+            with ProcessPoolExecutor(max_workers=n_workers) as executor:
+                results = list(executor.map(_fit_turbine, tasks))
+        else:
+            results = [_fit_turbine(task) for task in tasks]
+        for result in results:
+            rows.extend(result)
+
+    parameters = pd.DataFrame(rows, columns=TABLE_COLUMNS)
+    parameters = parameters.sort_values(["asset_id", "method"], kind="stable")
+    return FleetPowerCurves(parameters.reset_index(drop=True))
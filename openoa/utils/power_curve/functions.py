@@ -9,14 +9,156 @@ from typing import Callable
 
 import numpy as np
 import pandas as pd
-from pygam import LinearGAM
+import numpy.typing as npt
+from attrs import field, define
 from scipy.optimize import differential_evolution
-from scipy.interpolate import interp1d
 
-from openoa.utils._converters import series_method, dataframe_method
+from openoa.utils._converters import series_method, dataframe_method, flatten_by_asset
+from openoa.utils.power_curve.gam import GAMDesign
 from openoa.utils.power_curve.parametric_forms import logistic5param
 from openoa.utils.power_curve.parametric_optimize import least_squares, fit_parametric_power_curve
 
+# The bounds of the parameters of the 5 parameter logistic power curve, for power in kW and wind
+# speed in m/s
+LOGISTIC_5_PARAMETRIC_BOUNDS = ((1200, 1800), (-10, -1e-3), (1e-3, 30), (1e-3, 1), (1e-3, 10))
+
+
+def _iec_bins(bin_width: float, windspeed_start: float, windspeed_end: float) -> np.ndarray:
+    """Sets up evenly spaced bins of fixed width, with any value over the maximum getting np.inf."""
+    n_bins = int(np.ceil((windspeed_end - windspeed_start) / bin_width)) + 1
+    return np.append(np.linspace(windspeed_start, windspeed_end, n_bins), [np.inf])
+
+
+def _iec_bin_power(
+    windspeed: np.ndarray,
+    power: np.ndarray,
+    bins: np.ndarray,
+    codes: np.ndarray,
+    n_curves: int,
+    weights: np.ndarray | None = None,
+) -> np.ndarray:
+    """Computes the mean power of each wind speed bin of each power curve, and linearly interpolates
+    the bins without any data.
+
+    Args:
+        windspeed(:obj:`numpy.ndarray`): The 1-D wind speed data.
+        power(:obj:`numpy.ndarray`): The 1-D power data.
+        bins(:obj:`numpy.ndarray`): The bin edges, see :py:func:`_iec_bins`.
+        codes(:obj:`numpy.ndarray`): The integer code of the power curve of each value.
+        n_curves(:obj:`int`): The number of power curves.
+        weights(:obj:`numpy.ndarray`, optional): The weight of each value in the bin means, such as
+            its number of occurrences in a bootstrap resample. Defaults to None, for equal weights.
+
+    Returns:
+        :obj:`numpy.ndarray`: The (curve x bin) mean power.
+    """
+    n_bins = bins.size - 1
+    ix_bin = np.searchsorted(bins, windspeed, side="right") - 1
+    valid = (ix_bin >= 0) & (ix_bin < n_bins) & ~np.isnan(power)
+    ix = codes[valid] * n_bins + ix_bin[valid]
+    if weights is None:
+        count = np.bincount(ix, minlength=n_curves * n_bins).reshape(n_curves, n_bins)
+        total = np.bincount(ix, weights=power[valid], minlength=n_curves * n_bins)
+    else:
+        w = weights[valid]
+        count = np.bincount(ix, weights=w, minlength=n_curves * n_bins).reshape(n_curves, n_bins)
+        total = np.bincount(ix, weights=power[valid] * w, minlength=n_curves * n_bins)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        P_bin = total.reshape(n_curves, n_bins) / count
+
+    # Linearly interpolate any missing bins, using the nearest bin's power beyond the data
+    position = np.arange(n_bins)
+    for P in P_bin:
+        if (missing := np.isnan(P)).any() and not missing.all():
+            P[missing] = np.interp(position[missing], position[~missing], P[~missing])
+    return P_bin
+
+
+@define(auto_attribs=True)
+class IECPowerCurve:
+    """A binned wind speed power curve, or a set of power curves with the same wind speed bins, as
+    created by :py:func:`IEC` and :py:func:`IEC_by_asset`. The power curve is evaluated by calling
+    it on the wind speed data, and, unlike a closure, can be pickled.
+
+    Args:
+        bins(:obj:`numpy.ndarray`): The edges of the wind speed bins, where the last edge is np.inf.
+        power(:obj:`numpy.ndarray`): The mean power of each wind speed bin, or the (curve x bin)
+            mean power of each bin of multiple power curves.
+        windspeed_start(:obj:`float`): The cut-in wind speed, below which the power is zero.
+        windspeed_end(:obj:`float`): The cut-out wind speed, above which the power is zero.
+        interpolate(:obj:`bool`): If True, the power is linearly interpolated between the bins'
+            wind speeds. Otherwise, the bin-average power is assigned to all wind speeds within a
+            bin. Defaults to False.
+        asset_ids(:obj:`numpy.ndarray`, optional): The asset ID of each of multiple power curves.
+            Defaults to None.
+    """
+
+    bins: np.ndarray = field(converter=np.asarray)
+    power: np.ndarray = field(converter=np.asarray)
+    windspeed_start: float = field(converter=float)
+    windspeed_end: float = field(converter=float)
+    interpolate: bool = field(default=False, converter=bool)
+    asset_ids: np.ndarray | None = field(default=None)
+
+    @property
+    def windspeed(self) -> np.ndarray:
+        """The wind speed that each bin's power is assigned to when interpolating."""
+        return self.bins[:-1] + 0.5 / 2
+
+    def __call__(self, x: npt.ArrayLike, assets: npt.ArrayLike | None = None) -> np.ndarray:
+        """Evaluates the power curve.
+
+        Args:
+            x(:obj:`numpy.typing.ArrayLike`): The wind speed data. For multiple power curves, either
+                the last axis is the asset, in the order of :py:attr:`asset_ids`, or
+                :py:attr:`assets` gives the asset of each value.
+            assets(:obj:`numpy.typing.ArrayLike`, optional): The asset ID of each value of
+                :py:attr:`x`, for multiple power curves. Defaults to None.
+
+        Returns:
+            :obj:`numpy.ndarray`: The power of each wind speed.
+        """
+        x = np.asarray(x, dtype=float)
+        row = None
+        if self.power.ndim == 2 and assets is not None:
+            row = pd.Index(self.asset_ids).get_indexer(np.ravel(assets)).reshape(np.shape(assets))
+            if (row < 0).any():
+                raise ValueError("`assets` contains an asset without a power curve.")
+            row = np.broadcast_to(row, x.shape)
+        elif self.power.ndim == 2:
+            if x.shape[-1:] != self.power.shape[:1]:
+                raise ValueError("The last axis of `x` must have the wind speed of each asset.")
+            row = np.broadcast_to(np.arange(self.power.shape[0]), x.shape)
+
+        if self.interpolate:
+            P = np.asarray(self._interpolate(x, row))
+        else:
+            ix_bin = np.searchsorted(self.bins, x, side="right") - 1
+            in_bin = (ix_bin >= 0) & (ix_bin < self.bins.size - 1)
+            ix_bin = np.where(in_bin, ix_bin, 0)
+            P = np.where(
+                in_bin, self.power[ix_bin] if row is None else self.power[row, ix_bin], 0.0
+            )
+        P[(x < self.windspeed_start) | (x > self.windspeed_end)] = 0.0
+        return P
+
+    def _interpolate(self, x: np.ndarray, row: np.ndarray | None) -> np.ndarray:
+        """Linearly interpolates the power between the bins' wind speeds, using the first and last
+        bins' power beyond the bins.
+        """
+        ws = self.windspeed
+        power = self.power
+        if row is None:
+            return np.interp(x, ws, power, left=power[0], right=power[-1])
+
+        ix = np.clip(np.searchsorted(ws, x, side="left"), 1, ws.size - 1)
+        lo, hi = power[row, ix - 1], power[row, ix]
+        slope = (hi - lo) / (ws[ix] - ws[ix - 1])
+        with np.errstate(invalid="ignore"):
+            P = slope * (x - ws[ix - 1]) + lo
+        P = np.where(x < ws[0], power[row, 0], P)
+        return np.where(x > ws[-1], power[row, -1], P)
+
 
 @series_method(data_cols=["windspeed_col", "power_col"])
 def IEC(
@@ -27,7 +169,8 @@ def IEC(
     windspeed_end: float = 30.0,
     interpolate: bool = False,
     data: pd.DataFrame = None,
-) -> Callable:
+    weights: npt.ArrayLike | None = None,
+) -> IECPowerCurve:
     """
     Use IEC 61400-12-1-2 method for creating a binned wind-speed power curve. Power is set to zero
     for values outside the cutoff range: [:py:attr:`windspeed_start`, :py:attr:`windspeed_end`].
@@ -45,53 +188,63 @@ def IEC(
             wind speeds within a particular bin. Defaults to False.
         data(:obj:`pandas.DataFrame`, optional): a pandas DataFrame containing
             :py:attr:`windspeed_col` and :py:attr:`power_col`. Defaults to None.
+        weights(:obj:`numpy.typing.ArrayLike`, optional): The weight of each sample in the bin
+            averages, such as the number of times it is drawn in a bootstrap resample, so that a
+            resampled power curve is fit without repeating the data. Defaults to None, for equal
+            weights.
 
     Returns:
-        :obj:`Callable`: Python function of type (Array[float] -> Array[float]) implementing the power curve.
+        :obj:`IECPowerCurve`: Callable of type (Array[float] -> Array[float]) implementing the power curve.
 
     """
+    bins = _iec_bins(bin_width, windspeed_start, windspeed_end)
+    windspeed = windspeed_col.to_numpy(dtype=float)
+    if weights is not None:
+        weights = np.asarray(weights, dtype=float)
+    P_bin = _iec_bin_power(
+        windspeed,
+        power_col.to_numpy(dtype=float),
+        bins,
+        np.zeros(windspeed.size, dtype=int),
+        1,
+        weights,
+    )
+    return IECPowerCurve(bins, P_bin[0], windspeed_start, windspeed_end, interpolate)
 
-    # Set up evenly spaced bins of fixed width, with any value over the maximum getting np.inf
-    n_bins = int(np.ceil((windspeed_end - windspeed_start) / bin_width)) + 1
-    bins = np.append(np.linspace(windspeed_start, windspeed_end, n_bins), [np.inf])
-
-    # Initialize an array which will hold the mean values of each bin
-    P_bin = np.ones(len(bins) - 1) * np.nan
-
-    # Compute the mean of each bin and set corresponding P_bin
-    for ibin in range(0, len(bins) - 1):
-        indices = (windspeed_col >= bins[ibin]) & (windspeed_col < bins[ibin + 1])
-        P_bin[ibin] = power_col.loc[indices].mean()
-
-    # Linearly interpolate any missing bins
-    P_bin = pd.Series(data=P_bin).interpolate(method="linear").bfill().values
-
-    # Create a closure over the computed bins which computes the power curve value for arbitrary array-like input
-    def pc_iec_bin(x):
-        P = np.zeros(np.shape(x))
-        for i in range(0, len(bins) - 1):
-            idx = np.where((x >= bins[i]) & (x < bins[i + 1]))
-            P[idx] = P_bin[i]
-        cutoff_idx = (x < windspeed_start) | (x > windspeed_end)
-        P[cutoff_idx] = 0.0
-        return P
 
-    def pc_iec_interp(x):
-        f = interp1d(
-            bins[0:-1] + 0.5 / 2,
-            P_bin,
-            fill_value=(P_bin[0], P_bin[-1]),
-            bounds_error=False,
-        )
-        P = f(x)
-        cutoff_idx = (x < windspeed_start) | (x > windspeed_end)
-        P[cutoff_idx] = 0.0
-        return P
+def IEC_by_asset(
+    windspeed: pd.Series | pd.DataFrame | np.ndarray,
+    power: pd.Series | pd.DataFrame | np.ndarray,
+    bin_width: float = 0.5,
+    windspeed_start: float = 0,
+    windspeed_end: float = 30.0,
+    interpolate: bool = False,
+) -> IECPowerCurve:
+    """Creates the binned wind-speed power curve of each asset at once, in the same way as
+    :py:func:`IEC`.
 
-    if interpolate:
-        return pc_iec_interp
-    else:
-        return pc_iec_bin
+    Args:
+        windspeed(:obj:`pandas.Series` | `pandas.DataFrame` | `numpy.ndarray`): The wind speed data,
+            as either a ``pandas.Series`` with an "asset_id" index level, such as a column of
+            ``PlantData.scada``, or as (time x asset) data.
+        power(:obj:`pandas.Series` | `pandas.DataFrame` | `numpy.ndarray`): The power data, in the
+            same layout as :py:attr:`windspeed`.
+        bin_width(:obj:`float`): Width of windspeed bin. Defaults to 0.5 m/s, per the standard.
+        windspeed_start(:obj:`float`): Left edge of first windspeed bin. Defaults to 0.0.
+        windspeed_end(:obj:`float`): Right edge of last windspeed bin. Defaults to 30.0
+        interpolate(:obj:`bool`): If True, the power curves are linearly interpolated between wind
+            speed bin points. Defaults to False.
+
+    Returns:
+        :obj:`IECPowerCurve`: The power curves, with the asset IDs in sorted order for a
+            ``pandas.Series``, or in the order of the (time x asset) data's columns.
+    """
+    (windspeed, power), codes, assets = flatten_by_asset(windspeed, power)
+    bins = _iec_bins(bin_width, windspeed_start, windspeed_end)
+    P_bin = _iec_bin_power(windspeed, power, bins, codes, assets.size)
+    return IECPowerCurve(
+        bins, P_bin, windspeed_start, windspeed_end, interpolate, asset_ids=assets.to_numpy()
+    )
 
 
 @series_method(data_cols=["windspeed_col", "power_col"])
@@ -140,7 +293,7 @@ def logistic_5_parametric(
         curve=logistic5param,
         optimization_algorithm=differential_evolution,
         cost_function=least_squares,
-        bounds=((1200, 1800), (-10, -1e-3), (1e-3, 30), (1e-3, 1), (1e-3, 10)),
+        bounds=LOGISTIC_5_PARAMETRIC_BOUNDS,
     )
 
 
@@ -152,7 +305,9 @@ def gam(
     data: pd.DataFrame = None,
 ) -> Callable:
     """
-    Use the generalized additive model, :py:class:`pygam.LinearGAM` to fit power to wind speed.
+    Use the generalized additive model, :py:class:`pygam.LinearGAM` to fit power to wind speed. The
+    model is fit with a :py:class:`openoa.utils.power_curve.gam.GAMDesign`, which solves the same
+    penalized least squares problem.
 
     Args:
         windspeed_col(:obj:`str` | `pandas.Series`): Windspeed data, or the name of the column in
@@ -168,7 +323,9 @@ def gam(
 
     """
     # Fit the model
-    return LinearGAM(n_splines=n_splines).fit(windspeed_col.values, power_col.values).predict
+    design = GAMDesign(windspeed_col.values, n_splines=n_splines)
+    coef = design.fit(power_col.values)
+    return lambda windspeed: design.predict(coef, windspeed)
 
 
 @dataframe_method(data_cols=["windspeed_col", "wind_direction_col", "air_density_col", "power_col"])
@@ -182,6 +339,8 @@ def gam_3param(
 ) -> Callable:
     """
     Use a generalized additive model to fit power to wind speed, wind direction and air density.
+    The model is fit with a :py:class:`openoa.utils.power_curve.gam.GAMDesign`, which solves the
+    same penalized least squares problem as :py:class:`pygam.LinearGAM`.
 
     Args:
         windspeed_col(:obj:`str` | `pandas.Series`): Windspeed data, or the name of the column in
@@ -205,7 +364,8 @@ def gam_3param(
     y = data[power_col]
 
     # Fit the model
-    model = LinearGAM(n_splines=n_splines).fit(X, y)
+    design = GAMDesign(X.values, n_splines=n_splines)
+    coef = design.fit(y.values)
 
     # Wrap the prediction function in a closure to pack input variables
     @dataframe_method(data_cols=["windspeed_col", "wind_direction_col", "air_density_col"])
@@ -216,6 +376,6 @@ def gam_3param(
         data: pd.DataFrame = None,
     ):
         X = data[[windspeed_col, wind_direction_col, air_density_col]]
-        return model.predict(X)
+        return design.predict(coef, X.values)
 
     return predict
@@ -0,0 +1,149 @@
+"""
+This module provides the penalized least squares fit behind the generalized additive model (GAM)
+power curves. The spline basis and penalty matrices of a :py:class:`pygam.LinearGAM` are built
+once for a set of input data, and the model is then fit to any target data, or subset of the
+input data, with a single linear solve.
+
+A :py:class:`pygam.LinearGAM` has an identity link and normally distributed errors, so its
+penalized iteratively reweighted least squares fit has converged after the first iteration, which
+solves the penalized least squares problem with the QR decomposition of the basis and the singular
+value decomposition of the decomposition's R matrix stacked on the penalty's Cholesky factor.
+Repeating that solve directly returns the same coefficients, without the iterations or the model
+statistics that pygam computes after each fit, and the coefficients are linear in the target data,
+so a scaled target scales the coefficients.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+import scipy as sp
+import numpy.typing as npt
+from attrs import field, define
+from pygam.terms import TermList, Intercept, SplineTerm
+
+# The ridge that pygam adds to the penalty to improve the conditioning of the fit
+_EPS = np.finfo(np.float64).eps
+
+
+def _as_features(X: npt.ArrayLike, n_features: int | None = None) -> np.ndarray:
+    """Converts :py:attr:`X` to a 2-dimensional (sample x feature) array."""
+    X = np.asarray(X, dtype=float)
+    if X.ndim == 1:
+        X = X.reshape(-1, 1 if n_features is None else n_features)
+    return X
+
+
+def gam_edge_knots(X: npt.ArrayLike) -> np.ndarray:
+    """Computes the edge knots of each feature's splines, which are the minimum and maximum of the
+    data, as in :py:meth:`pygam.LinearGAM.fit`.
+
+    Args:
+        X(:obj:`numpy.typing.ArrayLike`): The (sample x feature) input data.
+
+    Returns:
+        :obj:`numpy.ndarray`: The (feature x 2) array of the minimum and maximum of each feature.
+    """
+    X = _as_features(X)
+    return np.column_stack([X.min(axis=0), X.max(axis=0)])
+
+
+@define(auto_attribs=True)
+class GAMDesign:
+    """The spline basis and penalty matrices of a :py:class:`pygam.LinearGAM` with a spline term
+    for each feature and an intercept, for a fixed set of input data.
+
+    The basis is built once, so that the model can be fit to the target data of any subset of the
+    input data's samples with :py:meth:`fit`, and evaluated with :py:meth:`predict`. The fits are
+    the same as those of ``pygam.LinearGAM(n_splines=n_splines, lam=lam).fit(X[rows], y)`` when
+    :py:attr:`edge_knots` are the minimum and maximum of ``X[rows]``, see
+    :py:func:`gam_edge_knots`.
+
+    Args:
+        X(:obj:`numpy.typing.ArrayLike`): The (sample x feature) input data.
+        edge_knots(:obj:`numpy.typing.ArrayLike`, optional): The (feature x 2) edge knots of each
+            feature's splines. Defaults to the minimum and maximum of :py:attr:`X`.
+        n_splines(:obj:`int`): The number of splines of each feature. Defaults to 20.
+        lam(:obj:`float`): The smoothing penalty of each feature's splines. Defaults to 0.6.
+    """
+
+    X: np.ndarray = field(converter=_as_features)
+    edge_knots: np.ndarray | None = field(default=None)
+    n_splines: int = field(default=20, converter=int)
+    lam: float = field(default=0.6, converter=float)
+    terms: TermList = field(init=False)
+    basis: np.ndarray = field(init=False)
+    penalty: np.ndarray = field(init=False)
+    _penalty_root: np.ndarray = field(init=False)
+
+    def __attrs_post_init__(self):
+        if self.edge_knots is None:
+            self.edge_knots = gam_edge_knots(self.X)
+        self.edge_knots = np.asarray(self.edge_knots, dtype=float).reshape(-1, 2)
+        if self.edge_knots.shape[0] != self.X.shape[1]:
+            raise ValueError(
+                "`edge_knots` must have a minimum and maximum for each feature of `X`."
+            )
+
+        self.terms = TermList(
+            *[
+                SplineTerm(i, n_splines=self.n_splines, lam=self.lam, edge_knots=knots)
+                for i, knots in enumerate(self.edge_knots)
+            ],
+            Intercept(),
+        )
+        self.terms.compile(self.X)
+        self.basis = self.terms.build_columns(self.X).toarray()
+        self.penalty = self.terms.build_penalties().toarray() + np.sqrt(_EPS) * np.eye(
+            self.terms.n_coefs
+        )
+        self._penalty_root = sp.linalg.cholesky(self.penalty, lower=False)
+
+    def fit(self, y: npt.ArrayLike, rows: npt.ArrayLike | None = None) -> np.ndarray:
+        """Fits the model to the target data, using the input data of :py:attr:`rows`.
+
+        Args:
+            y(:obj:`numpy.typing.ArrayLike`): The target data of each sample in :py:attr:`rows`, or
+                a (sample x target) array to fit multiple targets to the same input data at once.
+            rows(:obj:`numpy.typing.ArrayLike`, optional): The integer index or boolean mask of the
+                samples of :py:attr:`X` to be fit. Defaults to all of the samples.
+
+        Raises:
+            ValueError: Raised if the input or target data contain any NaN or infinite values.
+
+        Returns:
+            :obj:`numpy.ndarray`: The coefficients of each spline, with a column for each target if
+                :py:attr:`y` is 2-dimensional.
+        """
+        X = self.X if rows is None else self.X[rows]
+        B = self.basis if rows is None else self.basis[rows]
+        y = np.asarray(y, dtype=float)
+        if y.shape[0] != B.shape[0]:
+            raise ValueError("`y` must have a value for each of the samples being fit.")
+        if not (np.isfinite(X).all() and np.isfinite(y).all()):
+            raise ValueError(
+                "The input and target data must not contain any NaN or infinite values."
+            )
+
+        # Solve the penalized least squares problem as in pygam, where only the largest singular
+        # values are kept when there are fewer samples than coefficients
+        Q, R = np.linalg.qr(B)
+        U, d, Vt = np.linalg.svd(np.vstack([R, self._penalty_root]), full_matrices=False)
+        rank = min(B.shape)
+        return (Vt[:rank].T / d[:rank]) @ U[:rank, :rank].T @ (Q.T @ y)
+
+    def predict(self, coef: npt.ArrayLike, X: npt.ArrayLike | None = None) -> np.ndarray:
+        """Evaluates the fitted model.
+
+        Args:
+            coef(:obj:`numpy.typing.ArrayLike`): The coefficients from :py:meth:`fit`.
+            X(:obj:`numpy.typing.ArrayLike`, optional): The (sample x feature) data to evaluate the
+                model at. Defaults to the input data, :py:attr:`X`, whose basis is already built.
+
+        Returns:
+            :obj:`numpy.ndarray`: The modeled target data of each sample, with a column for each
+                target if :py:attr:`coef` is 2-dimensional.
+        """
+        if X is None:
+            return self.basis @ coef
+        X = _as_features(X, self.X.shape[1])
+        return self.terms.build_columns(X) @ np.asarray(coef)
@@ -0,0 +1,45 @@
+import unittest
+from unittest import mock
+
+from openoa.analysis._progress import MonteCarloProgress
+
+from api import tasks  # isort: skip
+from test.conftest import project_ENGIE, example_data_path_str  # isort: skip
+
+
+class TestAnalysisTasks(unittest.TestCase):
+    def setUp(self):
+        self.project = project_ENGIE.prepare(example_data_path_str, use_cleansed=False)
+
+    def test_convergence_options(self):
+        # The tolerance is checked after a tenth of the simulations, and at most every 500
+        options = tasks.convergence_options({"num_sim": 100, "tolerance": 0.01})
+        assert options == {"tolerance": 0.01, "convergence_batch_size": 10}
+        assert tasks.convergence_options({"num_sim": 20000})["convergence_batch_size"] == 500
+        assert tasks.convergence_options({"num_sim": 5})["convergence_batch_size"] == 1
+
+        params = {"num_sim": 100, "tolerance": 0.01, "convergence_batch_size": 25}
+        assert tasks.convergence_options(params)["convergence_batch_size"] == 25
+
+    def test_tie_tolerance(self):
+        # A loose tolerance stops the API's default number of simulations early
+        updates = []
+
+        def progress_callback(progress: MonteCarloProgress) -> None:
+            updates.append(progress.completed)
+
+        params = {"dataset_id": "engie", "num_sim": 100, "tolerance": 0.02, "seed": 42}
+        with mock.patch.object(tasks, "result_cache", None):
+            result = tasks.run_tie(self.project, params, progress_callback)
+
+        precision = result["precision"]
+        num_sim = precision["num_sim"]
+        assert num_sim < 100
+        assert num_sim % 10 == 0
+        assert precision["converged"]
+        assert precision["mean_relative_std_error"] <= 0.02
+        assert updates[-1] == num_sim
+
+
+if __name__ == "__main__":
+    unittest.main()
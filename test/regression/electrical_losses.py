@@ -1,8 +1,14 @@
+import os
+import tempfile
 import unittest
+from unittest import mock
 
 import numpy as np
+import pandas as pd
+import pytest
 import numpy.testing as npt
 
+from openoa.utils.cache import ResultCache
 from openoa.analysis.electrical_losses import ElectricalLosses
 
 from test.conftest import project_ENGIE, example_data_path_str  # isort: skip
@@ -64,6 +70,98 @@ class TestElectricalLossesUQ(unittest.TestCase):
             expected_losses_uq_std, actual_compiled_data_uq_std, decimal=3
         )
 
+    def test_electrical_losses_seed(self):
+        # Check that a seeded run is reproducible, regardless of the global random state
+        np.random.seed(0)
+        self.analysis_uq.run(num_sim=500, seed=2024)
+        losses = self.analysis_uq.electrical_losses.copy()
+        inputs = self.analysis_uq.inputs.copy()
+
+        np.random.seed(1)
+        self.analysis_uq.run(num_sim=500, seed=2024)
+        npt.assert_array_equal(losses, self.analysis_uq.electrical_losses)
+        pd.testing.assert_frame_equal(inputs, self.analysis_uq.inputs)
+        assert self.analysis_uq.seed is None
+
+        self.analysis_uq.run(num_sim=500, seed=2025)
+        assert not np.array_equal(losses, self.analysis_uq.electrical_losses)
+
+    def test_electrical_losses_progress_callback(self):
+        # Check that the progress and running statistics are reported after each simulation, and
+        # that raising from the callback stops the run
+        progress = []
+        summaries = []
+
+        def callback(p):
+            progress.append((p.completed, p.total))
+            summaries.append(p.summary())
+
+        self.analysis_uq.run(num_sim=50, progress_callback=callback)
+        assert progress == [(n, 50) for n in range(1, 51)]
+        losses = self.analysis_uq.electrical_losses
+        npt.assert_almost_equal(summaries[-1]["mean"], losses.mean())
+        npt.assert_almost_equal(summaries[-1]["std"], losses.std(ddof=1))
+        npt.assert_almost_equal(summaries[-1]["p50"], np.percentile(losses, 50))
+        npt.assert_almost_equal(summaries[-1]["p90"], np.percentile(losses, 10))
+        assert summaries[0]["p50_change"] is None
+        assert summaries[-1]["p50_change"] >= 0
+
+        def cancel(p):
+            if p.completed == 10:
+                raise KeyboardInterrupt
+
+        with self.assertRaises(KeyboardInterrupt):
+            self.analysis_uq.run(num_sim=50, progress_callback=cancel)
+
+        # The deprecated callback form is still called with the completed and total simulations
+        legacy = []
+        with pytest.deprecated_call():
+            self.analysis_uq.run(
+                num_sim=5,
+                progress_callback=lambda completed, total: legacy.append((completed, total)),
+            )
+        assert legacy == [(n, 5) for n in range(1, 6)]
+
+    def test_electrical_losses_cache(self):
+        # Check that a repeated seeded run is loaded from the cache instead of being recomputed
+        with tempfile.TemporaryDirectory() as cache_dir:
+            self.analysis_uq.cache = ResultCache(cache_dir)
+            self.analysis_uq.run(num_sim=500, seed=2024)
+            losses = self.analysis_uq.electrical_losses.copy()
+            assert len(os.listdir(cache_dir)) == 1
+
+            with mock.patch.object(ElectricalLosses, "calculate_electrical_losses") as calculate:
+                self.analysis_uq.run(num_sim=500, seed=2024)
+                calculate.assert_not_called()
+            npt.assert_array_equal(losses, self.analysis_uq.electrical_losses)
+
+            # Unseeded runs, and runs with different parameters, are not loaded from the cache
+            self.analysis_uq.run(num_sim=500)
+            assert not np.array_equal(losses, self.analysis_uq.electrical_losses)
+            self.analysis_uq.run(num_sim=400, seed=2024)
+            assert self.analysis_uq.electrical_losses.shape == (400, 1)
+            assert len(os.listdir(cache_dir)) == 2
+
+    def test_electrical_losses_monthly_meter(self):
+        # Check the simulations computed at once against each simulation's sum of the months that
+        # meet its correction threshold, with monthly meter data
+        project = project_ENGIE.prepare(example_data_path_str, use_cleansed=False)
+        project.meter = project.meter.resample("MS").sum()
+        analysis = ElectricalLosses(
+            project, UQ=True, num_sim=2000, uncertainty_correction_threshold=(0.5, 0.995), seed=5
+        )
+        analysis.monthly_meter = True
+        analysis.run()
+
+        combined, percent = analysis._concurrent_energy()
+        expected = []
+        for _, run in analysis.inputs.iterrows():
+            total = combined.loc[percent >= run.correction_threshold].sum()
+            turbine = total["WTUR_SupWh"] * run.scada_data_fraction
+            expected.append(1 - total["MMTR_SupWh"] * run.meter_data_fraction / turbine)
+        npt.assert_allclose(analysis.electrical_losses[:, 0], expected, rtol=1e-12)
+        assert np.unique(analysis.electrical_losses.round(8)).size > 1
+
     def tearDown(self):
         pass
 
@@ -1,6 +1,8 @@
 import copy
 import random
+import tempfile
 import unittest
+from unittest import mock
 
 import numpy as np
 import pandas as pd
@@ -8,6 +10,7 @@ import pytest
 from numpy import testing as nptest
 
 from openoa.analysis import MonteCarloAEP
+from openoa.analysis._convergence import ConvergenceCriterion
 
 from test.conftest import project_ENGIE, example_data_path_str  # isort: skip
 
@@ -292,6 +295,235 @@ class TestLongTermMonteCarloAEP(unittest.TestCase):
         sim_results = self.analysis.results
         self.check_simulation_results_lin_monthly(sim_results)
 
+    def test_monthly_lin_outlier_filters(self):
+        # ____________________________________________________________________
+        # Test the precomputed outlier filters match filtering each combination as it comes up
+        self.analysis = MonteCarloAEP(
+            self.project,
+            reanalysis_products=["merra2", "era5"],
+            time_resolution="MS",
+            reg_model="lin",
+            reg_temperature=False,
+            reg_wind_direction=False,
+            outlier_detection=True,
+            seed=2024,
+        )
+        self.analysis.run(num_sim=50, progress_bar=False)
+
+        combinations = self.analysis.mc_inputs.drop_duplicates(
+            ["reanalysis_product", "loss_threshold"]
+        )
+        masks = self.analysis.outlier_filtering
+        assert len(masks) == combinations.shape[0]
+        assert len({id(mask) for mask in masks.values()}) < len(masks)
+        for mask in masks.values():
+            assert mask.dtype == bool
+            assert mask.shape == (self.analysis.aggregate.shape[0],)
+
+        precomputed = {}
+        for n in combinations.index:
+            self.analysis._run = self.analysis.mc_inputs.loc[n]
+            precomputed[n] = self.analysis.filter_outliers(n)
+        self.analysis.outlier_filtering = {}
+        for n in combinations.index:
+            self.analysis._run = self.analysis.mc_inputs.loc[n]
+            pd.testing.assert_frame_equal(precomputed[n], self.analysis.filter_outliers(n))
+
+    def test_monthly_lin_vectorized(self):
+        reset_prng()
+        # ____________________________________________________________________
+        # Test the vectorized linear regression model, at monthly time resolution
+        self.analysis = MonteCarloAEP(
+            self.project,
+            reanalysis_products=["merra2", "era5"],
+            time_resolution="MS",
+            reg_model="lin",
+            reg_temperature=False,
+            reg_wind_direction=False,
+        )
+        # Run Monte Carlo AEP analysis, confirm the results are consistent with the iterative run
+        self.analysis.run(num_sim=10, vectorized=True)
+        sim_results = self.analysis.results
+        self.check_simulation_results_lin_monthly(sim_results)
+
+    def test_daily_lin_vectorized(self):
+        # ____________________________________________________________________
+        # Test the vectorized and iterative linear regression models produce the same results at
+        # daily time resolution with all of the regression inputs
+        self.analysis = MonteCarloAEP(
+            self.project,
+            reanalysis_products=["merra2", "era5"],
+            time_resolution="D",
+            reg_model="lin",
+            reg_temperature=True,
+            reg_wind_direction=True,
+        )
+
+        reset_prng()
+        self.analysis.run(num_sim=20)
+        expected = self.analysis.results
+
+        reset_prng()
+        self.analysis.run(num_sim=20, vectorized=True)
+        pd.testing.assert_frame_equal(expected, self.analysis.results, rtol=1e-9)
+
+        with pytest.raises(ValueError):
+            self.analysis.run(num_sim=20, reg_model="gam", vectorized=True)
+
+    def test_monthly_lin_seed(self):
+        # ____________________________________________________________________
+        # Test a seeded analysis is reproducible and independent of the global random state
+        self.analysis = MonteCarloAEP(
+            self.project,
+            reanalysis_products=["merra2", "era5"],
+            time_resolution="MS",
+            reg_model="lin",
+            reg_temperature=False,
+            reg_wind_direction=False,
+            seed=2024,
+        )
+
+        reset_prng()
+        self.analysis.run(num_sim=20, progress_bar=False)
+        expected = self.analysis.results
+
+        np.random.seed(0)
+        random.seed(0)
+        self.analysis.run(num_sim=20, progress_bar=False)
+        pd.testing.assert_frame_equal(expected, self.analysis.results)
+
+        self.analysis.run(num_sim=20, progress_bar=False, vectorized=True)
+        pd.testing.assert_frame_equal(expected, self.analysis.results, rtol=1e-9)
+
+        # A different seed at run time is only used for that run
+        self.analysis.run(num_sim=20, progress_bar=False, seed=2025)
+        assert not expected.equals(self.analysis.results)
+        assert self.analysis.seed == 2024
+
+    def test_monthly_lin_parallel(self):
+        # ____________________________________________________________________
+        # Test the parallel simulations are reproducible, and independent of the vectorization
+        self.analysis = MonteCarloAEP(
+            self.project,
+            reanalysis_products=["merra2", "era5"],
+            time_resolution="MS",
+            reg_model="lin",
+            reg_temperature=False,
+            reg_wind_direction=False,
+        )
+
+        reset_prng()
+        self.analysis.run(num_sim=20, n_workers=2, progress_bar=False)
+        expected = self.analysis.results
+        assert expected.shape[0] == 20
+        assert self.analysis.mc_inputs.shape[0] == 20
+        assert self.analysis._mc_slope.shape[0] == 20
+
+        reset_prng()
+        self.analysis.run(num_sim=20, n_workers=2, progress_bar=False, vectorized=True)
+        pd.testing.assert_frame_equal(expected, self.analysis.results, rtol=1e-9)
+
+    def test_monthly_lin_adaptive(self):
+        # ____________________________________________________________________
+        # Test an adaptive analysis stops once the mean and P90 AEP have converged
+        self.analysis = MonteCarloAEP(
+            self.project,
+            reanalysis_products=["merra2", "era5"],
+            time_resolution="MS",
+            reg_model="lin",
+            reg_temperature=False,
+            reg_wind_direction=False,
+            seed=2024,
+        )
+
+        kwargs = dict(num_sim=2000, tolerance=0.01, convergence_batch_size=50, progress_bar=False)
+        self.analysis.run(**kwargs)
+        num_sim = self.analysis.num_sim
+        expected = self.analysis.results
+        assert num_sim < 2000
+        assert num_sim % 50 == 0
+        assert expected.shape[0] == num_sim
+        assert self.analysis.mc_inputs.shape[0] == num_sim
+        assert self.analysis._mc_slope.shape[0] == num_sim
+
+        precision = self.analysis.precision
+        assert precision["num_sim"] == num_sim
+        assert precision["tolerance"] == 0.01
+        nptest.assert_almost_equal(precision["mean"], expected.aep_GWh.mean())
+        assert precision["mean_relative_std_error"] <= 0.01
+
+        # The vectorized simulations are checked after the same number of simulations
+        self.analysis.run(vectorized=True, **kwargs)
+        pd.testing.assert_frame_equal(expected, self.analysis.results, rtol=1e-9)
+
+    def test_monthly_lin_parallel_adaptive_iav(self):
+        # ____________________________________________________________________
+        # Test the convergence checks of a parallel analysis apply the IAV, which the workers don't
+        self.analysis = MonteCarloAEP(
+            self.project,
+            reanalysis_products=["merra2"],
+            time_resolution="MS",
+            reg_model="lin",
+            reg_temperature=False,
+            reg_wind_direction=False,
+            seed=2024,
+        )
+        self.analysis.num_sim = 100
+        results = pd.DataFrame({"aep_GWh": np.full(50, 12.0), "iav": np.full(50, 0.05)})
+        checked = []
+
+        def run_parallel_monte_carlo(analysis, **kwargs):
+            assert not analysis.apply_iav
+            checked.append(kwargs["convergence_values"]({"results": results}))
+            checked.append(kwargs["convergence_values"]({"results": results}))
+            raise InterruptedError
+
+        with mock.patch("openoa.analysis.aep.run_parallel_monte_carlo", run_parallel_monte_carlo):
+            with pytest.raises(InterruptedError):
+                self.analysis.run_AEP_monte_carlo_parallel(
+                    n_workers=2, progress_bar=False, convergence=ConvergenceCriterion(0.01)
+                )
+        assert self.analysis.apply_iav
+
+        # The checks of a run use the same IAV draws, which spread the AEP by the mean IAV
+        nptest.assert_array_equal(checked[0], checked[1])
+        nptest.assert_allclose(checked[0].std() / 12.0, 0.05, rtol=0.3)
+
+    def test_daily_cache_reg_model(self):
+        # ____________________________________________________________________
+        # Test the cached results of a run only include the regression coefficients of a linear
+        # regression, so a non-linear run after a linear run doesn't cache the earlier coefficients
+        with tempfile.TemporaryDirectory() as cache_dir:
+            self.analysis = MonteCarloAEP(
+                self.project,
+                reanalysis_products=["merra2"],
+                time_resolution="D",
+                reg_model="lin",
+                reg_temperature=False,
+                reg_wind_direction=False,
+                seed=2024,
+                cache=cache_dir,
+            )
+            self.analysis.run(num_sim=5, progress_bar=False)
+            assert self.analysis._mc_slope.shape[0] == 5
+            self.analysis.run(num_sim=5, reg_model="etr", progress_bar=False)
+            expected = self.analysis.results
+
+            cached = MonteCarloAEP(
+                self.project,
+                reanalysis_products=["merra2"],
+                time_resolution="D",
+                reg_model="etr",
+                reg_temperature=False,
+                reg_wind_direction=False,
+                seed=2024,
+                cache=cache_dir,
+            )
+            cached.run(num_sim=5, progress_bar=False)
+            pd.testing.assert_frame_equal(expected, cached.results)
+            assert not hasattr(cached, "_mc_slope")
+            assert not hasattr(cached, "_mc_intercept")
+
     # Test inputs to the regression model, at daily time resolution
     def test_daily_inputs(self):
         reset_prng()
@@ -1,9 +1,11 @@
 import copy
 import tempfile
 import unittest
+import itertools
 from pathlib import Path
 
 import yaml
+import numpy as np
 import pytest
 from numpy.testing import assert_array_equal
 from pandas.testing import assert_frame_equal
@@ -11,6 +13,7 @@ from pandas.testing import assert_frame_equal
 from openoa import PlantData
 from openoa.schema import ANALYSIS_REQUIREMENTS, ReanalysisMetaData
 from openoa.schema.schema import create_schema, create_analysis_schema
+from openoa.utils.met_data_processing import wrap_180
 
 from test.conftest import project_ENGIE, example_data_path_str  # isort: skip
 
@@ -163,6 +166,109 @@ class TestPlantData(unittest.TestCase):
             "MERRA2 dataframe did not survive CSV save/loading process",
         )
 
+    def test_freestream_turbine_table(self):
+        """
+        Check the freestream turbine tables against the freestream definitions for each wind
+        direction, and that the memoized tables are reset when the asset data changes.
+        """
+        directions = self.plant.turbine_direction_matrix().values
+        distances = self.plant.turbine_distance_matrix().values
+        distances = (
+            distances / self.plant.asset.loc[self.plant.turbine_ids, "rotor_diameter"].values
+        )
+        self_pairs = np.eye(self.plant.n_turbines, dtype=bool)
+
+        wd_bins = np.arange(0.0, 360.0, 10.0)
+        for sector_width in (60.0, 90.0, 137.5):
+            table = self.plant.freestream_turbine_table(
+                sector_width=sector_width, wd_bin_width=10.0
+            )
+            assert_array_equal(table.index, wd_bins)
+            for wd, freestream in table.iterrows():
+                offsets = np.abs(wrap_180(wd - np.where(self_pairs, 0.0, directions)))
+                expected = np.all((offsets > 0.5 * sector_width) | self_pairs, axis=1)
+                assert_array_equal(freestream.values, expected)
+                assert self.plant.get_freestream_turbines(wd, sector_width=sector_width) == list(
+                    self.plant.turbine_ids[expected]
+                )
+
+        table = self.plant.freestream_turbine_table("IEC", wd_bin_width=10.0)
+        for wd, freestream in table.iterrows():
+            offsets = np.abs(wrap_180(wd - np.where(self_pairs, 0.0, directions)))
+            threshold = 0.5 * (1.3 * np.degrees(np.arctan(2.5 / distances + 0.15)) + 10)
+            expected = np.all(
+                ((distances > 2) & (offsets > threshold)) | (distances > 20) | self_pairs, axis=1
+            )
+            assert_array_equal(freestream.values, expected)
+
+        # The flags of many wind directions match the table rows
+        flags = self.plant.freestream_turbine_flags(wd_bins, sector_width=90.0)
+        assert_frame_equal(flags, self.plant.freestream_turbine_table(wd_bin_width=10.0))
+
+        # The geometry is reused for each sector width, and reset with the asset data
+        assert list(self.plant._freestream_tables) == [("sector", 10.0), ("IEC", 10.0)]
+        self.plant.asset = self.plant.asset.copy()
+        assert self.plant._freestream_tables == {}
+        self.plant.freestream_turbine_table()
+        self.plant.calculate_asset_direction_matrix()
+        assert self.plant._freestream_tables == {}
+
+    def test_asset_geometry(self):
+        """
+        Check the asset distance and direction matrices against the pairwise asset geometries, and
+        the KD-tree neighbor queries against the distance matrix.
+        """
+        ids = self.plant.asset.index.values
+        geometry = self.plant.asset["geometry"]
+        distance = self.plant.asset_distance_matrix
+        direction = self.plant.asset_direction_matrix
+        assert_array_equal(distance.index, ids)
+        assert_array_equal(direction.columns, ids)
+        for i, j in itertools.permutations(ids, 2):
+            assert distance.loc[i, j] == geometry[i].distance(geometry[j])
+            if i < j:
+                dx, dy = geometry[j].x - geometry[i].x, geometry[j].y - geometry[i].y
+                expected = np.degrees(np.arctan2(dx, dy)) % 360.0
+                assert direction.loc[i, j] == expected
+                assert direction.loc[j, i] == (expected - 180.0) % 360.0
+        assert np.all(np.isinf(np.diag(distance))) and np.all(np.isinf(np.diag(direction)))
+
+        # The nearest neighbors are the same from the distance matrix and the KD-tree
+        self.plant.calculate_nearest_neighbor()
+        expected = self.plant.asset["nearest_turbine_id"].copy()
+        self.plant.calculate_nearest_neighbor(use_kdtree=True)
+        assert_array_equal(self.plant.asset["nearest_turbine_id"], expected)
+        for turbine_id, nearest in expected.items():
+            assert nearest == distance.loc[turbine_id].idxmin()
+
+        # The memoized KD-tree of the turbines is reused, and a subset of the turbines gets its own
+        tree = self.plant.asset_kdtree("turbine")
+        self.plant.calculate_nearest_neighbor(use_kdtree=True)
+        assert self.plant.asset_kdtree("turbine") is tree
+        self.plant.calculate_nearest_neighbor(turbine_ids=ids[:2])
+        subset = self.plant.asset["nearest_turbine_id"].copy()
+        self.plant.calculate_nearest_neighbor(turbine_ids=ids[:2], use_kdtree=True)
+        assert_array_equal(self.plant.asset["nearest_turbine_id"], subset)
+        assert self.plant.asset_kdtree("turbine") is tree
+
+        # The radius queries are ordered by distance and exclude each turbine
+        rotor_diameter = self.plant.asset["rotor_diameter"]
+        neighbors = self.plant.assets_within_radius(rotor_diameters=5.0)
+        assert list(neighbors) == list(self.plant.turbine_ids)
+        for turbine_id, neighbor_ids in neighbors.items():
+            d = distance.loc[turbine_id, self.plant.turbine_ids]
+            assert set(neighbor_ids) == set(d.index[d <= 5.0 * rotor_diameter[turbine_id]])
+            assert list(d[neighbor_ids]) == sorted(d[neighbor_ids])
+        neighbors = self.plant.assets_within_radius(ids[0], radius=distance.iloc[0].min())
+        assert neighbors == {ids[0]: [expected[ids[0]]]}
+        with pytest.raises(ValueError):
+            self.plant.assets_within_radius(radius=100.0, rotor_diameters=5.0)
+
+        # The KD-trees are reset with the asset geometries
+        assert list(self.plant._asset_trees) == ["turbine"]
+        self.plant.calculate_asset_distance_matrix()
+        assert self.plant._asset_trees == {}
+
 
 class TestPlantDatPartial(unittest.TestCase):
     """
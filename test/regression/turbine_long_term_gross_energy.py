@@ -1,10 +1,13 @@
 import random
 import unittest
+from unittest import mock
 
 import numpy as np
+import pandas as pd
 import numpy.testing as npt
 
 from openoa.analysis import TurbineLongTermGrossEnergy
+from openoa.utils.cache import MemoryCache
 
 from test.conftest import project_ENGIE, example_data_path_str  # isort: skip
 
@@ -73,6 +76,71 @@ class TestLongTermGrossEnergyUQ(unittest.TestCase):
         check_std_uq = 0.28508504
         npt.assert_almost_equal(res_std_uq / 1e6, check_std_uq)
 
+    def test_longterm_gross_energy_stage_caches(self):
+        # Check that the cached preprocessing stages are reused for repeated sampled parameters,
+        # and give the same results as recomputing every stage for every simulation
+        kwargs = dict(
+            num_sim=12,
+            reanalysis_products=["era5", "merra2"],
+            wind_bin_threshold=(1.0, 1.02),
+            max_power_filter=(0.85, 0.86),
+            correction_threshold=(0.9, 0.91),
+            seed=7,
+            progress_bar=False,
+        )
+        analysis = TurbineLongTermGrossEnergy(self.project, UQ=True)
+        analysis.run(**kwargs)
+        plant_gross = analysis.plant_gross.copy()
+
+        inputs = analysis._inputs
+        n_filters = inputs[["wind_bin_thresh", "max_power_filter"]].drop_duplicates().shape[0]
+        n_models = inputs.drop(columns="scada_data_fraction").drop_duplicates().shape[0]
+        assert analysis._daily_scada_cache.misses == n_filters < 12
+        assert analysis._gross_energy_cache.misses <= n_models < 12
+        assert analysis._gross_energy_cache.hits == 12 - analysis._gross_energy_cache.misses
+
+        uncached = TurbineLongTermGrossEnergy(self.project, UQ=True)
+        with mock.patch.object(MemoryCache, "get", lambda cache, key, compute: compute()):
+            uncached.run(**kwargs)
+        npt.assert_allclose(plant_gross, uncached.plant_gross, rtol=1e-10)
+
+        # The GAM inputs and long-term turbine energy are those of the last simulation, even when
+        # its long-term gross energy was cached
+        pd.testing.assert_frame_equal(analysis.turb_lt_gross, uncached.turb_lt_gross, rtol=1e-10)
+        for t, df in uncached.turbine_model_dict.items():
+            pd.testing.assert_frame_equal(analysis.turbine_model_dict[t], df)
+
+        # The caches are cleared by the next run, and are within their sizes
+        misses = analysis._gross_energy_cache.misses
+        analysis.run(**kwargs)
+        assert analysis._gross_energy_cache.misses == misses
+        for cache in (analysis._daily_scada_cache, analysis._imputed_scada_cache):
+            assert 0 < cache.nbytes <= cache.max_bytes
+
+    def test_longterm_gross_energy_adaptive(self):
+        # Check an adaptive run stops once the mean has converged, and only keeps the completed
+        # simulations
+        analysis = TurbineLongTermGrossEnergy(self.project, UQ=True, seed=7)
+        analysis.run(
+            num_sim=100,
+            reanalysis_products=["era5", "merra2"],
+            tolerance=0.02,
+            convergence_batch_size=5,
+            progress_bar=False,
+        )
+        num_sim = analysis.num_sim
+        assert num_sim < 100
+        assert num_sim % 5 == 0
+        assert analysis.plant_gross.shape == (num_sim, 1)
+        assert analysis._inputs.shape[0] == num_sim
+
+        precision = analysis.precision
+        assert precision["num_sim"] == num_sim
+        assert precision["tolerance"] == 0.02
+        assert precision["converged"]
+        npt.assert_almost_equal(precision["mean"], analysis.plant_gross.mean())
+        assert precision["mean_relative_std_error"] <= 0.02
+
     def tearDown(self):
         pass
 
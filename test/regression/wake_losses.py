@@ -137,6 +137,119 @@ class TestWakeLosses(unittest.TestCase):
         )
         self.check_simulation_results_wake_losses_with_heterogeneity_corrections()
 
+    def test_wake_losses_derating_flag_cache(self):
+        reset_prng()
+        # ____________________________________________________________________
+        # Test the derating flags are computed once for each set of derating filter parameters, and
+        # that a repeated run with the cached flags produces the same results.
+        self.analysis = wake_losses.WakeLosses(
+            plant=self.project,
+            wind_direction_asset_ids=["R80711", "R80721", "R80736"],
+            end_date="2015-11-25 00:00",
+            UQ=False,
+        )
+        run_kwargs = dict(
+            no_wakes_ws_thresh_LT_corr=15.0,
+            num_years_LT=20,
+            freestream_sector_width=90.0,
+            wind_bin_mad_thresh=7.0,
+        )
+        self.analysis.run(**run_kwargs)
+        expected_por = self.analysis.turbine_wake_losses_por
+        expected_lt = self.analysis.turbine_wake_losses_lt
+        assert self.analysis._derating_flag_cache.misses == 1
+
+        # Check the unpacked flags match the flags of a new calculation
+        packed_flags = self.analysis._calculate_derating_flags()
+        for col, packed_flag in zip(("derate_flag", "abnormal_ws_flag"), packed_flags):
+            nptest.assert_array_equal(
+                self.analysis._turbine_values(self.analysis.aggregate_df, col, dtype=bool),
+                np.unpackbits(packed_flag)[: self.analysis.aggregate_df.shape[0] * 4]
+                .reshape(-1, 4)
+                .astype(bool),
+            )
+
+        self.analysis.run(**run_kwargs)
+        assert self.analysis._derating_flag_cache.hits == 1
+        nptest.assert_array_equal(expected_por, self.analysis.turbine_wake_losses_por)
+        nptest.assert_array_equal(expected_lt, self.analysis.turbine_wake_losses_lt)
+
+        self.analysis.run(**{**run_kwargs, "wind_bin_mad_thresh": 5.0})
+        assert self.analysis._derating_flag_cache.misses == 2
+
+    def test_wake_losses_reanalysis_frequency_cache(self):
+        reset_prng()
+        # ____________________________________________________________________
+        # Test the long-term frequency tables are computed once for each reanalysis product and
+        # number of years, and that they match the frequencies of the binned reanalysis data.
+        self.analysis = wake_losses.WakeLosses(
+            plant=self.project,
+            wind_direction_asset_ids=["R80711", "R80721", "R80736"],
+            end_date="2015-11-25 00:00",
+            UQ=True,
+        )
+        self.analysis.run(
+            num_sim=10,
+            num_years_LT=(10, 10),
+            no_wakes_ws_thresh_LT_corr=15.0,
+            reanalysis_products=["merra2", "era5"],
+        )
+        cache = self.analysis._reanalysis_frequency_cache
+        assert cache.misses == 2
+        assert cache.hits == 8
+
+        # Check the cached table of the last simulation against the binned reanalysis data
+        freqs, first_wd_bin, first_ws_bin = self.analysis._calculate_reanalysis_frequencies()
+        df = self.analysis.plant.reanalysis[self.analysis._run.reanalysis_product]
+        df = df.loc[
+            (df.index <= self.analysis.end_date_lt)
+            & (df.index > self.analysis.end_date_lt - pd.offsets.DateOffset(years=10))
+        ]
+        wd_bin = 5.0 * np.round(df["WMETR_HorWdDir"] / 5.0)
+        wd_bin = wd_bin.where(wd_bin != 360.0, 0.0)
+        expected = df.groupby([wd_bin, np.round(df["WMETR_HorWdSpd"])]).size()
+        expected /= expected.sum()
+        wd_ix = (expected.index.get_level_values(0) / 5.0).astype(int) - first_wd_bin
+        ws_ix = expected.index.get_level_values(1).astype(int) - first_ws_bin
+        nptest.assert_array_almost_equal(freqs[wd_ix, ws_ix], expected.to_numpy())
+        nptest.assert_almost_equal(freqs.sum(), 1.0)
+
+    def test_wake_losses_adaptive(self):
+        reset_prng()
+        # ____________________________________________________________________
+        # Test an adaptive analysis stops once the mean long-term wake losses have converged, and
+        # only keeps the results of the completed simulations.
+        self.analysis = wake_losses.WakeLosses(
+            plant=self.project,
+            wind_direction_asset_ids=["R80711", "R80721", "R80736"],
+            end_date="2015-11-25 00:00",
+            UQ=True,
+            seed=2024,
+        )
+        self.analysis.run(
+            num_sim=100,
+            no_wakes_ws_thresh_LT_corr=15.0,
+            reanalysis_products=["merra2", "era5"],
+            tolerance=3.0,
+            convergence_batch_size=5,
+        )
+        num_sim = self.analysis.num_sim
+        assert num_sim < 100
+        assert num_sim % 5 == 0
+        n_turbines = len(self.analysis.turbine_ids)
+        assert self.analysis.inputs.shape[0] == num_sim
+        assert self.analysis.wake_losses_lt.shape == (num_sim, 1)
+        assert self.analysis.turbine_wake_losses_lt.shape == (num_sim, n_turbines)
+        assert self.analysis.wake_losses_lt_wd.shape[0] == num_sim
+        assert self.analysis.turbine_wake_losses_lt_ws.shape[:2] == (num_sim, n_turbines)
+
+        precision = self.analysis.precision
+        assert precision["num_sim"] == num_sim
+        assert precision["tolerance"] == 3.0
+        assert precision["converged"]
+        nptest.assert_almost_equal(precision["mean"], self.analysis.wake_losses_lt_mean)
+        assert precision["mean_relative_std_error"] <= 3.0
+
     def check_simulation_results_wake_losses_without_UQ(self):
         # Make sure wake loss results are consistent to six decimal places
         # Confirm plant-level and turbine-level wake losses for POR and long-term corrected
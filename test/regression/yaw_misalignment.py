@@ -5,6 +5,7 @@ import numpy as np
 import pandas as pd
 import pytest
 from numpy import testing as nptest
+from scipy.optimize import curve_fit
 
 from openoa.analysis import yaw_misalignment
 
@@ -96,6 +97,55 @@ class TestStaticYawMisalignment(unittest.TestCase):
         )
         self.check_simulation_results_yaw_misalignment_with_UQ_new_params()
 
+    def test_fit_cos_curves(self):
+        # ____________________________________________________________________
+        # Test the batched cosine curve fits recover the parameters of noisy cosine curves with a
+        # different number of missing points in each group, and fit at least as well as
+        # scipy's curve_fit for each group.
+        rng = np.random.default_rng(1)
+        x = np.arange(-25.0, 26.0)
+        true_params = np.column_stack(
+            [rng.uniform(0.5, 2.0, 6), rng.uniform(-8.0, 8.0, 6), rng.uniform(1.5, 3.0, 6)]
+        )
+        y = np.array([yaw_misalignment.cos_curve(x, *params) for params in true_params])
+        y += rng.normal(scale=1e-3, size=y.shape)
+        for i in range(y.shape[0]):
+            y[i, : 2 * i] = np.nan
+
+        params = yaw_misalignment.fit_cos_curves(x, y)
+        nptest.assert_allclose(params, true_params, rtol=0.05, atol=0.05)
+
+        for y_group, params_group in zip(y, params):
+            valid = ~np.isnan(y_group)
+            expected, _ = curve_fit(
+                yaw_misalignment.cos_curve,
+                x[valid],
+                y_group[valid],
+                [y_group[valid].max(), 0.0, 2.0],
+            )
+            nptest.assert_allclose(params_group, expected, rtol=1e-5, atol=1e-5)
+
+        # The fits of nearly flat curves fit at least as well as curve_fit
+        flat = 1.0 + rng.normal(scale=0.01, size=(20, x.size))
+        params = yaw_misalignment.fit_cos_curves(x, flat)
+        for y_group, params_group in zip(flat, params):
+            expected, _ = curve_fit(
+                yaw_misalignment.cos_curve, x, y_group, [y_group.max(), 0.0, 2.0]
+            )
+            cost = ((yaw_misalignment.cos_curve(x, *params_group) - y_group) ** 2).sum()
+            expected_cost = ((yaw_misalignment.cos_curve(x, *expected) - y_group) ** 2).sum()
+            assert cost <= expected_cost * (1 + 1e-6)
+
+        # Groups that haven't converged within the maximum number of steps are logged
+        with self.assertLogs(yaw_misalignment.logger, level="WARNING") as logs:
+            yaw_misalignment.fit_cos_curves(x, y, max_iterations=1)
+        assert "groups [0, 1, 2, 3, 4, 5]" in logs.output[0]
+
+        # Each group needs at least as many points as curve parameters
+        y[0, 2:] = np.nan
+        with pytest.raises(ValueError):
+            yaw_misalignment.fit_cos_curves(x, y)
+
     def check_simulation_results_yaw_misalignment_without_UQ(self):
         # Make sure yaw misalignment results are consistent to six decimal places without UQ.
         # Average yaw misaligment values for each turbine
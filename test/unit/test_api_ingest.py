@@ -0,0 +1,136 @@
+import io
+import asyncio
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import numpy as np
+import pandas as pd
+
+from openoa.plant import PlantData
+from openoa.schema.metadata import PlantMetaData
+
+from api import ingest  # isort: skip
+
+# The uploaded column names of the example plant's metadata in examples/data/plant_meta.yml
+METADATA = {
+    "latitude": 48.4497,
+    "longitude": 5.5896,
+    "capacity": 4.1,
+    "scada": {
+        "frequency": "10min",
+        "asset_id": "Wind_turbine_name",
+        "time": "Date_time",
+        "WTUR_W": "P_avg",
+        "WMET_HorWdSpd": "Ws_avg",
+        "WROT_BlPthAngVal": "Ba_avg",
+    },
+    "asset": {
+        "asset_id": "Wind_turbine_name",
+        "latitude": "Latitude",
+        "longitude": "Longitude",
+        "rated_power": "Rated_power",
+        "hub_height": "Hub_height_m",
+        "rotor_diameter": "Rotor_diameter_m",
+        "elevation": "elevation_m",
+    },
+    "reanalysis": {
+        "era5": {"frequency": "h", "time": "datetime", "WMETR_HorWdSpdU": "u_100"},
+    },
+}
+
+SCADA_CSV = """Wind_turbine_name,Date_time,Ba_avg,P_avg,Ws_avg
+R80711,2014-01-01 00:00:00,-1.0,302.5,5.9
+R80721,2014-01-01 00:00:00,-0.9,,6.1
+R80711,2014-01-01 00:10:00,-1.0,318.2,6.0
+R80721,2014-01-01 00:10:00,-0.9,350.1,6.3
+R80711,2014-01-01 00:20:00,-1.0,290.0,5.8
+R80721,2014-01-01 00:20:00,-0.9,333.3,6.2
+R80711,2014-01-01 00:30:00,-1.0,1007.0,8.0
+"""
+
+ASSET_CSV = """Wind_turbine_name,Latitude,Longitude,Rated_power,Hub_height_m,Rotor_diameter_m,elevation_m
+R80711,48.4569,5.5847,2050,80,82,411
+R80721,48.4497,5.5869,2050,80,82,411
+"""
+
+REANALYSIS_CSV = """datetime,u_100,v_100
+2014-01-01 00:00:00,4.5,-1.2
+2014-01-01 01:00:00,4.7,-1.0
+2014-01-01 02:00:00,5.1,-0.8
+"""
+
+
+class FakeUpload:
+    """Implements the parts of ``fastapi.UploadFile`` used by the ingestion."""
+
+    def __init__(self, content: str):
+        self.file = io.BytesIO(content.encode())
+        self.closed = False
+        self.reads = 0
+
+    async def read(self, size: int = -1) -> bytes:
+        self.reads += 1
+        return self.file.read(size)
+
+    async def close(self) -> None:
+        self.closed = True
+
+
+class TestIngest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.metadata = PlantMetaData.load(METADATA)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def ingest(self, content: str, name: str) -> tuple[pd.DataFrame, FakeUpload]:
+        upload = FakeUpload(content)
+        df = asyncio.run(ingest.ingest_upload(upload, self.tmp.name, self.metadata, name))
+        return df, upload
+
+    def test_csv_dtypes(self):
+        types, time_cols = ingest.csv_dtypes(
+            self.metadata.scada.col_map, self.metadata.scada.dtypes
+        )
+        assert time_cols == ["Date_time"]
+        assert types["Wind_turbine_name"] is str
+        assert types["P_avg"] == np.dtype(float)
+
+    def test_ingest_upload(self):
+        # Spool the upload in small chunks, and parse it a few rows at a time
+        with (
+            mock.patch.object(ingest, "UPLOAD_CHUNK_SIZE", 64),
+            mock.patch.object(ingest, "CSV_CHUNK_ROWS", 3),
+            mock.patch.object(ingest, "USE_PYARROW", False),
+        ):
+            scada, upload = self.ingest(SCADA_CSV, "scada")
+        assert upload.closed
+        assert upload.reads > len(SCADA_CSV) // 64
+
+        expected = pd.read_csv(io.StringIO(SCADA_CSV), parse_dates=["Date_time"])
+        pd.testing.assert_frame_equal(scada, expected)
+        assert scada["Date_time"].dtype.kind == "M"
+        assert scada["Wind_turbine_name"].dtype == object
+        assert np.isnan(scada.loc[1, "P_avg"])
+
+        # The spooled file is removed once it's been parsed
+        assert list(Path(self.tmp.name).iterdir()) == []
+
+    def test_ingest_plant(self):
+        # Ingest each of the uploads, and create the PlantData from them as in /api/data/upload
+        scada, _ = self.ingest(SCADA_CSV, "scada")
+        asset, _ = self.ingest(ASSET_CSV, "asset")
+        era5, _ = self.ingest(REANALYSIS_CSV, "reanalysis_era5")
+        assert asset["Rated_power"].dtype == np.dtype(float)
+        assert era5["datetime"].dtype.kind == "M"
+
+        plant = PlantData(
+            metadata=self.metadata, scada=scada, asset=asset, reanalysis={"era5": era5}
+        )
+        assert plant.scada.shape[0] == 7
+        assert plant.scada.loc[("2014-01-01 00:10:00", "R80721"), "WTUR_W"] == 350.1
+        assert plant.asset.index.tolist() == ["R80711", "R80721"]
+        assert plant.reanalysis["era5"].shape[0] == 3
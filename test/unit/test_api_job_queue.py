@@ -0,0 +1,221 @@
+import os
+import time
+import sqlite3
+import tempfile
+import unittest
+import threading
+from pathlib import Path
+from unittest import mock
+
+import pytest
+
+from openoa.analysis._progress import MonteCarloProgress
+
+from api import tasks, workers  # isort: skip
+from api.job_queue import (  # isort: skip
+    QUEUED,
+    FAILED,
+    RUNNING,
+    CANCELLED,
+    COMPLETED,
+    JobQueue,
+    JobCancelled,
+    create_job_queue,
+)
+
+
+class TestJobQueue(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = Path(self.tmp.name) / "jobs.sqlite"
+        self.queue = JobQueue(self.path, max_concurrency=2)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def set_heartbeat(self, job_id: str, heartbeat: float) -> None:
+        with sqlite3.connect(self.path) as conn:
+            conn.execute("UPDATE jobs SET heartbeat = ? WHERE id = ?", (heartbeat, job_id))
+
+    def test_submit_claim(self):
+        first = self.queue.submit("aep", {"dataset_id": "a"}, total=10)
+        second = self.queue.submit("tie", {"dataset_id": "b"})
+        assert self.queue.count(QUEUED) == 2
+
+        # The oldest job is claimed first
+        job = self.queue.claim("worker-1")
+        assert job["id"] == first
+        assert job["status"] == RUNNING
+        assert job["params"] == {"dataset_id": "a"}
+        assert self.queue.get(first)["worker"] == "worker-1"
+        assert self.queue.claim("worker-2")["id"] == second
+        assert self.queue.claim("worker-3") is None
+
+        self.queue.update_progress(first, 4, summary={"mean": 12.5})
+        job = self.queue.get(first)
+        assert (job["progress"], job["total"], job["summary"]) == (4, 10, {"mean": 12.5})
+
+        self.queue.complete(first, {"mean": 12.5})
+        self.queue.fail(second, "error")
+        job = self.queue.get(first)
+        assert (job["status"], job["progress"], job["result"]) == (COMPLETED, 10, {"mean": 12.5})
+        assert self.queue.get(second)["status"] == FAILED
+        assert self.queue.get("missing") is None
+
+    def test_claim_race(self):
+        # Many workers, each with its own connection to the database, race to claim one job
+        job_id = self.queue.submit("aep", {})
+        n_workers = 8
+        barrier = threading.Barrier(n_workers)
+        claimed = []
+
+        def claim(worker_id):
+            queue = JobQueue(self.path, max_concurrency=n_workers)
+            barrier.wait()
+            job = queue.claim(worker_id)
+            if job is not None:
+                claimed.append((worker_id, job["id"]))
+
+        threads = [threading.Thread(target=claim, args=(f"worker-{i}",)) for i in range(n_workers)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(claimed) == 1
+        worker_id, claimed_id = claimed[0]
+        assert claimed_id == job_id
+        assert self.queue.get(job_id)["worker"] == worker_id
+        assert self.queue.count(RUNNING) == 1
+
+    def test_max_concurrency(self):
+        queue = JobQueue(self.path, max_concurrency=1)
+        first = queue.submit("aep", {})
+        second = queue.submit("aep", {})
+        assert queue.claim("worker-1")["id"] == first
+        assert queue.claim("worker-2") is None
+
+        queue.complete(first, {})
+        assert queue.claim("worker-2")["id"] == second
+
+        with mock.patch.dict(
+            os.environ,
+            {"OPENOA_JOB_DB": str(self.path), "OPENOA_MAX_CONCURRENT_JOBS": "3"},
+        ):
+            assert create_job_queue().max_concurrency == 3
+
+    def test_stale_heartbeat(self):
+        queue = JobQueue(self.path, max_concurrency=1, stale_after=60.0)
+        job_id = queue.submit("aep", {})
+        assert queue.claim("worker-1")["id"] == job_id
+
+        # A recent heartbeat keeps the job running on its worker
+        assert not queue.heartbeat(job_id)
+        assert queue.claim("worker-2") is None
+
+        # Without a heartbeat the job is returned to the queue, and claimed by another worker
+        self.set_heartbeat(job_id, time.time() - 61.0)
+        job = queue.claim("worker-2")
+        assert job["id"] == job_id
+        assert queue.get(job_id)["worker"] == "worker-2"
+        assert queue.count(RUNNING) == 1
+
+    def test_cancel(self):
+        queued = self.queue.submit("aep", {})
+        running = self.queue.submit("aep", {})
+        assert self.queue.cancel("missing") is None
+
+        # A queued job is cancelled immediately, and is never claimed
+        assert self.queue.cancel(queued) == CANCELLED
+        assert self.queue.get(queued)["status"] == CANCELLED
+
+        # A running job keeps running until its worker sees the request
+        assert self.queue.claim("worker-1")["id"] == running
+        assert not self.queue.update_progress(running, 1)
+        assert self.queue.cancel(running) == RUNNING
+        assert self.queue.get(running)["cancel_requested"]
+        assert self.queue.heartbeat(running)
+        assert self.queue.update_progress(running, 2)
+
+        self.queue.mark_cancelled(running)
+        job = self.queue.get(running)
+        assert (job["status"], job["progress"]) == (CANCELLED, 2)
+        assert self.queue.cancel(running) == CANCELLED
+
+
+class TestWorkers(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.queue = JobQueue(Path(self.tmp.name) / "jobs.sqlite")
+        self.datasets = {"plant": "plant data"}
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def run_task(self, task, total: int = 3) -> dict:
+        job_id = self.queue.submit("test", {"dataset_id": "plant"}, total=total)
+        with (
+            mock.patch.dict(tasks.TASKS, {"test": task}),
+            mock.patch.object(workers, "PROGRESS_INTERVAL", 0.0),
+        ):
+            workers.run_job(self.queue, self.datasets, self.queue.claim("worker-1"))
+        return self.queue.get(job_id)
+
+    def test_run_job(self):
+        def task(plant, params, progress_callback):
+            assert plant == "plant data"
+            progress = MonteCarloProgress(total=3, metric="aep_GWh")
+            for i in range(1, 4):
+                progress.update(i, [12.0, 12.5, 13.0][:i])
+                progress_callback(progress)
+            return {"mean": 12.5}
+
+        job = self.run_task(task)
+        assert job["status"] == COMPLETED
+        assert job["result"] == {"mean": 12.5}
+        assert job["progress"] == 3
+        assert job["summary"]["mean"] == pytest.approx(12.5)
+
+    def test_run_job_failed(self):
+        def task(plant, params, progress_callback):
+            raise ValueError("bad input")
+
+        job = self.run_task(task)
+        assert job["status"] == FAILED
+        assert job["error"].startswith("bad input")
+
+    def test_run_job_cancelled(self):
+        completed = []
+
+        def task(plant, params, progress_callback):
+            progress = MonteCarloProgress(total=10, metric="aep_GWh")
+            for i in range(1, 11):
+                if i == 3:
+                    self.queue.cancel(params["job_id"])
+                progress.update(i)
+                progress_callback(progress)
+                completed.append(i)
+            return {}
+
+        job_id = self.queue.submit("test", {"dataset_id": "plant"}, total=10)
+        job = self.queue.claim("worker-1")
+        job["params"]["job_id"] = job_id
+        with (
+            mock.patch.dict(tasks.TASKS, {"test": task}),
+            mock.patch.object(workers, "PROGRESS_INTERVAL", 0.0),
+        ):
+            workers.run_job(self.queue, self.datasets, job)
+
+        # The task is stopped at the first progress update after the cancellation request
+        assert completed == [1, 2]
+        job = self.queue.get(job_id)
+        assert job["status"] == CANCELLED
+        assert job["progress"] == 3
+
+    def test_monitor_raises_once_cancelled(self):
+        job_id = self.queue.submit("test", {})
+        self.queue.claim("worker-1")
+        monitor = workers._JobMonitor(self.queue, job_id)
+        monitor.cancelled.set()
+        with pytest.raises(JobCancelled):
+            monitor.progress(MonteCarloProgress(total=2, metric="aep_GWh", completed=1))
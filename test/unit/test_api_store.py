@@ -0,0 +1,114 @@
+import tempfile
+import unittest
+
+import numpy as np
+import pandas as pd
+import pytest
+from api.store import PARQUET_AVAILABLE, LocalDatasetStore
+
+from openoa.plant import PlantData
+
+
+def small_plant() -> PlantData:
+    time = pd.date_range("2020-01-01", periods=6, freq="10min")
+    scada = pd.DataFrame(
+        {
+            "time": np.repeat(time, 2),
+            "asset_id": ["T1", "T2"] * 6,
+            "WTUR_W": np.arange(12.0),
+            "WMET_HorWdSpd": np.linspace(3.0, 9.0, 12),
+        }
+    )
+    asset = pd.DataFrame(
+        {
+            "asset_id": ["T1", "T2"],
+            "latitude": [48.45, 48.46],
+            "longitude": [5.58, 5.59],
+            "rated_power": [2.05, 2.05],
+            "hub_height": [80.0, 80.0],
+            "rotor_diameter": [82.0, 82.0],
+            "elevation": [411.0, 411.0],
+            "type": ["turbine", "turbine"],
+        }
+    )
+    reanalysis = pd.DataFrame(
+        {
+            "time": pd.date_range("2020-01-01", periods=3, freq="h"),
+            "WMETR_HorWdSpd": [5.0, 6.0, 7.0],
+        }
+    )
+    metadata = {
+        "latitude": 48.45,
+        "longitude": 5.59,
+        "capacity": 4.1,
+        "scada": {"frequency": "10min"},
+        "reanalysis": {"era5": {"frequency": "h"}},
+    }
+    return PlantData(metadata=metadata, scada=scada, asset=asset, reanalysis={"era5": reanalysis})
+
+
+class TestLocalDatasetStore(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.store = LocalDatasetStore(self.tmp.name, max_in_memory=1)
+        self.plant = small_plant()
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_save_load(self):
+        dataset_id = self.store.add(self.plant)
+        assert dataset_id in self.store
+        assert self.store.keys() == [dataset_id]
+        assert len(self.store) == 1
+
+        # A new store reads the dataset from disk, and recreates the derived columns
+        loaded = LocalDatasetStore(self.tmp.name)[dataset_id]
+        pd.testing.assert_frame_equal(self.plant.scada, loaded.scada)
+        pd.testing.assert_frame_equal(
+            self.plant.asset.drop(columns="geometry"), loaded.asset.drop(columns="geometry")
+        )
+        assert loaded.asset.geometry.equals(self.plant.asset.geometry)
+        pd.testing.assert_frame_equal(self.plant.reanalysis["era5"], loaded.reanalysis["era5"])
+        assert loaded.metadata.capacity == self.plant.metadata.capacity
+        assert loaded.metadata.scada.frequency == "10min"
+        assert loaded.metadata.reanalysis["era5"].frequency == "h"
+        assert loaded.analysis_type == self.plant.analysis_type
+
+    def test_info_and_load_frame(self):
+        dataset_id = self.store.add(self.plant)
+        frames = self.store.info(dataset_id)["frames"]
+        assert set(frames) == {"scada", "asset", "reanalysis_era5"}
+        assert frames["scada"]["rows"] == 12
+        suffix = ".parquet" if PARQUET_AVAILABLE else ".pkl"
+        assert all(frame["file"].endswith(suffix) for frame in frames.values())
+
+        scada = self.store.load_frame(dataset_id, "scada")
+        pd.testing.assert_frame_equal(scada, self.plant.scada.reset_index())
+        with pytest.raises(KeyError):
+            self.store.load_frame(dataset_id, "meter")
+
+    def test_memory_and_delete(self):
+        first = self.store.add(self.plant)
+        second = self.store.add(small_plant())
+
+        # Only the most recently used dataset is kept in memory, and the others are reloaded
+        assert list(self.store._memory) == [second]
+        assert self.store[second] is self.store[second]
+        reloaded = self.store[first]
+        assert reloaded is not self.plant
+        assert list(self.store._memory) == [first]
+
+        del self.store[first]
+        assert first not in self.store
+        assert self.store.keys() == [second]
+        with pytest.raises(KeyError):
+            self.store[first]
+        with pytest.raises(KeyError):
+            del self.store[first]
+
+    def test_invalid_id(self):
+        # IDs can't point outside of the store's directory
+        assert "../outside" not in self.store
+        with pytest.raises(KeyError):
+            self.store["../outside"]
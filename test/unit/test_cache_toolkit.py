@@ -0,0 +1,149 @@
+import os
+import time
+import tempfile
+import unittest
+
+import numpy as np
+import pandas as pd
+from numpy import testing as nptest
+
+from openoa.plant import PlantData
+from openoa.utils.cache import (
+    MemoryCache,
+    ResultCache,
+    memory_size,
+    hash_parameters,
+    hash_plant_data,
+)
+
+
+class TestResultCache(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.cache = ResultCache(self.tmp.name)
+        self.values = {
+            "results": pd.DataFrame({"aep_GWh": [12.1, 12.4], "avail_pct": [0.01, 0.02]}),
+            "losses": np.arange(6, dtype=float).reshape(3, 2),
+            "mean": 0.5,
+        }
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_hash_parameters(self):
+        params = {"num_sim": 10, "uncertainty": np.array([1.0, 2.0]), "seed": 42}
+        # Order independent and stable for equivalent values
+        assert hash_parameters(params) == hash_parameters(
+            {"seed": 42, "uncertainty": (1.0, 2.0), "num_sim": 10}
+        )
+        assert hash_parameters(params) != hash_parameters({**params, "seed": 43})
+
+    def test_hash_plant_data(self):
+        scada = pd.DataFrame(
+            {
+                "time": pd.date_range("2020-01-01", periods=4, freq="10min"),
+                "asset_id": "T1",
+                "WTUR_W": [1.0, 2.0, 3.0, 4.0],
+            }
+        )
+        plant = PlantData(metadata={}, scada=scada.copy())
+        same = PlantData(metadata={}, scada=scada.copy())
+        scada.loc[3, "WTUR_W"] = 5.0
+        different = PlantData(metadata={}, scada=scada)
+
+        assert hash_plant_data(plant) == hash_plant_data(same)
+        assert hash_plant_data(plant) != hash_plant_data(different)
+
+    def test_store_load(self):
+        key = self.cache.key("plant", "MonteCarloAEP", {"num_sim": 2, "seed": 42})
+        assert key not in self.cache
+        assert self.cache.load(key) is None
+
+        self.cache.store(key, self.values)
+        assert key in self.cache
+
+        loaded = self.cache.load(key)
+        pd.testing.assert_frame_equal(loaded["results"], self.values["results"])
+        nptest.assert_array_equal(loaded["losses"], self.values["losses"])
+        assert loaded["mean"] == self.values["mean"]
+
+        # Storing the same key twice is a no-op
+        self.cache.store(key, self.values)
+        assert len(os.listdir(self.tmp.name)) == 1
+
+    def test_eviction(self):
+        keys = [self.cache.key("plant", "MonteCarloAEP", {"seed": i}) for i in range(3)]
+        self.cache.store(keys[0], self.values)
+        entry_size = self.cache.size
+        self.cache.max_size = 2 * entry_size
+
+        self.cache.store(keys[1], self.values)
+        # Mark the first entry as more recently used than the second
+        time.sleep(0.01)
+        self.cache.load(keys[0])
+        time.sleep(0.01)
+        self.cache.store(keys[2], self.values)
+
+        assert keys[0] in self.cache
+        assert keys[1] not in self.cache
+        assert keys[2] in self.cache
+        assert self.cache.size <= self.cache.max_size
+
+        self.cache.clear()
+        assert self.cache.size == 0
+        assert all(key not in self.cache for key in keys)
+
+
+class TestMemoryCache(unittest.TestCase):
+    def test_get(self):
+        cache = MemoryCache(max_entries=2)
+        calls = []
+
+        def compute(value):
+            calls.append(value)
+            return value
+
+        assert cache.get((1.0, 0.85), lambda: compute("a")) == "a"
+        assert cache.get((1.0, 0.85), lambda: compute("b")) == "a"
+        assert cache.get((2.0, 0.85), lambda: compute("c")) == "c"
+        assert calls == ["a", "c"]
+        assert (cache.hits, cache.misses, len(cache)) == (1, 2, 2)
+
+        # The least recently used entry is evicted
+        cache.get((1.0, 0.85), lambda: compute("d"))
+        cache.get((3.0, 0.85), lambda: compute("e"))
+        assert (1.0, 0.85) in cache
+        assert (2.0, 0.85) not in cache
+        assert len(cache) == 2
+
+        cache.clear()
+        assert (cache.hits, cache.misses, len(cache)) == (0, 0, 0)
+
+        with self.assertRaises(ValueError):
+            MemoryCache(max_entries=0)
+
+    def test_max_bytes(self):
+        cache = MemoryCache(max_entries=10, max_bytes=2000)
+        cache.get("a", lambda: np.zeros(100))
+        cache.get("b", lambda: (np.zeros(100), {"c": np.zeros(50)}))
+        assert cache.nbytes == 800 + 1200
+        assert len(cache) == 2
+
+        # The least recently used entries are evicted until the cache is within its size
+        cache.get("a", lambda: None)
+        cache.get("d", lambda: pd.Series(np.zeros(50), index=pd.RangeIndex(50)))
+        assert "b" not in cache
+        assert cache.nbytes == memory_size(cache._entries["a"]) + memory_size(cache._entries["d"])
+        assert cache.nbytes <= 2000
+
+        # The newest entry is kept even if it's larger than the cache
+        cache.get("e", lambda: np.zeros(1000))
+        assert list(cache._entries) == ["e"]
+        assert cache.nbytes == 8000
+
+        cache.clear()
+        assert (cache.nbytes, len(cache)) == (0, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
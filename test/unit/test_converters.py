@@ -12,6 +12,8 @@ from openoa.utils._converters import (
     series_to_df,
     series_method,
     dataframe_method,
+    flatten_by_asset,
+    unflatten_by_asset,
     convert_args_to_lists,
     multiple_df_to_single_df,
 )
@@ -292,3 +294,36 @@ def test_dataframe_method():
     # Check for failure when an invalid column name is passed
     with pytest.raises(ValueError):
         sample_df_handling_method("d", 1.0, "a", 2.0, data=test_df1)
+
+
+def test_flatten_by_asset():
+    # A (time x asset) DataFrame is flattened by column, and returned in the same layout
+    (a, b), codes, assets = flatten_by_asset(test_df1, test_df1 * 2)
+    nptest.assert_array_equal(a, np.arange(15.0))
+    nptest.assert_array_equal(b, 2 * np.arange(15.0))
+    nptest.assert_array_equal(codes, np.repeat([0, 1, 2], 5))
+    tm.assert_index_equal(assets, test_df1.columns)
+    flag = unflatten_by_asset(a % 2 == 0, test_df1)
+    tm.assert_frame_equal(flag, test_df1 % 2 == 0)
+
+    # A 2-D array's assets are its column numbers
+    (values,), codes, assets = flatten_by_asset(test_df1.to_numpy())
+    nptest.assert_array_equal(values, np.arange(15.0))
+    tm.assert_index_equal(assets, pd.RangeIndex(3))
+    nptest.assert_array_equal(unflatten_by_asset(values > 7, test_df1.to_numpy()), test_df1 > 7)
+
+    # A Series is coded by the sorted IDs of its asset_id level
+    index = pd.MultiIndex.from_product([range(2), ["T2", "T1"]], names=["time", "asset_id"])
+    series = pd.Series([1.0, 2.0, 3.0, 4.0], index=index)
+    (values,), codes, assets = flatten_by_asset(series)
+    nptest.assert_array_equal(values, series.to_numpy())
+    nptest.assert_array_equal(codes, [1, 0, 1, 0])
+    tm.assert_index_equal(assets, pd.Index(["T1", "T2"]))
+    tm.assert_series_equal(unflatten_by_asset(values > 2, series), series > 2)
+
+    with pytest.raises(ValueError):
+        flatten_by_asset(test_df1, test_df2)
+    with pytest.raises(ValueError):
+        flatten_by_asset(test_series_a1)
+    with pytest.raises(ValueError):
+        flatten_by_asset(np.arange(5.0))
@@ -183,7 +183,6 @@ class SimpleFilters(unittest.TestCase):
         with self.assertRaises(ValueError):
             filters.std_range_flag(x, [2], col=["b", "c"])
 
-    # TODO: Test more code paths in bin_filter
     def test_bin_filter(self):
         x_val = pd.Series(np.array([-1, -1, -1, -1, -1, 10, -1]))
         x_bin = pd.Series(np.array([1, 1.5, 2, 2.5, 3, 3.5, 4]))
@@ -191,6 +190,152 @@ class SimpleFilters(unittest.TestCase):
         expected = pd.Series([False, False, False, False, False, True, False])
         nptest.assert_array_equal(flag, expected)
 
+    def test_bin_filter_code_paths(self):
+        # Compare each center, threshold, and direction option against a groupby of the bins, with
+        # missing values, empty bins, and an unsorted index
+        rng = np.random.default_rng(1)
+        x_bin = pd.Series(np.concatenate([rng.uniform(0, 30, 400), rng.uniform(60, 90, 100)]))
+        x_val = pd.Series(x_bin.values + rng.normal(0, 2, 500) + 20 * (rng.random(500) < 0.05))
+        x_val.iloc[::37] = np.nan
+        order = rng.permutation(500)
+        x_bin.index = x_val.index = pd.date_range("2020-01-01", periods=500, freq="10min")[order]
+
+        bins = pd.Series(np.digitize(x_bin, np.arange(10, 91, 10), right=True), index=x_bin.index)
+        grouped = x_val.groupby(bins)
+        for center_type in ("mean", "median"):
+            center = grouped.transform(center_type)
+            for threshold_type in ("std", "scalar", "mad"):
+                if threshold_type == "std":
+                    deviation = grouped.transform("std") * 1.5
+                elif threshold_type == "scalar":
+                    deviation = 1.5
+                else:
+                    deviation = (x_val - center).abs().groupby(bins).transform("median") * 1.5
+                for direction in ("all", "above", "below"):
+                    above = (x_val > center + deviation) & (direction != "below")
+                    below = (x_val < center - deviation) & (direction != "above")
+                    expected = (above | below) & (x_bin > 10)
+
+                    flag = filters.bin_filter(
+                        x_bin,
+                        x_val,
+                        10,
+                        threshold=1.5,
+                        center_type=center_type,
+                        bin_min=10,
+                        bin_max=90,
+                        threshold_type=threshold_type,
+                        direction=direction,
+                    )
+                    self.assertTrue(flag.index.equals(x_val.index))
+                    self.assertTrue(flag.any())
+                    nptest.assert_array_equal(flag, expected)
+
+        with self.assertRaises(ValueError):
+            filters.bin_filter(x_bin, x_val, 10, center_type="mode")
+
+    def test_filters_by_asset(self):
+        # Check that the batched filters match the filters applied to each asset's data, for both
+        # the long SCADA layout and the (time x asset) layout
+        rng = np.random.default_rng(2)
+        index = pd.MultiIndex.from_product(
+            [pd.date_range("2020-01-01", periods=300, freq="10min"), ["T2", "T0", "T1"]],
+            names=["time", "asset_id"],
+        )
+        scada = pd.DataFrame({"power": rng.uniform(0, 2000, index.size)}, index=index)
+        scada["windspeed"] = (
+            scada.power / 200 + rng.normal(0, 1, index.size) + 10 * (rng.random(index.size) < 0.05)
+        ).round(1)
+        scada.iloc[30:45, 1] = 5.0
+        scada.iloc[::23, 1] = np.nan
+        scada = scada.loc[rng.random(index.size) < 0.9]
+        capacity = pd.Series([1800.0, 2000.0, 2050.0], index=["T0", "T1", "T2"])
+
+        flag_bin = filters.bin_filter_by_asset(
+            "power",
+            "windspeed",
+            0.04 * capacity,
+            threshold=1.5,
+            center_type="median",
+            bin_min=0.01 * capacity,
+            bin_max=0.9 * capacity,
+            threshold_type="mad",
+            data=scada,
+        )
+        flag_window = filters.window_range_flag_by_asset(
+            "windspeed", 5.0, 40, "power", 0.02 * capacity, 1.2 * capacity, data=scada
+        )
+        flag_range = filters.range_flag_by_asset(scada.windspeed, 0, capacity / 100)
+        flag_frozen = filters.unresponsive_flag_by_asset(scada.windspeed, threshold=3)
+        for flag in (flag_bin, flag_window, flag_range, flag_frozen):
+            self.assertTrue(flag.index.equals(scada.index))
+            self.assertTrue(flag.any())
+
+        for t, df in scada.groupby(level="asset_id"):
+            ix = scada.index.get_level_values("asset_id") == t
+            expected = filters.bin_filter(
+                df.power,
+                df.windspeed,
+                0.04 * capacity[t],
+                threshold=1.5,
+                center_type="median",
+                bin_min=0.01 * capacity[t],
+                bin_max=0.9 * capacity[t],
+                threshold_type="mad",
+            )
+            nptest.assert_array_equal(flag_bin[ix], expected)
+            expected = filters.window_range_flag(
+                df.windspeed, 5.0, 40, df.power, 0.02 * capacity[t], 1.2 * capacity[t]
+            )
+            nptest.assert_array_equal(flag_window[ix], expected)
+            expected = filters.range_flag(df.windspeed, 0, capacity[t] / 100)
+            nptest.assert_array_equal(flag_range[ix], expected)
+            expected = filters.unresponsive_flag(df.windspeed, threshold=3)
+            nptest.assert_array_equal(flag_frozen[ix], expected)
+
+        # The (time x asset) frames and arrays return flags in the same layout
+        power = scada.power.unstack()
+        windspeed = scada.windspeed.unstack()
+        flag_bin = filters.bin_filter_by_asset(
+            power, windspeed, 0.04 * capacity, bin_min=0.01 * capacity, bin_max=0.9 * capacity
+        )
+        capacity = capacity[power.columns].values
+        flag_array = filters.bin_filter_by_asset(
+            power.values,
+            windspeed.values,
+            0.04 * capacity,
+            2,
+            "mean",
+            0.01 * capacity,
+            0.9 * capacity,
+        )
+        flag_frozen = filters.unresponsive_flag_by_asset(windspeed.values, threshold=3)
+        self.assertTrue(flag_bin.index.equals(power.index))
+        self.assertTrue(flag_bin.columns.equals(power.columns))
+        for i, t in enumerate(power.columns):
+            expected = filters.bin_filter(
+                power[t],
+                windspeed[t],
+                0.04 * capacity[i],
+                2,
+                "mean",
+                0.01 * capacity[i],
+                0.9 * capacity[i],
+            )
+            nptest.assert_array_equal(flag_bin[t], expected)
+            nptest.assert_array_equal(flag_array[:, i], expected)
+            expected = filters.unresponsive_flag(windspeed[t], threshold=3)
+            nptest.assert_array_equal(flag_frozen[:, i], expected)
+
+        with self.assertRaises(ValueError):
+            filters.range_flag_by_asset(
+                scada.windspeed, 0, pd.Series([1.0, 2.0], index=["T0", "T1"])
+            )
+        with self.assertRaises(ValueError):
+            filters.range_flag_by_asset(windspeed, 0, [1.0, 2.0])
+        with self.assertRaises(ValueError):
+            filters.bin_filter_by_asset(power, windspeed.iloc[1:], 100)
+
     def test_cluster_mahalanobis_2d(self):
         col1 = pd.Series(np.array([1.0, 1.01, 1.001, 2.0, 2.01, 2.001, 2.0001]))
         col2 = pd.Series(np.array([3.0, 3.02, 3.001, 4.0, 4.01, 4.001, 5.0001]))
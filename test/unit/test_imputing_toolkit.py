@@ -380,6 +380,52 @@ class SimpleFilters(unittest.TestCase):
         ).to_frame()
         nptest.assert_array_almost_equal(y_test["imputed_data"], self.test12_df["data"], decimal=4)
 
+    def test_impute_all_assets_by_correlation_vectorized(self):
+        # Build four correlated assets with missing values and rows, in a shuffled order
+        rng = np.random.default_rng(7)
+        times = pd.date_range("2020-01-01", periods=60, freq="h")
+        assets = ["d", "a", "c", "b"]
+        signal = rng.normal(size=(times.size, 1)) * np.array([1.0, 2.0, 0.5, -1.5])
+        values = signal + rng.normal(scale=0.1, size=signal.shape)
+        values[rng.random(values.shape) < 0.2] = np.nan
+        index = pd.MultiIndex.from_product([times, assets], names=["time", "asset_id"])
+        df = pd.DataFrame({"data": values.ravel(), "ref": values.ravel() * 2 + 1}, index=index)
+        df = df.sample(frac=0.9, random_state=7)
+
+        # Reproduce the imputation neighbor by neighbor with the single pair imputation
+        expected = df["data"].copy()
+        corr = imputing.asset_correlation_matrix(df, "data")
+        for target_id in corr.index:
+            ix_target = df.index.get_level_values("asset_id") == target_id
+            neighbors = corr.loc[target_id].sort_values(ascending=False).dropna()
+            for neighbor_id in neighbors.index[neighbors > 0.7]:
+                ix_nan = expected[ix_target].isnull().to_numpy()
+                imputed = imputing.impute_data(
+                    target_data=df.loc[ix_target, ["data"]].droplevel("asset_id"),
+                    target_col="data",
+                    reference_data=df.xs(neighbor_id, level="asset_id").loc[:, ["ref"]],
+                    reference_col="ref",
+                )
+                fill = expected[ix_target].to_numpy()
+                fill[ix_nan] = imputed.to_numpy()[ix_nan]
+                expected[ix_target] = fill
+
+        y_test = imputing.impute_all_assets_by_correlation(df, "data", "ref")
+        assert y_test.name == "imputed_data"
+        pd.testing.assert_index_equal(y_test.index, df.index)
+        nptest.assert_array_almost_equal(y_test.to_numpy(), expected.to_numpy(), decimal=10)
+
+        # A 1-degree polynomial matches the linear fit
+        y_poly = imputing.impute_all_assets_by_correlation(
+            df, "data", "ref", method="polynomial", degree=1
+        )
+        nptest.assert_array_almost_equal(y_poly.to_numpy(), y_test.to_numpy(), decimal=10)
+
+        with self.assertRaises(NotImplementedError):
+            imputing.impute_all_assets_by_correlation(df, "data", "ref", method="spline")
+        with self.assertRaises(ValueError):
+            imputing.impute_all_assets_by_correlation(pd.concat([df, df.iloc[:1]]), "data", "ref")
+
     def tearDown(self):
         pass
 
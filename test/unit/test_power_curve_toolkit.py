@@ -1,10 +1,16 @@
+import pickle
+import tempfile
 import unittest
+from pathlib import Path
 
 import numpy as np
 import pandas as pd
+import pytest
 from numpy import testing as nptest
 
+from openoa.plant import PlantData
 from openoa.utils import power_curve
+from openoa.utils.power_curve.gam import GAMDesign, gam_edge_knots
 from openoa.utils.power_curve.parametric_forms import logistic5param, logistic5param_capped
 
 noise = 0.1
@@ -57,6 +63,20 @@ class TestPowerCurveFunctions(unittest.TestCase):
             self.y, y_pred, rtol=1, atol=noise * 2, err_msg="Power curve did not properly fit."
         )
 
+    def test_IEC_weights(self):
+        # A weighted power curve is the same as the power curve of the repeated data
+        rng = np.random.default_rng(3)
+        weights = rng.integers(0, 4, self.x.size)
+        x = pd.Series(self.x)
+        y = pd.Series(self.y)
+        repeated = np.repeat(np.arange(x.size), weights)
+        expected = power_curve.IEC(x.iloc[repeated], y.iloc[repeated], interpolate=True)
+        curve = power_curve.IEC(x, y, interpolate=True, weights=weights)
+        nptest.assert_allclose(curve.power, expected.power, rtol=1e-12)
+
+        unweighted = power_curve.IEC(x, y, interpolate=True, weights=np.ones(x.size))
+        nptest.assert_array_equal(unweighted.power, power_curve.IEC(x, y, interpolate=True).power)
+
     def test_IEC_with_bounds(self):
         # Create the power curve with bounds at 4m/s adn 25m/s and bin width from power curve of 1m/s
         cut_in = 4
@@ -81,6 +101,46 @@ class TestPowerCurveFunctions(unittest.TestCase):
         valid_power = test_power[(test_windspeeds >= cut_in) & (test_windspeeds <= cut_out)]
         nptest.assert_array_equal(self.nrel_15mw_power, valid_power)
 
+    def test_IEC_by_asset(self):
+        # Build the power curves of three turbines, in both the MultiIndex and wide layouts
+        windspeed = pd.DataFrame(
+            {t: np.random.random(200) * 30 for t in ("T1", "T2", "T3")},
+            index=pd.date_range("2020-01-01", periods=200, freq="10min"),
+        )
+        power = windspeed**2 * np.array([1.0, 2.0, 3.0])
+        power.iloc[:20, 0] = np.nan
+        stacked = windspeed.stack().rename_axis(["time", "asset_id"])
+        stacked_power = pd.Series(power.to_numpy().ravel(), index=stacked.index)
+
+        x = np.random.random((50, 3)) * 35 - 2
+        for interpolate in (False, True):
+            curves = power_curve.IEC_by_asset(windspeed, power, interpolate=interpolate)
+            nptest.assert_array_equal(curves.asset_ids, ["T1", "T2", "T3"])
+            expected = np.column_stack(
+                [
+                    power_curve.IEC(windspeed[t], power[t], interpolate=interpolate)(x[:, i])
+                    for i, t in enumerate(curves.asset_ids)
+                ]
+            )
+            nptest.assert_allclose(curves(x), expected)
+
+            # The assets can be given for each value, and the curves are the same in either layout
+            assets = np.tile(curves.asset_ids, (50, 1))
+            nptest.assert_allclose(curves(x.ravel(), assets=assets.ravel()), expected.ravel())
+            stacked_curves = power_curve.IEC_by_asset(
+                stacked, stacked_power, interpolate=interpolate
+            )
+            nptest.assert_allclose(stacked_curves.power, curves.power)
+
+        # The power curves can be pickled, unlike a closure
+        unpickled = pickle.loads(pickle.dumps(curves))
+        nptest.assert_allclose(unpickled(x), curves(x))
+
+        with self.assertRaises(ValueError):
+            curves(x[:, :2])
+        with self.assertRaises(ValueError):
+            curves(x[:, 0], assets=np.full(50, "T4"))
+
     def test_logistic_5_param(self):
         # Create test data using logistic5param form
         curve = power_curve.logistic_5_parametric(self.x, self.y)
@@ -116,10 +176,132 @@ class TestPowerCurveFunctions(unittest.TestCase):
             self.y, y_pred, rtol=0.05, atol=20, err_msg="Power curve did not properly fit."
         )
 
+    def test_gam_design(self):
+        from pygam import LinearGAM
+
+        winddir = np.random.random(100) * 360
+        X = np.column_stack([self.x, winddir])
+        Y = np.column_stack([self.y, self.y * 0.9 + winddir])
+
+        # Fits to a subset of the data match the pygam fits, for every target at once
+        rows = np.flatnonzero(self.x < 25)
+        design = GAMDesign(X, edge_knots=gam_edge_knots(X[rows]))
+        coef = design.fit(Y[rows], rows)
+        for k in range(Y.shape[1]):
+            gam = LinearGAM(n_splines=20).fit(X[rows], Y[rows, k])
+            nptest.assert_allclose(design.predict(coef[:, k]), gam.predict(X), rtol=1e-8, atol=1e-6)
+            nptest.assert_allclose(
+                design.predict(coef[:, k], X[:10] + 1), gam.predict(X[:10] + 1), atol=1e-6
+            )
+
+        # With fewer samples than coefficients, the fit is the same as pygam's
+        rows = rows[:30]
+        design = GAMDesign(X, edge_knots=gam_edge_knots(X[rows]))
+        gam = LinearGAM(n_splines=20).fit(X[rows], Y[rows, 0])
+        nptest.assert_allclose(
+            design.predict(design.fit(Y[rows, 0], rows)), gam.predict(X), rtol=1e-8, atol=1e-6
+        )
+
+        # A scaled target scales the fit
+        nptest.assert_allclose(design.fit(Y[rows] * 1.1, rows), design.fit(Y[rows], rows) * 1.1)
+
+        with self.assertRaises(ValueError):
+            design.fit(np.full(rows.size, np.nan), rows)
+        with self.assertRaises(ValueError):
+            GAMDesign(X, edge_knots=[0, 1])
+
     def tearDown(self):
         pass
 
 
+class TestFleetPowerCurves(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(42)
+        scada = []
+        for i, t in enumerate(("T1", "T2", "T3")):
+            windspeed = rng.random(1000) * 25
+            power = logistic5param(windspeed, 1500 + 100 * i, -7, 11, 2, 0.5)
+            scada.append(
+                pd.DataFrame(
+                    {
+                        "time": pd.date_range("2020-01-01", periods=windspeed.size, freq="10min"),
+                        "asset_id": t,
+                        "WMET_HorWdSpd": windspeed,
+                        "WTUR_W": power + rng.normal(0, 20, windspeed.size),
+                    }
+                )
+            )
+        self.plant = PlantData(metadata={}, scada=pd.concat(scada))
+
+    def test_fit_fleet_power_curves(self):
+        curves = power_curve.fit_fleet_power_curves(self.plant, seed=1)
+        nptest.assert_array_equal(curves.asset_ids, ["T1", "T2", "T3"])
+
+        # Each method fits the data to within its noise, and finds each turbine's rated power
+        for method in power_curve.fleet.POWER_CURVE_METHODS:
+            nptest.assert_array_less(curves.values(method, "rmse"), 30)
+            nptest.assert_array_equal(curves.values(method, "n_samples"), 1000)
+        nptest.assert_allclose(curves.values("L5P", "a"), [1500, 1600, 1700], rtol=0.01)
+
+        # The curves are created from the parameters, and the IEC curves evaluated at once
+        windspeed = np.linspace(0, 25, 11)
+        expected = logistic5param(windspeed, 1600, -7, 11, 2, 0.5)
+        for method in power_curve.fleet.POWER_CURVE_METHODS:
+            nptest.assert_allclose(curves.curve("T2", method)(windspeed), expected, atol=100)
+        iec = curves.iec()
+        nptest.assert_array_equal(
+            iec(np.tile(windspeed[:, None], 3))[:, 1], curves.curve("T2", "IEC")(windspeed)
+        )
+
+        # The fits are the same in parallel, and a warm start finds the same L5P fit
+        parallel = power_curve.fit_fleet_power_curves(self.plant, n_workers=2, seed=1)
+        pd.testing.assert_frame_equal(parallel.parameters, curves.parameters)
+        warm = power_curve.fit_fleet_power_curves(self.plant, methods=("L5P",), previous=curves)
+        nptest.assert_allclose(warm.values("L5P", "rmse"), curves.values("L5P", "rmse"), rtol=0.05)
+
+        # The parameter table can be saved and reloaded
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "power_curves.csv"
+            curves.save(path)
+            loaded = power_curve.FleetPowerCurves.load(path)
+        pd.testing.assert_frame_equal(loaded.parameters, curves.parameters, check_exact=False)
+
+        with self.assertRaises(ValueError):
+            power_curve.fit_fleet_power_curves(self.plant, methods=("spline",))
+
+    def test_fleet_power_curve_tables(self):
+        curves = power_curve.fit_fleet_power_curves(self.plant, methods=("IEC", "GAM"))
+
+        # The IEC curves of a subset of the turbines are in the requested order
+        windspeed = np.linspace(0, 25, 11)[:, None]
+        subset = curves.iec(["T3", "T1"])
+        nptest.assert_array_equal(subset.asset_ids, ["T3", "T1"])
+        expected = curves.iec()(np.tile(windspeed, 3))[:, [2, 0]]
+        nptest.assert_array_equal(subset(np.tile(windspeed, 2)), expected)
+        with self.assertRaises(KeyError):
+            curves.iec(["T4"])
+        with self.assertRaises(KeyError):
+            curves.curve("T1", "L5P")
+
+        # The pivoted tables are reset when the parameters are replaced
+        df = curves.parameters
+        curves.parameters = df.loc[df.asset_id != "T2"]
+        nptest.assert_array_equal(curves.iec().asset_ids, ["T1", "T3"])
+
+    def test_save_load_parquet(self):
+        pytest.importorskip("pyarrow")
+        curves = power_curve.fit_fleet_power_curves(self.plant, methods=("IEC", "GAM"))
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "power_curves.parquet"
+            curves.save(path)
+            loaded = power_curve.FleetPowerCurves.load(path)
+        pd.testing.assert_frame_equal(loaded.parameters, curves.parameters)
+        windspeed = np.linspace(0, 25, 11)
+        nptest.assert_array_equal(
+            loaded.curve("T2", "GAM")(windspeed), curves.curve("T2", "GAM")(windspeed)
+        )
+
+
 class TestParametricForms(unittest.TestCase):
     def setUp(self):
         pass
@@ -0,0 +1,78 @@
+import unittest
+
+import numpy as np
+import pandas as pd
+from numpy import testing as nptest
+
+from openoa.analysis._random import AnalysisRandomState
+
+
+class TestBootstrap(unittest.TestCase):
+    def setUp(self):
+        self.df = pd.DataFrame({"x": np.arange(50.0) ** 2}, index=np.arange(50) + 100)
+
+    def resample_rows(self, seed: int | None) -> np.ndarray:
+        """Returns the row numbers of the ``DataFrame.sample`` bootstrap of earlier versions."""
+        if seed is None:
+            sample = self.df.sample(frac=1.0, replace=True)
+        else:
+            sample = self.df.sample(
+                frac=1.0, replace=True, random_state=np.random.default_rng(seed)
+            )
+        return self.df.index.get_indexer(sample.index)
+
+    def test_bootstrap_indices(self):
+        # Seeded draws match a DataFrame.sample with a generator of the same seed
+        indices = AnalysisRandomState(7).bootstrap_indices(self.df.shape[0])
+        nptest.assert_array_equal(indices, self.resample_rows(7))
+
+        # Unseeded draws match a DataFrame.sample from the global random state
+        np.random.seed(7)
+        indices = AnalysisRandomState().bootstrap_indices(self.df.shape[0])
+        np.random.seed(7)
+        nptest.assert_array_equal(indices, self.resample_rows(None))
+
+    def test_bootstrap_weights(self):
+        n = self.df.shape[0]
+        for seed in (7, None):
+            np.random.seed(7)
+            weights = AnalysisRandomState(seed).bootstrap_weights(n)
+            np.random.seed(7)
+            rows = self.resample_rows(seed)
+
+            # The weights are the number of times each row is in the resample
+            nptest.assert_array_equal(weights, np.bincount(rows, minlength=n))
+            assert weights.dtype == np.float64
+            assert weights.sum() == n
+
+            # A weighted statistic of the rows is the statistic of the resample
+            expected = self.df.x.iloc[rows].mean()
+            nptest.assert_allclose(np.average(self.df.x, weights=weights), expected, rtol=1e-12)
+
+
+class TestDerivedSeed(unittest.TestCase):
+    def test_derived_seed(self):
+        # Deriving a seed doesn't draw from the generator, and each derived stream is new
+        rng = AnalysisRandomState(7)
+        first = np.random.default_rng(rng.derived_seed()).random(5)
+        second = np.random.default_rng(rng.derived_seed()).random(5)
+        assert not np.array_equal(first, second)
+        nptest.assert_array_equal(rng.normal(0, 1, 5), AnalysisRandomState(7).normal(0, 1, 5))
+
+        # The same seed derives the same streams
+        repeated = np.random.default_rng(AnalysisRandomState(7).derived_seed()).random(5)
+        nptest.assert_array_equal(first, repeated)
+
+        # Unseeded streams are derived from, and don't change, NumPy's global random state
+        np.random.seed(7)
+        first = np.random.default_rng(AnalysisRandomState().derived_seed()).random(5)
+        expected = np.random.normal(0, 1, 5)
+        np.random.seed(7)
+        nptest.assert_array_equal(
+            first, np.random.default_rng(AnalysisRandomState().derived_seed()).random(5)
+        )
+        nptest.assert_array_equal(AnalysisRandomState().normal(0, 1, 5), expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
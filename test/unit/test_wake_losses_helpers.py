@@ -0,0 +1,51 @@
+import unittest
+
+import numpy as np
+import pandas as pd
+from numpy import testing as nptest
+
+from openoa.analysis.wake_losses import _bin_sums, _level_sums, _weighted_bin_means
+
+
+class TestWakeLossesHelpers(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(3)
+        self.codes = rng.integers(0, 6, 40)
+        self.codes[self.codes == 4] = 5  # Bin 4 has no rows
+        self.values = rng.random((40, 3)) * 100
+        self.values[rng.random((40, 3)) < 0.2] = np.nan
+        self.values[self.codes == 2, 1] = np.nan  # Bin 2 has no valid values in the second column
+        self.weights = rng.integers(1, 4, 40).astype(float)
+
+    def test_bin_sums(self):
+        values = np.nan_to_num(self.values)
+        sums = _bin_sums(self.codes, values, 7)
+        expected = pd.DataFrame(values).groupby(self.codes).sum().reindex(range(7))
+        nptest.assert_allclose(sums, expected.to_numpy())
+        assert np.isnan(sums[[4, 6]]).all()
+
+    def test_weighted_bin_means(self):
+        bins, means = _weighted_bin_means(self.codes, self.values, self.weights, 7)
+        nptest.assert_array_equal(bins, [0, 1, 2, 3, 5])
+
+        # The weighted means are identical to the means of the data with each row repeated by its
+        # weight
+        rows = np.repeat(np.arange(self.codes.size), self.weights.astype(int))
+        expected = pd.DataFrame(self.values[rows]).groupby(self.codes[rows]).mean()
+        nptest.assert_array_equal(means, expected.to_numpy())
+        assert np.isnan(means[2, 1])
+
+    def test_level_sums(self):
+        # The table's bins start at output bin 1, and its last bin is outside of the output bins
+        energy = np.array([[1.0, 2.0], [3.0, 4.0], [5.0, 6.0], [7.0, 8.0]])
+        present = np.array([True, True, False, True])
+        expected = np.array([[0.0, 0.0], [1.0, 2.0], [np.nan, np.nan], [5.0, 6.0]])
+        nptest.assert_array_equal(_level_sums(energy, 1, present), expected)
+
+        # Table bins before the first output bin are dropped
+        expected = np.array([[3.0, 4.0], [5.0, 6.0], [np.nan, np.nan], [0.0, 0.0]])
+        nptest.assert_array_equal(_level_sums(energy, -1, present), expected)
+
+
+if __name__ == "__main__":
+    unittest.main()